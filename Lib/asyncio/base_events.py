@@ -424,6 +424,8 @@ def __init__(self):
         self._ready = collections.deque()
         self._scheduled = []
         self._default_executor = None
+        # Executor of asyncio.open_file(), created on first use.
+        self._file_executor = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
         # event loop is not running
@@ -437,6 +439,10 @@ def __init__(self):
         # exceed this duration in seconds, the slow callback/task is logged.
         self.slow_callback_duration = 0.1
         self._current_handle = None
+        self._metrics = None
+        self._metrics_hook = None
+        self._metrics_hook_interval = None
+        self._metrics_hook_deadline = None
         self._task_factory = None
         self._coroutine_origin_tracking_enabled = False
         self._coroutine_origin_tracking_saved_depth = None
@@ -602,7 +608,7 @@ async def shutdown_default_executor(self, timeout=None):
         that the executor will be given an unlimited amount of time.
         """
         self._executor_shutdown_called = True
-        if self._default_executor is None:
+        if self._default_executor is None and self._file_executor is None:
             return
         future = self.create_future()
         thread = threading.Thread(target=self._do_shutdown, args=(future,))
@@ -614,13 +620,19 @@ async def shutdown_default_executor(self, timeout=None):
             warnings.warn("The executor did not finishing joining "
                           f"its threads within {timeout} seconds.",
                           RuntimeWarning, stacklevel=2)
-            self._default_executor.shutdown(wait=False)
+            if self._default_executor is not None:
+                self._default_executor.shutdown(wait=False)
+            if self._file_executor is not None:
+                self._file_executor.shutdown(wait=False)
         else:
             thread.join()
 
     def _do_shutdown(self, future):
         try:
-            self._default_executor.shutdown(wait=True)
+            if self._default_executor is not None:
+                self._default_executor.shutdown(wait=True)
+            if self._file_executor is not None:
+                self._file_executor.shutdown(wait=True)
             if not self.is_closed():
                 self.call_soon_threadsafe(futures._set_result_unless_cancelled,
                                           future, None)
@@ -750,6 +762,10 @@ def close(self):
         if executor is not None:
             self._default_executor = None
             executor.shutdown(wait=False)
+        executor = self._file_executor
+        if executor is not None:
+            self._file_executor = None
+            executor.shutdown(wait=False)
 
     def is_closed(self):
         """Returns True if the event loop was closed."""
@@ -896,6 +912,18 @@ def run_in_executor(self, executor, func, *args):
         return futures.wrap_future(
             executor.submit(func, *args), loop=self)
 
+    def _get_file_executor(self):
+        self._check_closed()
+        self._check_default_executor()
+        if self._file_executor is None:
+            # Reading a file mostly waits for the disk, so the pool has
+            # more threads than the default executor, but it is bounded
+            # and not shared with other blocking work.
+            self._file_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(64, 4 * (os.process_cpu_count() or 1)),
+                thread_name_prefix='asyncio-file')
+        return self._file_executor
+
     def set_default_executor(self, executor):
         if not isinstance(executor, concurrent.futures.ThreadPoolExecutor):
             raise TypeError('executor must be ThreadPoolExecutor instance')
@@ -1985,8 +2013,19 @@ def _run_once(self):
                 timeout = MAXIMUM_SELECT_TIMEOUT
             elif timeout < 0:
                 timeout = 0
-
-        event_list = self._selector.select(timeout)
+        if self._metrics_hook is not None and timeout != 0:
+            # Wake up to call the hook even if the loop is idle.
+            hook_timeout = max(self._metrics_hook_deadline - self.time(), 0)
+            if timeout is None or hook_timeout < timeout:
+                timeout = hook_timeout
+
+        metrics = self._metrics
+        if metrics is not None:
+            t0 = self.time()
+            event_list = self._selector.select(timeout)
+            metrics.select_time += self.time() - t0
+        else:
+            event_list = self._selector.select(timeout)
         self._process_events(event_list)
         # Needed to break cycles when an exception occurs.
         event_list = None
@@ -2021,12 +2060,27 @@ def _run_once(self):
                     if dt >= self.slow_callback_duration:
                         logger.warning('Executing %s took %.3f seconds',
                                        _format_handle(handle), dt)
+                    if metrics is not None:
+                        metrics._add_callback(dt)
                 finally:
                     self._current_handle = None
+            elif metrics is not None:
+                t0 = self.time()
+                handle._run()
+                metrics._add_callback(self.time() - t0)
             else:
                 handle._run()
         handle = None  # Needed to break cycles when an exception occurs.
 
+        if metrics is not None:
+            metrics.iterations += 1
+            metrics.ready_queue_depth = ntodo
+            if ntodo > metrics.max_ready_queue_depth:
+                metrics.max_ready_queue_depth = ntodo
+            if (self._metrics_hook is not None and
+                    self.time() >= self._metrics_hook_deadline):
+                self._call_metrics_hook()
+
     def _set_coroutine_origin_tracking(self, enabled):
         if bool(enabled) == bool(self._coroutine_origin_tracking_enabled):
             return
@@ -2042,6 +2096,61 @@ def _set_coroutine_origin_tracking(self, enabled):
 
         self._coroutine_origin_tracking_enabled = enabled
 
+    def get_metrics(self):
+        """Return a snapshot of the loop statistics.
+
+        Return None if metrics are not enabled.
+        """
+        if self._metrics is None:
+            return None
+        metrics = self._metrics._copy()
+        metrics.scheduled_timers = len(self._scheduled)
+        metrics.cancelled_timers = self._timer_cancelled_count
+        return metrics
+
+    def set_metrics_enabled(self, enabled):
+        """Enable or disable the collection of loop statistics.
+
+        Enabling metrics resets the statistics.  Disabling them also
+        removes the metrics hook.
+        """
+        if not enabled:
+            self._metrics = None
+            self._metrics_hook = None
+        elif self._metrics is None:
+            self._metrics = events.EventLoopMetrics()
+
+    def set_metrics_hook(self, hook, interval=1.0):
+        """Set a hook called with the loop statistics every interval seconds.
+
+        The hook is called by the event loop as hook(loop, metrics), where
+        metrics is the result of get_metrics().  Setting a hook enables
+        metrics; if hook is None, the current hook is removed but metrics
+        are still collected.
+        """
+        if hook is not None:
+            if not callable(hook):
+                raise TypeError(f'A callable object or None is expected, '
+                                f'got {hook!r}')
+            if interval <= 0:
+                raise ValueError('interval must be a positive number')
+            self.set_metrics_enabled(True)
+            self._metrics_hook_interval = interval
+            self._metrics_hook_deadline = self.time() + interval
+        self._metrics_hook = hook
+
+    def _call_metrics_hook(self):
+        self._metrics_hook_deadline = self.time() + self._metrics_hook_interval
+        try:
+            self._metrics_hook(self, self.get_metrics())
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as exc:
+            self.call_exception_handler({
+                'message': 'Exception in event loop metrics hook',
+                'exception': exc,
+            })
+
     def get_debug(self):
         return self._debug
 
@@ -7,13 +7,14 @@
 __all__ = (
     'AbstractEventLoopPolicy',
     'AbstractEventLoop', 'AbstractServer',
-    'Handle', 'TimerHandle',
+    'Handle', 'TimerHandle', 'EventLoopMetrics',
     'get_event_loop_policy', 'set_event_loop_policy',
     'get_event_loop', 'set_event_loop', 'new_event_loop',
     '_set_running_loop', 'get_running_loop',
     '_get_running_loop',
 )
 
+import bisect
 import contextvars
 import os
 import signal
@@ -167,6 +168,60 @@ def when(self):
         return self._when
 
 
+class EventLoopMetrics:
+    """Statistics collected by an event loop with metrics enabled.
+
+    Counters and times are cumulative since metrics were enabled; times
+    are in seconds, measured with loop.time().
+    """
+
+    # Upper bounds of the callback_durations histogram buckets.  The last
+    # bucket counts the callbacks which took longer than the last bound.
+    callback_duration_buckets = (0.0001, 0.001, 0.01, 0.1, 1.0)
+
+    __slots__ = ('iterations', 'select_time', 'callback_time', 'callbacks',
+                 'callback_durations', 'max_callback_time',
+                 'ready_queue_depth', 'max_ready_queue_depth',
+                 'scheduled_timers', 'cancelled_timers')
+
+    def __init__(self):
+        self.iterations = 0
+        self.select_time = 0.0
+        self.callback_time = 0.0
+        self.callbacks = 0
+        self.callback_durations = [0] * (len(self.callback_duration_buckets)
+                                         + 1)
+        self.max_callback_time = 0.0
+        # Number of callbacks run by the last iteration.
+        self.ready_queue_depth = 0
+        self.max_ready_queue_depth = 0
+        # Timers waiting in the loop; cancelled_timers of them were
+        # cancelled but not removed from the loop yet.
+        self.scheduled_timers = 0
+        self.cancelled_timers = 0
+
+    def __repr__(self):
+        return (f'<{self.__class__.__name__} iterations={self.iterations} '
+                f'callbacks={self.callbacks} '
+                f'select_time={self.select_time:.3f} '
+                f'callback_time={self.callback_time:.3f}>')
+
+    def _copy(self):
+        copy = EventLoopMetrics()
+        for name in self.__slots__:
+            setattr(copy, name, getattr(self, name))
+        copy.callback_durations = tuple(self.callback_durations)
+        return copy
+
+    def _add_callback(self, duration):
+        self.callbacks += 1
+        self.callback_time += duration
+        self.callback_durations[
+            bisect.bisect_left(self.callback_duration_buckets, duration)] += 1
+        if duration > self.max_callback_time:
+            self.max_callback_time = duration
+
+
 class AbstractServer:
     """Abstract server returned by create_server()."""
 
@@ -627,6 +682,17 @@ def get_debug(self):
     def set_debug(self, enabled):
         raise NotImplementedError
 
+    # Metrics.
+
+    def get_metrics(self):
+        raise NotImplementedError
+
+    def set_metrics_enabled(self, enabled):
+        raise NotImplementedError
+
+    def set_metrics_hook(self, hook, interval=1.0):
+        raise NotImplementedError
+
 
 class AbstractEventLoopPolicy:
     """Abstract policy for accessing the event loop."""
@@ -0,0 +1,220 @@
+"""Asynchronous file I/O running in a dedicated thread pool."""
+
+__all__ = ('AsyncFile', 'open_file')
+
+import io
+import os
+
+from . import events
+
+
+# Size hint of the batches of lines read by async iteration.
+_LINES_BATCH_SIZE = 64 * 1024
+
+
+async def _run(func, *args):
+    loop = events.get_running_loop()
+    try:
+        get_executor = loop._get_file_executor
+    except AttributeError:
+        # Not a BaseEventLoop: use the default executor.
+        executor = None
+    else:
+        executor = get_executor()
+    return await loop.run_in_executor(executor, func, *args)
+
+
+async def open_file(file, mode='r', buffering=-1, encoding=None, errors=None,
+                    newline=None, closefd=True, opener=None):
+    """Open file and return an AsyncFile.
+
+    The arguments have the same meaning as for the built-in open().
+    The file is opened in the thread pool of the event loop dedicated to
+    file I/O.
+    """
+    f = await _run(open, file, mode, buffering, encoding, errors, newline,
+                   closefd, opener)
+    return AsyncFile(f)
+
+
+class AsyncFile:
+    """Asynchronous wrapper of a file object.
+
+    The blocking methods of the file object are coroutines, run in a
+    thread pool dedicated to file I/O.  Async iteration yields the lines of
+    the file, reading them in large batches.
+    """
+
+    def __init__(self, file):
+        self._file = file
+        # Lines read ahead by async iteration.
+        self._lines = []
+        self._lines_pos = 0
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self._file!r}>'
+
+    @property
+    def file(self):
+        """The wrapped file object."""
+        return self._file
+
+    @property
+    def name(self):
+        return self._file.name
+
+    @property
+    def mode(self):
+        return self._file.mode
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def fileno(self):
+        return self._file.fileno()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._lines_pos >= len(self._lines):
+            self._lines = await _run(self._file.readlines, _LINES_BATCH_SIZE)
+            self._lines_pos = 0
+            if not self._lines:
+                raise StopAsyncIteration
+        line = self._lines[self._lines_pos]
+        self._lines_pos += 1
+        return line
+
+    async def _call(self, func, *args):
+        # Move the file position back over the lines read ahead by async
+        # iteration, then call func(*args).  The lines are only changed in
+        # the event loop thread, and kept if the position cannot be moved
+        # back.
+        if self._lines_pos < len(self._lines):
+            if isinstance(self._file, io.TextIOBase):
+                raise io.UnsupportedOperation(
+                    'cannot move the position of a text file back over '
+                    'the lines read ahead by async iteration')
+            size = sum(map(len, self._lines[self._lines_pos:]))
+            await _run(self._file.seek, -size, os.SEEK_CUR)
+            self._lines = []
+            self._lines_pos = 0
+        return await _run(func, *args)
+
+    def _read_ahead(self, size):
+        # Consume and return up to size characters or bytes (all of them if
+        # size is negative) of the lines read ahead by async iteration.
+        lines = self._lines
+        empty = lines[self._lines_pos][:0]
+        chunks = []
+        while self._lines_pos < len(lines) and size:
+            line = lines[self._lines_pos]
+            if 0 <= size < len(line):
+                chunks.append(line[:size])
+                lines[self._lines_pos] = line[size:]
+                break
+            chunks.append(line)
+            self._lines_pos += 1
+            size -= len(line)
+        return empty.join(chunks)
+
+    # The reads are served from the lines read ahead by async iteration
+    # first, so that they work for text files and unseekable files too.
+
+    async def read(self, size=-1):
+        if self._lines_pos < len(self._lines):
+            if size is None or size < 0:
+                data = self._read_ahead(-1)
+                return data + await _run(self._file.read)
+            data = self._read_ahead(size)
+            if len(data) < size:
+                data += await _run(self._file.read, size - len(data))
+            return data
+        return await _run(self._file.read, size)
+
+    async def read1(self, size=-1):
+        read1 = self._file.read1
+        if self._lines_pos < len(self._lines):
+            return self._read_ahead(size)
+        return await _run(read1, size)
+
+    async def readinto(self, buffer):
+        readinto = self._file.readinto
+        if self._lines_pos < len(self._lines):
+            with memoryview(buffer) as view, view.cast('B') as view:
+                data = self._read_ahead(len(view))
+                n = len(data)
+                view[:n] = data
+                if n < len(view):
+                    n += await _run(readinto, view[n:]) or 0
+            return n
+        return await _run(readinto, buffer)
+
+    async def readline(self, size=-1):
+        if self._lines_pos < len(self._lines):
+            line = self._lines[self._lines_pos]
+            if size is None or not 0 <= size < len(line):
+                size = len(line)
+            return self._read_ahead(size)
+        return await _run(self._file.readline, size)
+
+    async def readlines(self, hint=-1):
+        if self._lines_pos < len(self._lines):
+            lines = []
+            size = 0
+            while self._lines_pos < len(self._lines):
+                line = self._lines[self._lines_pos]
+                self._lines_pos += 1
+                lines.append(line)
+                size += len(line)
+                if hint is not None and 0 < hint <= size:
+                    return lines
+            if hint is None or hint <= 0:
+                return lines + await _run(self._file.readlines)
+            return lines + await _run(self._file.readlines, hint - size)
+        return await _run(self._file.readlines, hint)
+
+    async def write(self, data):
+        return await self._call(self._file.write, data)
+
+    async def writelines(self, lines):
+        return await self._call(self._file.writelines, lines)
+
+    async def flush(self):
+        return await _run(self._file.flush)
+
+    def _fsync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    async def fsync(self):
+        """Flush the file and its data to the storage device."""
+        return await _run(self._fsync)
+
+    async def seek(self, offset, whence=os.SEEK_SET):
+        if whence != os.SEEK_CUR and self._lines_pos < len(self._lines):
+            # The new position does not depend on the lines read ahead.
+            pos = await _run(self._file.seek, offset, whence)
+            self._lines = []
+            self._lines_pos = 0
+            return pos
+        return await self._call(self._file.seek, offset, whence)
+
+    async def tell(self):
+        return await self._call(self._file.tell)
+
+    async def truncate(self, size=None):
+        return await self._call(self._file.truncate, size)
+
+    async def close(self):
+        self._lines = []
+        self._lines_pos = 0
+        return await _run(self._file.close)
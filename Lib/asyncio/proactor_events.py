@@ -104,8 +104,8 @@ def close(self):
         if self._closing:
             return
         self._closing = True
-        self._conn_lost += 1
         if not self._buffer and self._write_fut is None:
+            self._conn_lost += 1
             self._loop.call_soon(self._call_connection_lost, None)
         if self._read_fut is not None:
             self._read_fut.cancel()
@@ -162,7 +162,12 @@ def _call_connection_lost(self, exc):
             # just close our end.  First calling shutdown() seems to
             # cure it, but maybe using DisconnectEx() would be better.
             if hasattr(self._sock, 'shutdown') and self._sock.fileno() != -1:
-                self._sock.shutdown(socket.SHUT_RDWR)
+                try:
+                    self._sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    # On Unix, shutdown() fails if the peer has already
+                    # disconnected.
+                    pass
             self._sock.close()
             self._sock = None
             server = self._server
@@ -388,16 +393,18 @@ def _loop_writing(self, f=None, data=None):
                 data = self._buffer
                 self._buffer = None
             if not data:
-                if self._closing:
-                    self._loop.call_soon(self._call_connection_lost, None)
-                if self._eof_written:
-                    self._sock.shutdown(socket.SHUT_WR)
                 # Now that we've reduced the buffer size, tell the
-                # protocol to resume writing if it was paused.  Note that
-                # we do this last since the callback is called immediately
-                # and it may add more data to the buffer (even causing the
-                # protocol to be paused again).
+                # protocol to resume writing if it was paused.  The
+                # callback is called immediately and it may write more
+                # data (even causing the protocol to be paused again), so
+                # only close the connection if it did not.
                 self._maybe_resume_protocol()
+                if self._write_fut is None:
+                    if self._closing:
+                        self._conn_lost += 1
+                        self._loop.call_soon(self._call_connection_lost, None)
+                    if self._eof_written:
+                        self._sock.shutdown(socket.SHUT_WR)
             else:
                 self._write_fut = self._loop._proactor.send(self._sock, data)
                 if not self._write_fut.done():
@@ -522,6 +529,7 @@ def _loop_writing(self, fut=None):
             if not self._buffer or (self._conn_lost and self._address):
                 # The connection has been closed
                 if self._closing:
+                    self._conn_lost += 1
                     self._loop.call_soon(self._call_connection_lost, None)
                 return
 
@@ -19,6 +19,9 @@
 if ssl is not None:
     SSLAgainErrors = (ssl.SSLWantReadError, ssl.SSLSyscallError)
 
+# Maximum amount of application data in a TLS record.
+_TLS_RECORD_SIZE = 16 * 1024
+
 
 class SSLProtocolState(enum.Enum):
     UNWRAPPED = "UNWRAPPED"
@@ -266,6 +269,7 @@ class SSLProtocol(protocols.BufferedProtocol):
     _handshake_start_time = None
     _handshake_timeout_handle = None
     _shutdown_timeout_handle = None
+    _write_handle = None
 
     def __init__(self, loop, app_protocol, sslcontext, waiter,
                  server_side=False, server_hostname=None,
@@ -638,6 +642,13 @@ def _check_shutdown_timeout(self):
                 exceptions.TimeoutError('SSL shutdown timed out'))
 
     def _do_flush(self):
+        if self._write_backlog:
+            # Write the data whose encryption was deferred.
+            try:
+                self._do_write()
+            except Exception as ex:
+                self._fatal_error(ex, 'Fatal error on SSL protocol')
+                return
         self._do_read()
         self._set_state(SSLProtocolState.SHUTDOWN)
         self._do_shutdown()
@@ -686,20 +697,58 @@ def _write_appdata(self, list_of_data):
             return
 
         for data in list_of_data:
+            if len(data) < _TLS_RECORD_SIZE and not isinstance(data, bytes):
+                # Small writes may only be encrypted at the end of the
+                # event loop iteration: copy mutable buffers, which the
+                # caller is free to reuse once write() returns.
+                data = bytes(data)
             self._write_backlog.append(data)
             self._write_buffer_size += len(data)
 
         try:
             if self._state == SSLProtocolState.WRAPPED:
-                self._do_write()
+                if self._write_buffer_size >= _TLS_RECORD_SIZE:
+                    self._do_write()
+                elif self._write_handle is None:
+                    # Wait for the end of the event loop iteration, so
+                    # that the small writes made until then are sent in
+                    # one record instead of a record (and a system call)
+                    # each.
+                    self._write_handle = self._loop.call_soon(
+                        self._do_deferred_write)
 
         except Exception as ex:
             self._fatal_error(ex, 'Fatal error on SSL protocol')
 
+    def _do_deferred_write(self):
+        self._write_handle = None
+        if self._state == SSLProtocolState.WRAPPED and self._write_backlog:
+            try:
+                self._do_write()
+            except Exception as ex:
+                self._fatal_error(ex, 'Fatal error on SSL protocol')
+
+    def _join_write_backlog(self):
+        # Join the small buffers at the start of the backlog, up to the
+        # size of a TLS record, so that they are encrypted together.
+        backlog = self._write_backlog
+        chunks = [backlog.popleft()]
+        size = len(chunks[0])
+        while backlog and size + len(backlog[0]) <= _TLS_RECORD_SIZE:
+            data = backlog.popleft()
+            chunks.append(data)
+            size += len(data)
+        data = b''.join(chunks)
+        backlog.appendleft(data)
+        return data
+
     def _do_write(self):
         try:
             while self._write_backlog:
                 data = self._write_backlog[0]
+                if (len(data) < _TLS_RECORD_SIZE and
+                        len(self._write_backlog) > 1):
+                    data = self._join_write_backlog()
                 count = self._sslobj.write(data)
                 data_len = len(data)
                 if count < data_len:
@@ -21,6 +21,7 @@
 
 
 _DEFAULT_LIMIT = 2 ** 16  # 64 KiB
+_RECV_BUFFER_SIZE = 256 * 1024  # 256 KiB
 
 
 async def open_connection(host=None, port=None, *,
@@ -44,7 +45,7 @@ async def open_connection(host=None, port=None, *,
     """
     loop = events.get_running_loop()
     reader = StreamReader(limit=limit, loop=loop)
-    protocol = StreamReaderProtocol(reader, loop=loop)
+    protocol = _BufferedStreamReaderProtocol(reader, loop=loop)
     transport, _ = await loop.create_connection(
         lambda: protocol, host, port, **kwds)
     writer = StreamWriter(transport, protocol, reader, loop)
@@ -77,8 +78,8 @@ async def start_server(client_connected_cb, host=None, port=None, *,
 
     def factory():
         reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                        loop=loop)
+        protocol = _BufferedStreamReaderProtocol(reader, client_connected_cb,
+                                                 loop=loop)
         return protocol
 
     return await loop.create_server(factory, host, port, **kwds)
@@ -93,7 +94,7 @@ async def open_unix_connection(path=None, *,
         loop = events.get_running_loop()
 
         reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, loop=loop)
+        protocol = _BufferedStreamReaderProtocol(reader, loop=loop)
         transport, _ = await loop.create_unix_connection(
             lambda: protocol, path, **kwds)
         writer = StreamWriter(transport, protocol, reader, loop)
@@ -106,8 +107,9 @@ async def start_unix_server(client_connected_cb, path=None, *,
 
         def factory():
             reader = StreamReader(limit=limit, loop=loop)
-            protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                            loop=loop)
+            protocol = _BufferedStreamReaderProtocol(reader,
+                                                     client_connected_cb,
+                                                     loop=loop)
             return protocol
 
         return await loop.create_unix_server(factory, path, **kwds)
@@ -306,6 +308,52 @@ def __del__(self):
                 closed.exception()
 
 
+# Receive buffers shared by the _BufferedStreamReaderProtocol instances of
+# an event loop.  Sharing is safe because transports call buffer_updated()
+# right after filling the buffer returned by get_buffer(), before any other
+# callback runs, and buffer_updated() copies the data out of it.
+_recv_buffers = weakref.WeakKeyDictionary()
+
+
+class _BufferedStreamReaderProtocol(StreamReaderProtocol,
+                                    protocols.BufferedProtocol):
+    """StreamReaderProtocol receiving data through the buffered protocol.
+
+    While a StreamReader.readinto() or readexactly_into() call waits for
+    data, the transport receives it straight into the caller's buffer.
+    Otherwise the data is received into a buffer shared by the event loop
+    and copied into the reader's buffer, without allocating a bytes object
+    for each chunk.
+    """
+
+    def __init__(self, stream_reader, client_connected_cb=None, loop=None):
+        super().__init__(stream_reader, client_connected_cb, loop=loop)
+        self._recv_buffer = _recv_buffers.get(self._loop)
+        if self._recv_buffer is None:
+            self._recv_buffer = memoryview(bytearray(_RECV_BUFFER_SIZE))
+            _recv_buffers[self._loop] = self._recv_buffer
+        self._reading_into = False
+
+    def get_buffer(self, sizehint):
+        reader = self._stream_reader
+        if reader is not None:
+            buf = reader._get_read_into_buffer()
+            if buf is not None:
+                self._reading_into = True
+                return buf
+        self._reading_into = False
+        return self._recv_buffer
+
+    def buffer_updated(self, nbytes):
+        if self._reading_into:
+            self._reading_into = False
+            reader = self._stream_reader
+            if reader is not None:
+                reader._read_into_updated(nbytes)
+        else:
+            self.data_received(self._recv_buffer[:nbytes])
+
+
 class StreamWriter:
     """Wraps a Transport.
 
@@ -431,6 +479,11 @@ def __init__(self, limit=_DEFAULT_LIMIT, loop=None):
         self._exception = None
         self._transport = None
         self._paused = False
+        # The buffer of a pending readinto() or readexactly_into() call,
+        # which a buffered protocol may fill directly.
+        self._read_into = None
+        self._read_into_pos = 0
+        self._read_into_min = 0
         if self._loop.get_debug():
             self._source_traceback = format_helpers.extract_stack(
                 sys._getframe(1))
@@ -512,6 +565,39 @@ def feed_data(self, data):
             else:
                 self._paused = True
 
+    def _get_read_into_buffer(self):
+        # Return the free part of the buffer of a pending readinto() or
+        # readexactly_into() call, or None if data must be fed into the
+        # internal buffer: data received earlier must be read first.
+        view = self._read_into
+        if (view is None or self._buffer or self._eof or
+                self._read_into_pos >= len(view)):
+            return None
+        return view[self._read_into_pos:]
+
+    def _read_into_updated(self, nbytes):
+        self._read_into_pos += nbytes
+        if self._read_into_pos >= self._read_into_min:
+            self._wakeup_waiter()
+
+    async def _wait_for_data_into(self, func_name, view, pos, minimum):
+        # Wait for data, letting a buffered protocol write it directly to
+        # view[pos:].  Return the new position.  On error or cancellation,
+        # the data in view[:pos] is put back into the internal buffer, so
+        # that it is not lost.
+        self._read_into = view
+        self._read_into_pos = pos
+        self._read_into_min = minimum
+        try:
+            await self._wait_for_data(func_name)
+        except BaseException:
+            self._buffer[:0] = view[:self._read_into_pos]
+            raise
+        finally:
+            pos = self._read_into_pos
+            self._read_into = None
+        return pos
+
     async def _wait_for_data(self, func_name):
         """Wait until feed_data() or feed_eof() is called.
 
@@ -777,6 +863,80 @@ async def readexactly(self, n):
         self._maybe_resume_transport()
         return data
 
+    async def readinto(self, buffer):
+        """Read up to len(buffer) bytes from the stream into buffer.
+
+        Return the number of bytes read, as soon as at least 1 byte is
+        available.  Return 0 if EOF was received and the internal buffer is
+        empty, or if buffer is empty.
+
+        buffer must be a writable bytes-like object.  If the internal buffer
+        is empty, the data may be received directly into it, without
+        intermediate copies.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        view = _writable_view(buffer)
+        if self._exception is not None:
+            raise self._exception
+
+        n = len(view)
+        if n == 0:
+            return 0
+
+        if not self._buffer and not self._eof:
+            nread = await self._wait_for_data_into('readinto', view, 0, 1)
+            if nread:
+                return nread
+
+        nread = min(n, len(self._buffer))
+        view[:nread] = memoryview(self._buffer)[:nread]
+        del self._buffer[:nread]
+        self._maybe_resume_transport()
+        return nread
+
+    async def readexactly_into(self, buffer):
+        """Read exactly len(buffer) bytes from the stream into buffer.
+
+        Return the number of bytes read.  Raise an IncompleteReadError if
+        EOF is reached before the buffer is full; the partial attribute of
+        the exception contains the bytes read, and the content of buffer
+        is undefined.
+
+        buffer must be a writable bytes-like object.  Data that is not in
+        the internal buffer yet may be received directly into it, without
+        intermediate copies.  Unlike readexactly(), the size is not
+        limited by the buffer limit of the stream.
+
+        If the call is cancelled, the data read so far is put back into the
+        stream.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        view = _writable_view(buffer)
+        if self._exception is not None:
+            raise self._exception
+
+        n = len(view)
+        pos = 0
+        while True:
+            if self._buffer:
+                nread = min(n - pos, len(self._buffer))
+                view[pos:pos + nread] = memoryview(self._buffer)[:nread]
+                del self._buffer[:nread]
+                pos += nread
+            if pos == n:
+                break
+            if self._eof:
+                incomplete = bytes(view[:pos])
+                raise exceptions.IncompleteReadError(incomplete, n)
+            pos = await self._wait_for_data_into('readexactly_into',
+                                                 view, pos, n)
+        self._maybe_resume_transport()
+        return n
+
     def __aiter__(self):
         return self
 
@@ -785,3 +945,11 @@ async def __anext__(self):
         if val == b'':
             raise StopAsyncIteration
         return val
+
+
+def _writable_view(buffer):
+    view = memoryview(buffer)
+    if view.readonly:
+        raise TypeError(f'buffer must be writable, '
+                        f'not {type(buffer).__name__}')
+    return view.cast('B')
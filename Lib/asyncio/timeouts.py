@@ -39,7 +39,8 @@ def __init__(self, when: Optional[float]) -> None:
         """
         self._state = _State.CREATED
 
-        self._timeout_handler: Optional[events.TimerHandle] = None
+        self._timeout_handler: Optional[events.Handle] = None
+        self._handler_when: float = 0.0
         self._task: Optional[tasks.Task] = None
         self._when = when
 
@@ -58,17 +59,29 @@ def reschedule(self, when: Optional[float]) -> None:
 
         self._when = when
 
-        if self._timeout_handler is not None:
-            self._timeout_handler.cancel()
+        handler = self._timeout_handler
+        if handler is not None:
+            if when is not None and self._handler_when <= when:
+                # Postponing the deadline, for example to reset an idle
+                # timeout on activity, keeps the scheduled handler:
+                # _on_timeout() reschedules it when it fires early.  This
+                # saves a cancellation and a heap insertion per call.
+                return
+            handler.cancel()
 
         if when is None:
             self._timeout_handler = None
         else:
-            loop = events.get_running_loop()
-            if when <= loop.time():
-                self._timeout_handler = loop.call_soon(self._on_timeout)
-            else:
-                self._timeout_handler = loop.call_at(when, self._on_timeout)
+            self._schedule(when)
+
+    def _schedule(self, when: float) -> None:
+        loop = events.get_running_loop()
+        if when <= loop.time():
+            self._handler_when = loop.time()
+            self._timeout_handler = loop.call_soon(self._on_timeout)
+        else:
+            self._handler_when = when
+            self._timeout_handler = loop.call_at(when, self._on_timeout)
 
     def expired(self) -> bool:
         """Is timeout expired during execution?"""
@@ -126,6 +139,10 @@ async def __aexit__(
 
     def _on_timeout(self) -> None:
         assert self._state is _State.ENTERED
+        if self._when > self._handler_when:
+            # The deadline was postponed after the handler was scheduled.
+            self._schedule(self._when)
+            return
         self._task.cancel()
         self._state = _State.EXPIRING
         # drop the reference early
@@ -1,9 +1,10 @@
-"""Selector event loop for Unix with signal handling."""
+"""Selector and io_uring event loops for Unix with signal handling."""
 
 import errno
 import io
 import itertools
 import os
+import select
 import selectors
 import signal
 import socket
@@ -20,6 +21,7 @@
 from . import events
 from . import exceptions
 from . import futures
+from . import proactor_events
 from . import selector_events
 from . import tasks
 from . import transports
@@ -32,6 +34,9 @@
     'EventLoop',
 )
 
+if hasattr(select, 'io_uring'):
+    __all__ += ('IoUringEventLoop',)
+
 
 if sys.platform == 'win32':  # pragma: no cover
     raise ImportError('Signals are not really supported on Windows')
@@ -52,14 +57,15 @@ def waitstatus_to_exitcode(status):
         return status
 
 
-class _UnixSelectorEventLoop(selector_events.BaseSelectorEventLoop):
-    """Unix event loop.
+class _UnixEventLoopMixin:
+    """Signal handling, subprocess and UNIX Domain Socket support.
 
-    Adds signal handling and UNIX Domain Socket support to SelectorEventLoop.
+    Shared by the Unix event loops; the event loop must support
+    add_reader() and add_writer().
     """
 
-    def __init__(self, selector=None):
-        super().__init__(selector)
+    def __init__(self, *args):
+        super().__init__(*args)
         self._signal_handlers = {}
         self._unix_server_sockets = {}
         if can_use_pidfd():
@@ -482,6 +488,17 @@ def _stop_serving(self, sock):
                              '%r: %r', path, err)
 
 
+class _UnixSelectorEventLoop(_UnixEventLoopMixin,
+                             selector_events.BaseSelectorEventLoop):
+    """Unix event loop.
+
+    Adds signal handling and UNIX Domain Socket support to SelectorEventLoop.
+    """
+
+    def __init__(self, selector=None):
+        super().__init__(selector)
+
+
 class _UnixReadPipeTransport(transports.ReadTransport):
 
     max_size = 256 * 1024  # max bytes we read in one event loop iteration
@@ -963,6 +980,469 @@ def can_use_pidfd():
     return True
 
 
+def _fileno(obj):
+    fd = obj if isinstance(obj, int) else obj.fileno()
+    if fd < 0:
+        raise OSError(errno.EBADF, 'Bad file descriptor')
+    return fd
+
+
+_PENDING = object()
+
+
+class _IoUringFuture(futures.Future):
+    """Subclass of Future which represents an operation queued in an io_uring.
+
+    Cancelling it cancels the operation in the kernel.
+    """
+
+    def __init__(self, proactor, *, loop=None):
+        super().__init__(loop=loop)
+        if self._source_traceback:
+            del self._source_traceback[-1]
+        self._proactor = proactor
+        self._user_data = None
+
+    def _repr_info(self):
+        info = super()._repr_info()
+        if self._user_data is not None:
+            info.insert(1, f'user_data={self._user_data}')
+        return info
+
+    def cancel(self, msg=None):
+        if not self.done() and self._user_data is not None:
+            self._proactor._cancel(self._user_data)
+        return super().cancel(msg=msg)
+
+
+class IoUringProactor:
+    """Proactor implementation using io_uring.
+
+    Operations are queued in the submission ring and handed to the kernel
+    in a single system call per event loop iteration.
+    """
+
+    def __init__(self, entries=256):
+        self._loop = None
+        self._results = []
+        self._ring = select.io_uring(entries)
+        self._cache = {}        # user_data => (future, callback)
+        self._next_user_data = 1
+
+    def _check_closed(self):
+        if self._ring is None:
+            raise RuntimeError('IoUringProactor is closed')
+
+    def __repr__(self):
+        info = ['operation#=%s' % len(self._cache),
+                'result#=%s' % len(self._results)]
+        if self._ring is None:
+            info.append('closed')
+        return '<%s %s>' % (self.__class__.__name__, " ".join(info))
+
+    def set_loop(self, loop):
+        self._loop = loop
+
+    def select(self, timeout=None):
+        if not self._results:
+            self._poll(timeout)
+        tmp = self._results
+        self._results = []
+        try:
+            return tmp
+        finally:
+            # Needed to break cycles when an exception occurs.
+            tmp = None
+
+    def _result(self, value):
+        fut = self._loop.create_future()
+        fut.set_result(value)
+        return fut
+
+    def _future(self):
+        self._check_closed()
+        return _IoUringFuture(self, loop=self._loop)
+
+    def _register(self, fut, prepare, callback=None):
+        # prepare(user_data) queues the operation in the ring.
+        # callback(result) returns the result of the future, or _PENDING
+        # if it registered another operation for the same future.
+        self._check_closed()
+        user_data = self._next_user_data
+        self._next_user_data += 1
+        prepare(user_data)
+        fut._user_data = user_data
+        self._cache[user_data] = (fut, callback)
+        return fut
+
+    def _cancel(self, user_data):
+        if self._ring is not None and user_data in self._cache:
+            # user_data 0 is never registered: the completion of the
+            # cancellation itself is ignored.
+            self._ring.cancel(0, user_data)
+
+    def _poll(self, timeout=None):
+        if timeout is not None and timeout < 0:
+            raise ValueError("negative timeout")
+        for user_data, res, flags in self._ring.wait(timeout):
+            try:
+                fut, callback = self._cache.pop(user_data)
+            except KeyError:
+                continue
+            if fut.done():
+                # The future was cancelled.
+                continue
+            if res < 0:
+                fut.set_exception(OSError(-res, os.strerror(-res)))
+            elif callback is None:
+                fut.set_result(res)
+            else:
+                try:
+                    value = callback(res)
+                except OSError as exc:
+                    fut.set_exception(exc)
+                    self._results.append(fut)
+                    continue
+                if value is _PENDING:
+                    continue
+                fut.set_result(value)
+            self._results.append(fut)
+
+    def _wait_ready(self, fut, conn, events, func):
+        # Call func() once conn is ready, until it does not block.
+        fd = _fileno(conn)
+
+        def finish_poll(revents):
+            try:
+                return func()
+            except (BlockingIOError, InterruptedError):
+                self._wait_ready(fut, conn, events, func)
+                return _PENDING
+
+        return self._register(
+            fut, lambda user_data: self._ring.poll_add(user_data, fd, events),
+            finish_poll)
+
+    def _nonblocking(self, conn, events, func):
+        try:
+            return self._result(func())
+        except (BlockingIOError, InterruptedError):
+            return self._wait_ready(self._future(), conn, events, func)
+
+    def recv(self, conn, nbytes, flags=0):
+        buf = bytearray(nbytes)
+
+        def finish_recv(nread):
+            del buf[nread:]
+            return bytes(buf)
+
+        return self._recv_into(conn, buf, flags, finish_recv)
+
+    def recv_into(self, conn, buf, flags=0):
+        return self._recv_into(conn, buf, flags, None)
+
+    def _recv_into(self, conn, buf, flags, callback):
+        fd = _fileno(conn)
+
+        def prepare(user_data):
+            if isinstance(conn, socket.socket):
+                self._ring.recv(user_data, fd, buf, flags)
+            else:
+                self._ring.read(user_data, fd, buf)
+
+        return self._register(self._future(), prepare, callback)
+
+    def recvfrom(self, conn, nbytes, flags=0):
+        return self._nonblocking(conn, select.POLLIN,
+                                 lambda: conn.recvfrom(nbytes, flags))
+
+    def recvfrom_into(self, conn, buf, nbytes=0, flags=0):
+        return self._nonblocking(conn, select.POLLIN,
+                                 lambda: conn.recvfrom_into(buf, nbytes, flags))
+
+    def send(self, conn, buf, flags=0):
+        view = memoryview(buf).cast('B')
+        sent = 0
+        if isinstance(conn, socket.socket) and conn.gettimeout() == 0:
+            # Like an overlapped send on Windows, complete the operation
+            # right away if the socket buffer has room for the data.
+            try:
+                sent = conn.send(view, flags)
+            except (BlockingIOError, InterruptedError):
+                pass
+            else:
+                if sent == len(view):
+                    return self._result(sent)
+        return self._send(self._future(), conn, _fileno(conn),
+                          view[sent:], flags, sent)
+
+    def _send(self, fut, conn, fd, view, flags, sent):
+        def prepare(user_data):
+            if isinstance(conn, socket.socket):
+                self._ring.send(user_data, fd, view, flags)
+            else:
+                self._ring.write(user_data, fd, view)
+
+        def finish_send(nbytes):
+            if 0 < nbytes < len(view):
+                # Short write: send the rest of the data.
+                self._send(fut, conn, fd, view[nbytes:], flags, sent + nbytes)
+                return _PENDING
+            return sent + nbytes
+
+        return self._register(fut, prepare, finish_send)
+
+    def sendto(self, conn, buf, flags=0, addr=None):
+        return self._nonblocking(conn, select.POLLOUT,
+                                 lambda: conn.sendto(buf, flags, addr))
+
+    def accept(self, listener):
+        fd = _fileno(listener)
+
+        def finish_accept(conn_fd):
+            conn = socket.socket(listener.family, listener.type,
+                                 listener.proto, fileno=conn_fd)
+            conn.setblocking(False)
+            try:
+                address = conn.getpeername()
+            except OSError:
+                # The peer has already closed the connection.
+                address = None
+            return conn, address
+
+        return self._register(
+            self._future(),
+            lambda user_data: self._ring.accept(user_data, fd,
+                                                socket.SOCK_CLOEXEC),
+            finish_accept)
+
+    def connect(self, conn, address):
+        try:
+            conn.connect(address)
+        except (BlockingIOError, InterruptedError):
+            pass
+        else:
+            return self._result(None)
+
+        def finish_connect():
+            err = conn.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            if err != 0:
+                raise OSError(err, f'Connect call failed {address}')
+
+        return self._wait_ready(self._future(), conn, select.POLLOUT,
+                                finish_connect)
+
+    def wait_fd(self, fd, events):
+        """Wait until the file descriptor is ready for events.
+
+        The result of the future is the mask of the events which occurred.
+        """
+        fd = _fileno(fd)
+        return self._register(
+            self._future(),
+            lambda user_data: self._ring.poll_add(user_data, fd, events))
+
+    def read(self, file, nbytes, offset=-1):
+        """Read up to nbytes from the file at offset.
+
+        An offset of -1 reads from the current file position.
+        """
+        buf = bytearray(nbytes)
+
+        def finish_read(nread):
+            del buf[nread:]
+            return bytes(buf)
+
+        return self._read_into(file, buf, offset, finish_read)
+
+    def read_into(self, file, buf, offset=-1):
+        """Read from the file at offset into buf.
+
+        An offset of -1 reads from the current file position.
+        """
+        return self._read_into(file, buf, offset, None)
+
+    def _read_into(self, file, buf, offset, callback):
+        fd = _fileno(file)
+        return self._register(
+            self._future(),
+            lambda user_data: self._ring.read(user_data, fd, buf, offset),
+            callback)
+
+    def write(self, file, buf, offset=-1):
+        """Write buf to the file at offset.
+
+        An offset of -1 writes at the current file position.
+        """
+        fd = _fileno(file)
+        return self._register(
+            self._future(),
+            lambda user_data: self._ring.write(user_data, fd, buf, offset))
+
+    def _stop_serving(self, obj):
+        # The accept operation is cancelled with its future.
+        pass
+
+    def close(self):
+        if self._ring is None:
+            # already closed
+            return
+
+        # Cancel remaining registered operations.
+        for fut, callback in list(self._cache.values()):
+            if not fut.done():
+                fut.cancel()
+        self._cache.clear()
+        self._results = []
+
+        # Closing the ring waits until the kernel no longer uses the
+        # buffers of the cancelled operations.
+        self._ring.close()
+        self._ring = None
+
+    def __del__(self):
+        self.close()
+
+
+class IoUringEventLoop(_UnixEventLoopMixin,
+                       proactor_events.BaseProactorEventLoop):
+    """Unix event loop using io_uring (Linux 5.11 and newer).
+
+    Socket reads and writes are completed by the kernel instead of being
+    retried on readiness, and all the operations of an event loop
+    iteration are submitted with a single system call.
+    """
+
+    def __init__(self, proactor=None):
+        if proactor is None:
+            proactor = IoUringProactor()
+        self._readers = {}  # fd => (handle, future)
+        self._writers = {}  # fd => (handle, future)
+        super().__init__(proactor)
+        self._add_reader(self._ssock.fileno(), self._read_from_self)
+
+    def close(self):
+        if self.is_running():
+            raise RuntimeError("Cannot close a running event loop")
+        if self.is_closed():
+            return
+        for fd in list(self._readers):
+            self._remove_reader(fd)
+        for fd in list(self._writers):
+            self._remove_writer(fd)
+        super().close()
+
+    def _close_self_pipe(self):
+        self._remove_reader(self._ssock.fileno())
+        super()._close_self_pipe()
+
+    def _read_from_self(self):
+        while True:
+            try:
+                data = self._ssock.recv(4096)
+                if not data:
+                    break
+                self._process_self_data(data)
+            except InterruptedError:
+                continue
+            except BlockingIOError:
+                break
+
+    def _wait_fd(self, pollers, fd, mask):
+        fut = self._proactor.wait_fd(fd, mask)
+        fut.add_done_callback(
+            lambda fut: self._fd_ready(pollers, fd, mask, fut))
+        return fut
+
+    def _fd_ready(self, pollers, fd, mask, fut):
+        entry = pollers.get(fd)
+        if entry is None or entry[1] is not fut:
+            # The callback was removed or replaced
+            return
+        handle = entry[0]
+        if fut.cancelled() or handle._cancelled:
+            del pollers[fd]
+            return
+        exc = fut.exception()
+        if exc is not None:
+            del pollers[fd]
+            self.call_exception_handler({
+                'message': 'Error waiting for a file descriptor',
+                'exception': exc,
+                'handle': handle,
+            })
+            return
+        # Poll again before running the callback: the operation is only
+        # submitted once the callbacks of this iteration have run.
+        pollers[fd] = (handle, self._wait_fd(pollers, fd, mask))
+        handle._run()
+
+    def _add_fd_callback(self, pollers, fd, mask, callback, args):
+        self._check_closed()
+        fd = selectors._fileobj_to_fd(fd)
+        handle = events.Handle(callback, args, self, None)
+        entry = pollers.get(fd)
+        if entry is None:
+            pollers[fd] = (handle, self._wait_fd(pollers, fd, mask))
+        else:
+            entry[0].cancel()
+            pollers[fd] = (handle, entry[1])
+        return handle
+
+    def _remove_fd_callback(self, pollers, fd):
+        if self.is_closed():
+            return False
+        entry = pollers.pop(selectors._fileobj_to_fd(fd), None)
+        if entry is None:
+            return False
+        handle, fut = entry
+        handle.cancel()
+        fut.cancel()
+        return True
+
+    def _add_reader(self, fd, callback, *args):
+        return self._add_fd_callback(self._readers, fd, select.POLLIN,
+                                     callback, args)
+
+    def _remove_reader(self, fd):
+        return self._remove_fd_callback(self._readers, fd)
+
+    def _add_writer(self, fd, callback, *args):
+        return self._add_fd_callback(self._writers, fd, select.POLLOUT,
+                                     callback, args)
+
+    def _remove_writer(self, fd):
+        return self._remove_fd_callback(self._writers, fd)
+
+    def add_reader(self, fd, callback, *args):
+        """Add a reader callback."""
+        self._add_reader(fd, callback, *args)
+
+    def remove_reader(self, fd):
+        """Remove a reader callback."""
+        return self._remove_reader(fd)
+
+    def add_writer(self, fd, callback, *args):
+        """Add a writer callback.."""
+        self._add_writer(fd, callback, *args)
+
+    def remove_writer(self, fd):
+        """Remove a writer callback."""
+        return self._remove_writer(fd)
+
+    async def sock_connect(self, sock, address):
+        if self._debug and sock.gettimeout() != 0:
+            raise ValueError("the socket must be non-blocking")
+        if sock.family == socket.AF_INET or (
+                base_events._HAS_IPv6 and sock.family == socket.AF_INET6):
+            resolved = await self._ensure_resolved(
+                address, family=sock.family, type=sock.type, proto=sock.proto,
+                loop=self,
+            )
+            _, _, _, _, address = resolved[0]
+        return await self._proactor.connect(sock, address)
+
+
 class _UnixDefaultEventLoopPolicy(events.BaseDefaultEventLoopPolicy):
     """UNIX event loop policy"""
     _loop_factory = _UnixSelectorEventLoop
@@ -34,12 +34,21 @@
 )
 
 
+try:
+    import _interpreters
+except ImportError:
+    _interpreters = None
+
+if _interpreters:
+    __all__ += ('InterpreterPoolExecutor',)
+
+
 def __dir__():
     return __all__ + ('__author__', '__doc__')
 
 
 def __getattr__(name):
-    global ProcessPoolExecutor, ThreadPoolExecutor
+    global ProcessPoolExecutor, ThreadPoolExecutor, InterpreterPoolExecutor
 
     if name == 'ProcessPoolExecutor':
         from .process import ProcessPoolExecutor as pe
@@ -51,4 +60,9 @@ def __getattr__(name):
         ThreadPoolExecutor = te
         return te
 
+    if _interpreters and name == 'InterpreterPoolExecutor':
+        from .interpreter import InterpreterPoolExecutor as ie
+        InterpreterPoolExecutor = ie
+        return ie
+
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,227 @@
+"""Implements InterpreterPoolExecutor."""
+
+import contextlib
+import pickle
+import textwrap
+from . import thread as _thread
+import _interpreters
+import _interpqueues
+
+
+class ExecutionFailed(_interpreters.InterpreterError):
+    """An unhandled exception happened during execution."""
+
+    def __init__(self, excinfo):
+        msg = excinfo.formatted
+        if not msg:
+            if excinfo.type and excinfo.msg:
+                msg = f'{excinfo.type.__name__}: {excinfo.msg}'
+            else:
+                msg = excinfo.type.__name__ or excinfo.msg
+        super().__init__(msg)
+        self.excinfo = excinfo
+
+    def __str__(self):
+        try:
+            formatted = self.excinfo.errdisplay
+        except Exception:
+            return super().__str__()
+        else:
+            return textwrap.dedent(f"""
+{super().__str__()}
+
+Uncaught in the interpreter:
+
+{formatted}
+                """.strip())
+
+
+# The queue item formats understood by _interpqueues.
+_SHARED = 0
+_PICKLED = 1
+
+UNBOUND = 2  # error; this should not happen.
+
+# The script run in the worker interpreter for every task.  The task data
+# and the results queue ID are bound into __main__ through the "shared"
+# argument of _interpreters.exec(), so the script itself never changes.
+_RUN_TASK = 'WorkerContext._call_task(_task, _resultsid)'
+
+
+def _is_shareable(obj):
+    # _interpreters.is_shareable() only looks at the type of the object,
+    # but a tuple is only shareable if all of its items are.
+    if type(obj) is tuple:
+        return all(_is_shareable(item) for item in obj)
+    return _interpreters.is_shareable(obj)
+
+
+class WorkerContext(_thread.WorkerContext):
+
+    @classmethod
+    def prepare(cls, initializer, initargs, shared):
+        def resolve_task(fn, args, kwargs):
+            if isinstance(fn, str):
+                # XXX Circle back to this later.
+                raise TypeError('scripts not supported')
+            # Functions defined in the __main__ module can't be pickled,
+            # so they can't be used here.  In the future, we could possibly
+            # borrow from multiprocessing to work around this.
+            fndata = pickle.dumps(fn)
+            if not kwargs and _is_shareable(args):
+                # The arguments are passed to the worker interpreter
+                # directly, without a round-trip through pickle.
+                return (fndata, args, _SHARED)
+            return (fndata, pickle.dumps((args, kwargs)), _PICKLED)
+
+        if initializer is not None:
+            if not callable(initializer):
+                raise TypeError("initializer must be a callable")
+            initdata = resolve_task(initializer, initargs, {})
+        else:
+            initdata = None
+        def create_context():
+            return cls(initdata, shared)
+        return create_context, resolve_task
+
+    @classmethod
+    @contextlib.contextmanager
+    def _capture_exc(cls, resultsid):
+        try:
+            yield
+        except BaseException as exc:
+            # Send the captured exception out on the results queue,
+            # but still leave it unhandled for the interpreter to handle.
+            err = pickle.dumps(exc)
+            _interpqueues.put(resultsid, (None, err), _PICKLED, UNBOUND)
+            raise  # re-raise
+
+    @classmethod
+    def _call(cls, func, args, kwargs, resultsid):
+        with cls._capture_exc(resultsid):
+            res = func(*args or (), **kwargs or {})
+        # Send the result back, pickling it only if it isn't shareable.
+        try:
+            _interpqueues.put(resultsid, (res, None), _SHARED, UNBOUND)
+        except _interpreters.NotShareableError:
+            res = pickle.dumps(res)
+            _interpqueues.put(resultsid, (res, None), _PICKLED, UNBOUND)
+
+    @classmethod
+    def _call_task(cls, task, resultsid):
+        with cls._capture_exc(resultsid):
+            fndata, argsdata, fmt = task
+            fn = pickle.loads(fndata)
+            if fmt == _SHARED:
+                args, kwargs = argsdata, None
+            else:
+                args, kwargs = pickle.loads(argsdata)
+        cls._call(fn, args, kwargs, resultsid)
+
+    def __init__(self, initdata, shared=None):
+        self.initdata = initdata
+        self.shared = dict(shared) if shared else None
+        self.interpid = None
+        self.resultsid = None
+
+    def __del__(self):
+        if self.interpid is not None:
+            self.finalize()
+
+    def _exec(self, script, shared=None):
+        assert self.interpid is not None
+        excinfo = _interpreters.exec(self.interpid, script, shared,
+                                     restrict=True)
+        if excinfo is not None:
+            raise ExecutionFailed(excinfo)
+
+    def initialize(self):
+        assert self.interpid is None, self.interpid
+        self.interpid = _interpreters.create(reqrefs=True)
+        try:
+            _interpreters.incref(self.interpid)
+
+            maxsize = 0
+            self.resultsid = _interpqueues.create(maxsize, _SHARED, UNBOUND)
+
+            self._exec(f'from {__name__} import WorkerContext')
+
+            if self.shared:
+                _interpreters.set___main___attrs(
+                                    self.interpid, self.shared, restrict=True)
+
+            if self.initdata:
+                self.run(self.initdata)
+        except BaseException:
+            self.finalize()
+            raise  # re-raise
+
+    def finalize(self):
+        interpid = self.interpid
+        resultsid = self.resultsid
+        self.resultsid = None
+        self.interpid = None
+        if resultsid is not None:
+            try:
+                _interpqueues.destroy(resultsid)
+            except _interpqueues.QueueNotFoundError:
+                pass
+        if interpid is not None:
+            try:
+                _interpreters.decref(interpid)
+            except _interpreters.InterpreterNotFoundError:
+                pass
+
+    def run(self, task):
+        try:
+            self._exec(_RUN_TASK, {'_task': task,
+                                   '_resultsid': self.resultsid})
+        except ExecutionFailed as exc:
+            exc_wrapper = exc
+        else:
+            exc_wrapper = None
+
+        # Return the result, or raise the exception.  The call has already
+        # finished, so the queue is never empty here.
+        obj = _interpqueues.get(self.resultsid)
+        (res, excdata), fmt, unboundop = obj
+        assert unboundop is None, unboundop
+        if excdata is not None:
+            assert res is None, res
+            assert fmt == _PICKLED
+            assert exc_wrapper is not None
+            exc = pickle.loads(excdata)
+            raise exc from exc_wrapper
+        return pickle.loads(res) if fmt == _PICKLED else res
+
+
+class BrokenInterpreterPool(_thread.BrokenThreadPool):
+    """
+    Raised when a worker thread in an InterpreterPoolExecutor failed initializing.
+    """
+
+
+class InterpreterPoolExecutor(_thread.ThreadPoolExecutor):
+
+    BROKEN = BrokenInterpreterPool
+
+    @classmethod
+    def prepare_context(cls, initializer, initargs, shared):
+        return WorkerContext.prepare(initializer, initargs, shared)
+
+    def __init__(self, max_workers=None, thread_name_prefix='',
+                 initializer=None, initargs=(), shared=None):
+        """Initializes a new InterpreterPoolExecutor instance.
+
+        Args:
+            max_workers: The maximum number of interpreters that can be used to
+                execute the given calls.
+            thread_name_prefix: An optional name prefix to give our threads.
+            initializer: A callable used to initialize each worker
+                interpreter.
+            initargs: A tuple of arguments to pass to the initializer.
+            shared: A mapping of shareable objects to be inserted into
+                each worker interpreter's __main__ module.
+        """
+        super().__init__(max_workers, thread_name_prefix,
+                         initializer, initargs, shared=shared)
@@ -17,6 +17,7 @@
 from abc import get_cache_token
 from collections import namedtuple
 # import types, weakref  # Deferred to single_dispatch()
+from operator import index
 from reprlib import recursive_repr
 from types import MethodType
 from _thread import RLock
@@ -444,6 +445,10 @@ def _unwrap_partialmethod(func):
 ################################################################################
 
 _CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+_EvictingCacheInfo = namedtuple("CacheInfo",
+                                ["hits", "misses", "maxsize", "currsize",
+                                 "evictions", "expirations", "currweight"],
+                                defaults=[0, 0, None])
 
 class _HashedSeq(list):
     """ This class guarantees that hash() will be called no more than once
@@ -492,7 +497,8 @@ def _make_key(args, kwds, typed,
         return key[0]
     return _HashedSeq(key)
 
-def lru_cache(maxsize=128, typed=False):
+def lru_cache(maxsize=128, typed=False, *, shards=1, ttl=None, weigher=None,
+              maxweight=None):
     """Least-recently-used cache decorator.
 
     If *maxsize* is set to None, the LRU features are disabled and the cache
@@ -503,10 +509,33 @@ def lru_cache(maxsize=128, typed=False):
     distinct calls with distinct results. Some types such as str and int may
     be cached separately even when typed is false.
 
+    If *shards* is greater than one, the cache is split into that many
+    independently locked LRU caches, selected by the hash of the arguments.
+    Calls that land in different shards never wait for each other, which
+    helps heavily shared caches scale across threads.  The *maxsize* is
+    divided between the shards, so the least recently used entry is only
+    evicted from its own shard.
+
+    If *ttl* is set, entries expire that many seconds after they were
+    cached, and the next call with the same arguments calls the function
+    again.
+
+    If *weigher* is set, it is called with each result and must return its
+    weight as a non-negative integer.  Least recently used entries are
+    evicted to keep the total weight at most *maxweight*, and results
+    heavier than *maxweight* are not cached at all.
+
+    If the decorated function is a coroutine function, the wrapper is one
+    too.  Concurrent calls with the same arguments share a single call of
+    the underlying function, and its awaited result is cached.  Calls that
+    raise an exception or are cancelled are not cached.
+
     Arguments to the cached function must be hashable.
 
     View the cache statistics named tuple (hits, misses, maxsize, currsize)
-    with f.cache_info().  Clear the cache and statistics with f.cache_clear().
+    with f.cache_info().  If *ttl* or *weigher* is set, the tuple also has
+    the number of evictions and expirations and the current total weight.
+    Clear the cache and statistics with f.cache_clear().
     Access the underlying function with f.__wrapped__.
 
     See:  https://en.wikipedia.org/wiki/Cache_replacement_policies#Least_recently_used_(LRU)
@@ -518,6 +547,29 @@ def lru_cache(maxsize=128, typed=False):
     # The internals of the lru_cache are encapsulated for thread safety and
     # to allow the implementation to change (including a possible C version).
 
+    if not isinstance(shards, int):
+        raise TypeError('shards must be an integer')
+    if shards < 1:
+        raise ValueError('shards must be at least 1')
+    if ttl is not None and not ttl > 0:
+        raise ValueError('ttl must be positive')
+    if weigher is None:
+        if maxweight is not None:
+            raise TypeError('maxweight requires a weigher')
+    elif not callable(weigher):
+        raise TypeError('weigher must be callable')
+    elif maxweight is not None:
+        maxweight = index(maxweight)
+        if maxweight < 0:
+            raise ValueError('maxweight must be non-negative')
+
+    params = {}
+    cache_info_type = _CacheInfo
+    if ttl is not None or weigher is not None:
+        params = {'ttl': ttl, 'weigher': weigher, 'maxweight': maxweight}
+        cache_info_type = _EvictingCacheInfo
+
+    user_function = None
     if isinstance(maxsize, int):
         # Negative maxsize is treated as 0
         if maxsize < 0:
@@ -525,28 +577,170 @@ def lru_cache(maxsize=128, typed=False):
     elif callable(maxsize) and isinstance(typed, bool):
         # The user_function was passed in directly via the maxsize argument
         user_function, maxsize = maxsize, 128
-        wrapper = _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo)
-        wrapper.cache_parameters = lambda : {'maxsize': maxsize, 'typed': typed}
-        return update_wrapper(wrapper, user_function)
     elif maxsize is not None:
         raise TypeError(
             'Expected first argument to be an integer, a callable, or None')
 
+    if maxsize is not None:
+        # Every shard holds at least one entry
+        shards = min(shards, maxsize) or 1
+    if shards > 1:
+        params['shards'] = shards
+
+    def make_wrapper(user_function):
+        wrapper = _lru_cache_wrapper(user_function, maxsize, typed,
+                                     cache_info_type, **params)
+        wrapper.cache_parameters = lambda : {'maxsize': maxsize,
+                                             'typed': typed, **params}
+        return wrapper
+
     def decorating_function(user_function):
-        wrapper = _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo)
-        wrapper.cache_parameters = lambda : {'maxsize': maxsize, 'typed': typed}
+        if _is_coroutine_function(user_function):
+            if weigher is not None:
+                raise TypeError('weigher is not supported for coroutine '
+                                'functions')
+            wrapper = _coroutine_lru_cache_wrapper(user_function, make_wrapper)
+        else:
+            wrapper = make_wrapper(user_function)
         return update_wrapper(wrapper, user_function)
 
+    if user_function is not None:
+        return decorating_function(user_function)
     return decorating_function
 
-def _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo):
+# Same value as inspect.CO_COROUTINE; inspect imports functools and is too
+# expensive to import for every cached function.
+_CO_COROUTINE = 0x80
+
+def _is_coroutine_function(func):
+    # A minimal inspect.iscoroutinefunction()
+    while True:
+        if isinstance(func, MethodType):
+            func = func.__func__
+        elif isinstance(func, partial):
+            func = func.func
+        else:
+            break
+    code = getattr(func, '__code__', None)
+    if code is not None and getattr(code, 'co_flags', 0) & _CO_COROUTINE:
+        return True
+    # Set by inspect.markcoroutinefunction()
+    return getattr(func, '_is_coroutine_marker', None) is not None
+
+def _coroutine_lru_cache_wrapper(user_function, make_wrapper):
+    # The LRU cache does not store results but the tasks that run the calls.
+    # Concurrent callers with the same arguments share the task while it is
+    # in flight, instead of each starting their own call, and later callers
+    # find the result in the finished task.
+    from asyncio import create_task, get_running_loop, shield
+
+    def start(*args, **kwds):
+        # Only called on a cache miss
+        task = create_task(user_function(*args, **kwds))
+        task.add_done_callback(partial(discard_failed, args, kwds))
+        return task
+
+    def discard_failed(args, kwds, task):
+        # Failed and cancelled calls are not cached, so that the next call
+        # is a miss and the cache does not keep the traceback alive.
+        if task.cancelled() or task.exception() is not None:
+            discard(task, args, kwds)
+
+    cached = make_wrapper(start)
+    discard = cached._cache_discard
+
+    async def wrapper(*args, **kwds):
+        task = cached(*args, **kwds)
+        if task.done():
+            if not task.cancelled() and task.exception() is None:
+                return task.result()
+            # The task failed, but discard_failed() has not run yet
+        elif task.get_loop() is get_running_loop():
+            # Cancelling one caller must not cancel the shared call
+            return await shield(task)
+        # A task left pending by another (probably closed) event loop will
+        # never finish either: drop it and run the call again.
+        discard(task, args, kwds)
+        task = cached(*args, **kwds)
+        return await shield(task)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.cache_parameters = cached.cache_parameters
+    return wrapper
+
+def _split(total, shards):
+    # Spread total so that the shard sizes add up to it exactly
+    if total is None:
+        return [None] * shards
+    size, extra = divmod(total, shards)
+    return [size + (i < extra) for i in range(shards)]
+
+def _sharded_lru_cache_wrapper(user_function, maxsize, typed, shards,
+                               _CacheInfo, *, ttl=None, weigher=None,
+                               maxweight=None):
+    # Each shard is a complete lru cache with its own lock, so hits on
+    # different shards do not serialize.  The key is only built here to
+    # pick a shard: _make_key() guarantees that equal calls land in the same
+    # shard.  The C version picks the shard from the key it builds anyway.
+    caches = [_lru_cache_wrapper(user_function, size, typed, _CacheInfo,
+                                 ttl=ttl, weigher=weigher, maxweight=weight)
+              for size, weight in zip(_split(maxsize, shards),
+                                      _split(maxweight, shards))]
+    make_key = _make_key
+
+    def wrapper(*args, **kwds):
+        key = make_key(args, kwds, typed)
+        return caches[hash(key) % shards](*args, **kwds)
+
+    def cache_info():
+        """Report cache statistics"""
+        infos = [cache.cache_info() for cache in caches]
+        if ttl is None and weigher is None:
+            return _CacheInfo(sum(info.hits for info in infos),
+                              sum(info.misses for info in infos),
+                              maxsize,
+                              sum(info.currsize for info in infos))
+        return _CacheInfo(sum(info.hits for info in infos),
+                          sum(info.misses for info in infos),
+                          maxsize,
+                          sum(info.currsize for info in infos),
+                          sum(info.evictions for info in infos),
+                          sum(info.expirations for info in infos),
+                          None if weigher is None else
+                          sum(info.currweight for info in infos))
+
+    def cache_clear():
+        """Clear the cache and cache statistics"""
+        for cache in caches:
+            cache.cache_clear()
+
+    def cache_discard(result, args, kwds):
+        key = make_key(args, kwds, typed)
+        caches[hash(key) % shards]._cache_discard(result, args, kwds)
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    wrapper._cache_discard = cache_discard
+    return wrapper
+
+def _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo, *,
+                       ttl=None, weigher=None, maxweight=None, shards=1):
+    if shards > 1:
+        return _sharded_lru_cache_wrapper(user_function, maxsize, typed,
+                                          shards, _CacheInfo, ttl=ttl,
+                                          weigher=weigher,
+                                          maxweight=maxweight)
+
     # Constants shared by all lru cache instances:
     sentinel = object()          # unique object used to signal cache misses
     make_key = _make_key         # build a key from the function arguments
     PREV, NEXT, KEY, RESULT = 0, 1, 2, 3   # names for the link fields
+    EXPIRES, WEIGHT = 4, 5       # extra link fields for evicting caches
 
     cache = {}
     hits = misses = 0
+    evictions = expirations = currweight = 0
     full = False
     cache_get = cache.get    # bound method to lookup a key or return None
     cache_len = cache.__len__  # get cache size without calling len()
@@ -563,6 +757,74 @@ def wrapper(*args, **kwds):
             result = user_function(*args, **kwds)
             return result
 
+    elif ttl is not None or weigher is not None:
+        from time import monotonic
+
+        def unlink(link):
+            # Remove a link from both the queue and the cache dictionary
+            nonlocal currweight
+            link_prev, link_next = link[PREV], link[NEXT]
+            link_prev[NEXT] = link_next
+            link_next[PREV] = link_prev
+            del cache[link[KEY]]
+            currweight -= link[WEIGHT]
+
+        def wrapper(*args, **kwds):
+            # Size, weight or age limited caching that tracks accesses by
+            # recency.  Expired entries are dropped lazily, when they are
+            # looked up or when they are the oldest entry in the queue.
+            nonlocal hits, misses, evictions, expirations, currweight
+            key = make_key(args, kwds, typed)
+            with lock:
+                link = cache_get(key)
+                if link is not None:
+                    if ttl is None or monotonic() < link[EXPIRES]:
+                        # Move the link to the front of the circular queue
+                        link_prev, link_next = link[PREV], link[NEXT]
+                        link_prev[NEXT] = link_next
+                        link_next[PREV] = link_prev
+                        last = root[PREV]
+                        last[NEXT] = root[PREV] = link
+                        link[PREV] = last
+                        link[NEXT] = root
+                        hits += 1
+                        return link[RESULT]
+                    expirations += 1
+                    unlink(link)
+                misses += 1
+            result = user_function(*args, **kwds)
+            weight = 1
+            if weigher is not None:
+                # Weights are integers, like in the C version
+                weight = index(weigher(result))
+                if weight < 0:
+                    raise ValueError('weigher must return a non-negative integer')
+                if maxweight is not None and weight > maxweight:
+                    # Too heavy to ever fit in the cache
+                    return result
+            with lock:
+                if key in cache:
+                    # Same key added to the cache while the lock was released
+                    return result
+                now = monotonic() if ttl is not None else 0
+                last = root[PREV]
+                link = [last, root, key, result, now + (ttl or 0), weight]
+                last[NEXT] = root[PREV] = cache[key] = link
+                currweight += weight
+                # Evict the oldest entries until the cache fits its limits
+                # again.  The new entry fits on its own, so it always stays.
+                while ((maxsize is not None and cache_len() > maxsize) or
+                       (maxweight is not None and currweight > maxweight)):
+                    oldest = root[NEXT]
+                    if oldest is link:
+                        break
+                    if ttl is not None and now >= oldest[EXPIRES]:
+                        expirations += 1
+                    else:
+                        evictions += 1
+                    unlink(oldest)
+            return result
+
     elif maxsize is None:
 
         def wrapper(*args, **kwds):
@@ -640,19 +902,49 @@ def wrapper(*args, **kwds):
     def cache_info():
         """Report cache statistics"""
         with lock:
+            if maxsize != 0 and (ttl is not None or weigher is not None):
+                return _CacheInfo(hits, misses, maxsize, cache_len(),
+                                  evictions, expirations,
+                                  None if weigher is None else currweight)
             return _CacheInfo(hits, misses, maxsize, cache_len())
 
     def cache_clear():
         """Clear the cache and cache statistics"""
-        nonlocal hits, misses, full
+        nonlocal hits, misses, full, evictions, expirations, currweight
         with lock:
             cache.clear()
             root[:] = [root, root, None, None]
             hits = misses = 0
+            evictions = expirations = currweight = 0
+            full = False
+
+    def cache_discard(result, args, kwds):
+        # Remove the entry for the arguments if it still holds result.  Used
+        # by the coroutine wrapper to drop the calls that failed.
+        nonlocal full, currweight
+        key = make_key(args, kwds, typed)
+        with lock:
+            entry = cache_get(key, sentinel)
+            if entry is sentinel:
+                return
+            if maxsize is None and ttl is None and weigher is None:
+                # The simple cache stores the results themselves
+                if entry is result:
+                    del cache[key]
+                return
+            if entry[RESULT] is not result:
+                return
+            link_prev, link_next = entry[PREV], entry[NEXT]
+            link_prev[NEXT] = link_next
+            link_next[PREV] = link_prev
+            del cache[key]
+            if len(entry) > WEIGHT:
+                currweight -= entry[WEIGHT]
             full = False
 
     wrapper.cache_info = cache_info
     wrapper.cache_clear = cache_clear
+    wrapper._cache_discard = cache_discard
     return wrapper
 
 try:
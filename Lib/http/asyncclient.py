@@ -0,0 +1,530 @@
+"""Asynchronous HTTP/1.1 client built on asyncio streams.
+
+A ClientSession sends requests over keep-alive connections, which are
+pooled per server.  Requests return a ClientResponse once its status line
+and headers have been received; the body is then read or streamed by the
+caller:
+
+    async with http.asyncclient.ClientSession() as session:
+        async with await session.request('GET', url) as response:
+            async for chunk in response:
+                ...
+
+Headers are parsed by http.client, and the same exceptions are raised.
+"""
+
+import asyncio
+import collections.abc
+import io
+from http import client
+from http.client import (HTTPException, LineTooLong, RemoteDisconnected,
+                         IncompleteRead, UnknownProtocol, BadStatusLine,
+                         InvalidURL, parse_headers)
+from urllib.parse import urlsplit
+
+__all__ = ["ClientSession", "ClientResponse"]
+
+# Size of the chunks yielded by iterating over a response.
+_CHUNK_SIZE = 64 * 1024
+
+_DEFAULT_PORTS = {'http': client.HTTP_PORT, 'https': client.HTTPS_PORT}
+
+
+async def _readline(reader):
+    try:
+        return await reader.readuntil(b'\n')
+    except asyncio.IncompleteReadError as exc:
+        return exc.partial
+    except asyncio.LimitOverrunError:
+        raise LineTooLong("header line") from None
+
+
+async def _read_headers(reader):
+    lines = []
+    while True:
+        line = await _readline(reader)
+        lines.append(line)
+        if len(lines) > client._MAXHEADERS:
+            raise HTTPException(f"got more than {client._MAXHEADERS} headers")
+        if line in (b'\r\n', b'\n', b''):
+            break
+    return parse_headers(io.BytesIO(b''.join(lines)))
+
+
+def _parse_status(line):
+    line = str(line, "iso-8859-1")
+    try:
+        version, status, reason = line.split(None, 2)
+    except ValueError:
+        try:
+            version, status = line.split(None, 1)
+            reason = ""
+        except ValueError:
+            # empty version will cause next test to fail.
+            version = ""
+    if not version.startswith("HTTP/"):
+        raise BadStatusLine(line)
+
+    # The status code is a three-digit number
+    try:
+        status = int(status)
+        if status < 100 or status > 999:
+            raise BadStatusLine(line)
+    except ValueError:
+        raise BadStatusLine(line)
+    return version, status, reason
+
+
+def _split_url(url):
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS:
+        raise InvalidURL(f"unsupported URL scheme: {url!r}")
+    host = parts.hostname
+    if not host:
+        raise InvalidURL(f"no host given: {url!r}")
+    try:
+        port = parts.port
+    except ValueError:
+        raise InvalidURL(f"nonnumeric port: {url!r}") from None
+    if port is None:
+        port = _DEFAULT_PORTS[scheme]
+    target = parts.path or '/'
+    if parts.query:
+        target += '?' + parts.query
+    if client._contains_disallowed_url_pchar_re.search(target):
+        raise InvalidURL(f"URL can't contain control characters. {target!r}")
+    host_header = f'[{host}]' if ':' in host else host
+    if port != _DEFAULT_PORTS[scheme]:
+        host_header = f'{host_header}:{port}'
+    return scheme, host, port, target, host_header
+
+
+def _encode_body(body):
+    if isinstance(body, str):
+        # RFC 2616 Section 3.7.1 says that text default has a
+        # default charset of iso-8859-1.
+        return client._encode(body, 'body')
+    return body
+
+
+def _can_resend(body):
+    return body is None or isinstance(body, (bytes, bytearray, memoryview))
+
+
+class _Connection:
+
+    def __init__(self, key, reader, writer):
+        self.key = key
+        self.reader = reader
+        self.writer = writer
+        self.reused = False
+        self.idle_since = None
+
+    def is_usable(self):
+        # An idle connection closed by the server is at EOF.
+        return not self.reader.at_eof() and not self.writer.is_closing()
+
+    def close(self):
+        self.writer.close()
+
+
+class _HostPool:
+
+    def __init__(self, limit):
+        self.semaphore = asyncio.Semaphore(limit)
+        # Idle connections, the most recently used one last.
+        self.idle = []
+
+
+class ClientSession:
+    """Send HTTP/1.1 requests over pooled keep-alive connections.
+
+    At most max_connections_per_host connections are open to each server
+    at the same time; further requests wait for a connection to be released.
+    Idle connections are closed after idle_timeout seconds.  timeout is the
+    default time limit for getting the headers of a response, and ssl the
+    SSL context of HTTPS connections.
+    """
+
+    def __init__(self, *, max_connections_per_host=10, idle_timeout=60.0,
+                 timeout=None, ssl=None):
+        if max_connections_per_host < 1:
+            raise ValueError("max_connections_per_host must be at least 1")
+        self._max_connections_per_host = max_connections_per_host
+        self._idle_timeout = idle_timeout
+        self._timeout = timeout
+        self._ssl = ssl
+        self._pools = {}
+        self._closed = False
+
+    def __repr__(self):
+        state = 'closed' if self._closed else 'open'
+        return f'<{self.__class__.__name__} {state}>'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    @property
+    def closed(self):
+        return self._closed
+
+    async def close(self):
+        """Close the idle connections and the connections released later."""
+        self._closed = True
+        conns = []
+        for pool in self._pools.values():
+            conns.extend(pool.idle)
+            pool.idle.clear()
+        for conn in conns:
+            conn.close()
+        for conn in conns:
+            try:
+                await conn.writer.wait_closed()
+            except (OSError, asyncio.IncompleteReadError):
+                pass
+
+    def _get_ssl_context(self):
+        if self._ssl is None:
+            self._ssl = client._create_https_context(11)
+        return self._ssl
+
+    async def _acquire(self, key):
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _HostPool(self._max_connections_per_host)
+        await pool.semaphore.acquire()
+        try:
+            now = asyncio.get_running_loop().time()
+            while pool.idle:
+                conn = pool.idle.pop()
+                if (now - conn.idle_since < self._idle_timeout
+                        and conn.is_usable()):
+                    conn.reused = True
+                    return conn
+                conn.close()
+            scheme, host, port = key
+            if scheme == 'https':
+                reader, writer = await asyncio.open_connection(
+                    host, port, ssl=self._get_ssl_context(),
+                    server_hostname=host)
+            else:
+                reader, writer = await asyncio.open_connection(host, port)
+            return _Connection(key, reader, writer)
+        except BaseException:
+            pool.semaphore.release()
+            raise
+
+    def _release(self, conn, reusable):
+        pool = self._pools[conn.key]
+        if reusable and not self._closed and conn.is_usable():
+            conn.idle_since = asyncio.get_running_loop().time()
+            pool.idle.append(conn)
+        else:
+            conn.close()
+        pool.semaphore.release()
+
+    async def request(self, method, url, *, headers=None, body=None,
+                      timeout=None):
+        """Send a request and return a ClientResponse.
+
+        body can be bytes, a string encoded to ISO-8859-1, or an iterable or
+        asynchronous iterable of bytes, sent with the chunked transfer
+        encoding unless a Content-Length header is given.  The time limit
+        applies to sending the request and getting the response headers;
+        wrap reads of the body in asyncio.timeout() to limit them as well.
+        """
+        if self._closed:
+            raise RuntimeError("session is closed")
+        match = client._contains_disallowed_method_pchar_re.search(method)
+        if match:
+            raise ValueError(
+                f"method can't contain control characters. {method!r} "
+                f"(found at least {match.group()!r})")
+        scheme, host, port, target, host_header = _split_url(url)
+        body = _encode_body(body)
+        head, chunked = self._encode_head(method, target, host_header,
+                                          headers or {}, body)
+        if timeout is None:
+            timeout = self._timeout
+
+        async with asyncio.timeout(timeout):
+            while True:
+                conn = await self._acquire((scheme, host, port))
+                sent = False
+                try:
+                    await self._send(conn.writer, head, body, chunked)
+                    sent = True
+                    version, status, reason, response_headers = (
+                        await self._read_head(conn.reader))
+                except ConnectionError:
+                    self._release(conn, False)
+                    # The server may have closed the connection while it
+                    # was idle: send the request again on a new connection.
+                    # Once the request was sent, the server may have
+                    # processed it, so only idempotent requests are sent
+                    # again.
+                    if (conn.reused and _can_resend(body)
+                            and (not sent or method.upper()
+                                 in client._IDEMPOTENT_METHODS)):
+                        continue
+                    raise
+                except BaseException:
+                    self._release(conn, False)
+                    raise
+                break
+        return ClientResponse(self, conn, method, url, version, status,
+                              reason, response_headers)
+
+    def _encode_head(self, method, target, host_header, headers, body):
+        names = {name.lower() for name in headers}
+        lines = [f'{method} {target} HTTP/1.1'.encode('ascii')]
+        default_headers = {}
+        if 'host' not in names:
+            default_headers['Host'] = host_header
+        if 'accept-encoding' not in names:
+            default_headers['Accept-Encoding'] = 'identity'
+        chunked = False
+        if 'content-length' not in names and 'transfer-encoding' not in names:
+            if body is None:
+                if method.upper() in client._METHODS_EXPECTING_BODY:
+                    default_headers['Content-Length'] = '0'
+            elif isinstance(body, (bytes, bytearray, memoryview)):
+                default_headers['Content-Length'] = str(memoryview(body).nbytes)
+            else:
+                default_headers['Transfer-Encoding'] = 'chunked'
+                chunked = True
+        elif 'transfer-encoding' in names:
+            chunked = any(name.lower() == 'transfer-encoding'
+                          and 'chunked' in str(value).lower()
+                          for name, value in headers.items())
+        for name, value in (*default_headers.items(), *headers.items()):
+            name = name.encode('ascii')
+            if not client._is_legal_header_name(name):
+                raise ValueError(f'Invalid header name {name!r}')
+            if not isinstance(value, bytes):
+                value = str(value).encode('latin-1')
+            if client._is_illegal_header_value(value):
+                raise ValueError(f'Invalid header value {value!r}')
+            lines.append(name + b': ' + value)
+        lines.append(b'\r\n')
+        return b'\r\n'.join(lines), chunked
+
+    async def _send(self, writer, head, body, chunked):
+        if body is None:
+            writer.write(head)
+        elif isinstance(body, (bytes, bytearray, memoryview)):
+            writer.writelines((head, body))
+        else:
+            writer.write(head)
+            if isinstance(body, collections.abc.AsyncIterable):
+                async for data in body:
+                    await self._send_data(writer, data, chunked)
+            else:
+                for data in body:
+                    await self._send_data(writer, data, chunked)
+            if chunked:
+                writer.write(b'0\r\n\r\n')
+        await writer.drain()
+
+    async def _send_data(self, writer, data, chunked):
+        if not data:
+            return
+        if chunked:
+            writer.writelines((b'%X\r\n' % len(data), data, b'\r\n'))
+        else:
+            writer.write(data)
+        # Wait until the transport buffer drains.
+        await writer.drain()
+
+    async def _read_head(self, reader):
+        # read until we get a non-100 response
+        while True:
+            line = await _readline(reader)
+            if len(line) > client._MAXLINE:
+                raise LineTooLong("status line")
+            if not line:
+                # Presumably, the server closed the connection before
+                # sending a valid response.
+                raise RemoteDisconnected("Remote end closed connection "
+                                         "without response")
+            version, status, reason = _parse_status(line)
+            headers = await _read_headers(reader)
+            if status != client.CONTINUE:
+                return version, status, reason, headers
+
+
+class ClientResponse:
+    """Response to a request of a ClientSession.
+
+    The status line and headers are available as attributes.  The body is
+    read with read() or by asynchronous iteration over chunks of bytes.  The
+    connection returns to the pool of the session when the body has been
+    completely read, and is closed if the response is closed before that.
+    """
+
+    def __init__(self, session, conn, method, url, version, status, reason,
+                 headers):
+        self._session = session
+        self._conn = conn
+        self.method = method
+        self.url = url
+        self.status = status
+        self.reason = reason.strip()
+        if version in ("HTTP/1.0", "HTTP/0.9"):
+            # Some servers might still return "0.9", treat it as 1.0 anyway
+            self.version = 10
+        elif version.startswith("HTTP/1."):
+            self.version = 11   # use HTTP/1.1 code for HTTP/1.x where x>=1
+        else:
+            self._release(False)
+            raise UnknownProtocol(version)
+        self.headers = headers
+
+        # are we using the chunked-style of transfer encoding?
+        tr_enc = headers.get("transfer-encoding")
+        self._chunked = bool(tr_enc and tr_enc.lower() == "chunked")
+        self._chunk_left = None
+
+        # will the connection close at the end of the response?
+        self._will_close = self._check_close()
+
+        # do we have a Content-Length?
+        self._length = None
+        length = headers.get("content-length")
+        if length and not self._chunked:
+            try:
+                self._length = int(length)
+            except ValueError:
+                pass
+            else:
+                if self._length < 0:  # ignore nonsensical negative lengths
+                    self._length = None
+
+        # does the body have a fixed length? (of zero)
+        if (status == client.NO_CONTENT or status == client.NOT_MODIFIED or
+            100 <= status < 200 or method.upper() == "HEAD"):
+            self._chunked = False
+            self._length = 0
+
+        # if the connection remains open, and we aren't using chunked, and
+        # a content-length was not provided, then assume that the connection
+        # WILL close.
+        if not self._chunked and self._length is None:
+            self._will_close = True
+
+        if self._length == 0:
+            self._release(not self._will_close)
+
+    _check_close = client.HTTPResponse._check_close
+
+    def __repr__(self):
+        return (f'<{self.__class__.__name__} [{self.status} {self.reason}] '
+                f'{self.url}>')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        data = await self.read(_CHUNK_SIZE)
+        if not data:
+            raise StopAsyncIteration
+        return data
+
+    @property
+    def closed(self):
+        """True if the body was completely read or the response closed."""
+        return self._conn is None
+
+    def getheader(self, name, default=None):
+        """Return the value of the header name, or default."""
+        return client.HTTPResponse.getheader(self, name, default)
+
+    def close(self):
+        """Close the response.
+
+        The connection is closed if the body was not completely read.
+        """
+        if self._conn is not None:
+            self._release(False)
+
+    def _release(self, reusable):
+        conn = self._conn
+        self._conn = None
+        self._session._release(conn, reusable)
+
+    async def read(self, n=-1):
+        """Read up to n bytes of the body, or the whole body if n < 0.
+
+        Return b'' at the end of the body.
+        """
+        if self._conn is None or n == 0:
+            return b''
+        if n > 0:
+            return await self._read(n)
+        chunks = []
+        while data := await self._read(_CHUNK_SIZE):
+            chunks.append(data)
+        return b''.join(chunks)
+
+    async def _read(self, n):
+        if self._conn is None:
+            return b''
+        try:
+            if self._chunked:
+                return await self._read_chunked(n)
+            return await self._read_length(n)
+        except BaseException:
+            if self._conn is not None:
+                self._release(False)
+            raise
+
+    async def _read_length(self, n):
+        reader = self._conn.reader
+        if self._length is None:
+            data = await reader.read(n)
+            if not data:
+                self._release(False)
+            return data
+        data = await reader.read(min(n, self._length))
+        if not data:
+            raise IncompleteRead(b'', self._length)
+        self._length -= len(data)
+        if not self._length:
+            self._release(not self._will_close)
+        return data
+
+    async def _read_chunked(self, n):
+        reader = self._conn.reader
+        if not self._chunk_left:
+            if self._chunk_left == 0:
+                # Read the CRLF at the end of the previous chunk.
+                await _readline(reader)
+            line = await _readline(reader)
+            i = line.find(b";")
+            if i >= 0:
+                line = line[:i] # strip chunk-extensions
+            try:
+                chunk_left = int(line, 16)
+            except ValueError:
+                raise IncompleteRead(b'') from None
+            if chunk_left == 0:
+                # Skip the trailers.
+                await _read_headers(reader)
+                self._release(not self._will_close)
+                return b''
+            self._chunk_left = chunk_left
+        data = await reader.read(min(n, self._chunk_left))
+        if not data:
+            raise IncompleteRead(b'', self._chunk_left)
+        self._chunk_left -= len(data)
+        return data
@@ -76,6 +76,8 @@
 import re
 import socket
 import sys
+import threading
+import collections
 import collections.abc
 from urllib.parse import urlsplit
 
@@ -157,6 +159,10 @@
 # servers will otherwise respond with a 411
 _METHODS_EXPECTING_BODY = {'PATCH', 'POST', 'PUT'}
 
+# Requests with these methods can be sent again if the server may already
+# have processed them (RFC 9110, section 9.2.2)
+_IDEMPOTENT_METHODS = {'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS', 'TRACE'}
+
 
 def _encode(data, name='data'):
     """Call data.encode("latin-1") but show a better error message."""
@@ -1449,6 +1455,56 @@ def getresponse(self):
 except ImportError:
     pass
 else:
+    class SSLSessionCache:
+        """Cache of TLS sessions to resume when reconnecting to a server.
+
+        Sessions are keyed by SSL context, server name and port, and the
+        least recently used ones are evicted beyond maxsize.  A cache can be
+        shared by HTTPSConnection objects in different threads.  The hits
+        and misses attributes count the handshakes that resumed a session
+        and the full handshakes.
+        """
+
+        def __init__(self, maxsize=128):
+            if maxsize < 1:
+                raise ValueError("maxsize must be at least 1")
+            self.maxsize = maxsize
+            self.hits = 0
+            self.misses = 0
+            self._sessions = collections.OrderedDict()
+            self._lock = threading.Lock()
+
+        def __len__(self):
+            return len(self._sessions)
+
+        def _get(self, key):
+            with self._lock:
+                session = self._sessions.get(key)
+                if session is not None:
+                    self._sessions.move_to_end(key)
+                return session
+
+        def _put(self, key, session):
+            with self._lock:
+                self._sessions[key] = session
+                self._sessions.move_to_end(key)
+                if len(self._sessions) > self.maxsize:
+                    self._sessions.popitem(last=False)
+
+        def _record(self, reused):
+            with self._lock:
+                if reused:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+
+        def clear(self):
+            """Remove all sessions and reset the counters."""
+            with self._lock:
+                self._sessions.clear()
+                self.hits = 0
+                self.misses = 0
+
     class HTTPSConnection(HTTPConnection):
         "This class allows communication via SSL."
 
@@ -1456,13 +1512,18 @@ class HTTPSConnection(HTTPConnection):
 
         def __init__(self, host, port=None,
                      *, timeout=socket._GLOBAL_DEFAULT_TIMEOUT,
-                     source_address=None, context=None, blocksize=8192):
+                     source_address=None, context=None, blocksize=8192,
+                     session_cache=None):
             super(HTTPSConnection, self).__init__(host, port, timeout,
                                                   source_address,
                                                   blocksize=blocksize)
             if context is None:
                 context = _create_https_context(self._http_vsn)
             self._context = context
+            if session_cache is None:
+                session_cache = SSLSessionCache(maxsize=1)
+            self.session_cache = session_cache
+            self._session_key = None
 
         def connect(self):
             "Connect to a host on a given (SSL) port."
@@ -1471,13 +1532,46 @@ def connect(self):
 
             if self._tunnel_host:
                 server_hostname = self._tunnel_host
+                port = self._tunnel_port
             else:
                 server_hostname = self.host
+                port = self.port
 
+            key = (self._context, server_hostname, port)
+            session = self.session_cache._get(key)
             self.sock = self._context.wrap_socket(self.sock,
-                                                  server_hostname=server_hostname)
+                                                  server_hostname=server_hostname,
+                                                  session=session)
+            self.session_cache._record(self.sock.session_reused)
+            self._session_key = key
+            self._save_session()
+
+        def _save_session(self):
+            # TLS 1.3 session tickets are only received after the
+            # handshake: the session is saved again once a response has
+            # been received, and on close.
+            if self._session_key is None or self.sock is None:
+                return
+            try:
+                session = self.sock.session
+            except (OSError, ValueError):
+                return
+            if session is not None:
+                self.session_cache._put(self._session_key, session)
+
+        def getresponse(self):
+            response = super().getresponse()
+            # The caller may close the socket without calling close(), as
+            # urllib.request does.
+            self._save_session()
+            return response
+
+        def close(self):
+            self._save_session()
+            self._session_key = None
+            super().close()
 
-    __all__.append("HTTPSConnection")
+    __all__.extend(["HTTPSConnection", "SSLSessionCache"])
 
 class HTTPException(Exception):
     # Subclasses that define an __init__ must call Exception.__init__
@@ -83,7 +83,8 @@
 __version__ = "0.6"
 
 __all__ = [
-    "HTTPServer", "ThreadingHTTPServer", "BaseHTTPRequestHandler",
+    "HTTPServer", "ThreadingHTTPServer", "ThreadPoolHTTPServer",
+    "BaseHTTPRequestHandler",
     "SimpleHTTPRequestHandler", "CGIHTTPRequestHandler",
 ]
 
@@ -144,6 +145,10 @@ class ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
     daemon_threads = True
 
 
+class ThreadPoolHTTPServer(socketserver.ThreadPoolMixIn, HTTPServer):
+    daemon_threads = True
+
+
 class BaseHTTPRequestHandler(socketserver.StreamRequestHandler):
 
     """HTTP request handler base class.
@@ -1295,6 +1300,14 @@ def test(HandlerClass=BaseHTTPRequestHandler,
                         default='HTTP/1.0',
                         help='conform to this HTTP version '
                              '(default: %(default)s)')
+    parser.add_argument('-w', '--workers', type=int, metavar='N',
+                        help='handle requests in a pool of N threads '
+                             '(default: a thread per request)')
+    if hasattr(os, 'fork'):
+        parser.add_argument('--processes', type=int, metavar='N',
+                            help='handle requests in N pre-forked worker '
+                                 'processes; SIGHUP restarts the workers')
+    parser.set_defaults(processes=None)
     parser.add_argument('port', default=8000, type=int, nargs='?',
                         help='bind to this port '
                              '(default: %(default)s)')
@@ -1304,8 +1317,23 @@ def test(HandlerClass=BaseHTTPRequestHandler,
     else:
         handler_class = SimpleHTTPRequestHandler
 
+    if args.workers is not None:
+        if args.workers < 1:
+            parser.error('--workers must be at least 1')
+        base_classes = (ThreadPoolHTTPServer,)
+    else:
+        base_classes = (ThreadingHTTPServer,)
+    if args.processes is not None:
+        if args.processes < 1:
+            parser.error('--processes must be at least 1')
+        base_classes = (socketserver.PreForkMixIn,) + base_classes
+
     # ensure dual-stack is not disabled; ref #38907
-    class DualStackServer(ThreadingHTTPServer):
+    class DualStackServer(*base_classes):
+        if args.workers is not None:
+            workers = args.workers
+        if args.processes is not None:
+            processes = args.processes
 
         def server_bind(self):
             # suppress exception when protocol is IPv4
@@ -1314,6 +1342,13 @@ def server_bind(self):
                     socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 0)
             return super().server_bind()
 
+        def server_activate(self):
+            super().server_activate()
+            if args.processes is not None:
+                import signal
+                signal.signal(signal.SIGHUP,
+                              lambda signum, frame: self.reload_workers())
+
         def finish_request(self, request, client_address):
             self.RequestHandlerClass(request, client_address, self,
                                      directory=args.directory)
@@ -97,7 +97,7 @@
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
+    'dump', 'dumps', 'load', 'loads', 'load_iter',
     'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
 ]
 
@@ -106,6 +106,7 @@
 from .decoder import JSONDecoder, JSONDecodeError
 from .encoder import JSONEncoder
 import codecs
+import io
 
 _default_encoder = JSONEncoder(
     skipkeys=False,
@@ -160,24 +161,47 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
     ``.default()`` method to serialize additional types), specify it with
     the ``cls`` kwarg; otherwise ``JSONEncoder`` is used.
 
+    If ``fp`` is a binary file, the output is encoded to UTF-8.
+
     """
     # cached encoder
     if (not skipkeys and ensure_ascii and
         check_circular and allow_nan and
         cls is None and indent is None and separators is None and
         default is None and not sort_keys and not kw):
-        iterable = _default_encoder.iterencode(obj)
+        encoder = _default_encoder
     else:
         if cls is None:
             cls = JSONEncoder
-        iterable = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        encoder = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
             check_circular=check_circular, allow_nan=allow_nan, indent=indent,
             separators=separators,
-            default=default, sort_keys=sort_keys, **kw).iterencode(obj)
-    # could accelerate with writelines in some versions of Python, at
-    # a debuggability cost
-    for chunk in iterable:
-        fp.write(chunk)
+            default=default, sort_keys=sort_keys, **kw)
+    if isinstance(fp, io.BufferedIOBase):
+        def write(chunk, _write=fp.write):
+            _write(chunk.encode('utf-8', 'surrogatepass'))
+    elif isinstance(fp, io.RawIOBase):
+        def write(chunk):
+            _write_raw(fp, chunk.encode('utf-8', 'surrogatepass'))
+    else:
+        write = fp.write
+    if type(encoder).iterencode is JSONEncoder.iterencode:
+        # Encode in C (if available) and write the output in large blocks
+        encoder.iterencode(obj, _write=write)
+    else:
+        for chunk in encoder.iterencode(obj):
+            write(chunk)
+
+
+def _write_raw(fp, data):
+    # Raw files may write only part of the data
+    with memoryview(data) as view:
+        while view:
+            n = fp.write(view)
+            if n is None:
+                raise BlockingIOError('write could not complete without '
+                                      'blocking')
+            view = view[n:]
 
 
 def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
@@ -240,6 +264,9 @@ def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
 
 _default_decoder = JSONDecoder(object_hook=None, object_pairs_hook=None)
 
+# How much load_iter() reads at a time
+_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 def detect_encoding(b):
     bstartswith = b.startswith
@@ -296,6 +323,69 @@ def load(fp, *, cls=None, object_hook=None, parse_float=None,
         parse_constant=parse_constant, object_pairs_hook=object_pairs_hook, **kw)
 
 
+def _read_text(fp, size):
+    # Read from fp in chunks of at most size bytes or characters, and
+    # decode binary data incrementally.  read1() returns the data already
+    # available instead of waiting for a full chunk, which matters for pipes
+    # and sockets.
+    read = getattr(fp, 'read1', fp.read)
+    chunk = read(size)
+    if isinstance(chunk, str):
+        while chunk:
+            yield chunk
+            chunk = read(size)
+        return
+    if not isinstance(chunk, (bytes, bytearray)):
+        raise TypeError(f'the JSON stream must read str, bytes or bytearray, '
+                        f'not {chunk.__class__.__name__}')
+    head = bytes(chunk)
+    while chunk and len(head) < 4:
+        chunk = read(size)
+        head += chunk
+    decoder = codecs.getincrementaldecoder(detect_encoding(head))('surrogatepass')
+    chunk = head
+    while chunk:
+        yield decoder.decode(chunk)
+        chunk = read(size)
+    yield decoder.decode(b'', True)
+
+
+def load_iter(fp, *, cls=None, object_hook=None, parse_float=None,
+        parse_int=None, parse_constant=None, object_pairs_hook=None,
+        lines=False, **kw):
+    """Deserialize ``fp`` (a ``.read()``-supporting file-like object
+    reading ``str`` or ``bytes``) incrementally, and return an iterator over
+    the values it contains.
+
+    By default ``fp`` must contain a JSON array, and its items are yielded
+    one at a time as they are read, without loading the whole document in
+    memory.  If ``lines`` is true, ``fp`` contains whitespace separated JSON
+    values instead, for instance in the JSON Lines format, and every value
+    is yielded.
+
+    The other arguments have the same meaning as in ``load``.
+    """
+    if (cls is None and object_hook is None and
+            parse_int is None and parse_float is None and
+            parse_constant is None and object_pairs_hook is None and not kw):
+        decoder = _default_decoder
+    else:
+        if cls is None:
+            cls = JSONDecoder
+        if object_hook is not None:
+            kw['object_hook'] = object_hook
+        if object_pairs_hook is not None:
+            kw['object_pairs_hook'] = object_pairs_hook
+        if parse_float is not None:
+            kw['parse_float'] = parse_float
+        if parse_int is not None:
+            kw['parse_int'] = parse_int
+        if parse_constant is not None:
+            kw['parse_constant'] = parse_constant
+        decoder = cls(**kw)
+    return decoder.iter_decode(_read_text(fp, _STREAM_CHUNK_SIZE), lines=lines)
+
+
 def loads(s, *, cls=None, object_hook=None, parse_float=None,
         parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
     """Deserialize ``s`` (a ``str``, ``bytes`` or ``bytearray`` instance
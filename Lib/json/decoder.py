@@ -361,3 +361,179 @@ def raw_decode(self, s, idx=0):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+    def iter_decode(self, chunks, *, lines=False):
+        """Decode a JSON document incrementally from ``chunks`` (an iterable
+        of ``str`` instances) and return an iterator over its values.
+
+        By default the document must be an array, and its items are yielded
+        one at a time as soon as they have been read.  If ``lines`` is true,
+        the input is instead a sequence of whitespace separated JSON values,
+        such as JSON Lines, and every value is yielded.
+
+        Only the data needed to decode the current value is kept in memory,
+        so the largest value, rather than the whole document, bounds the
+        memory used.
+        """
+        return _iter_decode(self.scan_once, chunks, lines)
+
+
+def _iter_decode(scan_once, chunks, lines,
+                 _w=WHITESPACE.match, _ws=WHITESPACE_STR,
+                 _number_chars=frozenset('0123456789.eE+-'),
+                 _number_tail=re.compile(r'[-+.0-9eE]*\Z').match,
+                 _constants=('true', 'false', 'null',
+                             'NaN', 'Infinity', '-Infinity')):
+    chunks = iter(chunks)
+    buf = ''
+    pos = 0
+    eof = False
+    # Where the data dropped from the buffer ends, to report error positions
+    # in the whole document.
+    offset = 0
+    newlines = 0
+    line_start = 0
+
+    def fill(keep=None):
+        # Drop the data decoded so far (except from index keep on), then
+        # read until the rest of the buffer has at least doubled, so that a
+        # value spanning many chunks is only rescanned a logarithmic number
+        # of times.
+        nonlocal buf, pos, eof, offset, newlines, line_start
+        drop = pos if keep is None else keep
+        if drop:
+            n = buf.count('\n', 0, drop)
+            if n:
+                newlines += n
+                line_start = offset + buf.rfind('\n', 0, drop) + 1
+            offset += drop
+            buf = buf[drop:]
+            pos -= drop
+        parts = [buf]
+        size = 0
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                raise TypeError(f'chunks must be str, '
+                                f'not {chunk.__class__.__name__}')
+            if not offset and not buf and chunk.startswith('\ufeff'):
+                raise JSONDecodeError("Unexpected UTF-8 BOM "
+                                      "(decode using utf-8-sig)", chunk, 0)
+            parts.append(chunk)
+            size += len(chunk)
+            if size and size >= len(buf):
+                break
+        else:
+            eof = True
+        buf = ''.join(parts)
+
+    def error(msg, at):
+        err = JSONDecodeError(msg, buf, at)
+        if offset:
+            err.pos = offset + at
+            if err.lineno == 1:
+                err.colno = err.pos - line_start + 1
+            err.lineno += newlines
+            err.args = ('%s: line %d column %d (char %d)'
+                        % (msg, err.lineno, err.colno, err.pos),)
+        return err
+
+    def skip_whitespace(keep=None):
+        # Advance pos to the next non-whitespace character, or to the end
+        # of the document.
+        nonlocal pos
+        while True:
+            pos = _w(buf, pos).end()
+            if pos < len(buf) or eof:
+                return
+            fill(keep)
+
+    def truncated(msg, at):
+        # Whether the error at index at may be caused by the buffer ending
+        # in the middle of a value, rather than by invalid data.
+        left = len(buf) - at
+        if left <= 0 or msg == "Unterminated string starting at":
+            return True
+        if msg == "Invalid \\uXXXX escape":
+            # Room for a surrogate pair.
+            return left < 12
+        if _number_tail(buf, at):
+            # A number cut after a character which cannot end it, such as
+            # '1.' or '2e', in a nested value.
+            return True
+        if msg == "Expecting value" and left < 9:
+            rest = buf[at:]
+            return any(c.startswith(rest) for c in _constants)
+        return False
+
+    def scan():
+        # Decode the value at pos, reading more data as long as the value
+        # may be incomplete.  A number is only complete once it is followed
+        # by a character that cannot be part of it.
+        nonlocal pos
+        while True:
+            try:
+                value, end = scan_once(buf, pos)
+            except StopIteration as err:
+                if eof or not truncated("Expecting value", err.value):
+                    raise error("Expecting value", err.value) from None
+            except JSONDecodeError as err:
+                if eof or not truncated(err.msg, err.pos):
+                    raise error(err.msg, err.pos) from None
+            else:
+                if eof or end < len(buf) and buf[end] not in _number_chars:
+                    pos = end
+                    return value
+            fill()
+
+    fill()
+    skip_whitespace()
+    if lines:
+        while pos < len(buf):
+            yield scan()
+            skip_whitespace()
+        return
+
+    if buf[pos:pos + 1] != '[':
+        raise error("Expecting '['", pos)
+    pos += 1
+    skip_whitespace()
+    if buf[pos:pos + 1] == ']':
+        pos += 1
+    else:
+        while True:
+            # Inlined scan() for the common case of a value that is
+            # complete in the buffer.
+            try:
+                value, end = scan_once(buf, pos)
+            except (StopIteration, JSONDecodeError):
+                value = scan()
+            else:
+                if end < len(buf) and buf[end] not in _number_chars:
+                    pos = end
+                else:
+                    value = scan()
+            yield value
+            if buf[pos:pos + 1] != ',':
+                skip_whitespace()
+                nextchar = buf[pos:pos + 1]
+                if nextchar == ']':
+                    pos += 1
+                    break
+                elif nextchar != ',':
+                    raise error("Expecting ',' delimiter", pos)
+            comma_idx = offset + pos
+            pos += 1
+            nextchar = buf[pos:pos + 1]
+            if nextchar == ' ':
+                # The default separator
+                pos += 1
+                nextchar = buf[pos:pos + 1]
+            if not nextchar or nextchar in _ws:
+                skip_whitespace(keep=comma_idx - offset)
+                nextchar = buf[pos:pos + 1]
+            if nextchar == ']':
+                raise error("Illegal trailing comma before end of array",
+                            comma_idx - offset)
+    skip_whitespace()
+    if pos != len(buf):
+        raise error("Extra data", pos)
@@ -102,9 +102,11 @@ class JSONEncoder(object):
     """
     item_separator = ', '
     key_separator = ': '
+    object_fields = False
+    _object_plans = None
     def __init__(self, *, skipkeys=False, ensure_ascii=True,
             check_circular=True, allow_nan=True, sort_keys=False,
-            indent=None, separators=None, default=None):
+            indent=None, separators=None, default=None, object_fields=False):
         """Constructor for JSONEncoder, with sensible defaults.
 
         If skipkeys is false, then it is a TypeError to attempt
@@ -143,6 +145,13 @@ def __init__(self, *, skipkeys=False, ensure_ascii=True,
         that can't otherwise be serialized.  It should return a JSON encodable
         version of the object or raise a ``TypeError``.
 
+        If object_fields is true, dataclass instances are encoded as JSON
+        objects of their fields, without calling default.  object_fields
+        may also be a tuple of classes with ``__slots__`` and no
+        ``__dict__``, whose instances (and those of their subclasses) are
+        then also encoded as JSON objects of their public slots.  The fields
+        of each class are looked up once per encoder.
+
         """
 
         self.skipkeys = skipkeys
@@ -157,6 +166,7 @@ def __init__(self, *, skipkeys=False, ensure_ascii=True,
             self.item_separator = ','
         if default is not None:
             self.default = default
+        self.object_fields = object_fields
 
     def default(self, o):
         """Implement this method in a subclass such that it returns
@@ -202,7 +212,7 @@ def encode(self, o):
             chunks = list(chunks)
         return ''.join(chunks)
 
-    def iterencode(self, o, _one_shot=False):
+    def iterencode(self, o, _one_shot=False, _write=None):
         """Encode the given object and yield each string
         representation as available.
 
@@ -212,6 +222,8 @@ def iterencode(self, o, _one_shot=False):
                 mysocket.write(chunk)
 
         """
+        # If _write is given, the encoded data is passed to it in large
+        # blocks while encoding, and nothing is yielded.
         if self.check_circular:
             markers = {}
         else:
@@ -248,20 +260,96 @@ def floatstr(o, allow_nan=self.allow_nan,
             indent = self.indent
         else:
             indent = ' ' * self.indent
-        if _one_shot and c_make_encoder is not None:
+        if self.object_fields:
+            classes = self.object_fields
+            if not isinstance(classes, tuple):
+                classes = ()
+            object_plans = self._object_plans
+            if (object_plans is None or object_plans.encoder is not _encoder
+                    or object_plans.sort_keys != self.sort_keys
+                    or object_plans.classes != classes):
+                object_plans = _ObjectPlans(_encoder, self.sort_keys, classes)
+                self._object_plans = object_plans
+        else:
+            object_plans = None
+        if (_one_shot or _write is not None) and c_make_encoder is not None:
             _iterencode = c_make_encoder(
                 markers, self.default, _encoder, indent,
                 self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, self.allow_nan)
+                self.skipkeys, self.allow_nan, object_plans=object_plans)
+            if _write is not None:
+                return _iterencode(o, 0, _write=_write)
         else:
             _iterencode = _make_iterencode(
                 markers, self.default, _encoder, indent, floatstr,
                 self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, _one_shot)
+                self.skipkeys, _one_shot, object_plans)
+            if _write is not None:
+                _write_blocks(_iterencode(o, 0), _write)
+                return ()
         return _iterencode(o, 0)
 
+class _ObjectPlans(dict):
+    # Map a type to the fields encoded for its instances: a tuple of
+    # (attribute name, encoded key) pairs, or None if the instances are
+    # passed to default().  Plans are computed on first use.
+
+    def __init__(self, encoder, sort_keys, classes):
+        self.encoder = encoder
+        self.sort_keys = sort_keys
+        self.classes = classes
+
+    def __missing__(self, cls):
+        fields = _object_fields(cls, self.classes)
+        if fields is not None:
+            if self.sort_keys:
+                fields.sort(key=lambda field: field[1])
+            fields = tuple([(attr, self.encoder(key)) for attr, key in fields])
+        self[cls] = fields
+        return fields
+
+def _object_fields(cls, classes):
+    # Return the (attribute name, key) pairs of a dataclass, or of a class
+    # with __slots__ and no __dict__ that is a subclass of one of classes,
+    # or None for other classes.  Slotted classes must be opted in
+    # explicitly, since their slots are often private state: encoding a
+    # Fraction or an IPv4Address from its slots would be wrong.
+    if hasattr(cls, '__dataclass_fields__'):
+        import dataclasses
+        return [(f.name, f.name) for f in dataclasses.fields(cls)]
+    if (not issubclass(cls, classes) or cls.__dictoffset__
+            or not hasattr(cls, '__slots__')):
+        return None
+    fields = []
+    for base in reversed(cls.__mro__):
+        slots = base.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            # Skip private slots (which also covers the mangled __names),
+            # __dict__ and __weakref__.
+            if not name.startswith('_') and name not in fields:
+                fields.append(name)
+    return [(name, name) for name in fields]
+
+def _write_blocks(chunks, write, size=64 * 1024):
+    # Join the small chunks produced by _make_iterencode() into blocks of
+    # about size characters, to call write() less often.
+    block = []
+    length = 0
+    for chunk in chunks:
+        block.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            write(''.join(block))
+            block.clear()
+            length = 0
+    if block:
+        write(''.join(block))
+
 def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         _key_separator, _item_separator, _sort_keys, _skipkeys, _one_shot,
+        _object_plans=None,
         ## HACK: hand-optimized bytecode; turn globals into locals
         ValueError=ValueError,
         dict=dict,
@@ -420,6 +508,48 @@ def _iterencode_dict(dct, _current_indent_level):
         if markers is not None:
             del markers[markerid]
 
+    def _iterencode_fields(o, plan, _current_indent_level):
+        if markers is not None:
+            markerid = id(o)
+            if markerid in markers:
+                raise ValueError("Circular reference detected")
+            markers[markerid] = o
+        yield '{'
+        if _indent is not None:
+            _current_indent_level += 1
+            newline_indent = '\n' + _indent * _current_indent_level
+            item_separator = _item_separator + newline_indent
+        else:
+            newline_indent = None
+            item_separator = _item_separator
+        first = True
+        for attr, key in plan:
+            try:
+                value = getattr(o, attr)
+            except AttributeError:
+                continue
+            if first:
+                first = False
+                if newline_indent is not None:
+                    yield newline_indent
+            else:
+                yield item_separator
+            yield key
+            yield _key_separator
+            try:
+                yield from _iterencode(value, _current_indent_level)
+            except GeneratorExit:
+                raise
+            except BaseException as exc:
+                exc.add_note(f'when serializing {type(o).__name__} field {attr!r}')
+                raise
+        if newline_indent is not None and not first:
+            _current_indent_level -= 1
+            yield '\n' + _indent * _current_indent_level
+        yield '}'
+        if markers is not None:
+            del markers[markerid]
+
     def _iterencode(o, _current_indent_level):
         if isinstance(o, str):
             yield _encoder(o)
@@ -440,6 +570,11 @@ def _iterencode(o, _current_indent_level):
         elif isinstance(o, dict):
             yield from _iterencode_dict(o, _current_indent_level)
         else:
+            if _object_plans is not None:
+                plan = _object_plans[type(o)]
+                if plan is not None:
+                    yield from _iterencode_fields(o, plan, _current_indent_level)
+                    return
             if markers is not None:
                 markerid = id(o)
                 if markerid in markers:
@@ -296,9 +296,14 @@ class LogRecord(object):
     information to be logged.
     """
     def __init__(self, name, level, pathname, lineno,
-                 msg, args, exc_info, func=None, sinfo=None, **kwargs):
+                 msg, args, exc_info, func=None, sinfo=None, *,
+                 attributes=None, **kwargs):
         """
         Initialize a logging record with interesting information.
+
+        If attributes is not None, the threadName, processName and taskName
+        attributes are only looked up if they are in it, and are None
+        otherwise.
         """
         ct = time.time_ns()
         self.name = name
@@ -352,12 +357,17 @@ def __init__(self, name, level, pathname, lineno,
         self.relativeCreated = (ct - _startTime) / 1e6
         if logThreads:
             self.thread = threading.get_ident()
-            self.threadName = threading.current_thread().name
+            if attributes is None or 'threadName' in attributes:
+                self.threadName = threading.current_thread().name
+            else:
+                self.threadName = None
         else: # pragma: no cover
             self.thread = None
             self.threadName = None
         if not logMultiprocessing: # pragma: no cover
             self.processName = None
+        elif attributes is not None and 'processName' not in attributes:
+            self.processName = None
         else:
             self.processName = 'MainProcess'
             mp = sys.modules.get('multiprocessing')
@@ -376,7 +386,8 @@ def __init__(self, name, level, pathname, lineno,
             self.process = None
 
         self.taskName = None
-        if logAsyncioTasks:
+        if logAsyncioTasks and (attributes is None
+                                or 'taskName' in attributes):
             asyncio = sys.modules.get('asyncio')
             if asyncio:
                 try:
@@ -400,6 +411,16 @@ def getMessage(self):
             msg = msg % self.args
         return msg
 
+# The LogRecord attributes which require to find the caller's frame.
+_CALLER_ATTRIBUTES = frozenset({'pathname', 'filename', 'module', 'lineno',
+                                'funcName'})
+
+def _addExtra(record, extra):
+    for key in extra:
+        if (key in ["message", "asctime"]) or (key in record.__dict__):
+            raise KeyError("Attempt to overwrite %r in LogRecord" % key)
+        record.__dict__[key] = extra[key]
+
 #
 #   Determine which class to use when instantiating log records.
 #
@@ -455,6 +476,26 @@ def __init__(self, fmt, *, defaults=None):
     def usesTime(self):
         return self._fmt.find(self.asctime_search) >= 0
 
+    _used_attributes = (None, None)
+
+    def usedAttributes(self):
+        """
+        Return the set of the record attributes referenced by the format,
+        or None if it cannot be parsed.
+        """
+        fmt, attributes = self._used_attributes
+        if fmt is not self._fmt:
+            fmt = self._fmt
+            try:
+                attributes = frozenset(self._parseAttributes(fmt))
+            except ValueError:
+                attributes = None
+            self._used_attributes = (fmt, attributes)
+        return attributes
+
+    def _parseAttributes(self, fmt):
+        return re.findall(r'%\(([^)]*)\)', fmt)
+
     def validate(self):
         """Validate the input format, ensure it matches the correct style"""
         if not self.validation_pattern.search(self._fmt):
@@ -489,6 +530,16 @@ def _format(self, record):
             values = record.__dict__
         return self._fmt.format(**values)
 
+    def _parseAttributes(self, fmt):
+        attributes = []
+        for _, fieldname, spec, _ in _str_formatter.parse(fmt):
+            if fieldname:
+                attributes.append(re.match(r'[^.[]*', fieldname).group())
+            if spec:
+                # The format spec can contain nested fields.
+                attributes.extend(self._parseAttributes(spec))
+        return attributes
+
     def validate(self):
         """Validate the input format, ensure it is the correct string formatting style"""
         fields = set()
@@ -521,6 +572,11 @@ def usesTime(self):
         fmt = self._fmt
         return fmt.find('$asctime') >= 0 or fmt.find(self.asctime_search) >= 0
 
+    def _parseAttributes(self, fmt):
+        return [m['named'] or m['braced']
+                for m in Template.pattern.finditer(fmt)
+                if m['named'] or m['braced']]
+
     def validate(self):
         pattern = Template.pattern
         fields = set()
@@ -679,6 +735,29 @@ def usesTime(self):
         """
         return self._style.usesTime()
 
+    def usedAttributes(self):
+        """
+        Return the set of the LogRecord attributes used to format a record,
+        or None if they are not known.
+
+        The attributes which format() handles itself, such as message,
+        asctime and exc_info, are not included. None is returned if
+        format() or formatMessage() are overridden in a subclass which does
+        not override this method.
+        """
+        cls = type(self)
+        try:
+            known = _formatterAttributesKnown[cls]
+        except KeyError:
+            known = _formatterAttributesKnown[cls] = _defined_first(
+                cls, 'usedAttributes', ('format', 'formatMessage'))
+        if not known:
+            return None
+        try:
+            return self._style.usedAttributes()
+        except AttributeError:
+            return None
+
     def formatMessage(self, record):
         return self._style.format(record)
 
@@ -1026,6 +1105,63 @@ def handle(self, record):
                 self.emit(record)
         return rv
 
+    def usedAttributes(self):
+        """
+        Return the set of the LogRecord attributes used by this handler, or
+        None if they are not known.
+
+        Loggers skip the lookup of the attributes which are costly to
+        compute, such as the caller's file name and line number, when no
+        handler uses them. This version returns None; subclasses which know
+        what they output should override it.
+        """
+        return None
+
+    def _formatterAttributes(self):
+        # Return the attributes used by the formatter if the handler has no
+        # filters other than logging.Filter, and the class does not override
+        # the methods which handle records more deeply than usedAttributes().
+        if not _handler_attributes_known(type(self)):
+            return None
+        if self.filters:
+            for f in self.filters:
+                if type(f) is not Filter:
+                    return None
+        return (self.formatter or _defaultFormatter).usedAttributes()
+
+    def emitBatch(self, records):
+        """
+        Emit a sequence of logging records.
+
+        This version calls emit() for each record. Subclasses may override
+        it to output the records at once.
+        """
+        for record in records:
+            self.emit(record)
+
+    def handleBatch(self, records):
+        """
+        Conditionally emit a sequence of logging records.
+
+        Each record is filtered as in handle(), and the records which pass
+        the filters are emitted by a single call to emitBatch(), with the
+        I/O thread lock held. If a subclass overrides emit() but not
+        emitBatch(), emit() is called for each record instead.
+        """
+        batch = []
+        for record in records:
+            rv = self.filter(record)
+            if isinstance(rv, LogRecord):
+                record = rv
+            if rv:
+                batch.append(record)
+        if batch:
+            with self.lock:
+                if _emits_batches(type(self)):
+                    self.emitBatch(batch)
+                else:
+                    Handler.emitBatch(self, batch)
+
     def setFormatter(self, fmt):
         """
         Set the formatter for this handler.
@@ -1082,10 +1218,14 @@ def handleError(self, record):
                     frame = frame.f_back
                 if frame:
                     traceback.print_stack(frame, file=sys.stderr)
-                else:
+                elif record.lineno:
                     # couldn't find the right stack frame, for some reason
                     sys.stderr.write('Logged from file %s, line %s\n' % (
                                      record.filename, record.lineno))
+                else:
+                    # The caller's location was not looked up, since no
+                    # handler uses it (see usedAttributes()).
+                    sys.stderr.write('Logged to logger %r\n' % record.name)
                 # Issue 18671: output logging message and arguments
                 try:
                     sys.stderr.write('Message: %r\n'
@@ -1107,6 +1247,37 @@ def __repr__(self):
         level = getLevelName(self.level)
         return '<%s (%s)>' % (self.__class__.__name__, level)
 
+def _defined_first(cls, name, others):
+    # Return whether the method name is defined in cls at least as deep as
+    # all the methods in others, so that it can rely on their behaviour.
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return True
+        if any(other in klass.__dict__ for other in others):
+            return False
+    return False
+
+# Caches of whether the usedAttributes() method of handler and formatter
+# classes can be relied on, and whether logger classes make and handle
+# records as Logger does.
+_handlerAttributesKnown = {}
+_formatterAttributesKnown = {}
+_loggerAttributesKnown = {}
+
+def _handler_attributes_known(cls):
+    try:
+        return _handlerAttributesKnown[cls]
+    except KeyError:
+        known = _handlerAttributesKnown[cls] = _defined_first(
+            cls, 'usedAttributes',
+            ('handle', 'handleBatch', 'emit', 'emitBatch', 'format',
+             'filter', 'handleError', 'shouldRollover'))
+        return known
+
+def _emits_batches(cls):
+    # Return whether emitBatch() outputs the records the way emit() would.
+    return _defined_first(cls, 'emitBatch', ('emit',))
+
 class StreamHandler(Handler):
     """
     A handler class which writes logging records, appropriately formatted,
@@ -1157,6 +1328,36 @@ def emit(self, record):
         except Exception:
             self.handleError(record)
 
+    def usedAttributes(self):
+        """
+        Return the set of the LogRecord attributes used by the formatter.
+        """
+        return self._formatterAttributes()
+
+    def emitBatch(self, records):
+        """
+        Emit a sequence of records.
+
+        The records are formatted, then written to the stream by a single
+        call to its writelines() method, and the stream is flushed once.
+        """
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.format(record) + self.terminator)
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(record)
+        if lines:
+            try:
+                self.stream.writelines(lines)
+                self.flush()
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(records[-1])
+
     def setStream(self, stream):
         """
         Sets the StreamHandler's stream to the specified value,
@@ -1263,6 +1464,19 @@ def emit(self, record):
         if self.stream:
             StreamHandler.emit(self, record)
 
+    def emitBatch(self, records):
+        """
+        Emit a sequence of records.
+
+        If the stream was not opened because 'delay' was specified in the
+        constructor, open it before calling the superclass's emitBatch.
+        """
+        if self.stream is None:
+            if self.mode != 'w' or not self._closed:
+                self.stream = self._open()
+        if self.stream:
+            StreamHandler.emitBatch(self, records)
+
     def __repr__(self):
         level = getLevelName(self.level)
         return '<%s %s (%s)>' % (self.__class__.__name__, self.baseFilename, level)
@@ -1631,20 +1845,67 @@ def makeRecord(self, name, level, fn, lno, msg, args, exc_info,
         rv = _logRecordFactory(name, level, fn, lno, msg, args, exc_info, func,
                              sinfo)
         if extra is not None:
-            for key in extra:
-                if (key in ["message", "asctime"]) or (key in rv.__dict__):
-                    raise KeyError("Attempt to overwrite %r in LogRecord" % key)
-                rv.__dict__[key] = extra[key]
+            _addExtra(rv, extra)
         return rv
 
+    def _usedAttributes(self, level):
+        """
+        Return a tuple (handled, attributes): whether a record of the given
+        level would be passed to a handler, and the set of the LogRecord
+        attributes used by those handlers, or None if they are not known.
+        """
+        # Filters, a custom record factory or a subclass overriding how
+        # records are made and handled may use any attribute.
+        if self.filters or _logRecordFactory is not LogRecord:
+            return True, None
+        cls = type(self)
+        try:
+            known = _loggerAttributesKnown[cls]
+        except KeyError:
+            known = _loggerAttributesKnown[cls] = _defined_first(
+                cls, '_log', ('makeRecord', 'handle', 'callHandlers'))
+        if not known:
+            return True, None
+        attributes = None
+        found = False
+        c = self
+        while c:
+            for hdlr in c.handlers:
+                found = True
+                if level >= hdlr.level:
+                    try:
+                        used = hdlr.usedAttributes()
+                    except AttributeError:
+                        used = None
+                    if used is None:
+                        return True, None
+                    if attributes is None:
+                        attributes = used
+                    else:
+                        attributes = attributes | used
+            if not c.propagate:
+                break
+            c = c.parent
+        if not found:
+            # Let callHandlers() use lastResort or warn.
+            return True, None
+        return attributes is not None, attributes
+
     def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False,
              stacklevel=1):
         """
         Low-level logging routine which creates a LogRecord and then calls
         all the handlers of this logger to handle the record.
         """
+        handled, attributes = self._usedAttributes(level)
+        if not handled:
+            return
         sinfo = None
-        if _srcfile:
+        if (attributes is not None and not stack_info
+                and attributes.isdisjoint(_CALLER_ATTRIBUTES)):
+            # No handler outputs the location of the logging call.
+            fn, lno, func = "(unknown file)", 0, "(unknown function)"
+        elif _srcfile:
             #IronPython doesn't track Python frames, so findCaller raises an
             #exception on some versions of IronPython. We trap it here so that
             #IronPython can use logging.
@@ -1659,8 +1920,14 @@ def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False,
                 exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
             elif not isinstance(exc_info, tuple):
                 exc_info = sys.exc_info()
-        record = self.makeRecord(self.name, level, fn, lno, msg, args,
-                                 exc_info, func, extra, sinfo)
+        if attributes is None:
+            record = self.makeRecord(self.name, level, fn, lno, msg, args,
+                                     exc_info, func, extra, sinfo)
+        else:
+            record = LogRecord(self.name, level, fn, lno, msg, args,
+                               exc_info, func, sinfo, attributes=attributes)
+            if extra is not None:
+                _addExtra(record, extra)
         self.handle(record)
 
     def handle(self, record):
@@ -2277,6 +2544,11 @@ def handle(self, record):
     def emit(self, record):
         """Stub."""
 
+    def usedAttributes(self):
+        if not _handler_attributes_known(type(self)):
+            return None
+        return frozenset()
+
     def createLock(self):
         self.lock = None
 
@@ -777,6 +777,7 @@ def configure_handler(self, config):
                                  '%r' % formatter) from e
         level = config.pop('level', None)
         filters = config.pop('filters', None)
+        async_options = config.pop('async', None)
         if '()' in config:
             c = config.pop('()')
             if not callable(c):
@@ -886,6 +887,20 @@ def configure_handler(self, config):
         if props:
             for name, value in props.items():
                 setattr(result, name, value)
+        if async_options:
+            result = self._configure_async_handler(result, async_options)
+        return result
+
+    def _configure_async_handler(self, handler, options):
+        """Wrap a handler in an AsyncHandler."""
+        if options is True:
+            options = {}
+        elif isinstance(options, dict):
+            options = {k: options[k] for k in options}
+        else:
+            raise TypeError('Invalid async specifier %r' % options)
+        result = logging.handlers.AsyncHandler(handler, **options)
+        result.setLevel(handler.level)
         return result
 
     def add_handlers(self, logger, handlers):
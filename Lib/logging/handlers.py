@@ -82,6 +82,12 @@ def emit(self, record):
         except Exception:
             self.handleError(record)
 
+    def usedAttributes(self):
+        """
+        Return the set of the LogRecord attributes used by the formatter.
+        """
+        return self._formatterAttributes()
+
     def rotation_filename(self, default_name):
         """
         Modify the filename of a log file when rotating.
@@ -186,6 +192,13 @@ def doRollover(self):
         if not self.delay:
             self.stream = self._open()
 
+    def usedAttributes(self):
+        """
+        Return the set of the LogRecord attributes used by the formatter.
+        """
+        # shouldRollover() uses no other attributes than the formatter.
+        return self._formatterAttributes()
+
     def shouldRollover(self, record):
         """
         Determine if rollover should occur.
@@ -360,6 +373,13 @@ def computeRollover(self, currentTime):
                     result += addend
         return result
 
+    def usedAttributes(self):
+        """
+        Return the set of the LogRecord attributes used by the formatter.
+        """
+        # shouldRollover() uses no other attributes than the formatter.
+        return self._formatterAttributes()
+
     def shouldRollover(self, record):
         """
         Determine if rollover should occur.
@@ -457,6 +477,239 @@ def doRollover(self):
             self.stream = self._open()
         self.rolloverAt = self.computeRollover(currentTime)
 
+class CompressingRotatingFileHandler(TimedRotatingFileHandler):
+    """
+    Handler for logging to a file, rotating the log file when it reaches a
+    certain size or at certain timed intervals.
+
+    The rotated files are compressed, and the oldest ones deleted, by a
+    background thread, so that the thread which logs a record only pays
+    for renaming the file.
+    """
+    def __init__(self, filename, when=None, interval=1, maxBytes=0,
+                 backupCount=0, maxTotalBytes=0, compression='gzip',
+                 encoding=None, delay=False, utc=False, atTime=None,
+                 errors=None):
+        """
+        Open the specified file and use it as the stream for logging.
+
+        Rollover occurs whenever the current log file is nearly maxBytes in
+        length, unless maxBytes is zero, and at the times given by when,
+        interval and atTime as for TimedRotatingFileHandler, unless when is
+        None. The file is renamed with the date and time of the rollover
+        appended, e.g. "app.log.2026-10-17_09-40-00", followed by ".1",
+        ".2" etc. if several rollovers occur in the same second.
+
+        The renamed file is then compressed by a background thread, as
+        specified by compression ('gzip', 'bz2', 'lzma' or None), and the
+        oldest rotated files are deleted so that no more than backupCount
+        of them are kept, using no more than maxTotalBytes bytes in total.
+        A limit of zero means that there is no such limit.
+        """
+        if compression == 'gzip':
+            import gzip
+            self._compressor = gzip.open
+            self.extension = '.gz'
+        elif compression == 'bz2':
+            import bz2
+            self._compressor = bz2.open
+            self.extension = '.bz2'
+        elif compression == 'lzma':
+            import lzma
+            self._compressor = lzma.open
+            self.extension = '.xz'
+        elif compression is None:
+            self._compressor = None
+            self.extension = ''
+        else:
+            raise ValueError("Invalid compression specified: %s" % compression)
+        TimedRotatingFileHandler.__init__(self, filename, when=when or 'H',
+                                          interval=interval,
+                                          backupCount=backupCount,
+                                          encoding=encoding, delay=delay,
+                                          utc=utc, atTime=atTime,
+                                          errors=errors)
+        if when is None:
+            # No timed rollover.
+            self.when = None
+            self.rolloverAt = None
+        self.compression = compression
+        self.maxBytes = maxBytes
+        self.maxTotalBytes = maxTotalBytes
+        self.suffix = "%Y-%m-%d_%H-%M-%S"
+        self.extMatch = re.compile(
+            r"(?<!\d)\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}(?:\.\d+)?(?!\d)",
+            re.ASCII)
+        self._thread = None
+        self._jobs = None
+        # The name and count of the last rotated file.
+        self._last_rotated = None
+
+    def usedAttributes(self):
+        """
+        Return the set of the LogRecord attributes used by the formatter.
+        """
+        # shouldRollover() uses no other attributes than the formatter.
+        return self._formatterAttributes()
+
+    def shouldRollover(self, record):
+        """
+        Determine if rollover should occur.
+
+        This is the case when the rollover time has been reached, or when
+        the supplied record would cause the file to exceed the size limit.
+        """
+        if (self.rolloverAt is not None and
+                TimedRotatingFileHandler.shouldRollover(self, record)):
+            return True
+        if self.maxBytes > 0:
+            if self.stream is None:             # delay was set...
+                self.stream = self._open()
+            pos = self.stream.tell()
+            if not pos:
+                # Never rollover an empty file
+                return False
+            msg = "%s\n" % self.format(record)
+            if pos + len(msg) >= self.maxBytes:
+                # Never rollover anything other than regular files
+                if os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename):
+                    return False
+                return True
+        return False
+
+    def getFilesToDelete(self):
+        """
+        Determine the rotated files to delete, oldest first, so that no
+        more than backupCount files and maxTotalBytes bytes are kept.
+        """
+        dirName, baseName = os.path.split(self.baseFilename)
+        rotated = []
+        for fileName in os.listdir(dirName):
+            # The files may be compressed, and custom named. Find the date
+            # and time suffix and verify that the file name can be
+            # generated by this handler.
+            m = self.extMatch.search(fileName)
+            while m:
+                dfn = os.path.basename(
+                    self.rotation_filename(self.baseFilename + "." + m[0]))
+                if fileName == dfn or fileName == dfn + self.extension:
+                    stamp, _, count = m[0].partition(".")
+                    rotated.append(((stamp, int(count or 0)),
+                                    os.path.join(dirName, fileName)))
+                    break
+                m = self.extMatch.search(fileName, m.start() + 1)
+        rotated.sort()
+        rotated = [path for key, path in rotated]
+        result = []
+        if 0 < self.backupCount < len(rotated):
+            result = rotated[:len(rotated) - self.backupCount]
+            del rotated[:len(result)]
+        if self.maxTotalBytes > 0:
+            sizes = [os.path.getsize(path) for path in rotated]
+            total = sum(sizes)
+            for path, size in zip(rotated, sizes):
+                if total <= self.maxTotalBytes:
+                    break
+                result.append(path)
+                total -= size
+        return result
+
+    def doRollover(self):
+        """
+        Do a rollover, as described in __init__().
+
+        The file is only renamed; it is compressed, and the oldest rotated
+        files are deleted, by the background thread.
+        """
+        currentTime = int(time.time())
+        if self.utc:
+            timeTuple = time.gmtime(currentTime)
+        else:
+            timeTuple = time.localtime(currentTime)
+        name = self.baseFilename + "." + time.strftime(self.suffix, timeTuple)
+        count = 0
+        if self._last_rotated is not None and self._last_rotated[0] == name:
+            # The background thread may already have deleted the files
+            # rotated earlier in the same second: do not reuse their names,
+            # which would sort before the newer files.
+            count = self._last_rotated[1] + 1
+        while True:
+            if count:
+                dfn = self.rotation_filename("%s.%d" % (name, count))
+            else:
+                dfn = self.rotation_filename(name)
+            if not (os.path.exists(dfn)
+                    or os.path.exists(dfn + self.extension)):
+                break
+            count += 1
+        self._last_rotated = (name, count)
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        self.rotate(self.baseFilename, dfn)
+        if not self.delay:
+            self.stream = self._open()
+        if self.rolloverAt is not None:
+            self.rolloverAt = self.computeRollover(currentTime)
+        with self.lock:
+            if self._thread is None:
+                self._jobs = queue.SimpleQueue()
+                self._thread = threading.Thread(
+                    target=self._compress_rotated, args=(self._jobs,),
+                    name='CompressingRotatingFileHandler', daemon=True)
+                self._thread.start()
+            self._jobs.put(dfn)
+
+    def _compress_rotated(self, jobs):
+        # Run in the background thread: compress the rotated files, then
+        # delete the oldest ones.
+        while (path := jobs.get()) is not None:
+            try:
+                # The file may have been deleted already, or not created if
+                # delay is True.
+                if self._compressor is not None and os.path.exists(path):
+                    self.compress(path, path + self.extension)
+                for fileName in self.getFilesToDelete():
+                    os.remove(fileName)
+            except Exception:
+                self.handleError(logging.makeLogRecord({
+                    'msg': 'Cannot compress or delete rotated log file %s',
+                    'args': (path,),
+                }))
+
+    def compress(self, source, dest):
+        """
+        Compress the rotated file source to dest, then remove source.
+
+        This is called by the background thread.
+        """
+        temp = dest + ".tmp"
+        with open(source, 'rb') as src, self._compressor(temp, 'wb') as dst:
+            while data := src.read(1 << 20):
+                dst.write(data)
+        os.replace(temp, dest)
+        os.remove(source)
+
+    def close(self):
+        """
+        Close the file, and wait until the background thread has compressed
+        the rotated files.
+        """
+        with self.lock:
+            thread = self._thread
+            jobs = self._jobs
+            self._thread = self._jobs = None
+            TimedRotatingFileHandler.close(self)
+        if thread is not None:
+            jobs.put(None)
+            thread.join()
+
+    def _at_fork_reinit(self):
+        # The background thread does not exist in a child process. The
+        # files rotated before the fork are compressed by the parent.
+        TimedRotatingFileHandler._at_fork_reinit(self)
+        self._thread = self._jobs = None
+
 class WatchedFileHandler(logging.FileHandler):
     """
     A handler for logging to a file, which watches the file
@@ -1503,15 +1756,22 @@ class QueueListener(object):
     """
     _sentinel = None
 
-    def __init__(self, queue, *handlers, respect_handler_level=False):
+    def __init__(self, queue, *handlers, respect_handler_level=False,
+                 batch_size=1):
         """
         Initialise an instance with the specified queue and
         handlers.
+
+        If batch_size is greater than 1, up to that many records which are
+        waiting in the queue are passed to the handlers at once.
         """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
         self.queue = queue
         self.handlers = handlers
         self._thread = None
         self.respect_handler_level = respect_handler_level
+        self.batch_size = batch_size
 
     def dequeue(self, block):
         """
@@ -1559,6 +1819,23 @@ def handle(self, record):
             if process:
                 handler.handle(record)
 
+    def handleBatch(self, records):
+        """
+        Handle a list of records.
+
+        This passes the records to the handleBatch() method of each
+        handler, so that they are formatted and output at once.
+        """
+        records = [self.prepare(record) for record in records]
+        for handler in self.handlers:
+            if not self.respect_handler_level:
+                batch = records
+            else:
+                batch = [record for record in records
+                         if record.levelno >= handler.level]
+            if batch:
+                handler.handleBatch(batch)
+
     def _monitor(self):
         """
         Monitor the queue for records, and ask the handler
@@ -1571,14 +1848,27 @@ def _monitor(self):
         has_task_done = hasattr(q, 'task_done')
         while True:
             try:
-                record = self.dequeue(True)
-                if record is self._sentinel:
-                    if has_task_done:
+                records = [self.dequeue(True)]
+                # Take the records which are already waiting, without
+                # blocking, up to batch_size.
+                while (len(records) < self.batch_size
+                       and records[-1] is not self._sentinel):
+                    try:
+                        records.append(self.dequeue(False))
+                    except queue.Empty:
+                        break
+                stop = records[-1] is self._sentinel
+                if stop:
+                    del records[-1]
+                if len(records) == 1:
+                    self.handle(records[0])
+                elif records:
+                    self.handleBatch(records)
+                if has_task_done:
+                    for _ in range(len(records) + stop):
                         q.task_done()
+                if stop:
                     break
-                self.handle(record)
-                if has_task_done:
-                    q.task_done()
             except queue.Empty:
                 break
 
@@ -1604,3 +1894,143 @@ def stop(self):
             self.enqueue_sentinel()
             self._thread.join()
             self._thread = None
+
+
+class _AsyncListener(QueueListener):
+    def enqueue_sentinel(self):
+        # The queue is bounded: wait for room for the sentinel.
+        self.queue.put(self._sentinel)
+
+
+class AsyncHandler(logging.Handler):
+    """
+    A handler which only puts records in a bounded queue. The records are
+    taken off the queue in batches by a background thread, which formats
+    them and passes them to other handlers.
+
+    Since the records are formatted later, mutable objects passed as
+    arguments of a logging call should not be modified after the call.
+    """
+
+    def __init__(self, *handlers, maxsize=10000, overflow='block',
+                 sample_rate=10, batch_size=100, respect_handler_level=True):
+        """
+        Initialise the handler with the handlers which output the records.
+
+        When the queue already holds maxsize records, the overflow policy
+        decides what happens to a new record: 'block' waits for room in
+        the queue, 'drop' discards it, and 'sample' waits for room for one
+        record out of every sample_rate and discards the others.
+        """
+        if overflow not in ('block', 'drop', 'sample'):
+            raise ValueError('overflow must be one of '
+                             "'block', 'drop' or 'sample'")
+        if sample_rate < 1:
+            raise ValueError('sample_rate must be at least 1')
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+        logging.Handler.__init__(self)
+        self.handlers = handlers
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.sample_rate = sample_rate
+        self.batch_size = batch_size
+        self.respect_handler_level = respect_handler_level
+        self.dropped = 0
+        self._overflowed = 0
+        self.listener = None
+
+    def _start(self):
+        with self.lock:
+            if self.listener is None:
+                listener = _AsyncListener(
+                    queue.Queue(self.maxsize), *self.handlers,
+                    respect_handler_level=self.respect_handler_level,
+                    batch_size=self.batch_size)
+                listener.start()
+                self.listener = listener
+            return self.listener
+
+    def handle(self, record):
+        """
+        Conditionally emit the specified logging record.
+
+        Unlike other handlers, the I/O thread lock is not acquired, since
+        the queue is thread-safe.
+        """
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record):
+        """
+        Emit a record.
+
+        The record is put in the queue as is, and the background thread is
+        started if needed.
+        """
+        listener = self.listener
+        if listener is None:
+            if self._closed:
+                return
+            listener = self._start()
+        try:
+            listener.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow != 'block':
+                with self.lock:
+                    self._overflowed += 1
+                    if (self.overflow == 'drop'
+                            or self._overflowed % self.sample_rate):
+                        self.dropped += 1
+                        return
+            listener.queue.put(record)
+
+    def usedAttributes(self):
+        """
+        Return the set of the LogRecord attributes used by the handlers
+        which the records are passed to.
+        """
+        if not logging._handler_attributes_known(type(self)):
+            return None
+        for f in self.filters:
+            if type(f) is not logging.Filter:
+                return None
+        attributes = set()
+        for handler in self.handlers:
+            used = handler.usedAttributes()
+            if used is None:
+                return None
+            attributes.update(used)
+        return attributes
+
+    def flush(self):
+        """
+        Wait until the records in the queue have been handled.
+        """
+        listener = self.listener
+        if listener is not None:
+            listener.queue.join()
+
+    def close(self):
+        """
+        Handle the records left in the queue, stop the background thread
+        and close the handler.
+
+        The handlers which the records are passed to are not closed.
+        """
+        with self.lock:
+            listener = self.listener
+            self.listener = None
+            logging.Handler.close(self)
+        if listener is not None:
+            listener.stop()
+
+    def _at_fork_reinit(self):
+        # The background thread does not exist in a child process. A new
+        # one is started with a new queue when a record is emitted.
+        logging.Handler._at_fork_reinit(self)
+        self.listener = None
@@ -609,7 +609,3 @@ def main():
     else:
         parser.print_usage()
     return parser
-
-# When invoked as main program, invoke the profiler on a script
-if __name__ == '__main__':
-    main()
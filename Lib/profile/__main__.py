@@ -0,0 +1,6 @@
+"""Profile a script or module: ``python -m profile [options] scriptfile``."""
+from profile import main
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,303 @@
+"""Statistical sampling profiler for running Python processes.
+
+Unlike the deterministic profilers in :mod:`profile` and :mod:`cProfile`,
+the sampler does not run inside the target process.  It periodically
+reads the Python call stacks of every thread straight out of the target's
+memory, so the profiled program runs at full speed and does not need to
+be restarted::
+
+    python -m profile.sample 1234
+    python -m profile.sample -d 30 -i 1000 --collapsed -o stacks.txt 1234
+
+The samples can be aggregated into a :class:`pstats.Stats` compatible
+profile or into collapsed stacks, the input format of most flame graph
+tools.
+"""
+
+import collections
+import os
+import sys
+import time
+
+try:
+    from _remote_debugging import get_all_stack_traces
+except ImportError:
+    get_all_stack_traces = None
+
+__all__ = ["SampleProfiler", "PstatsCollector", "CollapsedStackCollector",
+           "sample"]
+
+
+class PstatsCollector:
+    """Aggregate stack samples into :mod:`pstats` compatible statistics.
+
+    Each sample is assumed to account for *sample_interval_usec*
+    microseconds of run time.  A function's own time is the time of the
+    samples in which it was the innermost frame; its cumulative time is
+    the time of the samples in which it was anywhere on the stack.  The
+    call counts reported by :mod:`pstats` are sample counts.
+
+    An instance can be passed straight to :class:`pstats.Stats`.
+    """
+
+    def __init__(self, sample_interval_usec):
+        self.sample_interval_usec = sample_interval_usec
+        self.total_samples = 0
+        self.thread_samples = collections.Counter()
+        self._self_samples = collections.Counter()
+        self._cumulative_samples = collections.Counter()
+        self._caller_samples = collections.defaultdict(collections.Counter)
+        self.stats = {}
+
+    def collect(self, stack_traces):
+        """Add one sample, as returned by the stack reader.
+
+        *stack_traces* is a list of ``(thread_id, frames)`` pairs, where
+        *frames* lists ``(filename, lineno, funcname)`` tuples from the
+        innermost frame outwards.  Threads without Python frames are
+        ignored.
+        """
+        for thread_id, frames in stack_traces:
+            if not frames:
+                continue
+            self.total_samples += 1
+            self.thread_samples[thread_id] += 1
+            self._self_samples[frames[0]] += 1
+            # Recursive functions are only counted once per sample.
+            seen = set()
+            for i, func in enumerate(frames):
+                if func in seen:
+                    continue
+                seen.add(func)
+                self._cumulative_samples[func] += 1
+                if i + 1 < len(frames):
+                    self._caller_samples[func][frames[i + 1]] += 1
+
+    def create_stats(self):
+        """Build the ``stats`` dictionary read by :class:`pstats.Stats`."""
+        interval = self.sample_interval_usec / 1e6
+        stats = {}
+        for func, cumulative in self._cumulative_samples.items():
+            tt = self._self_samples[func] * interval
+            ct = cumulative * interval
+            callers = {}
+            for caller, count in self._caller_samples[func].items():
+                callers[caller] = (count, count, 0.0, count * interval)
+            stats[func] = (cumulative, cumulative, tt, ct, callers)
+        self.stats = stats
+
+    def print_stats(self, sort=-1, limit=None, stream=None):
+        """Print the profile, followed by the per-thread sample counts."""
+        import pstats
+        if stream is None:
+            stream = sys.stdout
+        stats = pstats.Stats(self, stream=stream)
+        stats.strip_dirs().sort_stats(sort)
+        if limit is None:
+            stats.print_stats()
+        else:
+            stats.print_stats(limit)
+        self.print_thread_breakdown(stream)
+
+    def print_thread_breakdown(self, stream=None):
+        """Print the number and share of samples taken in each thread."""
+        if stream is None:
+            stream = sys.stdout
+        print("   samples  percent  thread", file=stream)
+        for thread_id, count in self.thread_samples.most_common():
+            percent = 100.0 * count / self.total_samples
+            print(f"{count:10d} {percent:7.1f}%  {thread_id}", file=stream)
+
+    def dump_stats(self, file):
+        """Write the profile in the :mod:`marshal` format used by
+        :meth:`pstats.Stats.dump_stats`, so it can be loaded back later."""
+        import marshal
+        self.create_stats()
+        with open(file, 'wb') as f:
+            marshal.dump(self.stats, f)
+
+
+class CollapsedStackCollector:
+    """Aggregate stack samples into collapsed stacks.
+
+    Every distinct stack is written on its own line as semicolon separated
+    frames, from the outermost frame inwards, followed by the number of
+    samples in which it was seen.  This is the input format expected by
+    ``flamegraph.pl`` and compatible flame graph tools.
+
+    If *per_thread* is true, the thread identifier is used as the root of
+    every stack, so that each thread gets its own tower in the graph.
+    """
+
+    def __init__(self, per_thread=False):
+        self.per_thread = per_thread
+        self.stack_counter = collections.Counter()
+
+    def collect(self, stack_traces):
+        """Add one sample, as returned by the stack reader."""
+        for thread_id, frames in stack_traces:
+            if not frames:
+                continue
+            stack = tuple(f"{funcname} ({os.path.basename(filename)}:{lineno})"
+                          for filename, lineno, funcname in reversed(frames))
+            if self.per_thread:
+                stack = (f"thread {thread_id}",) + stack
+            self.stack_counter[stack] += 1
+
+    def export(self, stream=None):
+        """Write the collapsed stacks to *stream* (default: stdout)."""
+        if stream is None:
+            stream = sys.stdout
+        for stack, count in sorted(self.stack_counter.items()):
+            print(f"{';'.join(stack)} {count}", file=stream)
+
+
+class SampleProfiler:
+    """Take periodic stack samples of another Python process.
+
+    *pid* is the process to attach to; it must run the same Python version
+    as the profiler.  Reading the memory of another process usually needs
+    elevated privileges (for example ``CAP_SYS_PTRACE`` on Linux, or root
+    on macOS).
+    """
+
+    def __init__(self, pid, sample_interval_usec=1000):
+        if get_all_stack_traces is None:
+            raise RuntimeError("sampling profiler is not available "
+                               "on this platform")
+        if sample_interval_usec <= 0:
+            raise ValueError("sample_interval_usec must be greater than 0")
+        self.pid = pid
+        self.sample_interval_usec = sample_interval_usec
+        self.samples = 0
+        self.missed_samples = 0
+
+    def sample(self, collector, duration_sec=10):
+        """Feed samples to *collector* for *duration_sec* seconds.
+
+        Sampling stops early if the target process exits.  A sample is
+        counted as missed if the profiler falls behind its schedule, for
+        instance because reading the stacks took longer than the interval.
+        """
+        interval = self.sample_interval_usec / 1e6
+        start = time.perf_counter()
+        deadline = start + duration_sec
+        next_sample = start
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            if now < next_sample:
+                time.sleep(next_sample - now)
+            try:
+                stack_traces = get_all_stack_traces(self.pid)
+            except PermissionError:
+                raise
+            except (OSError, RuntimeError):
+                # The target process is gone (or shutting down).
+                if not _process_exists(self.pid):
+                    break
+                self.missed_samples += 1
+            else:
+                collector.collect(stack_traces)
+                self.samples += 1
+            next_sample += interval
+            behind = time.perf_counter() - next_sample
+            if behind > interval:
+                skipped = int(behind / interval)
+                self.missed_samples += skipped
+                next_sample += skipped * interval
+
+
+def _process_exists(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def sample(pid, *, sample_interval_usec=1000, duration_sec=10,
+           filename=None, output_format="pstats", sort="cumulative",
+           limit=None, per_thread=False):
+    """Sample process *pid* and print or save the result.
+
+    *output_format* is either ``"pstats"`` or ``"collapsed"``.  If
+    *filename* is given, the result is written to that file instead of
+    being printed: in the :mod:`marshal` format read by :class:`pstats.Stats`
+    for ``"pstats"``, and as text for ``"collapsed"``.
+    """
+    if output_format == "pstats":
+        collector = PstatsCollector(sample_interval_usec)
+    elif output_format == "collapsed":
+        collector = CollapsedStackCollector(per_thread=per_thread)
+    else:
+        raise ValueError(f"unknown output format: {output_format!r}")
+
+    profiler = SampleProfiler(pid, sample_interval_usec)
+    profiler.sample(collector, duration_sec)
+
+    if output_format == "pstats":
+        if filename is not None:
+            collector.dump_stats(filename)
+        else:
+            collector.print_stats(sort, limit)
+    elif filename is not None:
+        with open(filename, 'w', encoding='utf-8') as f:
+            collector.export(f)
+    else:
+        collector.export()
+    return profiler
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m profile.sample",
+        description="Take statistical samples of the Python stacks "
+                    "of a running process.")
+    parser.add_argument("pid", type=int, help="process ID to sample")
+    parser.add_argument("-i", "--interval", type=int, default=1000,
+                        metavar="USEC",
+                        help="sampling interval in microseconds "
+                             "(default: %(default)s)")
+    parser.add_argument("-d", "--duration", type=float, default=10,
+                        metavar="SEC",
+                        help="sampling duration in seconds "
+                             "(default: %(default)s)")
+    parser.add_argument("-o", "--outfile",
+                        help="save the result to OUTFILE instead of "
+                             "printing it")
+    parser.add_argument("--collapsed", dest="output_format",
+                        action="store_const", const="collapsed",
+                        default="pstats",
+                        help="output collapsed stacks for flame graphs "
+                             "instead of pstats statistics")
+    parser.add_argument("--per-thread", action="store_true",
+                        help="root every collapsed stack at its thread")
+    parser.add_argument("-s", "--sort", default="cumulative",
+                        help="pstats sort key (default: %(default)s)")
+    parser.add_argument("-l", "--limit", type=int, default=None,
+                        help="number of pstats entries to print")
+    args = parser.parse_args()
+
+    try:
+        profiler = sample(args.pid,
+                          sample_interval_usec=args.interval,
+                          duration_sec=args.duration,
+                          filename=args.outfile,
+                          output_format=args.output_format,
+                          sort=args.sort,
+                          limit=args.limit,
+                          per_thread=args.per_thread)
+    except (PermissionError, RuntimeError, ValueError) as exc:
+        parser.exit(1, f"{parser.prog}: error: {exc}\n")
+    print(f"Captured {profiler.samples} samples "
+          f"({profiler.missed_samples} missed).", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
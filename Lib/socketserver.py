@@ -126,23 +126,30 @@ class will essentially render the service "deaf" while one request is
 import socket
 import selectors
 import os
+import queue
+import signal
 import sys
 import threading
 from io import BufferedIOBase
-from time import monotonic as time
+from time import monotonic as time, sleep
 
 __all__ = ["BaseServer", "TCPServer", "UDPServer",
            "ThreadingUDPServer", "ThreadingTCPServer",
+           "ThreadPoolUDPServer", "ThreadPoolTCPServer",
            "BaseRequestHandler", "StreamRequestHandler",
-           "DatagramRequestHandler", "ThreadingMixIn"]
+           "DatagramRequestHandler", "ThreadingMixIn", "ThreadPoolMixIn"]
 if hasattr(os, "fork"):
-    __all__.extend(["ForkingUDPServer","ForkingTCPServer", "ForkingMixIn"])
+    __all__.extend(["ForkingUDPServer","ForkingTCPServer", "ForkingMixIn",
+                    "PreForkUDPServer", "PreForkTCPServer", "PreForkMixIn"])
 if hasattr(socket, "AF_UNIX"):
     __all__.extend(["UnixStreamServer","UnixDatagramServer",
                     "ThreadingUnixStreamServer",
-                    "ThreadingUnixDatagramServer"])
+                    "ThreadingUnixDatagramServer",
+                    "ThreadPoolUnixStreamServer",
+                    "ThreadPoolUnixDatagramServer"])
     if hasattr(os, "fork"):
-        __all__.extend(["ForkingUnixStreamServer", "ForkingUnixDatagramServer"])
+        __all__.extend(["ForkingUnixStreamServer", "ForkingUnixDatagramServer",
+                        "PreForkUnixStreamServer", "PreForkUnixDatagramServer"])
 
 # poll/select have the advantage of not requiring any extra file descriptor,
 # contrarily to epoll/kqueue (also, they require a single syscall).
@@ -224,26 +231,34 @@ def serve_forever(self, poll_interval=0.5):
         """
         self.__is_shut_down.clear()
         try:
-            # XXX: Consider using another file descriptor or connecting to the
-            # socket to wake this up instead of polling. Polling reduces our
-            # responsiveness to a shutdown request and wastes cpu at all other
-            # times.
-            with _ServerSelector() as selector:
-                selector.register(self, selectors.EVENT_READ)
-
-                while not self.__shutdown_request:
-                    ready = selector.select(poll_interval)
-                    # bpo-35017: shutdown() called during select(), exit immediately.
-                    if self.__shutdown_request:
-                        break
-                    if ready:
-                        self._handle_request_noblock()
-
-                    self.service_actions()
+            self._serve_forever_loop(poll_interval)
         finally:
             self.__shutdown_request = False
             self.__is_shut_down.set()
 
+    def _serve_forever_loop(self, poll_interval):
+        """Internal routine run by serve_forever() until shutdown.
+
+        May be overridden; it must return soon after
+        _shutdown_requested() becomes true.
+        """
+        # XXX: Consider using another file descriptor or connecting to the
+        # socket to wake this up instead of polling. Polling reduces our
+        # responsiveness to a shutdown request and wastes cpu at all other
+        # times.
+        with _ServerSelector() as selector:
+            selector.register(self, selectors.EVENT_READ)
+
+            while not self.__shutdown_request:
+                ready = selector.select(poll_interval)
+                # bpo-35017: shutdown() called during select(), exit immediately.
+                if self.__shutdown_request:
+                    break
+                if ready:
+                    self._handle_request_noblock()
+
+                self.service_actions()
+
     def shutdown(self):
         """Stops the serve_forever loop.
 
@@ -251,9 +266,21 @@ def shutdown(self):
         serve_forever() is running in another thread, or it will
         deadlock.
         """
-        self.__shutdown_request = True
+        self._request_shutdown()
         self.__is_shut_down.wait()
 
+    def _request_shutdown(self):
+        """Internal routine to stop the serve_forever loop without waiting.
+
+        Unlike shutdown(), this can be called from the loop itself.
+        """
+        self.__shutdown_request = True
+
+    def _shutdown_requested(self):
+        """Internal routine to check whether the serve_forever loop
+        has been asked to stop."""
+        return self.__shutdown_request
+
     def service_actions(self):
         """Called by the serve_forever() loop.
 
@@ -637,6 +664,122 @@ def server_close(self):
             self.collect_children(blocking=self.block_on_close)
 
 
+    class PreForkMixIn:
+        """Mix-in class to handle requests in a fixed set of processes.
+
+        serve_forever() forks the worker processes, which share the
+        listening socket, and replaces the workers which exit until
+        shutdown() is called.
+        """
+
+        # Number of worker processes.
+        processes = 4
+        _worker_pids = None
+        _retiring_pids = None
+        _reload_request = False
+        _is_worker = False
+        # Pipe of the current generation of workers.  They exit when its
+        # write end, kept by the parent, is closed.
+        _stop_pipe = None
+
+        def _serve_forever_loop(self, poll_interval):
+            """Fork the workers and supervise them until shutdown.
+
+            The workers finish the requests in progress before exiting.
+            """
+            if self._is_worker:
+                return super()._serve_forever_loop(poll_interval)
+            self._worker_pids = set()
+            self._retiring_pids = set()
+            self._stop_pipe = os.pipe()
+            try:
+                while not self._shutdown_requested():
+                    if self._reload_request:
+                        self._reload_request = False
+                        self._stop_workers()
+                        self._retiring_pids |= self._worker_pids
+                        self._worker_pids = set()
+                        self._stop_pipe = os.pipe()
+                    self.collect_workers()
+                    while len(self._worker_pids) < self.processes:
+                        self._spawn_worker(poll_interval)
+                    sleep(poll_interval)
+            finally:
+                self._stop_workers()
+                self.collect_workers(blocking=True)
+
+        def reload_workers(self):
+            """Replace the workers by new ones forked from this process.
+
+            The current workers finish the requests in progress and exit.
+            This can be called from a signal handler.
+            """
+            self._reload_request = True
+
+        def collect_workers(self, *, blocking=False):
+            """Internal routine to wait for workers that have exited."""
+            for pids in self._worker_pids, self._retiring_pids:
+                for pid in pids.copy():
+                    try:
+                        pid, _ = os.waitpid(pid, 0 if blocking else os.WNOHANG)
+                        # if the worker hasn't exited yet, pid will be 0 and
+                        # ignored by discard() below
+                        pids.discard(pid)
+                    except ChildProcessError:
+                        # someone else reaped it
+                        pids.discard(pid)
+                    except OSError:
+                        pass
+
+        def service_actions(self):
+            """Stop the worker when the parent closes its pipe.
+
+            service_actions is called in the BaseServer's serve_forever loop.
+            """
+            super().service_actions()
+            if self._is_worker:
+                try:
+                    stopped = not os.read(self._stop_pipe[0], 1)
+                except BlockingIOError:
+                    stopped = False
+                if stopped:
+                    self._request_shutdown()
+
+        def _stop_workers(self):
+            r, w = self._stop_pipe
+            os.close(r)
+            os.close(w)
+
+        def _spawn_worker(self, poll_interval):
+            pid = os.fork()
+            if pid:
+                self._worker_pids.add(pid)
+                return
+            # Child process.
+            # This must never return, hence os._exit()!
+            status = 1
+            try:
+                self._is_worker = True
+                os.close(self._stop_pipe[1])
+                os.set_blocking(self._stop_pipe[0], False)
+                # Leave SIGINT to the parent.
+                signal.signal(signal.SIGINT, signal.SIG_IGN)
+                # The workers accept connections concurrently: wait for
+                # them in accept() rather than block when another worker
+                # got the connection.
+                self.socket.settimeout(poll_interval)
+                self.serve_forever(poll_interval)
+                status = 0
+            except Exception:
+                import traceback
+                traceback.print_exc()
+            finally:
+                try:
+                    self.server_close()
+                finally:
+                    os._exit(status)
+
+
 class _Threads(list):
     """
     Joinable list of all non-daemon threads.
@@ -710,13 +853,81 @@ def server_close(self):
         self._threads.join()
 
 
+class ThreadPoolMixIn:
+    """Mix-in class to handle requests in a fixed pool of threads.
+
+    The requests are queued until a thread of the pool is available.  When
+    as many requests as threads are waiting, the server stops accepting
+    new connections.
+    """
+
+    # Number of threads of the pool.
+    workers = 8
+    # Decides how threads will act upon termination of the
+    # main process
+    daemon_threads = False
+    # If true, server_close() waits until the threads have handled the
+    # queued requests.
+    block_on_close = True
+    _pool = None
+
+    def process_request_thread(self, request, client_address):
+        """Same as in BaseServer but as a thread.
+
+        In addition, exception handling is done here.
+
+        """
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def _worker(self, requests):
+        while (item := requests.get()) is not None:
+            self.process_request_thread(*item)
+
+    def process_request(self, request, client_address):
+        """Queue the request for a thread of the pool."""
+        if self._pool is None:
+            self._requests = queue.Queue(self.workers)
+            self._pool = []
+            for i in range(self.workers):
+                t = threading.Thread(target=self._worker,
+                                     args=(self._requests,),
+                                     name=f'{type(self).__name__}-{i}')
+                t.daemon = self.daemon_threads
+                t.start()
+                self._pool.append(t)
+        self._requests.put((request, client_address))
+
+    def server_close(self):
+        super().server_close()
+        pool = self._pool
+        if pool is None:
+            return
+        self._pool = None
+        for t in pool:
+            self._requests.put(None)
+        if self.block_on_close:
+            for t in pool:
+                t.join()
+
+
 if hasattr(os, "fork"):
     class ForkingUDPServer(ForkingMixIn, UDPServer): pass
     class ForkingTCPServer(ForkingMixIn, TCPServer): pass
 
+    class PreForkUDPServer(PreForkMixIn, UDPServer): pass
+    class PreForkTCPServer(PreForkMixIn, TCPServer): pass
+
 class ThreadingUDPServer(ThreadingMixIn, UDPServer): pass
 class ThreadingTCPServer(ThreadingMixIn, TCPServer): pass
 
+class ThreadPoolUDPServer(ThreadPoolMixIn, UDPServer): pass
+class ThreadPoolTCPServer(ThreadPoolMixIn, TCPServer): pass
+
 if hasattr(socket, 'AF_UNIX'):
 
     class UnixStreamServer(TCPServer):
@@ -729,11 +940,19 @@ class ThreadingUnixStreamServer(ThreadingMixIn, UnixStreamServer): pass
 
     class ThreadingUnixDatagramServer(ThreadingMixIn, UnixDatagramServer): pass
 
+    class ThreadPoolUnixStreamServer(ThreadPoolMixIn, UnixStreamServer): pass
+
+    class ThreadPoolUnixDatagramServer(ThreadPoolMixIn, UnixDatagramServer): pass
+
     if hasattr(os, "fork"):
         class ForkingUnixStreamServer(ForkingMixIn, UnixStreamServer): pass
 
         class ForkingUnixDatagramServer(ForkingMixIn, UnixDatagramServer): pass
 
+        class PreForkUnixStreamServer(PreForkMixIn, UnixStreamServer): pass
+
+        class PreForkUnixDatagramServer(PreForkMixIn, UnixDatagramServer): pass
+
 class BaseRequestHandler:
 
     """Base class for request handler classes.
@@ -2004,6 +2004,108 @@ async def stop_loop_coro(loop):
                          "took .* seconds$")
 
 
+class EventLoopMetricsTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.SelectorEventLoop()
+        self.set_event_loop(self.loop)
+
+    def test_disabled(self):
+        self.assertIsNone(self.loop.get_metrics())
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.assertIsNone(self.loop.get_metrics())
+
+    def test_metrics(self):
+        self.loop.set_metrics_enabled(True)
+        metrics = self.loop.get_metrics()
+        self.assertIsInstance(metrics, asyncio.EventLoopMetrics)
+        self.assertEqual(metrics.iterations, 0)
+        self.assertEqual(metrics.callbacks, 0)
+
+        def slow():
+            time.sleep(0.02)
+
+        for _ in range(5):
+            self.loop.call_soon(lambda: None)
+        self.loop.call_soon(slow)
+        timer = self.loop.call_later(10, lambda: None)
+        self.loop.call_later(20, lambda: None).cancel()
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+
+        metrics = self.loop.get_metrics()
+        self.assertGreater(metrics.iterations, 1)
+        self.assertGreaterEqual(metrics.callbacks, 6)
+        self.assertEqual(sum(metrics.callback_durations), metrics.callbacks)
+        self.assertEqual(metrics.callback_durations[-3:], (1, 0, 0))
+        self.assertGreaterEqual(metrics.max_callback_time, 0.02)
+        self.assertGreaterEqual(metrics.callback_time, 0.02)
+        self.assertGreater(metrics.select_time, 0)
+        self.assertGreaterEqual(metrics.max_ready_queue_depth, 7)
+        self.assertEqual(metrics.scheduled_timers, 2)
+        self.assertEqual(metrics.cancelled_timers, 1)
+        self.assertRegex(repr(metrics),
+                         r'^<EventLoopMetrics iterations=\d+ callbacks=\d+ ')
+
+        # get_metrics() returns a snapshot.
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.assertGreater(self.loop.get_metrics().iterations,
+                           metrics.iterations)
+        timer.cancel()
+
+        self.loop.set_metrics_enabled(False)
+        self.assertIsNone(self.loop.get_metrics())
+        self.loop.set_metrics_enabled(True)
+        self.assertEqual(self.loop.get_metrics().iterations, 0)
+
+    def test_callback_duration_buckets(self):
+        metrics = asyncio.EventLoopMetrics()
+        for duration in (0.00005, 0.0001, 0.0005, 0.05, 0.5, 1.0, 3.0):
+            metrics._add_callback(duration)
+        self.assertEqual(metrics.callback_durations, [2, 1, 0, 1, 2, 1])
+        self.assertEqual(metrics.max_callback_time, 3.0)
+        self.assertEqual(metrics.callbacks, 7)
+
+    def test_hook(self):
+        calls = []
+
+        def hook(loop, metrics):
+            calls.append((loop, metrics))
+
+        self.assertRaises(TypeError, self.loop.set_metrics_hook, 1)
+        self.assertRaises(ValueError, self.loop.set_metrics_hook, hook, 0)
+        self.assertIsNone(self.loop.get_metrics())
+
+        self.loop.set_metrics_hook(hook, 0.01)
+        self.loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertGreaterEqual(len(calls), 2)
+        self.assertLessEqual(len(calls), 12)
+        for loop, metrics in calls:
+            self.assertIs(loop, self.loop)
+            self.assertIsInstance(metrics, asyncio.EventLoopMetrics)
+        self.assertLess(calls[0][1].iterations, calls[-1][1].iterations)
+
+        self.loop.set_metrics_hook(None)
+        ncalls = len(calls)
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(len(calls), ncalls)
+        self.assertIsNotNone(self.loop.get_metrics())
+
+    def test_hook_exception(self):
+        def hook(loop, metrics):
+            raise ZeroDivisionError
+
+        handler = mock.Mock()
+        self.loop.set_exception_handler(handler)
+        self.loop.set_metrics_hook(hook, 0.01)
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertTrue(handler.called)
+        context = handler.call_args[0][1]
+        self.assertEqual(context['message'],
+                         'Exception in event loop metrics hook')
+        self.assertIsInstance(context['exception'], ZeroDivisionError)
+
+
 class RunningLoopTests(unittest.TestCase):
 
     def test_running_loop_within_a_loop(self):
@@ -2250,6 +2250,18 @@ class PollEventLoopTests(EventLoopTestsMixin,
             def create_event_loop(self):
                 return asyncio.SelectorEventLoop(selectors.PollSelector())
 
+    if hasattr(asyncio, 'IoUringEventLoop'):
+        class IoUringEventLoopTests(EventLoopTestsMixin,
+                                    SubprocessTestsMixin,
+                                    test_utils.TestCase):
+
+            def create_event_loop(self):
+                try:
+                    return asyncio.IoUringEventLoop()
+                except OSError as exc:
+                    # io_uring can be disabled by the system administrator.
+                    self.skipTest(f"io_uring is not available: {exc}")
+
     # Should always exist.
     class SelectEventLoopTests(EventLoopTestsMixin,
                                SubprocessTestsMixin,
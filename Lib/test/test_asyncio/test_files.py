@@ -0,0 +1,177 @@
+"""Tests for asyncio/files.py"""
+
+import asyncio
+import io
+import os
+import threading
+import unittest
+
+from asyncio import files
+from test.support import os_helper
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class OpenFileTests(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+
+    async def test_write_read(self):
+        async with await asyncio.open_file(os_helper.TESTFN, 'w',
+                                           encoding='utf-8') as f:
+            self.assertIsInstance(f, asyncio.AsyncFile)
+            self.assertEqual(f.name, os_helper.TESTFN)
+            self.assertEqual(f.mode, 'w')
+            self.assertIsInstance(f.file, io.TextIOWrapper)
+            self.assertEqual(await f.write('spam\n'), 5)
+            await f.writelines(['ham\n', 'eggs'])
+            await f.flush()
+            await f.fsync()
+        self.assertTrue(f.closed)
+
+        async with await asyncio.open_file(os_helper.TESTFN,
+                                           encoding='utf-8') as f:
+            self.assertEqual(await f.readline(), 'spam\n')
+            self.assertEqual(await f.read(), 'ham\neggs')
+            await f.seek(0)
+            self.assertEqual(await f.readlines(), ['spam\n', 'ham\n', 'eggs'])
+            self.assertEqual(await f.tell(), 13)
+        with self.assertRaises(ValueError):
+            await f.read()
+
+    async def test_binary(self):
+        async with await asyncio.open_file(os_helper.TESTFN, 'w+b') as f:
+            await f.write(b'0123456789')
+            await f.truncate(8)
+            await f.seek(2)
+            buf = bytearray(4)
+            self.assertEqual(await f.readinto(buf), 4)
+            self.assertEqual(buf, b'2345')
+            self.assertEqual(await f.read1(), b'67')
+            self.assertEqual(f.fileno(), f.file.fileno())
+
+    async def test_runs_in_file_pool(self):
+        thread_names = []
+
+        def opener(path, flags):
+            thread_names.append(threading.current_thread().name)
+            return os.open(path, flags)
+
+        f = await asyncio.open_file(os_helper.TESTFN, 'wb', opener=opener)
+        await f.close()
+        self.assertTrue(thread_names[0].startswith('asyncio-file'))
+
+    async def test_open_error(self):
+        with self.assertRaises(FileNotFoundError):
+            await asyncio.open_file(os_helper.TESTFN + '.missing')
+
+    async def test_aiter(self):
+        lines = [f'line {i}\n' for i in range(10000)]
+        with open(os_helper.TESTFN, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+
+        async with await asyncio.open_file(os_helper.TESTFN,
+                                           encoding='utf-8') as f:
+            self.assertEqual([line async for line in f], lines)
+            self.assertEqual([line async for line in f], [])
+
+    async def test_aiter_batches(self):
+        with open(os_helper.TESTFN, 'wb') as f:
+            f.writelines(b'x' * 99 + b'\n' for i in range(10000))
+
+        reads = 0
+        async with await asyncio.open_file(os_helper.TESTFN, 'rb') as f:
+            readlines = f.file.readlines
+
+            def counting_readlines(hint):
+                nonlocal reads
+                reads += 1
+                return readlines(hint)
+
+            f.file.readlines = counting_readlines
+            count = 0
+            async for line in f:
+                count += 1
+        self.assertEqual(count, 10000)
+        self.assertLessEqual(reads, 1_000_000 // files._LINES_BATCH_SIZE + 2)
+
+    async def test_aiter_then_read_binary(self):
+        with open(os_helper.TESTFN, 'wb') as f:
+            f.write(b'a\nb\nc\nd\n')
+
+        async with await asyncio.open_file(os_helper.TESTFN, 'rb') as f:
+            self.assertEqual(await anext(f), b'a\n')
+            self.assertEqual(await f.readline(), b'b\n')
+            self.assertEqual(await f.tell(), 4)
+            self.assertEqual(await f.read(), b'c\nd\n')
+
+    async def test_aiter_then_read_text(self):
+        with open(os_helper.TESTFN, 'w', encoding='utf-8') as f:
+            f.write('a\nb\nc\n')
+
+        async with await asyncio.open_file(os_helper.TESTFN,
+                                           encoding='utf-8') as f:
+            self.assertEqual(await anext(f), 'a\n')
+            self.assertEqual(await f.readline(), 'b\n')
+            with self.assertRaises(io.UnsupportedOperation):
+                await f.tell()
+            # The lines read ahead are kept.
+            self.assertEqual(await f.read(), 'c\n')
+            self.assertEqual(await f.tell(), 6)
+
+        async with await asyncio.open_file(os_helper.TESTFN,
+                                           encoding='utf-8') as f:
+            self.assertEqual(await anext(f), 'a\n')
+            self.assertEqual(await f.readline(1), 'b')
+            self.assertEqual(await f.read(2), '\nc')
+            self.assertEqual(await f.readlines(), ['\n'])
+            self.assertEqual(await f.seek(2), 2)
+            self.assertEqual(await f.readline(), 'b\n')
+
+    async def test_aiter_then_read_zero_size(self):
+        with open(os_helper.TESTFN, 'wb') as f:
+            f.write(b'a\nb\n')
+
+        async with await asyncio.open_file(os_helper.TESTFN, 'rb') as f:
+            self.assertEqual(await anext(f), b'a\n')
+            self.assertEqual(await f.read(0), b'')
+            self.assertEqual(await f.read1(0), b'')
+            self.assertEqual(await f.readline(0), b'')
+            self.assertEqual(await f.readinto(bytearray()), 0)
+            self.assertEqual(await f.read(), b'b\n')
+
+        async with await asyncio.open_file(os_helper.TESTFN,
+                                           encoding='utf-8') as f:
+            self.assertEqual(await anext(f), 'a\n')
+            self.assertEqual(await f.read(0), '')
+            self.assertEqual(await f.readline(0), '')
+            self.assertEqual(await f.readline(), 'b\n')
+
+    async def test_aiter_then_read_pipe(self):
+        r, w = os.pipe()
+        os.write(w, b'a\nb\nc\nd\n')
+        os.close(w)
+        async with await asyncio.open_file(r, 'rb') as f:
+            self.assertEqual(await anext(f), b'a\n')
+            buf = bytearray(3)
+            self.assertEqual(await f.readinto(buf), 3)
+            self.assertEqual(buf, b'b\nc')
+            self.assertEqual(await f.read1(), b'\nd\n')
+            self.assertEqual(await f.read(), b'')
+
+        r, w = os.pipe()
+        os.write(w, b'a\nb\nc\n')
+        os.close(w)
+        async with await asyncio.open_file(r, 'rb') as f:
+            self.assertEqual(await anext(f), b'a\n')
+            # The position of a pipe cannot be moved back.
+            with self.assertRaises(OSError):
+                await f.tell()
+            self.assertEqual(await f.readlines(), [b'b\n', b'c\n'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -245,6 +245,30 @@ def test_close_buffer(self):
         test_utils.run_briefly(self.loop)
         self.assertFalse(self.protocol.connection_lost.called)
 
+    def test_close_write_on_resume(self):
+        # Data written by the protocol when its writing is resumed while
+        # the transport is closing is still sent.
+        self.proactor.send.side_effect = (
+            lambda sock, data: self.loop.create_future())
+        tr = self.socket_transport()
+        tr.set_write_buffer_limits(high=1, low=0)
+        tr.write(b'data')
+        self.assertTrue(self.protocol.pause_writing.called)
+        self.protocol.resume_writing.side_effect = lambda: tr.write(b'bye')
+        tr.close()
+        self.assertEqual(tr._conn_lost, 0)
+
+        tr._write_fut.set_result(4)
+        test_utils.run_briefly(self.loop)
+        self.proactor.send.assert_called_with(self.sock, b'bye')
+        self.assertFalse(self.protocol.connection_lost.called)
+
+        self.protocol.resume_writing.side_effect = None
+        tr._write_fut.set_result(3)
+        test_utils.run_briefly(self.loop)
+        self.protocol.connection_lost.assert_called_with(None)
+        self.assertEqual(tr._conn_lost, 1)
+
     def test_close_invalid_sockobj(self):
         tr = self.socket_transport()
         self.sock.fileno.return_value = -1
@@ -173,6 +173,64 @@ def test_write_after_closing(self):
         # should not raise
         self.assertIsNone(transp.write(b'data'))
 
+    def wrapped_protocol(self):
+        ssl_proto = self.ssl_protocol()
+        transport = self.connection_made(ssl_proto,
+                                         do_handshake=mock.Mock())
+        self.assertEqual(ssl_proto._state,
+                         sslproto.SSLProtocolState.WRAPPED)
+        written = []
+        def write(data):
+            written.append(bytes(data))
+            return len(data)
+        ssl_proto._sslobj.write.side_effect = write
+        return ssl_proto, written
+
+    def test_small_writes_batched(self):
+        ssl_proto, written = self.wrapped_protocol()
+        transp = ssl_proto._app_transport
+        transp.write(b'spam')
+        transp.write(b'ham')
+        transp.writelines([b'eggs', bytearray(b'!')])
+        self.assertEqual(written, [])
+        self.assertEqual(transp.get_write_buffer_size(), 12)
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(written, [b'spamhameggs!'])
+        self.assertEqual(transp.get_write_buffer_size(), 0)
+
+    def test_deferred_write_copies_mutable_data(self):
+        ssl_proto, written = self.wrapped_protocol()
+        transp = ssl_proto._app_transport
+        buf = bytearray(b'spam')
+        transp.write(buf)
+        transp.write(memoryview(buf))
+        transp.writelines([buf])
+        # The caller may reuse the buffer once write() returns.
+        buf[:] = b'eggs'
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(written, [b'spam' * 3])
+
+    def test_large_writes_not_deferred(self):
+        ssl_proto, written = self.wrapped_protocol()
+        transp = ssl_proto._app_transport
+        record = sslproto._TLS_RECORD_SIZE
+        transp.write(b'a' * 10)
+        transp.write(b'b' * record)
+        # The data is written right away, in records of at most
+        # _TLS_RECORD_SIZE bytes.
+        self.assertEqual(written, [b'a' * 10, b'b' * record])
+        written.clear()
+        transp.writelines([b'c' * (record // 2)] * 3)
+        self.assertEqual(written, [b'c' * record, b'c' * (record // 2)])
+
+    def test_deferred_write_flushed_on_close(self):
+        ssl_proto, written = self.wrapped_protocol()
+        ssl_proto._sslobj.unwrap.side_effect = ssl.SSLWantReadError
+        transp = ssl_proto._app_transport
+        transp.write(b'data')
+        transp.close()
+        self.assertEqual(written, [b'data'])
+
 
 ##############################################################################
 # Start TLS Tests
@@ -586,6 +586,187 @@ def test_readexactly_exception(self):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readexactly(2))
 
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        buf = bytearray(5)
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 5)
+        self.assertEqual(buf, self.DATA[:5])
+        self.assertEqual(stream._buffer, self.DATA[5:])
+
+        buf = bytearray(100)
+        n = self.loop.run_until_complete(stream.readinto(memoryview(buf)[10:]))
+        self.assertEqual(n, len(self.DATA) - 5)
+        self.assertEqual(buf[10:10 + n], self.DATA[5:])
+        self.assertEqual(stream._buffer, b'')
+
+        self.assertEqual(
+            self.loop.run_until_complete(stream.readinto(bytearray())), 0)
+
+    def test_readinto_wait(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(100)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        self.loop.call_soon(stream.feed_data, self.DATA)
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(buf[:n], self.DATA)
+
+    def test_readinto_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        read_task = self.loop.create_task(stream.readinto(bytearray(10)))
+        self.loop.call_soon(stream.feed_eof)
+        self.assertEqual(self.loop.run_until_complete(read_task), 0)
+        self.assertEqual(
+            self.loop.run_until_complete(stream.readinto(bytearray(10))), 0)
+
+    def test_readinto_invalid_buffer(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        for buf in b'spam', 'spam', memoryview(b'spam'):
+            with self.assertRaises(TypeError):
+                self.loop.run_until_complete(stream.readinto(buf))
+            with self.assertRaises(TypeError):
+                self.loop.run_until_complete(stream.readexactly_into(buf))
+        self.assertEqual(stream._buffer, self.DATA)
+
+    def test_readexactly_into(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA[:5])
+        buf = bytearray(2 * len(self.DATA))
+        read_task = self.loop.create_task(stream.readexactly_into(buf))
+
+        def cb():
+            stream.feed_data(self.DATA[5:])
+            stream.feed_data(self.DATA)
+            stream.feed_data(self.DATA)
+        self.loop.call_soon(cb)
+
+        self.assertEqual(self.loop.run_until_complete(read_task), len(buf))
+        self.assertEqual(buf, self.DATA + self.DATA)
+        self.assertEqual(stream._buffer, self.DATA)
+
+        self.assertEqual(
+            self.loop.run_until_complete(stream.readexactly_into(bytearray())), 0)
+
+    def test_readexactly_into_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(2 * len(self.DATA))
+        read_task = self.loop.create_task(stream.readexactly_into(buf))
+
+        def cb():
+            stream.feed_data(self.DATA)
+            stream.feed_eof()
+        self.loop.call_soon(cb)
+
+        with self.assertRaises(asyncio.IncompleteReadError) as cm:
+            self.loop.run_until_complete(read_task)
+        self.assertEqual(cm.exception.partial, self.DATA)
+        self.assertEqual(cm.exception.expected, len(buf))
+        self.assertEqual(stream._buffer, b'')
+
+    def test_readexactly_into_cancel(self):
+        # Data read by a cancelled call is not lost.
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'chunk1')
+        read_task = self.loop.create_task(
+            stream.readexactly_into(bytearray(100)))
+        test_utils.run_briefly(self.loop)
+        stream.feed_data(b'chunk2')
+        read_task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(read_task)
+        self.assertEqual(stream._buffer, b'chunk1chunk2')
+
+    def test_readexactly_into_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        read_task = self.loop.create_task(
+            stream.readexactly_into(bytearray(10)))
+        test_utils.run_briefly(self.loop)
+        stream.set_exception(ValueError())
+        self.assertRaises(ValueError, self.loop.run_until_complete, read_task)
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete,
+            stream.readexactly_into(bytearray(10)))
+
+    def test_buffered_protocol(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.streams._BufferedStreamReaderProtocol(
+            stream, loop=self.loop)
+        self.assertIsInstance(protocol, asyncio.BufferedProtocol)
+
+        # Without a pending read, data is copied into the internal buffer.
+        buf = protocol.get_buffer(-1)
+        buf[:4] = b'spam'
+        protocol.buffer_updated(4)
+        self.assertEqual(stream._buffer, b'spam')
+        self.assertEqual(self.loop.run_until_complete(stream.read(4)), b'spam')
+
+        # A pending readexactly_into() call receives the data directly.
+        target = bytearray(10)
+        read_task = self.loop.create_task(stream.readexactly_into(target))
+        test_utils.run_briefly(self.loop)
+        buf = protocol.get_buffer(-1)
+        self.assertEqual(len(buf), 10)
+        buf[:6] = b'chunk1'
+        protocol.buffer_updated(6)
+        self.assertEqual(target[:6], b'chunk1')
+        self.assertFalse(read_task.done())
+        buf = protocol.get_buffer(-1)
+        self.assertEqual(len(buf), 4)
+        buf[:4] = b'chun'
+        protocol.buffer_updated(4)
+        self.assertEqual(self.loop.run_until_complete(read_task), 10)
+        self.assertEqual(target, b'chunk1chun')
+        self.assertEqual(stream._buffer, b'')
+
+        # Data received once the target is full goes to the internal buffer.
+        target = bytearray(10)
+        read_task = self.loop.create_task(stream.readinto(target))
+        test_utils.run_briefly(self.loop)
+        buf = protocol.get_buffer(-1)
+        buf[:3] = b'abc'
+        protocol.buffer_updated(3)
+        buf = protocol.get_buffer(-1)
+        buf[:3] = b'def'
+        protocol.buffer_updated(3)
+        self.assertEqual(self.loop.run_until_complete(read_task), 6)
+        self.assertEqual(target[:6], b'abcdef')
+        buf = protocol.get_buffer(-1)
+        self.assertGreater(len(buf), 10)
+        buf[:3] = b'ghi'
+        protocol.buffer_updated(3)
+        self.assertEqual(stream._buffer, b'ghi')
+
+    def test_readexactly_into_connection(self):
+        payload = bytes(range(256)) * 4096
+
+        async def handle_client(client_reader, client_writer):
+            client_writer.write(payload)
+            await client_writer.drain()
+            client_writer.close()
+            await client_writer.wait_closed()
+
+        async def client(addr):
+            reader, writer = await asyncio.open_connection(*addr)
+            buf = bytearray(len(payload))
+            view = memoryview(buf)
+            await reader.readexactly_into(view[:1000])
+            n = await reader.readinto(view[1000:2000])
+            await reader.readexactly_into(view[1000 + n:])
+            self.assertEqual(await reader.read(), b'')
+            writer.close()
+            await writer.wait_closed()
+            return buf
+
+        async def main():
+            server = await asyncio.start_server(handle_client, '127.0.0.1', 0)
+            async with server:
+                addr = server.sockets[0].getsockname()
+                return await client(addr)
+
+        self.assertEqual(self.loop.run_until_complete(main()), payload)
+
     def test_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
         self.assertIsNone(stream.exception())
@@ -251,6 +251,48 @@ async def f():
             await task
         self.assertFalse(cm.expired())
 
+    async def test_reschedule_later(self):
+        # Postponing the deadline does not add timer handles to the loop.
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        with self.assertRaises(TimeoutError):
+            async with asyncio.timeout(0.05) as cm:
+                scheduled = len(loop._scheduled)
+                for i in range(1, 11):
+                    await asyncio.sleep(0.01)
+                    cm.reschedule(loop.time() + 0.05)
+                    self.assertEqual(len(loop._scheduled), scheduled)
+                self.assertFalse(cm.expired())
+                await asyncio.sleep(10)
+        self.assertTrue(cm.expired())
+        self.assertGreaterEqual(loop.time() - t0, 0.15)
+
+    async def test_reschedule_earlier(self):
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        with self.assertRaises(TimeoutError):
+            async with asyncio.timeout(10) as cm:
+                cm.reschedule(loop.time() + 20)
+                cm.reschedule(loop.time() + 0.01)
+                await asyncio.sleep(10)
+        self.assertLess(loop.time() - t0, 5)
+
+        with self.assertRaises(TimeoutError):
+            async with asyncio.timeout(10) as cm:
+                cm.reschedule(loop.time() - 1)
+                cm.reschedule(None)
+                cm.reschedule(loop.time() + 0.01)
+                await asyncio.sleep(10)
+        self.assertLess(loop.time() - t0, 5)
+
+    async def test_reschedule_expired_to_later(self):
+        # A deadline in the past is postponed before the loop runs.
+        loop = asyncio.get_running_loop()
+        async with asyncio.timeout(-1) as cm:
+            cm.reschedule(loop.time() + 10)
+            await asyncio.sleep(0.01)
+        self.assertFalse(cm.expired())
+
     async def test_repr_active(self):
         async with asyncio.timeout(10) as cm:
             self.assertRegex(repr(cm), r"<Timeout \[active\] when=\d+\.\d*>")
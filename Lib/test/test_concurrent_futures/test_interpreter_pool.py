@@ -0,0 +1,151 @@
+import contextlib
+import io
+import os
+import unittest
+from test import support
+from test.support import import_helper
+
+_interpreters = import_helper.import_module('_interpreters')
+
+from concurrent import futures
+from concurrent.futures.interpreter import (
+    BrokenInterpreterPool, ExecutionFailed,
+)
+
+from .executor import ExecutorTest, mul
+from .util import BaseTestCase, InterpreterPoolMixin, setup_module
+
+
+def get_current_interpid():
+    return _interpreters.get_current()[0]
+
+
+def get_current_name():
+    return __name__
+
+
+def fail(exctype, msg=None):
+    raise exctype(msg)
+
+
+def echo(*args, **kwargs):
+    return args, kwargs
+
+
+def set_spam(value):
+    global spam
+    spam = value
+
+
+def get_spam():
+    return globals().get('spam')
+
+
+def get_main_attr(name):
+    import __main__
+    return getattr(__main__, name)
+
+
+class InterpreterPoolExecutorTest(
+            InterpreterPoolMixin, ExecutorTest, BaseTestCase):
+
+    def test_map_exception(self):
+        i = self.executor.map(divmod, [1, 1, 1, 1], [2, 3, 0, 5])
+        self.assertEqual(i.__next__(), (0, 1))
+        self.assertEqual(i.__next__(), (0, 1))
+        with self.assertRaises(ZeroDivisionError) as cm:
+            i.__next__()
+        self.assertIsInstance(cm.exception.__cause__, ExecutionFailed)
+
+    def test_no_stale_references(self):
+        # The work items are pickled before they are sent to the worker
+        # interpreters, so the executor never holds on to the submitted
+        # objects in the first place.
+        self.skipTest("objects are copied into the worker interpreters")
+
+    def test_free_reference(self):
+        # Each result is a copy made in the calling interpreter, so the
+        # executor never holds a reference to it either.
+        self.skipTest("objects are copied into the worker interpreters")
+
+    def test_runs_in_subinterpreter(self):
+        main = get_current_interpid()
+        interpid = self.executor.submit(get_current_interpid).result()
+        self.assertNotEqual(interpid, main)
+
+    def test_worker_interpreters_are_reused(self):
+        with self.executor_type(1) as executor:
+            first = executor.submit(get_current_interpid).result()
+            for _ in range(5):
+                interpid = executor.submit(get_current_interpid).result()
+                self.assertEqual(interpid, first)
+
+    def test_state_is_kept_between_tasks(self):
+        with self.executor_type(1) as executor:
+            executor.submit(set_spam, 'eggs').result()
+            self.assertEqual(executor.submit(get_spam).result(), 'eggs')
+            # The calling interpreter is left alone.
+            self.assertIsNone(get_spam())
+
+    def test_shareable_args_and_results(self):
+        args = (1, 2.5, 'spam', b'eggs', None, True, (3, ('x',)))
+        res = self.executor.submit(echo, *args).result()
+        self.assertEqual(res, (args, {}))
+
+    def test_pickled_args_and_results(self):
+        res = self.executor.submit(echo, [1, 2], {'a': 3}, spam=4).result()
+        self.assertEqual(res, (([1, 2], {'a': 3}), {'spam': 4}))
+
+    def test_exception(self):
+        fut = self.executor.submit(fail, ValueError, 'spam')
+        with self.assertRaisesRegex(ValueError, 'spam') as cm:
+            fut.result()
+        self.assertIsInstance(cm.exception.__cause__, ExecutionFailed)
+        self.assertIn('spam', str(cm.exception.__cause__))
+
+    def test_unpicklable_callable(self):
+        with self.assertRaises(Exception):
+            self.executor.submit(lambda: None)
+
+    def test_shared(self):
+        with self.executor_type(1, shared={'spam': b'eggs'}) as executor:
+            res = executor.submit(get_main_attr, 'spam').result()
+            self.assertEqual(res, b'eggs')
+
+    def test_initializer(self):
+        with self.executor_type(1, initializer=set_spam,
+                                initargs=('ham',)) as executor:
+            self.assertEqual(executor.submit(get_spam).result(), 'ham')
+
+    def test_initializer_failure(self):
+        with self.executor_type(1, initializer=fail,
+                                initargs=(ValueError,)) as executor:
+            with contextlib.redirect_stderr(io.StringIO()):
+                with self.assertLogs('concurrent.futures', 'CRITICAL'):
+                    fut = executor.submit(get_spam)
+                    with self.assertRaises(BrokenInterpreterPool):
+                        fut.result()
+
+    def test_idle_interpreter_reuse(self):
+        with self.executor_type() as executor:
+            executor.submit(mul, 21, 2).result()
+            executor.submit(mul, 6, 7).result()
+            executor.submit(mul, 3, 14).result()
+            self.assertEqual(len(executor._threads), 1)
+
+    def test_default_workers(self):
+        with self.executor_type() as executor:
+            expected = min(32, (os.process_cpu_count() or 1) + 4)
+            self.assertEqual(executor._max_workers, expected)
+
+    def test_exported(self):
+        self.assertIs(futures.InterpreterPoolExecutor, self.executor_type)
+        self.assertIn('InterpreterPoolExecutor', futures.__all__)
+
+
+def setUpModule():
+    setup_module()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -74,6 +74,15 @@ class ThreadPoolMixin(ExecutorMixin):
     executor_type = futures.ThreadPoolExecutor
 
 
+class InterpreterPoolMixin(ExecutorMixin):
+    executor_type = getattr(futures, 'InterpreterPoolExecutor', None)
+
+    def setUp(self):
+        if self.executor_type is None:
+            self.skipTest("InterpreterPoolExecutor unavailable on this system")
+        super().setUp()
+
+
 class ProcessPoolForkMixin(ExecutorMixin):
     executor_type = futures.ProcessPoolExecutor
     ctx = "fork"
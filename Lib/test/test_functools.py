@@ -1,4 +1,5 @@
 import abc
+import asyncio
 import builtins
 import collections
 import collections.abc
@@ -17,6 +18,7 @@
 import gc
 from weakref import proxy
 import contextlib
+import inspect
 from inspect import Signature
 
 from test.support import import_helper
@@ -1889,6 +1891,379 @@ def f():
             return 1
         self.assertEqual(f.cache_parameters(), {'maxsize': 1000, "typed": True})
 
+    def test_lru_cache_sharded(self):
+        def orig(x, y):
+            return 3 * x + y
+        f = self.module.lru_cache(maxsize=20, shards=4)(orig)
+        self.assertIs(f.__wrapped__, orig)
+        self.assertEqual(f.cache_parameters(),
+                         {'maxsize': 20, 'typed': False, 'shards': 4})
+        self.assertEqual(f.cache_info(), (0, 0, 20, 0))
+
+        for x in range(5):
+            for y in range(3):
+                self.assertEqual(f(x, y), orig(x, y))
+                self.assertEqual(f(x, y), orig(x, y))
+        hits, misses, maxsize, currsize = f.cache_info()
+        self.assertEqual(hits, 15)
+        self.assertEqual(misses, 15)
+        self.assertEqual(maxsize, 20)
+        self.assertEqual(currsize, 15)
+
+        # The shards never hold more than maxsize entries in total.
+        for x in range(100):
+            f(x, 0)
+        self.assertLessEqual(f.cache_info().currsize, 20)
+
+        f.cache_clear()
+        self.assertEqual(f.cache_info(), (0, 0, 20, 0))
+
+    def test_lru_cache_sharded_keywords_and_typed(self):
+        @self.module.lru_cache(maxsize=None, typed=True, shards=8)
+        def f(x, *, y=0):
+            return (x, y)
+        self.assertEqual(f(1, y=2), (1, 2))
+        self.assertEqual(f(1, y=2), (1, 2))
+        self.assertEqual(f(1.0, y=2), (1.0, 2))
+        self.assertEqual(type(f(1.0, y=2)[0]), float)
+        self.assertEqual(f.cache_info(), (2, 2, None, 2))
+
+    def test_lru_cache_sharded_small_maxsize(self):
+        # There are never more shards than cache entries.
+        @self.module.lru_cache(maxsize=2, shards=16)
+        def f(x):
+            return x
+        self.assertEqual(f.cache_parameters(),
+                         {'maxsize': 2, 'typed': False, 'shards': 2})
+        for x in range(10):
+            f(x)
+        self.assertLessEqual(f.cache_info().currsize, 2)
+
+        @self.module.lru_cache(maxsize=0, shards=16)
+        def f(x):
+            return x
+        self.assertEqual(f.cache_parameters(), {'maxsize': 0, 'typed': False})
+
+    def test_lru_cache_sharded_bad_shards(self):
+        with self.assertRaises(ValueError):
+            self.module.lru_cache(shards=0)
+        with self.assertRaises(TypeError):
+            self.module.lru_cache(shards=2.0)
+
+    def test_lru_cache_sharded_method(self):
+        module = self.module
+        class A:
+            @module.lru_cache(shards=4)
+            def f(self, x):
+                return (self, x)
+        a = A()
+        self.assertEqual(a.f(1), (a, 1))
+        self.assertEqual(a.f(1), (a, 1))
+        self.assertEqual(A.f.cache_info().hits, 1)
+
+    @threading_helper.requires_working_threading()
+    def test_lru_cache_sharded_threaded(self):
+        n, m = 8, 50
+        def orig(x):
+            return x * 2
+        f = self.module.lru_cache(maxsize=n, shards=4)(orig)
+
+        start = threading.Event()
+        def worker(k):
+            start.wait(10)
+            for _ in range(m):
+                self.assertEqual(f(k), orig(k))
+
+        threads = [threading.Thread(target=worker, args=[k])
+                   for k in range(n)]
+        with threading_helper.start_threads(threads):
+            start.set()
+        hits, misses, maxsize, currsize = f.cache_info()
+        self.assertEqual(hits + misses, n * m)
+        self.assertGreaterEqual(misses, n)
+        self.assertLessEqual(currsize, n)
+
+    def test_lru_cache_ttl(self):
+        calls = []
+        def orig(x):
+            calls.append(x)
+            return x * 2
+        f = self.module.lru_cache(maxsize=10, ttl=3600)(orig)
+        self.assertEqual(f.cache_parameters(),
+                         {'maxsize': 10, 'typed': False, 'ttl': 3600,
+                          'weigher': None, 'maxweight': None})
+        self.assertEqual(f.cache_info(), (0, 0, 10, 0, 0, 0, None))
+        self.assertEqual(f(1), 2)
+        self.assertEqual(f(1), 2)
+        self.assertEqual(calls, [1])
+        self.assertEqual(f.cache_info(), (1, 1, 10, 1, 0, 0, None))
+
+        f = self.module.lru_cache(maxsize=10, ttl=0.001)(orig)
+        calls.clear()
+        self.assertEqual(f(1), 2)
+        time.sleep(0.01)
+        self.assertEqual(f(1), 2)
+        self.assertEqual(calls, [1, 1])
+        info = f.cache_info()
+        self.assertEqual((info.hits, info.misses), (0, 2))
+        self.assertEqual((info.evictions, info.expirations), (0, 1))
+        self.assertEqual(info.currsize, 1)
+
+        f.cache_clear()
+        self.assertEqual(f.cache_info(), (0, 0, 10, 0, 0, 0, None))
+
+    def test_lru_cache_ttl_evictions_and_expirations(self):
+        f = self.module.lru_cache(maxsize=2, ttl=0.001)(lambda x: x)
+        f(1)
+        time.sleep(0.01)
+        # The oldest entry has expired by the time it is pushed out.
+        f(2)
+        f(3)
+        info = f.cache_info()
+        self.assertEqual((info.evictions, info.expirations), (0, 1))
+        self.assertEqual(info.currsize, 2)
+
+        f = self.module.lru_cache(maxsize=2, ttl=3600)(lambda x: x)
+        for x in range(5):
+            f(x)
+        info = f.cache_info()
+        self.assertEqual((info.evictions, info.expirations), (3, 0))
+        self.assertEqual(info.currsize, 2)
+
+    def test_lru_cache_ttl_unbounded(self):
+        f = self.module.lru_cache(maxsize=None, ttl=3600)(lambda x: x)
+        for x in range(100):
+            f(x)
+            f(x)
+        self.assertEqual(f.cache_info(), (100, 100, None, 100, 0, 0, None))
+
+    def test_lru_cache_weigher(self):
+        f = self.module.lru_cache(maxsize=None, weigher=len,
+                                  maxweight=10)(lambda x: 'x' * x)
+        self.assertEqual(f(4), 'xxxx')
+        self.assertEqual(f(3), 'xxx')
+        self.assertEqual(f.cache_info(), (0, 2, None, 2, 0, 0, 7))
+        self.assertEqual(f(4), 'xxxx')    # 4 is now the most recent entry
+        self.assertEqual(f(2), 'xx')
+        self.assertEqual(f.cache_info(), (1, 3, None, 3, 0, 0, 9))
+        # Adding 5 pushes out 3 and 4, the least recently used entries.
+        self.assertEqual(f(5), 'xxxxx')
+        self.assertEqual(f.cache_info(), (1, 4, None, 2, 2, 0, 7))
+        f(2)
+        self.assertEqual(f.cache_info().hits, 2)
+
+        # Results heavier than maxweight are never cached.
+        self.assertEqual(f(11), 'x' * 11)
+        self.assertEqual(f(11), 'x' * 11)
+        self.assertEqual(f.cache_info(), (2, 6, None, 2, 2, 0, 7))
+
+        # A zero weight is allowed.
+        f(0)
+        self.assertEqual(f.cache_info().currweight, 7)
+        self.assertEqual(f.cache_info().currsize, 3)
+
+        f.cache_clear()
+        self.assertEqual(f.cache_info(), (0, 0, None, 0, 0, 0, 0))
+
+    def test_lru_cache_weigher_and_maxsize(self):
+        f = self.module.lru_cache(maxsize=2, weigher=lambda r: 1,
+                                  maxweight=100)(lambda x: x)
+        for x in range(5):
+            f(x)
+        self.assertEqual(f.cache_info(), (0, 5, 2, 2, 3, 0, 2))
+
+        # Without maxweight the weight is only reported.
+        f = self.module.lru_cache(maxsize=None, weigher=len)(str)
+        f(12345)
+        f(6789)
+        self.assertEqual(f.cache_info().currweight, 9)
+
+    def test_lru_cache_bad_weigher(self):
+        f = self.module.lru_cache(weigher=lambda r: r, maxweight=10)(lambda x: x)
+        with self.assertRaises(ValueError):
+            f(-1)
+        with self.assertRaises(TypeError):
+            f('spam')
+        # Weights must be integers, not merely real numbers.
+        with self.assertRaises(TypeError):
+            f(2.5)
+        self.assertEqual(f.cache_info().currsize, 0)
+        self.assertEqual(f(1), 1)
+        self.assertEqual(f.cache_info().currsize, 1)
+
+    def test_lru_cache_bad_eviction_arguments(self):
+        with self.assertRaises(ValueError):
+            self.module.lru_cache(ttl=0)
+        with self.assertRaises(ValueError):
+            self.module.lru_cache(ttl=-1)
+        with self.assertRaises(TypeError):
+            self.module.lru_cache(maxweight=10)
+        with self.assertRaises(TypeError):
+            self.module.lru_cache(weigher=10, maxweight=10)
+        with self.assertRaises(ValueError):
+            self.module.lru_cache(weigher=len, maxweight=-1)
+        with self.assertRaises(TypeError):
+            self.module.lru_cache(weigher=len, maxweight=2.5)
+
+    def test_lru_cache_sharded_weigher(self):
+        f = self.module.lru_cache(maxsize=None, shards=4, ttl=3600,
+                                  weigher=len, maxweight=40)(lambda x: 'x' * x)
+        self.assertEqual(f.cache_parameters(),
+                         {'maxsize': None, 'typed': False, 'shards': 4,
+                          'ttl': 3600, 'weigher': len, 'maxweight': 40})
+        for x in range(1, 11):
+            f(x)
+        info = f.cache_info()
+        self.assertLessEqual(info.currweight, 40)
+        self.assertEqual(info.misses, 10)
+        self.assertEqual(info.evictions, 10 - info.currsize)
+        f.cache_clear()
+        self.assertEqual(f.cache_info(), (0, 0, None, 0, 0, 0, 0))
+
+    def test_lru_cache_coroutine_function(self):
+        calls = []
+        @self.module.lru_cache
+        async def coro(x):
+            calls.append(x)
+            await asyncio.sleep(0)
+            return x * 2
+
+        self.assertTrue(inspect.iscoroutinefunction(coro))
+        self.assertEqual(coro.__name__, 'coro')
+        self.assertEqual(coro.cache_parameters(),
+                         {'maxsize': 128, 'typed': False})
+
+        async def main():
+            self.assertEqual(await coro(1), 2)
+            self.assertEqual(await coro(1), 2)
+            self.assertEqual(await coro(2), 4)
+        asyncio.run(main())
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(coro.cache_info(), (1, 2, 128, 2))
+
+        # Results outlive the event loop that computed them.
+        self.assertEqual(asyncio.run(coro(1)), 2)
+        self.assertEqual(calls, [1, 2])
+
+        coro.cache_clear()
+        self.assertEqual(coro.cache_info(), (0, 0, 128, 0))
+        self.assertEqual(asyncio.run(coro(1)), 2)
+        self.assertEqual(calls, [1, 2, 1])
+
+    def test_lru_cache_coroutine_concurrent_calls(self):
+        calls = []
+        @self.module.lru_cache(maxsize=10)
+        async def coro(x):
+            calls.append(x)
+            await release.wait()
+            return [x]
+
+        async def main():
+            nonlocal release
+            release = asyncio.Event()
+            tasks = [asyncio.create_task(coro(1)) for _ in range(10)]
+            tasks.append(asyncio.create_task(coro(2)))
+            await asyncio.sleep(0)
+            release.set()
+            return await asyncio.gather(*tasks)
+
+        release = None
+        results = asyncio.run(main())
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(results[:10], [[1]] * 10)
+        # All the callers share the same result object.
+        self.assertTrue(all(r is results[0] for r in results[:10]))
+        self.assertEqual(results[10], [2])
+        self.assertEqual(coro.cache_info(), (9, 2, 10, 2))
+
+    def test_lru_cache_coroutine_exception_not_cached(self):
+        calls = 0
+        @self.module.lru_cache
+        async def coro(x):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            if calls == 1:
+                raise ValueError(x)
+            return x
+
+        async def main():
+            with self.assertRaises(ValueError):
+                await coro(1)
+            self.assertEqual(await coro(1), 1)
+            self.assertEqual(await coro(1), 1)
+        asyncio.run(main())
+        self.assertEqual(calls, 2)
+        self.assertEqual(coro.cache_info(), (1, 2, 128, 1))
+
+    def test_lru_cache_coroutine_failed_call_discarded(self):
+        # Retries of a failed call are misses, and the cache does not keep
+        # the exception alive.
+        class Error(Exception):
+            pass
+        for maxsize, kwargs in ((None, {}), (128, {}), (128, {'shards': 4}),
+                                (128, {'ttl': 3600})):
+            with self.subTest(maxsize=maxsize, **kwargs):
+                @self.module.lru_cache(maxsize, **kwargs)
+                async def coro(x):
+                    await asyncio.sleep(0)
+                    raise Error(x)
+
+                async def main():
+                    for _ in range(3):
+                        with self.assertRaises(Error) as cm:
+                            await coro(1)
+                    return weakref.ref(cm.exception)
+                ref = asyncio.run(main())
+                info = coro.cache_info()
+                self.assertEqual(info.hits, 0)
+                self.assertEqual(info.misses, 3)
+                self.assertEqual(info.currsize, 0)
+                support.gc_collect()
+                self.assertIsNone(ref())
+
+    def test_lru_cache_coroutine_cancelled_caller(self):
+        calls = 0
+        @self.module.lru_cache
+        async def coro():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 'done'
+
+        async def main():
+            first = asyncio.create_task(coro())
+            second = asyncio.create_task(coro())
+            await asyncio.sleep(0)
+            # Cancelling one caller does not cancel the shared call.
+            first.cancel()
+            self.assertEqual(await second, 'done')
+            with self.assertRaises(asyncio.CancelledError):
+                await first
+            self.assertEqual(await coro(), 'done')
+        asyncio.run(main())
+        self.assertEqual(calls, 1)
+
+    def test_lru_cache_coroutine_method(self):
+        module = self.module
+        class A:
+            @module.lru_cache(maxsize=None, ttl=3600)
+            async def f(self, x):
+                return (self, x)
+        a = A()
+        async def main():
+            self.assertEqual(await a.f(1), (a, 1))
+            self.assertEqual(await a.f(1), (a, 1))
+        asyncio.run(main())
+        self.assertTrue(inspect.iscoroutinefunction(a.f))
+        self.assertEqual(A.f.cache_info().hits, 1)
+
+    def test_lru_cache_coroutine_weigher(self):
+        with self.assertRaises(TypeError):
+            @self.module.lru_cache(weigher=len)
+            async def coro():
+                return ''
+
     @support.suppress_immortalization()
     def test_lru_cache_weakrefable(self):
         @self.module.lru_cache
@@ -1987,6 +2362,23 @@ def cached_meth(self, x, y):
         def cached_staticmeth(x, y):
             return 3 * x + y
 
+    @unittest.skipUnless(c_functools, 'requires the C _functools module')
+    def test_lru_cache_sharded_c_wrapper(self):
+        # The C wrapper picks the shard from the key it builds.
+        @self.module.lru_cache(maxsize=4, shards=2)
+        def f(x):
+            return x
+        self.assertIsInstance(f, c_functools._lru_cache_wrapper)
+        for x in range(8):
+            f(x)
+            f(x)
+        self.assertEqual(f.cache_info().hits, 8)
+        self.assertLessEqual(f.cache_info().currsize, 4)
+
+        with self.assertRaises(ValueError):
+            c_functools._lru_cache_wrapper(f, 4, False, c_functools._CacheInfo,
+                                           shards=0)
+
 
 class TestSingleDispatch(unittest.TestCase):
     def test_simple_overloads(self):
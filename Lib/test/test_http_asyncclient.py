@@ -0,0 +1,303 @@
+import asyncio
+import unittest
+from http import asyncclient, client
+
+from test import support
+from test.support import socket_helper
+
+support.requires_working_socket(module=True)
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class Server:
+    """HTTP/1.1 server replying to each request with a canned response."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.connections = 0
+        self.requests = []
+
+    async def start(self):
+        self.server = await asyncio.start_server(
+            self.handle, socket_helper.HOSTv4, 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    def url(self, path='/'):
+        return f'http://{socket_helper.HOSTv4}:{self.port}{path}'
+
+    async def read_body(self, reader, head):
+        lines = head.lower().split(b'\r\n')
+        if b'transfer-encoding: chunked' in lines:
+            body = b''
+            while True:
+                size = int(await reader.readline(), 16)
+                body += await reader.readexactly(size + 2)
+                if not size:
+                    return body[:-2]
+                body = body[:-2]
+        for line in lines:
+            if line.startswith(b'content-length:'):
+                return await reader.readexactly(int(line.split(b':')[1]))
+        return b''
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.IncompleteReadError:
+                    break
+                body = await self.read_body(reader, head)
+                self.requests.append((head, body))
+                response = self.respond(head, body)
+                if response is None:
+                    break
+                writer.write(response)
+                await writer.drain()
+                if (response.startswith(b'HTTP/1.0')
+                        or b'connection: close' in response.lower()):
+                    break
+        finally:
+            writer.close()
+
+
+def ok(body=b'hello', extra=b''):
+    return (b'HTTP/1.1 200 OK\r\nContent-Length: %d\r\n%s\r\n%s'
+            % (len(body), extra, body))
+
+
+class ClientSessionTests(unittest.IsolatedAsyncioTestCase):
+
+    async def start_server(self, respond=lambda head, body: ok()):
+        server = Server(respond)
+        await server.start()
+        self.addAsyncCleanup(server.stop)
+        return server
+
+    async def make_session(self, **kwargs):
+        session = asyncclient.ClientSession(**kwargs)
+        self.addAsyncCleanup(session.close)
+        return session
+
+    async def test_get(self):
+        server = await self.start_server()
+        session = await self.make_session()
+        async with await session.request('GET', server.url('/a?b=c')) as resp:
+            self.assertEqual(resp.status, 200)
+            self.assertEqual(resp.reason, 'OK')
+            self.assertEqual(resp.version, 11)
+            self.assertIsInstance(resp.headers, client.HTTPMessage)
+            self.assertEqual(resp.getheader('content-length'), '5')
+            self.assertEqual(await resp.read(), b'hello')
+            self.assertTrue(resp.closed)
+            self.assertEqual(await resp.read(), b'')
+        head = server.requests[0][0]
+        self.assertTrue(head.startswith(b'GET /a?b=c HTTP/1.1\r\n'))
+        self.assertIn(b'\r\nHost: %s:%d\r\n'
+                      % (socket_helper.HOSTv4.encode(), server.port), head)
+
+    async def test_keep_alive(self):
+        server = await self.start_server()
+        session = await self.make_session()
+        for _ in range(3):
+            async with await session.request('GET', server.url()) as resp:
+                self.assertEqual(await resp.read(), b'hello')
+        self.assertEqual(server.connections, 1)
+
+    async def test_concurrent_requests(self):
+        server = await self.start_server()
+        session = await self.make_session(max_connections_per_host=3)
+
+        async def fetch():
+            async with await session.request('GET', server.url()) as resp:
+                await asyncio.sleep(0.01)
+                return await resp.read()
+
+        results = await asyncio.gather(*[fetch() for _ in range(10)])
+        self.assertEqual(results, [b'hello'] * 10)
+        self.assertEqual(server.connections, 3)
+
+    async def test_unread_response_closes_connection(self):
+        server = await self.start_server()
+        session = await self.make_session()
+        async with await session.request('GET', server.url()) as resp:
+            self.assertEqual(await resp.read(2), b'he')
+        self.assertTrue(resp.closed)
+        async with await session.request('GET', server.url()) as resp:
+            self.assertEqual(await resp.read(), b'hello')
+        self.assertEqual(server.connections, 2)
+
+    async def test_connection_close(self):
+        server = await self.start_server(
+            lambda head, body: ok(extra=b'Connection: close\r\n'))
+        session = await self.make_session()
+        for _ in range(2):
+            async with await session.request('GET', server.url()) as resp:
+                self.assertEqual(await resp.read(), b'hello')
+        self.assertEqual(server.connections, 2)
+
+    async def test_read_until_eof(self):
+        server = await self.start_server(
+            lambda head, body: b'HTTP/1.0 200 OK\r\n\r\nuntil eof')
+        session = await self.make_session()
+        async with await session.request('GET', server.url()) as resp:
+            self.assertEqual(resp.version, 10)
+            self.assertEqual(await resp.read(), b'until eof')
+
+    async def test_chunked_response(self):
+        server = await self.start_server(lambda head, body: (
+            b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+            b'4;ext=1\r\nspam\r\n3\r\nham\r\n0\r\nTrailer: x\r\n\r\n'))
+        session = await self.make_session()
+        for _ in range(2):
+            async with await session.request('GET', server.url()) as resp:
+                self.assertEqual([chunk async for chunk in resp],
+                                 [b'spam', b'ham'])
+        self.assertEqual(server.connections, 1)
+
+    async def test_streaming_body(self):
+        server = await self.start_server()
+        session = await self.make_session()
+
+        async def agen():
+            yield b'spam'
+            yield b''
+            yield b'ham'
+
+        for body in agen(), iter([b'spam', b'ham']):
+            async with await session.request('POST', server.url(),
+                                             body=body) as resp:
+                await resp.read()
+        for head, body in server.requests:
+            self.assertIn(b'\r\nTransfer-Encoding: chunked\r\n', head)
+            self.assertEqual(body, b'spamham')
+
+    async def test_body(self):
+        server = await self.start_server()
+        session = await self.make_session()
+        for body in b'data', 'data', None:
+            async with await session.request('POST', server.url(),
+                                             body=body) as resp:
+                await resp.read()
+        self.assertEqual([body for head, body in server.requests],
+                         [b'data', b'data', b''])
+        self.assertIn(b'\r\nContent-Length: 0\r\n', server.requests[2][0])
+
+    async def test_head_and_no_content(self):
+        server = await self.start_server(lambda head, body: (
+            b'HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\n'
+            if head.startswith(b'HEAD') else
+            b'HTTP/1.1 204 No Content\r\n\r\n'))
+        session = await self.make_session()
+        for method in 'HEAD', 'DELETE', 'HEAD':
+            resp = await session.request(method, server.url())
+            self.assertTrue(resp.closed)
+            self.assertEqual(await resp.read(), b'')
+        self.assertEqual(server.connections, 1)
+
+    async def test_continue(self):
+        server = await self.start_server(lambda head, body: (
+            b'HTTP/1.1 100 Continue\r\n\r\n' + ok()))
+        session = await self.make_session()
+        async with await session.request('GET', server.url()) as resp:
+            self.assertEqual(resp.status, 200)
+            self.assertEqual(await resp.read(), b'hello')
+
+    async def test_retry_on_closed_idle_connection(self):
+        server = await self.start_server(
+            lambda head, body: ok() if len(server.requests) != 2 else None)
+        session = await self.make_session()
+        for _ in range(3):
+            async with await session.request('GET', server.url()) as resp:
+                self.assertEqual(await resp.read(), b'hello')
+        self.assertEqual(server.connections, 2)
+
+    async def test_no_retry_non_idempotent_request(self):
+        server = await self.start_server(
+            lambda head, body: ok() if len(server.requests) != 2 else None)
+        session = await self.make_session()
+        async with await session.request('GET', server.url()) as resp:
+            self.assertEqual(await resp.read(), b'hello')
+        # The server may have processed the request before closing the
+        # connection: a POST request is not sent again.
+        with self.assertRaises(client.RemoteDisconnected):
+            await session.request('POST', server.url(), body=b'data')
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(server.connections, 1)
+
+    async def test_remote_disconnected(self):
+        server = await self.start_server(lambda head, body: None)
+        session = await self.make_session()
+        with self.assertRaises(client.RemoteDisconnected):
+            await session.request('GET', server.url())
+
+    async def test_incomplete_read(self):
+        server = await self.start_server(lambda head, body: (
+            b'HTTP/1.1 200 OK\r\nContent-Length: 10\r\n'
+            b'Connection: close\r\n\r\nshort'))
+        session = await self.make_session()
+        async with await session.request('GET', server.url()) as resp:
+            with self.assertRaises(client.IncompleteRead):
+                await resp.read()
+            self.assertTrue(resp.closed)
+
+    async def test_bad_status_line(self):
+        server = await self.start_server(lambda head, body: b'spam\r\n\r\n')
+        session = await self.make_session()
+        with self.assertRaises(client.BadStatusLine):
+            await session.request('GET', server.url())
+
+    async def test_timeout(self):
+        server = await self.start_server(lambda head, body: b'')
+        session = await self.make_session(timeout=0.01)
+        with self.assertRaises(TimeoutError):
+            await session.request('GET', server.url())
+        with self.assertRaises(TimeoutError):
+            async with asyncio.timeout(0.01):
+                await session.request('GET', server.url(), timeout=60)
+
+    async def test_idle_timeout(self):
+        server = await self.start_server()
+        session = await self.make_session(idle_timeout=0)
+        for _ in range(2):
+            async with await session.request('GET', server.url()) as resp:
+                await resp.read()
+        self.assertEqual(server.connections, 2)
+
+    async def test_invalid_requests(self):
+        session = await self.make_session()
+        with self.assertRaises(client.InvalidURL):
+            await session.request('GET', 'ftp://example.com/')
+        with self.assertRaises(client.InvalidURL):
+            await session.request('GET', 'http:///path')
+        with self.assertRaises(client.InvalidURL):
+            await session.request('GET', 'http://example.com/a b')
+        with self.assertRaises(ValueError):
+            await session.request('GET\r\n', 'http://example.com/')
+        with self.assertRaises(ValueError):
+            await session.request('GET', 'http://example.com/',
+                                  headers={'X-Spam': 'a\r\nb: c'})
+        with self.assertRaises(ValueError):
+            asyncclient.ClientSession(max_connections_per_host=0)
+
+    async def test_closed_session(self):
+        server = await self.start_server()
+        session = await self.make_session()
+        resp = await session.request('GET', server.url())
+        await session.close()
+        self.assertTrue(session.closed)
+        self.assertEqual(await resp.read(), b'hello')
+        with self.assertRaises(RuntimeError):
+            await session.request('GET', server.url())
+
+
+if __name__ == "__main__":
+    unittest.main()
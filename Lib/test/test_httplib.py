@@ -2026,6 +2026,66 @@ def test_local_good_hostname(self):
         self.addCleanup(resp.close)
         self.assertEqual(resp.status, 404)
 
+    def _request_with_cache(self, port, context, cache):
+        h = client.HTTPSConnection('localhost', port, context=context,
+                                   session_cache=cache)
+        hits = cache.hits
+        try:
+            h.request('GET', '/nonexistent')
+            with h.getresponse() as resp:
+                resp.read()
+        finally:
+            h.close()
+        return cache.hits > hits
+
+    def test_session_resumption(self):
+        import ssl
+        server = self.make_server(CERT_localhost)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.load_verify_locations(CERT_localhost)
+        cache = client.SSLSessionCache()
+        self.assertFalse(self._request_with_cache(server.port, context, cache))
+        self.assertEqual(len(cache), 1)
+        self.assertTrue(self._request_with_cache(server.port, context, cache))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # Sessions are not shared between contexts.
+        context2 = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context2.load_verify_locations(CERT_localhost)
+        self.assertFalse(self._request_with_cache(server.port, context2, cache))
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertEqual(len(cache), 2)
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_session_resumption_on_reconnect(self):
+        import ssl
+        server = self.make_server(CERT_localhost)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.load_verify_locations(CERT_localhost)
+        h = client.HTTPSConnection('localhost', server.port, context=context)
+        self.addCleanup(h.close)
+        for _ in range(2):
+            h.request('GET', '/nonexistent')
+            with h.getresponse() as resp:
+                resp.read()
+            h.close()
+        self.assertEqual((h.session_cache.hits, h.session_cache.misses),
+                         (1, 1))
+
+    def test_session_cache_maxsize(self):
+        cache = client.SSLSessionCache(maxsize=2)
+        cache._put('a', 1)
+        cache._put('b', 2)
+        self.assertEqual(cache._get('a'), 1)
+        cache._put('c', 3)
+        self.assertIsNone(cache._get('b'))
+        self.assertEqual(cache._get('a'), 1)
+        self.assertEqual(cache._get('c'), 3)
+        with self.assertRaises(ValueError):
+            client.SSLSessionCache(maxsize=0)
+
     def test_local_bad_hostname(self):
         # The (valid) cert doesn't validate the HTTPS hostname
         import ssl
@@ -0,0 +1,160 @@
+"""
+Tests for the io_uring wrapper.
+"""
+import errno
+import gc
+import os
+import select
+import socket
+import time
+import unittest
+from test.support import os_helper
+
+if not hasattr(select, "io_uring"):
+    raise unittest.SkipTest("test works only on Linux 5.11+")
+
+try:
+    select.io_uring().close()
+except OSError as e:
+    if e.errno in (errno.ENOSYS, errno.EPERM):
+        raise unittest.SkipTest("kernel doesn't support io_uring")
+    raise
+
+
+class TestIoUring(unittest.TestCase):
+
+    def setUp(self):
+        self.ring = select.io_uring(8)
+        self.addCleanup(self.ring.close)
+        self.a, self.b = socket.socketpair()
+        self.addCleanup(self.a.close)
+        self.addCleanup(self.b.close)
+        self.a.setblocking(False)
+        self.b.setblocking(False)
+
+    def test_create(self):
+        ring = select.io_uring()
+        self.assertGreater(ring.fileno(), 0)
+        self.assertFalse(ring.closed)
+        self.assertFalse(os.get_inheritable(ring.fileno()))
+        ring.close()
+        self.assertTrue(ring.closed)
+        self.assertRaises(ValueError, ring.fileno)
+        self.assertRaises(ValueError, ring.nop, 1)
+        self.assertRaises(ValueError, ring.wait, 0)
+        ring.close()
+        self.assertRaises(ValueError, select.io_uring, 0)
+        with select.io_uring() as ring:
+            self.assertFalse(ring.closed)
+        self.assertTrue(ring.closed)
+
+    def test_nop(self):
+        self.ring.nop(1)
+        self.ring.nop(2)
+        self.assertEqual(sorted(self.ring.wait()), [(1, 0, 0), (2, 0, 0)])
+
+    def test_wait_timeout(self):
+        self.assertEqual(self.ring.wait(0), [])
+        t = time.monotonic()
+        self.assertEqual(self.ring.wait(0.1), [])
+        self.assertGreaterEqual(time.monotonic() - t, 0.09)
+        self.assertRaises(TypeError, self.ring.wait, 'x')
+
+    def test_submit_batches(self):
+        # Queuing more operations than the ring can hold submits them.
+        for i in range(20):
+            self.ring.nop(i)
+        self.assertLessEqual(self.ring.submit(), 8)
+        results = []
+        while len(results) < 20:
+            results += self.ring.wait(1.0)
+        self.assertEqual(sorted(results), [(i, 0, 0) for i in range(20)])
+
+    def test_recv_send(self):
+        buf = bytearray(10)
+        self.ring.recv(1, self.a, buf)
+        # The receive waits for data although the socket is non-blocking.
+        self.assertEqual(self.ring.wait(0), [])
+        self.ring.send(2, self.b.fileno(), b'spam')
+        results = []
+        while len(results) < 2:
+            results += self.ring.wait(1.0)
+        self.assertEqual(sorted(results), [(1, 4, 0), (2, 4, 0)])
+        self.assertEqual(buf[:4], b'spam')
+
+    def test_buffer_kept_alive(self):
+        self.ring.recv(1, self.a, bytearray(10))
+        gc.collect()
+        buf = bytearray(10)
+        self.ring.recv(2, self.a, buf)
+        with self.assertRaises(BufferError):
+            buf.append(0)
+        with self.assertRaisesRegex(ValueError, 'already in use'):
+            self.ring.recv(2, self.a, bytearray(1))
+        self.b.send(b'ab')
+        self.assertEqual(self.ring.wait(1.0), [(1, 2, 0)])
+        self.ring.cancel(3, 2)
+        self.assertEqual(sorted(self.ring.wait(1.0)),
+                         [(2, -errno.ECANCELED, 0), (3, 0, 0)])
+        buf.append(0)
+
+    def test_bad_buffer(self):
+        self.assertRaises(TypeError, self.ring.recv, 1, self.a, b'readonly')
+        self.assertRaises(TypeError, self.ring.send, 1, self.a, 'text')
+        self.assertRaises(ValueError, self.ring.nop, -1)
+        self.assertRaises(ValueError, self.ring.nop, 2**64 - 1)
+        self.assertEqual(self.ring.wait(0), [])
+
+    def test_errors(self):
+        self.ring.recv(1, self.a, bytearray(1), 0)
+        self.ring.cancel(2, 12345)
+        self.ring.nop(3)
+        self.a.shutdown(socket.SHUT_RD)
+        results = []
+        while len(results) < 3:
+            results += self.ring.wait(1.0)
+        self.assertEqual(sorted(results),
+                         [(1, 0, 0), (2, -errno.ENOENT, 0), (3, 0, 0)])
+
+    def test_read_write_file(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        with open(os_helper.TESTFN, 'w+b') as f:
+            self.ring.write(1, f.fileno(), b'0123456789', 0)
+            self.assertEqual(self.ring.wait(1.0), [(1, 10, 0)])
+            buf = bytearray(4)
+            self.ring.read(2, f, buf, 3)
+            self.assertEqual(self.ring.wait(1.0), [(2, 4, 0)])
+            self.assertEqual(buf, b'3456')
+
+    def test_accept_and_poll(self):
+        with socket.create_server(('127.0.0.1', 0)) as server:
+            self.ring.poll_add(1, server, select.POLLIN)
+            client = socket.create_connection(server.getsockname())
+            self.addCleanup(client.close)
+            [(user_data, events, flags)] = self.ring.wait(1.0)
+            self.assertEqual(user_data, 1)
+            self.assertTrue(events & select.POLLIN)
+            self.ring.accept(2, server, socket.SOCK_CLOEXEC)
+            [(user_data, fd, flags)] = self.ring.wait(1.0)
+            self.assertEqual(user_data, 2)
+            self.assertGreater(fd, 0)
+            self.assertFalse(os.get_inheritable(fd))
+            os.close(fd)
+
+        self.ring.poll_add(3, self.a, select.POLLOUT)
+        [(user_data, events, flags)] = self.ring.wait(1.0)
+        self.assertEqual(user_data, 3)
+        self.assertTrue(events & select.POLLOUT)
+
+    def test_close_with_pending_operations(self):
+        buf = bytearray(10)
+        self.ring.recv(1, self.a, buf)
+        self.ring.poll_add(2, self.a, select.POLLIN)
+        self.ring.submit()
+        self.ring.close()
+        # The buffer is released once the operation has been cancelled.
+        buf.append(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
+import io
 from io import StringIO
 from test.test_json import PyTest, CTest
+from test.support import os_helper
 
 from test.support import bigmemtest, _1G
 
@@ -57,6 +59,65 @@ def __lt__(self, o):
         d[1337] = "true.dat"
         self.assertEqual(self.dumps(d, sort_keys=True), '{"1337": "true.dat"}')
 
+    def test_dump_large(self):
+        # The output is written in a few large blocks.
+        class Writer:
+            def __init__(self):
+                self.chunks = []
+            def write(self, chunk):
+                self.chunks.append(chunk)
+        obj = [{'id': i, 'name': f'item {i}', 'tags': ['a', 'b']}
+               for i in range(20000)]
+        for kwargs in {}, {'indent': 2}, {'sort_keys': True}:
+            with self.subTest(**kwargs):
+                writer = Writer()
+                self.json.dump(obj, writer, **kwargs)
+                expected = self.dumps(obj, **kwargs)
+                self.assertEqual(''.join(writer.chunks), expected)
+                self.assertGreater(len(writer.chunks), 1)
+                self.assertLess(len(writer.chunks), len(expected) // 10000)
+
+    def test_dump_binary(self):
+        obj = {'a': ['\xe9\u20ac\U0001f600', 1.5, None]}
+        for kwargs in {}, {'ensure_ascii': False}:
+            with self.subTest(**kwargs):
+                bio = io.BytesIO()
+                self.json.dump(obj, bio, **kwargs)
+                self.assertEqual(bio.getvalue(),
+                                 self.dumps(obj, **kwargs).encode('utf-8'))
+                self.assertEqual(self.json.loads(bio.getvalue()), obj)
+
+    def test_dump_raw_file(self):
+        obj = [list(range(100))] * 1000
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        with open(os_helper.TESTFN, 'wb', buffering=0) as f:
+            self.json.dump(obj, f)
+        with open(os_helper.TESTFN, 'rb') as f:
+            self.assertEqual(f.read(), self.dumps(obj).encode())
+
+    def test_dump_error(self):
+        sio = StringIO()
+        with self.assertRaises(TypeError):
+            self.json.dump([1, 2, object()], sio)
+
+        class Error(Exception):
+            pass
+        class Writer:
+            def write(self, chunk):
+                raise Error
+        with self.assertRaises(Error):
+            self.json.dump(list(range(100000)), Writer())
+
+    def test_dump_custom_iterencode(self):
+        # json.dump() still uses an overridden iterencode().
+        class Encoder(self.json.JSONEncoder):
+            def iterencode(self, o, _one_shot=False):
+                yield from super().iterencode(o, _one_shot)
+                yield '\n'
+        sio = StringIO()
+        self.json.dump([1], sio, cls=Encoder)
+        self.assertEqual(sio.getvalue(), '[1]\n')
+
 
 class TestPyDump(TestDump, PyTest): pass
 
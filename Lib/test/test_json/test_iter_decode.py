@@ -0,0 +1,179 @@
+import io
+from decimal import Decimal
+from test.test_json import PyTest, CTest
+
+
+def split(s, size):
+    return [s[i:i + size] for i in range(0, len(s), size)]
+
+
+DOC = '[1, -2.5e3, "spam \\u00e9", {"a": [true, false, null]}, [], {}, 12345]'
+
+
+class TestIterDecode:
+    def iter_decode(self, chunks, **kwargs):
+        return list(self.json.JSONDecoder().iter_decode(chunks, **kwargs))
+
+    def test_array(self):
+        expected = self.loads(DOC)
+        for size in range(1, len(DOC) + 1):
+            with self.subTest(size=size):
+                self.assertEqual(self.iter_decode(split(DOC, size)), expected)
+
+    def test_empty_array(self):
+        self.assertEqual(self.iter_decode(['[]']), [])
+        self.assertEqual(self.iter_decode([' \n[', ' ', ']\n']), [])
+
+    def test_numbers_across_chunks(self):
+        self.assertEqual(self.iter_decode(['[1', '2, 3', '4.5e', '1, -', '7]']),
+                         [12, 345.0, -7])
+        self.assertEqual(self.iter_decode(['12\n3', '4'], lines=True),
+                         [12, 34])
+
+    def test_lines(self):
+        values = [{'a': 1}, [1, 2], 'x', 3, None]
+        doc = '\n'.join(self.dumps(value) for value in values) + '\n'
+        for size in (1, 2, 5, len(doc)):
+            with self.subTest(size=size):
+                self.assertEqual(self.iter_decode(split(doc, size), lines=True),
+                                 values)
+        self.assertEqual(self.iter_decode(['1 2[3]{}'], lines=True),
+                         [1, 2, [3], {}])
+        self.assertEqual(self.iter_decode([], lines=True), [])
+        self.assertEqual(self.iter_decode(['  \n'], lines=True), [])
+
+    def test_incremental(self):
+        # Items are yielded before the rest of the input is read.
+        read = []
+        def chunks():
+            for chunk in ['[{"a": 1}, ', '2, ', '3]']:
+                read.append(chunk)
+                yield chunk
+        it = self.json.JSONDecoder().iter_decode(chunks())
+        self.assertEqual(next(it), {'a': 1})
+        self.assertEqual(len(read), 1)
+        self.assertEqual(next(it), 2)
+        self.assertEqual(len(read), 2)
+        self.assertEqual(next(it), 3)
+        self.assertEqual(list(it), [])
+
+    def test_hooks(self):
+        decoder = self.json.JSONDecoder(parse_float=Decimal,
+                                        object_pairs_hook=list)
+        self.assertEqual(list(decoder.iter_decode(['[1.5, {"a"', ': 2}]'])),
+                         [Decimal('1.5'), [('a', 2)]])
+
+    def test_errors(self):
+        for doc, msg, pos in [
+            ('', "Expecting '['", 0),
+            ('{}', "Expecting '['", 0),
+            ('[1', "Expecting ',' delimiter", 2),
+            ('[1 2]', "Expecting ',' delimiter", 3),
+            ('[1,]', "Illegal trailing comma before end of array", 2),
+            ('[1, ,2]', "Expecting value", 4),
+            ('[1] 2', "Extra data", 4),
+            ('["a', "Unterminated string starting at", 1),
+            ('[\n1,\n2\n3]', "Expecting ',' delimiter", 7),
+        ]:
+            for size in (1, 3, len(doc) or 1):
+                with self.subTest(doc=doc, size=size):
+                    with self.assertRaises(self.JSONDecodeError) as cm:
+                        self.iter_decode(split(doc, size))
+                    self.assertEqual(cm.exception.msg, msg)
+                    self.assertEqual(cm.exception.pos, pos)
+                    with self.assertRaises(self.JSONDecodeError) as cm2:
+                        self.loads(doc if doc.startswith('[') else '[' + doc)
+                    if doc.startswith('['):
+                        self.assertEqual(cm.exception.lineno,
+                                         cm2.exception.lineno)
+                        self.assertEqual(cm.exception.colno,
+                                         cm2.exception.colno)
+
+    def test_error_before_end_of_buffer(self):
+        # An error inside the buffer is raised without reading the rest of
+        # the input.
+        read = []
+        def chunks():
+            for chunk in ['[1, {"a" 2}, ', '3, ', '4]']:
+                read.append(chunk)
+                yield chunk
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            self.iter_decode(chunks())
+        self.assertEqual(cm.exception.msg, "Expecting ':' delimiter")
+        self.assertEqual(cm.exception.pos, 9)
+        self.assertEqual(len(read), 1)
+
+    def test_truncated_tokens(self):
+        doc = '["\\ud834\\udd1e", -Infinity, NaN, true, false, null]'
+        expected = self.loads(doc)
+        for size in range(1, len(doc) + 1):
+            with self.subTest(size=size):
+                self.assertEqual(self.iter_decode(split(doc, size)), expected)
+
+    def test_nested_numbers_across_chunks(self):
+        doc = ('[{"a": 1.5}, {"b": 2e10}, [3.25, -7, -0.5e-3], '
+               '{"c": [-12, 1E+2, 0.0]}]')
+        expected = self.loads(doc)
+        for size in range(1, len(doc) + 1):
+            with self.subTest(size=size):
+                self.assertEqual(self.iter_decode(split(doc, size)), expected)
+        for size in (1, 7, 9, 21, 29):
+            with self.subTest(size=size):
+                fp = io.StringIO(doc)
+                chunks = iter(lambda: fp.read(size), '')
+                self.assertEqual(self.iter_decode(chunks), expected)
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            self.iter_decode(['[{"a": 1.', '}]'])
+        self.assertEqual(cm.exception.msg, "Expecting ',' delimiter")
+        self.assertEqual(cm.exception.pos, 8)
+
+    def test_lines_errors(self):
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            self.iter_decode(['1\n', '2\n', '{]\n'], lines=True)
+        self.assertEqual(cm.exception.pos, 5)
+        self.assertEqual(cm.exception.lineno, 3)
+        self.assertEqual(cm.exception.colno, 2)
+
+    def test_bad_chunks(self):
+        with self.assertRaises(TypeError):
+            self.iter_decode([b'[]'])
+        with self.assertRaises(self.JSONDecodeError):
+            self.iter_decode(['\ufeff[]'])
+
+
+class TestLoadIter:
+    def test_text(self):
+        fp = io.StringIO(DOC)
+        self.assertEqual(list(self.json.load_iter(fp)), self.loads(DOC))
+
+    def test_bytes(self):
+        for encoding in ['utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le',
+                         'utf-16-be', 'utf-32', 'utf-32-le', 'utf-32-be']:
+            with self.subTest(encoding=encoding):
+                fp = io.BytesIO(DOC.encode(encoding))
+                self.assertEqual(list(self.json.load_iter(fp)),
+                                 self.loads(DOC))
+        self.assertEqual(list(self.json.load_iter(io.BytesIO(b'[]'))), [])
+        self.assertEqual(list(self.json.load_iter(io.BytesIO(b'[1]'))), [1])
+
+    def test_large(self):
+        values = [{'id': i, 'name': f'item {i}'} for i in range(20000)]
+        fp = io.BytesIO(self.dumps(values).encode())
+        self.assertEqual(list(self.json.load_iter(fp)), values)
+
+    def test_lines(self):
+        fp = io.BytesIO(b'{"a": 1}\n{"a": 2}\n')
+        self.assertEqual(list(self.json.load_iter(fp, lines=True)),
+                         [{'a': 1}, {'a': 2}])
+
+    def test_hooks(self):
+        fp = io.StringIO('[1.5, {"a": 2}]')
+        result = self.json.load_iter(fp, parse_float=Decimal,
+                                     object_hook=lambda d: sorted(d))
+        self.assertEqual(list(result), [Decimal('1.5'), ['a']])
+
+
+class TestPyIterDecode(TestIterDecode, PyTest): pass
+class TestCIterDecode(TestIterDecode, CTest): pass
+class TestPyLoadIter(TestLoadIter, PyTest): pass
+class TestCLoadIter(TestLoadIter, CTest): pass
@@ -0,0 +1,161 @@
+import dataclasses
+import io
+import ipaddress
+import pathlib
+import uuid
+from fractions import Fraction
+from test.test_json import PyTest, CTest
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+@dataclasses.dataclass
+class Line:
+    start: Point
+    end: Point
+    label: str = 'line'
+    weight: float = dataclasses.field(default=1.0, init=False)
+
+
+class Slotted:
+    __slots__ = ('b', 'a')
+
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
+
+class SlottedChild(Slotted):
+    __slots__ = ('c', '_protected', '__private', '__weakref__')
+
+    def __init__(self, a, b, c):
+        super().__init__(a, b)
+        self.c = c
+        self._protected = self.__private = c
+
+
+class _(Slotted):
+    __slots__ = ('__private', 'd')
+
+    def __init__(self, a, b, d):
+        super().__init__(a, b)
+        self.d = d
+        self.__private = d
+
+
+class WithDict:
+    __slots__ = ('a', '__dict__')
+
+
+class TestObjectFields:
+    def dumps(self, obj, **kw):
+        kw.setdefault('object_fields', (Slotted,))
+        return super().dumps(obj, **kw)
+
+    def test_dataclass(self):
+        line = Line(Point(1, 2), Point(3, 4))
+        self.assertEqual(self.dumps(line),
+                         '{"start": {"x": 1, "y": 2}, "end": {"x": 3, "y": 4}, '
+                         '"label": "line", "weight": 1.0}')
+        self.assertEqual(self.loads(self.dumps([line, line])),
+                         [dataclasses.asdict(line)] * 2)
+
+    def test_slots(self):
+        self.assertEqual(self.dumps(Slotted(1, [2])), '{"b": [2], "a": 1}')
+        self.assertEqual(self.dumps(SlottedChild(1, 2, 3)),
+                         '{"b": 2, "a": 1, "c": 3}')
+        self.assertEqual(self.dumps(_(1, 2, 3)), '{"b": 2, "a": 1, "d": 3}')
+
+    def test_slots_opt_in(self):
+        # Slotted classes are only encoded if they are listed.
+        self.assertEqual(self.dumps(Point(1, 2), object_fields=True),
+                         '{"x": 1, "y": 2}')
+        self.assertRaises(TypeError, self.dumps, Slotted(1, 2),
+                          object_fields=True)
+        self.assertRaises(TypeError, self.dumps, Slotted(1, 2),
+                          object_fields=(SlottedChild,))
+        self.assertEqual(self.dumps(Slotted(1, 2), object_fields=True,
+                                    default=lambda o: 'other'),
+                         '"other"')
+
+    def test_stdlib_slots_use_default(self):
+        for obj in [Fraction(1, 3), uuid.UUID(int=1),
+                    pathlib.PurePosixPath('/tmp'),
+                    ipaddress.IPv4Address('127.0.0.1')]:
+            with self.subTest(obj=obj):
+                self.assertEqual(self.dumps(obj, object_fields=True,
+                                            default=str),
+                                 self.json.dumps(str(obj)))
+
+    def test_missing_attribute(self):
+        obj = Slotted(1, 2)
+        del obj.b
+        self.assertEqual(self.dumps(obj), '{"a": 1}')
+        del obj.a
+        self.assertEqual(self.dumps(obj), '{}')
+        self.assertEqual(self.dumps(obj, indent=2), '{}')
+
+    def test_sort_keys_and_indent(self):
+        self.assertEqual(self.dumps({'k': Slotted(1, 2)}, sort_keys=True,
+                                    indent=2, separators=(',', ': ')),
+                         '{\n  "k": {\n    "a": 1,\n    "b": 2\n  }\n}')
+
+    def test_ensure_ascii(self):
+        self.assertEqual(self.dumps(Point('\xe9', None)),
+                         '{"x": "\\u00e9", "y": null}')
+        self.assertEqual(self.dumps(Point('\xe9', None), ensure_ascii=False),
+                         '{"x": "\xe9", "y": null}')
+
+    def test_other_objects_use_default(self):
+        self.assertRaises(TypeError, self.dumps, WithDict())
+        self.assertRaises(TypeError, self.dumps, object())
+        self.assertRaises(TypeError, self.dumps, Point)
+        self.assertEqual(self.dumps([WithDict(), Point(1, 2)],
+                                    default=lambda o: 'other'),
+                         '["other", {"x": 1, "y": 2}]')
+
+    def test_disabled_by_default(self):
+        self.assertRaises(TypeError, self.json.dumps, Point(1, 2))
+        self.assertEqual(self.json.dumps(Point(1, 2), default=vars),
+                         '{"x": 1, "y": 2}')
+
+    def test_circular(self):
+        obj = Slotted(1, None)
+        obj.b = obj
+        with self.assertRaises(ValueError) as cm:
+            self.dumps(obj)
+        self.assertRegex(cm.exception.__notes__[0],
+                         r"^when serializing (\S+\.)?Slotted field 'b'$")
+        self.assertRaises(RecursionError, self.dumps, obj,
+                          check_circular=False)
+
+    def test_error_notes(self):
+        with self.assertRaises(TypeError) as cm:
+            self.dumps([Point(1, object())])
+        notes = cm.exception.__notes__
+        self.assertEqual(len(notes), 2)
+        self.assertRegex(notes[0], r"^when serializing (\S+\.)?Point field 'y'$")
+        self.assertEqual(notes[1], 'when serializing list item 0')
+
+    def test_encoder_reuse(self):
+        encoder = self.json.JSONEncoder(object_fields=True)
+        self.assertEqual(encoder.encode(Point(1, 2)), '{"x": 1, "y": 2}')
+        self.assertEqual(''.join(encoder.iterencode([Point(3, 4)])),
+                         '[{"x": 3, "y": 4}]')
+        self.assertRaises(TypeError, encoder.encode, Slotted(1, 2))
+        encoder.object_fields = (Slotted,)
+        encoder.sort_keys = True
+        self.assertEqual(encoder.encode(Slotted(1, 2)), '{"a": 1, "b": 2}')
+
+    def test_dump(self):
+        sio = io.StringIO()
+        self.json.dump([Point(1, 2)] * 3, sio, object_fields=True)
+        self.assertEqual(sio.getvalue(), '[' + ', '.join(['{"x": 1, "y": 2}'] * 3) + ']')
+
+
+class TestPyObjectFields(TestObjectFields, PyTest): pass
+class TestCObjectFields(TestObjectFields, CTest): pass
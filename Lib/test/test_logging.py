@@ -670,6 +670,7 @@ def test_pathlike_objects(self):
                     (logging.FileHandler, (pfn, 'w')),
                     (logging.handlers.RotatingFileHandler, (pfn, 'a')),
                     (logging.handlers.TimedRotatingFileHandler, (pfn, 'h')),
+                    (logging.handlers.CompressingRotatingFileHandler, (pfn,)),
                 )
         if sys.platform in ('linux', 'android', 'darwin'):
             cases += ((logging.handlers.WatchedFileHandler, (pfn, 'w')),)
@@ -854,6 +855,39 @@ def test_can_represent_stream_with_int_name(self):
         h = logging.StreamHandler(StreamWithIntName())
         self.assertEqual(repr(h), '<StreamHandler 2 (NOTSET)>')
 
+    def test_handle_batch(self):
+        class Stream(io.StringIO):
+            def writelines(self, lines):
+                self.calls.append(list(lines))
+                super().writelines(lines)
+        stream = Stream()
+        stream.calls = []
+        h = logging.StreamHandler(stream)
+        h.setFormatter(logging.Formatter('%(levelname)s:%(message)s'))
+        h.addFilter(lambda record: record.msg != 'skip')
+        records = [logging.makeLogRecord({'msg': msg, 'levelname': 'INFO'})
+                   for msg in ('a', 'skip', 'b')]
+        h.handleBatch(records)
+        self.assertEqual(stream.calls, [['INFO:a\n', 'INFO:b\n']])
+        self.assertEqual(stream.getvalue(), 'INFO:a\nINFO:b\n')
+
+    def test_handle_batch_error_handling(self):
+        h = TestStreamHandler(BadStream())
+        r = logging.makeLogRecord({})
+        h.handleBatch([r])
+        self.assertIs(h.error_record, r)
+
+    def test_handle_batch_overridden_emit(self):
+        # A subclass which overrides emit() only gets the records one by one.
+        class Handler(logging.StreamHandler):
+            def emit(self, record):
+                self.stream.write('<%s>' % record.msg)
+        stream = io.StringIO()
+        h = Handler(stream)
+        h.handleBatch([logging.makeLogRecord({'msg': msg})
+                       for msg in ('a', 'b')])
+        self.assertEqual(stream.getvalue(), '<a><b>')
+
 # -- The following section could be moved into a server_helper.py module
 # -- if it proves to be of wider utility than just test_logging
 
@@ -4145,6 +4179,54 @@ def __init__(self, *args, **kwargs):
         self.assertEqual(handler.custom_kwargs, custom_kwargs)
 
 
+    @threading_helper.requires_working_threading()
+    def test_config_async_handler(self):
+        config = {
+            'version': 1,
+            'formatters': {
+                'form1': {'format': '%(levelname)s %(message)s'},
+            },
+            'handlers': {
+                'h1': {
+                    'class': 'logging.StreamHandler',
+                    'formatter': 'form1',
+                    'level': 'INFO',
+                    'stream': 'ext://sys.stdout',
+                    'async': True,
+                },
+                'h2': {
+                    'class': 'logging.StreamHandler',
+                    'stream': 'ext://sys.stdout',
+                    'async': {'maxsize': 5, 'overflow': 'drop'},
+                },
+            },
+            'root': {
+                'level': 'DEBUG',
+                'handlers': ['h1'],
+            },
+        }
+        with support.captured_stdout() as output:
+            self.apply_config(config)
+            h1 = logging.getHandlerByName('h1')
+            h2 = logging.getHandlerByName('h2')
+            self.assertIsInstance(h1, logging.handlers.AsyncHandler)
+            self.assertEqual(h1.level, logging.INFO)
+            self.assertEqual((h2.maxsize, h2.overflow), (5, 'drop'))
+            self.assertIsInstance(h1.handlers[0], logging.StreamHandler)
+            logging.debug('spam')
+            logging.info('ham')
+            h1.flush()
+            self.assertEqual(output.getvalue(), 'INFO ham\n')
+        logging.shutdown([weakref.ref(h1), weakref.ref(h2)])
+
+        config['handlers']['h1']['async'] = 'spam'
+        with self.assertRaises(ValueError):
+            self.apply_config(config)
+        config['handlers']['h1']['async'] = {'overflow': 'spam'}
+        with self.assertRaises(ValueError):
+            self.apply_config(config)
+
+
 class ManagerTest(BaseTest):
     def test_manager_loggerclass(self):
         logged = []
@@ -4346,6 +4428,29 @@ def test_queue_listener_with_multiple_handlers(self):
         listener.stop()
         self.assertEqual(self.stream.getvalue().strip(), "que -> ERROR: error")
 
+    @threading_helper.requires_working_threading()
+    def test_queue_listener_batch_size(self):
+        class Handler(TestHandler):
+            def handleBatch(self, records):
+                batches.append(len(records))
+                super().handleBatch(records)
+        batches = []
+        handler = Handler(support.Matcher())
+        handler.setLevel(logging.ERROR)
+        for i in range(5):
+            self.que_logger.warning(self.next_message())
+            self.que_logger.error(self.next_message())
+        listener = logging.handlers.QueueListener(self.queue, handler,
+                                                  respect_handler_level=True,
+                                                  batch_size=4)
+        listener.start()
+        listener.stop()
+        self.assertEqual(batches, [2, 2, 1])
+        self.assertEqual([record['msg'] for record in handler.buffer],
+                         ['2', '4', '6', '8', '10'])
+        with self.assertRaises(ValueError):
+            logging.handlers.QueueListener(self.queue, batch_size=0)
+
 if hasattr(logging.handlers, 'QueueListener'):
     import multiprocessing
     from unittest.mock import patch
@@ -4448,6 +4553,145 @@ def test_calls_task_done_after_stop(self):
                 log_queue.task_done()
 
 
+
+class BlockingHandler(TestHandler):
+    """Handler which waits for an event before handling records."""
+
+    def __init__(self):
+        super().__init__(support.Matcher())
+        self.event = threading.Event()
+        self.batches = []
+
+    def handleBatch(self, records):
+        self.batches.append([record.msg for record in records])
+        super().handleBatch(records)
+
+    def emit(self, record):
+        self.event.wait(support.SHORT_TIMEOUT)
+        super().emit(record)
+
+
+@threading_helper.requires_working_threading()
+class AsyncHandlerTest(BaseTest):
+
+    def setUp(self):
+        BaseTest.setUp(self)
+        self.logger = logging.getLogger('async')
+        self.logger.propagate = False
+        self.addCleanup(setattr, self.logger, 'propagate', True)
+
+    def make_handler(self, *handlers, **kwargs):
+        h = logging.handlers.AsyncHandler(*handlers, **kwargs)
+        self.logger.addHandler(h)
+        self.addCleanup(self.logger.removeHandler, h)
+        self.addCleanup(h.close)
+        return h
+
+    def test_emit(self):
+        h = self.make_handler(self.root_hdlr)
+        self.assertIsNone(h.listener)
+        self.logger.error('%s %s', 'spam', 'ham')
+        self.assertIsNotNone(h.listener)
+        h.flush()
+        self.assertEqual(self.stream.getvalue(), 'async -> ERROR: spam ham\n')
+        h.close()
+        self.assertIsNone(h.listener)
+        self.logger.error('eggs')
+        self.assertEqual(self.stream.getvalue(), 'async -> ERROR: spam ham\n')
+
+    def test_batches(self):
+        target = BlockingHandler()
+        h = self.make_handler(target, batch_size=3)
+        for i in range(7):
+            self.logger.error(str(i))
+        target.event.set()
+        h.close()
+        self.assertEqual([record['msg'] for record in target.buffer],
+                         list('0123456'))
+        # The records queued while the first batch was handled are taken
+        # by batches of 3.
+        self.assertEqual(max(map(len, target.batches)), 3)
+
+    def test_respect_handler_level(self):
+        target = TestHandler(support.Matcher())
+        target.setLevel(logging.ERROR)
+        h = self.make_handler(target)
+        self.logger.warning('spam')
+        self.logger.error('ham')
+        h.close()
+        self.assertEqual([record['msg'] for record in target.buffer], ['ham'])
+
+    def fill(self, overflow, **kwargs):
+        target = BlockingHandler()
+        h = self.make_handler(target, maxsize=2, overflow=overflow, **kwargs)
+        self.logger.error('first')
+        # Wait until the background thread is blocked on the first record.
+        for _ in support.sleeping_retry(support.SHORT_TIMEOUT):
+            if h.listener.queue.empty():
+                break
+        return target, h
+
+    def test_overflow_drop(self):
+        target, h = self.fill('drop')
+        for i in range(10):
+            self.logger.error(str(i))
+        self.assertEqual(h.dropped, 8)
+        target.event.set()
+        h.close()
+        self.assertEqual([record['msg'] for record in target.buffer],
+                         ['first', '0', '1'])
+
+    def test_overflow_sample(self):
+        target, h = self.fill('sample', sample_rate=4)
+        for i in range(5):
+            self.logger.error(str(i))
+        self.assertEqual(h.dropped, 3)
+        # The fourth overflowing record waits for room in the queue.
+        threading.Timer(0.1, target.event.set).start()
+        self.logger.error('5')
+        self.assertEqual(h.dropped, 3)
+        h.close()
+        self.assertEqual([record['msg'] for record in target.buffer],
+                         ['first', '0', '1', '5'])
+
+    def test_overflow_block(self):
+        target, h = self.fill('block')
+        self.logger.error('0')
+        self.logger.error('1')
+        threading.Timer(0.1, target.event.set).start()
+        self.logger.error('2')
+        h.close()
+        self.assertEqual(h.dropped, 0)
+        self.assertEqual([record['msg'] for record in target.buffer],
+                         ['first', '0', '1', '2'])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            logging.handlers.AsyncHandler(overflow='spam')
+        with self.assertRaises(ValueError):
+            logging.handlers.AsyncHandler(sample_rate=0)
+        with self.assertRaises(ValueError):
+            logging.handlers.AsyncHandler(batch_size=0)
+
+    @support.requires_fork()
+    def test_fork(self):
+        h = self.make_handler(self.root_hdlr)
+        self.logger.error('parent')
+        h.flush()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                self.assertIsNone(h.listener)
+                self.logger.error('child')
+                h.flush()
+                self.assertIn('child', self.stream.getvalue())
+            except:
+                os._exit(1)
+            os._exit(0)
+        support.wait_process(pid, exitcode=0)
+        self.assertEqual(self.stream.getvalue(), 'async -> ERROR: parent\n')
+
+
 ZERO = datetime.timedelta(0)
 
 class UTC(datetime.tzinfo):
@@ -4715,6 +4959,28 @@ def test_defaults_parameter(self):
             r = self.get_record("custom")
             self.assertEqual(f.format(r), '1234 Message with 2 placeholders')
 
+    def test_used_attributes(self):
+        f = logging.Formatter('%(asctime)s %(levelname)-8s %(funcName)s')
+        self.assertEqual(f.usedAttributes(),
+                         {'asctime', 'levelname', 'funcName'})
+        f = logging.Formatter('{lineno:{width}} {name!r} {args[0]}',
+                              style='{')
+        self.assertEqual(f.usedAttributes(),
+                         {'lineno', 'width', 'name', 'args'})
+        f = logging.Formatter('$module ${threadName}', style='$')
+        self.assertEqual(f.usedAttributes(), {'module', 'threadName'})
+        self.assertEqual(logging.Formatter().usedAttributes(), {'message'})
+
+        class CustomFormatter(logging.Formatter):
+            def format(self, record):
+                return record.pathname
+        self.assertIsNone(CustomFormatter().usedAttributes())
+
+        class CustomFormatter(CustomFormatter):
+            def usedAttributes(self):
+                return {'pathname'}
+        self.assertEqual(CustomFormatter().usedAttributes(), {'pathname'})
+
     def test_invalid_style(self):
         self.assertRaises(ValueError, logging.Formatter, None, None, 'x')
 
@@ -5215,6 +5481,18 @@ def test_str_rep(self):
         self.assertTrue(s.startswith('<LogRecord: '))
         self.assertTrue(s.endswith('>'))
 
+    def test_attributes(self):
+        r = logging.LogRecord('name', logging.INFO, 'path', 1, 'msg', (),
+                              None, attributes={'threadName'})
+        self.assertEqual(r.threadName, threading.current_thread().name)
+        self.assertIsNone(r.processName)
+        self.assertIsNone(r.taskName)
+        r = logging.LogRecord('name', logging.INFO, 'path', 1, 'msg', (),
+                              None, attributes=())
+        self.assertIsNone(r.threadName)
+        self.assertIsNotNone(r.thread)
+        self.assertIsNotNone(r.process)
+
     def test_dict_arg(self):
         h = RecordingHandler()
         r = logging.getLogger()
@@ -5350,6 +5628,170 @@ def test_taskName_without_asyncio_imported(self):
             asyncio.set_event_loop_policy(None)
 
 
+class AttributesHandler(logging.StreamHandler):
+    """Handler recording the records, which declares the attributes used."""
+
+    def __init__(self, attributes):
+        super().__init__(io.StringIO())
+        self.attributes = attributes
+        self.records = []
+
+    def usedAttributes(self):
+        return self.attributes
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class UsedAttributesTest(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.logger = logging.getLogger('attributes')
+        self.logger.propagate = False
+        self.addCleanup(setattr, self.logger, 'propagate', True)
+
+    def add_handler(self, handler):
+        self.logger.addHandler(handler)
+        self.addCleanup(self.logger.removeHandler, handler)
+        return handler
+
+    def test_handler_used_attributes(self):
+        self.assertIsNone(logging.Handler().usedAttributes())
+        h = logging.StreamHandler()
+        self.assertEqual(h.usedAttributes(), {'message'})
+        h.setFormatter(logging.Formatter('%(lineno)d %(message)s'))
+        self.assertEqual(h.usedAttributes(), {'lineno', 'message'})
+        h.addFilter(logging.Filter('spam'))
+        self.assertEqual(h.usedAttributes(), {'lineno', 'message'})
+        h.addFilter(lambda record: True)
+        self.assertIsNone(h.usedAttributes())
+        self.assertEqual(logging.NullHandler().usedAttributes(), set())
+
+        class CustomHandler(logging.StreamHandler):
+            def emit(self, record):
+                pass
+        self.assertIsNone(CustomHandler().usedAttributes())
+        class CustomHandler(logging.StreamHandler):
+            def filter(self, record):
+                return True
+        self.assertIsNone(CustomHandler().usedAttributes())
+        class CustomHandler(logging.StreamHandler):
+            def handleError(self, record):
+                pass
+        self.assertIsNone(CustomHandler().usedAttributes())
+
+        fn = make_temp_file('.log', 'test_logging-ua-')
+        self.addCleanup(os.remove, fn)
+        h = logging.handlers.RotatingFileHandler(fn, encoding='utf-8',
+                                                 delay=True)
+        h.setFormatter(logging.Formatter('%(funcName)s'))
+        self.assertEqual(h.usedAttributes(), {'funcName'})
+        for cls in (logging.handlers.TimedRotatingFileHandler,
+                    logging.handlers.CompressingRotatingFileHandler):
+            h2 = cls(fn, encoding='utf-8', delay=True)
+            self.assertEqual(h2.usedAttributes(), {'message'})
+        class CustomHandler(logging.handlers.RotatingFileHandler):
+            def shouldRollover(self, record):
+                return False
+        self.assertIsNone(CustomHandler(fn, encoding='utf-8',
+                                        delay=True).usedAttributes())
+
+        h = logging.handlers.AsyncHandler(logging.StreamHandler(), h)
+        self.assertEqual(h.usedAttributes(), {'message', 'funcName'})
+        h = logging.handlers.AsyncHandler(logging.Handler())
+        self.assertIsNone(h.usedAttributes())
+
+    def test_skip_unused_attributes(self):
+        h = self.add_handler(AttributesHandler({'message'}))
+        self.logger.error('spam', extra={'eggs': 1})
+        r = h.records[-1]
+        self.assertEqual((r.pathname, r.lineno, r.funcName),
+                         ('(unknown file)', 0, '(unknown function)'))
+        self.assertIsNone(r.threadName)
+        self.assertIsNone(r.processName)
+        self.assertEqual(r.eggs, 1)
+        self.assertEqual(r.getMessage(), 'spam')
+
+        # Stack information needs the caller's frame.
+        self.logger.error('spam', stack_info=True)
+        r = h.records[-1]
+        self.assertEqual(r.funcName, 'test_skip_unused_attributes')
+        self.assertIsNotNone(r.stack_info)
+
+    def test_used_attributes(self):
+        h = self.add_handler(AttributesHandler({'funcName', 'threadName'}))
+        self.logger.error('spam')
+        r = h.records[-1]
+        self.assertEqual(r.funcName, 'test_used_attributes')
+        self.assertEqual(r.filename, os.path.basename(__file__))
+        self.assertEqual(r.threadName, threading.current_thread().name)
+
+    def test_handler_filter_override(self):
+        # A filter() method may use any attribute of the record.
+        class FuncNameHandler(logging.StreamHandler):
+            def filter(self, record):
+                return record.funcName == 'test_handler_filter_override'
+        stream = io.StringIO()
+        h = self.add_handler(FuncNameHandler(stream))
+        self.logger.error('spam')
+        self.assertEqual(stream.getvalue(), 'spam\n')
+
+    def assertAllAttributes(self, record):
+        self.assertEqual(record.funcName, 'check_all_attributes')
+        self.assertEqual(record.threadName, threading.current_thread().name)
+        self.assertIsNotNone(record.processName)
+
+    def check_all_attributes(self, h):
+        self.logger.error('spam')
+        self.assertAllAttributes(h.records[-1])
+
+    def test_unknown_attributes(self):
+        h = self.add_handler(AttributesHandler({'message'}))
+        other = self.add_handler(AttributesHandler(None))
+        self.check_all_attributes(h)
+        self.logger.removeHandler(other)
+
+        self.logger.addFilter(lambda record: True)
+        self.addCleanup(self.logger.filters.clear)
+        self.check_all_attributes(h)
+        self.logger.filters.clear()
+
+        old_factory = logging.getLogRecordFactory()
+        logging.setLogRecordFactory(
+            lambda *args, **kwargs: old_factory(*args, **kwargs))
+        self.addCleanup(logging.setLogRecordFactory, old_factory)
+        self.check_all_attributes(h)
+
+    def test_propagate(self):
+        h = self.add_handler(AttributesHandler({'message'}))
+        parent = AttributesHandler({'lineno'})
+        self.root_logger.addHandler(parent)
+        self.addCleanup(self.root_logger.removeHandler, parent)
+        self.logger.propagate = True
+        self.logger.error('spam')
+        self.assertNotEqual(h.records[-1].lineno, 0)
+        self.assertIs(parent.records[-1], h.records[-1])
+
+    def test_no_handler_for_level(self):
+        h = self.add_handler(AttributesHandler({'lineno'}))
+        h.setLevel(logging.ERROR)
+        with patch.object(self.logger, 'findCaller',
+                          wraps=self.logger.findCaller) as find_caller:
+            self.logger.warning('spam')
+            find_caller.assert_not_called()
+            self.logger.error('spam')
+            find_caller.assert_called_once()
+        self.assertEqual(len(h.records), 1)
+
+        # A logger without handlers uses lastResort.
+        h.setLevel(logging.NOTSET)
+        self.logger.removeHandler(h)
+        with support.captured_stderr() as stderr:
+            self.logger.error('eggs')
+        self.assertEqual(stderr.getvalue(), 'eggs\n')
+
+
 class BasicConfigTest(unittest.TestCase):
 
     """Test suite for logging.basicConfig."""
@@ -6184,6 +6626,16 @@ def test_delay(self):
         self.assertTrue(os.path.exists(self.fn))
         fh.close()
 
+    def test_handle_batch_delay(self):
+        os.unlink(self.fn)
+        fh = logging.FileHandler(self.fn, encoding='utf-8', delay=True)
+        fh.setFormatter(logging.Formatter('%(message)s'))
+        fh.handleBatch([self.next_rec(), self.next_rec()])
+        self.assertIsNotNone(fh.stream)
+        fh.close()
+        with open(self.fn, encoding='utf-8') as fp:
+            self.assertEqual(fp.read(), '1\n2\n')
+
     def test_emit_after_closing_in_write_mode(self):
         # Issue #42378
         os.unlink(self.fn)
@@ -7077,6 +7529,144 @@ def test_compute_rollover(self, when=when, interval=interval, exp=exp):
         setattr(TimedRotatingFileHandlerTest, name, test_compute_rollover)
 
 
+class CompressingRotatingFileHandlerTest(BaseFileTest):
+    def setUp(self):
+        super().setUp()
+        self.dir = tempfile.mkdtemp(prefix='test_logging_')
+        self.addCleanup(os_helper.rmtree, self.dir)
+        self.base = os.path.join(self.dir, 'app.log')
+
+    def make_handler(self, **kwargs):
+        rh = logging.handlers.CompressingRotatingFileHandler(
+            self.base, encoding='utf-8', **kwargs)
+        rh.setFormatter(logging.Formatter('%(msg)s'))
+        self.addCleanup(rh.close)
+        return rh
+
+    def rotated_files(self):
+        return sorted(name for name in os.listdir(self.dir)
+                      if name != 'app.log')
+
+    def test_compression(self):
+        for compression, ext in (('gzip', '.gz'), ('bz2', '.bz2'),
+                                 ('lzma', '.xz')):
+            with self.subTest(compression=compression):
+                try:
+                    module = import_helper.import_module(compression)
+                except unittest.SkipTest:
+                    continue
+                os_helper.rmtree(self.dir)
+                os.mkdir(self.dir)
+                # Each file holds a single record.
+                rh = self.make_handler(maxBytes=1, compression=compression)
+                for i in range(4):
+                    rh.emit(self.next_rec())
+                rh.close()
+                rotated = self.rotated_files()
+                self.assertEqual(len(rotated), 3)
+                records = []
+                for name in rotated:
+                    self.assertRegex(
+                        name, r'^app\.log\.\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}'
+                              r'(\.\d+)?' + re.escape(ext) + '$')
+                    with module.open(os.path.join(self.dir, name)) as f:
+                        records.append(f.read().decode())
+                with open(self.base, encoding='utf-8') as f:
+                    records.append(f.read())
+                # The rotated files sort by name, except for the counter.
+                self.assertEqual(sorted(records), sorted(
+                    '%d\n' % i for i in range(self.message_num - 3,
+                                              self.message_num + 1)))
+
+    def test_compress_in_background(self):
+        threads = []
+        rh = self.make_handler(maxBytes=1)
+        compress = rh.compress
+        def record_thread(*args):
+            threads.append(threading.current_thread())
+            compress(*args)
+        rh.compress = record_thread
+        rh.emit(self.next_rec())
+        rh.emit(self.next_rec())
+        self.assertIsNotNone(rh._thread)
+        rh.close()
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+        self.assertIsNone(rh._thread)
+
+    def test_backup_count(self):
+        rh = self.make_handler(maxBytes=1, backupCount=2, compression=None)
+        for i in range(5):
+            rh.emit(self.next_rec())
+        rh.close()
+        rotated = self.rotated_files()
+        self.assertEqual(len(rotated), 2)
+        contents = []
+        for name in rotated:
+            with open(os.path.join(self.dir, name), encoding='utf-8') as f:
+                contents.append(f.read())
+        self.assertEqual(sorted(contents), ['3\n', '4\n'])
+
+    def test_max_total_bytes(self):
+        rh = self.make_handler(maxBytes=1, maxTotalBytes=25, compression=None)
+        for i in range(5):
+            rh.emit(logging.makeLogRecord({'msg': '%09d' % i}))
+        rh.close()
+        # Each rotated file holds 10 bytes.
+        contents = []
+        for name in self.rotated_files():
+            with open(os.path.join(self.dir, name), encoding='utf-8') as f:
+                contents.append(f.read())
+        self.assertEqual(sorted(contents), ['000000002\n', '000000003\n'])
+
+    def test_namer(self):
+        def namer(name):
+            return name.replace('app.log.', 'app.') + '.log'
+        rh = self.make_handler(maxBytes=1, backupCount=2)
+        rh.namer = namer
+        for i in range(4):
+            rh.emit(self.next_rec())
+        rh.close()
+        rotated = self.rotated_files()
+        self.assertEqual(len(rotated), 2)
+        for name in rotated:
+            self.assertRegex(name, r'^app\.[-_\d.]+\.log\.gz$')
+
+    def test_timed_rollover(self):
+        rh = self.make_handler(when='H')
+        rh.emit(self.next_rec())
+        self.assertFalse(rh.shouldRollover(self.next_rec()))
+        rh.rolloverAt = int(time.time()) - 1
+        self.assertTrue(rh.shouldRollover(self.next_rec()))
+        rh.emit(self.next_rec())
+        self.assertGreater(rh.rolloverAt, time.time())
+        rh.close()
+        self.assertEqual(len(self.rotated_files()), 1)
+
+        rh = self.make_handler()
+        self.assertIsNone(rh.rolloverAt)
+        self.assertFalse(rh.shouldRollover(self.next_rec()))
+
+    def test_compression_error(self):
+        rh = self.make_handler(maxBytes=1)
+        def compress(source, dest):
+            raise OSError('spam')
+        rh.compress = compress
+        errors = []
+        rh.handleError = errors.append
+        rh.emit(self.next_rec())
+        rh.emit(self.next_rec())
+        rh.close()
+        self.assertEqual(len(errors), 1)
+        path, = errors[0].args
+        self.assertEqual(os.path.dirname(path), self.dir)
+        self.assertTrue(os.path.exists(path))
+
+    def test_invalid_compression(self):
+        with self.assertRaises(ValueError):
+            logging.handlers.CompressingRotatingFileHandler(
+                self.base, compression='zip')
+
 @unittest.skipUnless(win32evtlog, 'win32evtlog/win32evtlogutil/pywintypes required for this test.')
 class NTEventLogHandlerTest(BaseTest):
     def test_basic(self):
@@ -0,0 +1,184 @@
+"""Tests for the sampling profiler (profile.sample)."""
+
+import io
+import marshal
+import os
+import pstats
+import subprocess
+import sys
+import textwrap
+import unittest
+from test.support import os_helper, requires_subprocess, SHORT_TIMEOUT
+from test.support.script_helper import make_script
+
+from profile import sample as profile_sample
+from profile.sample import (
+    CollapsedStackCollector, PstatsCollector, SampleProfiler,
+)
+
+
+def make_frames(*names):
+    # Innermost frame first, as returned by the stack reader.
+    return [(f"/src/{name}.py", 1, name) for name in names]
+
+
+class TestPstatsCollector(unittest.TestCase):
+
+    def test_self_and_cumulative_time(self):
+        collector = PstatsCollector(sample_interval_usec=1000)
+        collector.collect([(1, make_frames('c', 'b', 'a'))])
+        collector.collect([(1, make_frames('b', 'a'))])
+        collector.create_stats()
+        by_name = {func[2]: value for func, value in collector.stats.items()}
+        # (cc, nc, tt, ct, callers)
+        self.assertEqual(by_name['a'][:2], (2, 2))
+        self.assertAlmostEqual(by_name['a'][2], 0.0)
+        self.assertAlmostEqual(by_name['a'][3], 0.002)
+        self.assertAlmostEqual(by_name['b'][2], 0.001)
+        self.assertAlmostEqual(by_name['b'][3], 0.002)
+        self.assertAlmostEqual(by_name['c'][2], 0.001)
+        self.assertAlmostEqual(by_name['c'][3], 0.001)
+        callers_of_b = {func[2]: value
+                        for func, value in by_name['b'][4].items()}
+        self.assertEqual(list(callers_of_b), ['a'])
+        self.assertEqual(callers_of_b['a'][0], 2)
+
+    def test_recursion_counted_once(self):
+        collector = PstatsCollector(sample_interval_usec=1000)
+        frame = ("/src/r.py", 1, "r")
+        collector.collect([(1, [frame, frame, frame])])
+        collector.create_stats()
+        cc, nc, tt, ct, callers = collector.stats[frame]
+        self.assertEqual(nc, 1)
+        self.assertAlmostEqual(ct, 0.001)
+
+    def test_pstats_compatible(self):
+        collector = PstatsCollector(sample_interval_usec=1000)
+        for _ in range(3):
+            collector.collect([(1, make_frames('inner', 'outer'))])
+        stream = io.StringIO()
+        stats = pstats.Stats(collector, stream=stream)
+        self.assertEqual(stats.total_calls, 6)
+        stats.sort_stats('cumulative').print_stats()
+        self.assertIn('outer', stream.getvalue())
+        self.assertIn('inner', stream.getvalue())
+
+    def test_dump_stats(self):
+        collector = PstatsCollector(sample_interval_usec=1000)
+        collector.collect([(1, make_frames('inner', 'outer'))])
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        collector.dump_stats(os_helper.TESTFN)
+        with open(os_helper.TESTFN, 'rb') as f:
+            self.assertEqual(marshal.load(f), collector.stats)
+        stats = pstats.Stats(os_helper.TESTFN, stream=io.StringIO())
+        self.assertEqual(stats.total_calls, 2)
+
+    def test_thread_breakdown(self):
+        collector = PstatsCollector(sample_interval_usec=1000)
+        collector.collect([(1, make_frames('a')), (2, make_frames('b'))])
+        collector.collect([(1, make_frames('a')), (2, [])])
+        self.assertEqual(collector.total_samples, 3)
+        self.assertEqual(collector.thread_samples, {1: 2, 2: 1})
+        stream = io.StringIO()
+        collector.print_thread_breakdown(stream)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(lines[1].split(), ['2', '66.7%', '1'])
+        self.assertEqual(lines[2].split(), ['1', '33.3%', '2'])
+
+
+class TestCollapsedStackCollector(unittest.TestCase):
+
+    def test_export(self):
+        collector = CollapsedStackCollector()
+        collector.collect([(1, make_frames('b', 'a'))])
+        collector.collect([(2, make_frames('b', 'a'))])
+        collector.collect([(1, make_frames('a'))])
+        stream = io.StringIO()
+        collector.export(stream)
+        self.assertEqual(stream.getvalue().splitlines(), [
+            'a (a.py:1) 1',
+            'a (a.py:1);b (b.py:1) 2',
+        ])
+
+    def test_per_thread(self):
+        collector = CollapsedStackCollector(per_thread=True)
+        collector.collect([(1, make_frames('a')), (2, make_frames('a'))])
+        stream = io.StringIO()
+        collector.export(stream)
+        self.assertEqual(stream.getvalue().splitlines(), [
+            'thread 1;a (a.py:1) 1',
+            'thread 2;a (a.py:1) 1',
+        ])
+
+
+@unittest.skipIf(profile_sample.get_all_stack_traces is None,
+                 "test requires _remote_debugging")
+@unittest.skipIf(sys.platform not in ("darwin", "linux"),
+                 "test only runs on Linux and macOS")
+class TestSampleProfiler(unittest.TestCase):
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            SampleProfiler(os.getpid(), sample_interval_usec=0)
+
+    @requires_subprocess()
+    def test_sample_running_process(self):
+        script = textwrap.dedent("""\
+            import sys, threading, time
+
+            def spin(seconds):
+                end = time.monotonic() + seconds
+                while time.monotonic() < end:
+                    pass
+
+            def worker():
+                spin(60)
+
+            threading.Thread(target=worker, daemon=True).start()
+            with open(sys.argv[1], "w") as fifo:
+                fifo.write("ready")
+            spin(60)
+            """)
+        with os_helper.temp_dir() as work_dir:
+            fifo = os.path.join(work_dir, "the_fifo")
+            os.mkfifo(fifo)
+            script_name = make_script(work_dir, 'script', script)
+            p = subprocess.Popen([sys.executable, script_name, fifo])
+            try:
+                with open(fifo) as fifo_file:
+                    self.assertEqual(fifo_file.read(), "ready")
+                collector = PstatsCollector(sample_interval_usec=10_000)
+                profiler = SampleProfiler(p.pid, sample_interval_usec=10_000)
+                try:
+                    profiler.sample(collector, duration_sec=0.5)
+                except PermissionError:
+                    self.skipTest("insufficient permissions to read "
+                                  "the target's memory")
+            finally:
+                p.kill()
+                p.wait(timeout=SHORT_TIMEOUT)
+
+        self.assertGreater(profiler.samples, 0)
+        self.assertEqual(len(collector.thread_samples), 2)
+        collector.create_stats()
+        names = {func[2] for func in collector.stats}
+        self.assertIn('spin', names)
+        self.assertIn('worker', names)
+        self.assertIn('<module>', names)
+        filenames = {func[0] for func in collector.stats
+                     if func[2] == 'spin'}
+        self.assertEqual(filenames, {script_name})
+
+    @requires_subprocess()
+    def test_exited_process(self):
+        # Sampling a process that is gone stops right away.
+        p = subprocess.Popen([sys.executable, '-c', 'pass'])
+        p.wait(timeout=SHORT_TIMEOUT)
+        profiler = SampleProfiler(p.pid, sample_interval_usec=1000)
+        collector = PstatsCollector(1000)
+        profiler.sample(collector, duration_sec=SHORT_TIMEOUT)
+        self.assertEqual(profiler.samples, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
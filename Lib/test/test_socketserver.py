@@ -236,6 +236,41 @@ def test_ForkingUnixDatagramServer(self):
                         socketserver.DatagramRequestHandler,
                         self.dgram_examine)
 
+    def test_ThreadPoolTCPServer(self):
+        self.run_server(socketserver.ThreadPoolTCPServer,
+                        socketserver.StreamRequestHandler,
+                        self.stream_examine)
+
+    def test_ThreadPoolUDPServer(self):
+        self.run_server(socketserver.ThreadPoolUDPServer,
+                        socketserver.DatagramRequestHandler,
+                        self.dgram_examine)
+
+    @requires_unix_sockets
+    def test_ThreadPoolUnixStreamServer(self):
+        self.run_server(socketserver.ThreadPoolUnixStreamServer,
+                        socketserver.StreamRequestHandler,
+                        self.stream_examine)
+
+    @requires_forking
+    def test_PreForkTCPServer(self):
+        self.run_server(socketserver.PreForkTCPServer,
+                        socketserver.StreamRequestHandler,
+                        self.stream_examine)
+
+    @requires_forking
+    def test_PreForkUDPServer(self):
+        self.run_server(socketserver.PreForkUDPServer,
+                        socketserver.DatagramRequestHandler,
+                        self.dgram_examine)
+
+    @requires_unix_sockets
+    @requires_forking
+    def test_PreForkUnixStreamServer(self):
+        self.run_server(socketserver.PreForkUnixStreamServer,
+                        socketserver.StreamRequestHandler,
+                        self.stream_examine)
+
     @threading_helper.reap_threads
     def test_shutdown(self):
         # Issue #2302: shutdown() should always succeed in making an
@@ -286,6 +321,104 @@ def test_context_manager(self):
         self.assertEqual(-1, server.socket.fileno())
 
 
+class ThreadPoolTest(unittest.TestCase):
+
+    @threading_helper.reap_threads
+    def test_pool_size(self):
+        threads = set()
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                threads.add(threading.current_thread())
+                self.rfile.readline()
+                self.wfile.write(b'ok\n')
+
+        class Server(socketserver.ThreadPoolTCPServer):
+            workers = 3
+
+        with Server((HOST, 0), Handler) as server:
+            t = threading.Thread(target=server.serve_forever,
+                                 kwargs={'poll_interval': 0.01})
+            t.start()
+            try:
+                clients = [socket.create_connection(server.server_address)
+                           for _ in range(10)]
+                for sock in clients:
+                    with sock:
+                        sock.sendall(b'hello\n')
+                        self.assertEqual(receive(sock, 100), b'ok\n')
+            finally:
+                server.shutdown()
+                t.join()
+        self.assertEqual(len(threads), 3)
+        self.assertIsNone(server._pool)
+        for thread in threads:
+            self.assertFalse(thread.is_alive())
+
+
+@requires_forking
+class PreForkTest(unittest.TestCase):
+
+    def setUp(self):
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                if self.rfile.readline() == b'exit\n':
+                    os._exit(0)
+                self.wfile.write(b'%d\n' % os.getpid())
+
+        class Server(socketserver.PreForkTCPServer):
+            processes = 2
+
+        self.server = Server((HOST, 0), Handler)
+        self.addCleanup(self.server.server_close)
+        t = threading.Thread(target=self.server.serve_forever,
+                             kwargs={'poll_interval': 0.01})
+        t.start()
+        self.addCleanup(t.join)
+        self.addCleanup(self.server.shutdown)
+        self.addCleanup(reap_children)
+
+    def request(self, line=b'pid\n'):
+        with socket.create_connection(self.server.server_address) as sock:
+            sock.sendall(line)
+            data = receive(sock, 100)
+        return int(data) if data else None
+
+    def test_workers(self):
+        pids = {self.request() for _ in range(20)}
+        self.assertNotIn(os.getpid(), pids)
+        self.assertLessEqual(len(pids), 2)
+
+    def test_respawn(self):
+        self.request()
+        for _ in test.support.sleeping_retry(test.support.SHORT_TIMEOUT):
+            old_workers = set(self.server._worker_pids)
+            if len(old_workers) == 2:
+                break
+        self.request(b'exit\n')
+        for _ in test.support.sleeping_retry(test.support.SHORT_TIMEOUT):
+            workers = set(self.server._worker_pids)
+            if len(workers) == 2 and workers != old_workers:
+                break
+        self.assertEqual(len(workers & old_workers), 1)
+        self.request()
+
+    def test_reload(self):
+        self.request()
+        for _ in test.support.sleeping_retry(test.support.SHORT_TIMEOUT):
+            old_workers = set(self.server._worker_pids)
+            if len(old_workers) == 2:
+                break
+        self.server.reload_workers()
+        # The old workers exit once they are replaced.
+        for _ in test.support.sleeping_retry(test.support.SHORT_TIMEOUT):
+            if (not old_workers & self.server._worker_pids
+                    and not self.server._retiring_pids):
+                break
+        for _ in range(10):
+            self.assertNotIn(self.request(), old_workers)
+
+
 class ErrorHandlerTest(unittest.TestCase):
     """Test that the servers pass normal exceptions from the handler to
     handle_error(), and that exiting exceptions like SystemExit and
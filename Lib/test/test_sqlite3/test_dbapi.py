@@ -20,6 +20,7 @@
 #    misrepresented as being the original software.
 # 3. This notice may not be removed or altered from any source distribution.
 
+import array
 import contextlib
 import os
 import sqlite3 as sqlite
@@ -605,6 +606,95 @@ def test_uninit_operations(self):
                                        func)
 
 
+class PreparedStatementTests(unittest.TestCase):
+
+    def setUp(self):
+        self.cx = sqlite.connect(":memory:")
+        self.cx.execute("create table test(i, t)")
+
+    def tearDown(self):
+        self.cx.close()
+
+    def test_prepare(self):
+        sql = "insert into test values (?, ?)"
+        st = self.cx.prepare(sql)
+        self.assertEqual(st.sql, sql)
+        with self.assertRaises(AttributeError):
+            st.sql = "select 1"
+        cu = self.cx.cursor()
+        for i in range(3):
+            cu.execute(st, (i, str(i)))
+            self.assertEqual(cu.rowcount, 1)
+        self.cx.executemany(st, [(3, "3"), (4, "4")])
+        rows = self.cx.execute("select * from test").fetchall()
+        self.assertEqual(rows, [(i, str(i)) for i in range(5)])
+
+    def test_prepare_select(self):
+        self.cx.executemany("insert into test values (?, 't')",
+                            [(i,) for i in range(3)])
+        st = self.cx.prepare("select i from test where i >= ?")
+        cu = self.cx.execute(st, (1,))
+        self.assertEqual(cu.description[0][0], "i")
+        self.assertEqual(cu.fetchall(), [(1,), (2,)])
+        self.assertEqual(self.cx.execute(st, (2,)).fetchall(), [(2,)])
+
+    def test_prepare_in_use(self):
+        # A statement still in use by a cursor is not reset by another one.
+        self.cx.executemany("insert into test values (?, 't')",
+                            [(i,) for i in range(3)])
+        st = self.cx.prepare("select i from test")
+        cu1 = self.cx.execute(st)
+        self.assertEqual(cu1.fetchone(), (0,))
+        cu2 = self.cx.execute(st)
+        self.assertEqual(cu2.fetchall(), [(0,), (1,), (2,)])
+        self.assertEqual(cu1.fetchall(), [(1,), (2,)])
+
+    def test_prepare_errors(self):
+        with self.assertRaises(TypeError):
+            self.cx.prepare(42)
+        with self.assertRaises(sqlite.OperationalError):
+            self.cx.prepare("select spam from eggs")
+        with self.assertRaises(sqlite.ProgrammingError):
+            self.cx.prepare("select 1; select 2")
+        with self.assertRaisesRegex(TypeError, "str or Statement"):
+            self.cx.execute(b"select 1")
+
+    def test_prepare_other_connection(self):
+        st = self.cx.prepare("select 1")
+        with memory_database() as cx:
+            msg = "prepared by another connection"
+            with self.assertRaisesRegex(sqlite.ProgrammingError, msg):
+                cx.execute(st)
+            with self.assertRaisesRegex(sqlite.ProgrammingError, msg):
+                cx.executemany(st, [()])
+
+    def test_statement_cache_info(self):
+        with memory_database(cached_statements=2) as cx:
+            info = cx.statement_cache_info()
+            self.assertEqual(info, (0, 0, 0, 2, 0))
+            for sql in ("select 1", "select 2", "select 1", "select 3",
+                        "select 2"):
+                cx.execute(sql)
+            info = cx.statement_cache_info()
+            self.assertEqual(info, (1, 4, 2, 2, 2))
+            self.assertEqual(info.hits, 1)
+            self.assertEqual(info.misses, 4)
+            self.assertEqual(info.evictions, 2)
+            self.assertEqual(info.maxsize, 2)
+            self.assertEqual(info.currsize, 2)
+
+            # Prepared statements do not use the cache.
+            st = cx.prepare("select 4")
+            cx.execute(st)
+            self.assertEqual(cx.statement_cache_info(), info)
+
+    def test_statement_cache_info_disabled(self):
+        with memory_database(cached_statements=0) as cx:
+            cx.execute("select 1")
+            cx.execute("select 1")
+            self.assertEqual(cx.statement_cache_info(), (0, 2, 0, 0, 0))
+
+
 @unittest.skipUnless(hasattr(sqlite.Connection, "serialize"),
                      "Needs SQLite serialize API")
 class SerializeTests(unittest.TestCase):
@@ -1099,6 +1189,51 @@ def test_fetchall(self):
         res = self.cu.fetchall()
         self.assertEqual(res, [])
 
+    def test_fetchcolumns(self):
+        self.cu.execute("delete from test")
+        self.cu.executemany("insert into test(name, income) values (?, ?)",
+                            [("A", 1.5), ("B", 2.5), ("C", 3.5)])
+        self.cu.execute("select id, name, income, unique_test from test")
+        res = self.cu.fetchcolumns(2)
+        self.assertEqual(res, [array.array("q", [1, 2]), ["A", "B"],
+                               array.array("d", [1.5, 2.5]), [None, None]])
+        self.assertEqual(res[0].typecode, "q")
+        self.assertEqual(res[2].typecode, "d")
+        res = self.cu.fetchcolumns()
+        self.assertEqual(res, [array.array("q", [3]), ["C"],
+                               array.array("d", [3.5]), [None]])
+        self.assertEqual(self.cu.fetchcolumns(), [[], [], [], []])
+        self.assertEqual(self.cx.cursor().fetchcolumns(), [])
+
+    def test_fetchcolumns_mixed_types(self):
+        # Columns holding NULLs or values of several types are lists.
+        self.cu.execute("select 1, 2, null, x'01', 1.5 "
+                        "union all select 2, null, 3, x'02', 2 "
+                        "union all select 3, 4, 5, x'03', 2.5")
+        res = self.cu.fetchcolumns()
+        self.assertEqual(res, [array.array("q", [1, 2, 3]), [2, None, 4],
+                               [None, 3, 5], [b"\x01", b"\x02", b"\x03"],
+                               [1.5, 2, 2.5]])
+        self.assertIsInstance(res[4][1], int)
+
+    def test_fetchcolumns_many_rows(self):
+        self.cu.execute("with recursive c(x) as (select 1 union all "
+                        "select x + 1 from c limit 1000) "
+                        "select x, x * 0.5 from c")
+        ints, floats = self.cu.fetchcolumns()
+        self.assertEqual(ints, array.array("q", range(1, 1001)))
+        self.assertEqual(floats.tolist(), [x * 0.5 for x in range(1, 1001)])
+
+    def test_fetchcolumns_text_factory(self):
+        self.cx.text_factory = bytes
+        self.cu.execute("select 'a', 1")
+        self.assertEqual(self.cu.fetchcolumns(), [[b"a"], array.array("q", [1])])
+
+    def test_fetchcolumns_ignores_row_factory(self):
+        self.cu.row_factory = lambda cur, row: None
+        self.cu.execute("select 'a', 1")
+        self.assertEqual(self.cu.fetchcolumns(), [["a"], array.array("q", [1])])
+
     def test_setinputsizes(self):
         self.cu.setinputsizes([3, 4, 5])
 
@@ -1751,13 +1886,20 @@ def progress():
     def test_closed_call(self):
         self.check(self.con)
 
+    def test_closed_prepare(self):
+        self.check(self.con.prepare, "select 1")
+
+    def test_closed_statement_cache_info(self):
+        self.check(self.con.statement_cache_info)
+
 
 class ClosedCurTests(MemoryDatabaseMixin, unittest.TestCase):
     def test_closed(self):
         cur = self.cx.cursor()
         cur.close()
 
-        for method_name in ("execute", "executemany", "executescript", "fetchall", "fetchmany", "fetchone"):
+        for method_name in ("execute", "executemany", "executescript", "fetchall",
+                            "fetchcolumns", "fetchmany", "fetchone"):
             if method_name in ("execute", "executescript"):
                 params = ("select 4 union select 5",)
             elif method_name == "executemany":
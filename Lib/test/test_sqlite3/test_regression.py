@@ -500,6 +500,13 @@ def test_recursive_cursor_iter(self):
             self.assertRaisesRegex(sqlite.ProgrammingError, self.msg,
                                    self.cur.fetchall)
 
+    def test_recursive_cursor_fetchcolumns(self):
+        conv = lambda x: self.cur.fetchone()
+        with patch.dict(sqlite.converters, {"ITER": conv}):
+            self.cur.execute('select x as "x [ITER]", x from test')
+            self.assertRaisesRegex(sqlite.ProgrammingError, self.msg,
+                                   self.cur.fetchcolumns)
+
 
 if __name__ == "__main__":
     unittest.main()
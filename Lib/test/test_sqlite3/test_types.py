@@ -293,6 +293,16 @@ def test_number1(self):
         # if the converter is not used, it's an int instead of a float
         self.assertEqual(type(value), float)
 
+    def test_fetchcolumns_converters(self):
+        self.cur.executemany("insert into test(i, n1) values (?, ?)",
+                             [(1, 5), (2, None)])
+        self.cur.execute("select i, n1 from test")
+        ints, numbers = self.cur.fetchcolumns()
+        self.assertEqual(list(ints), [1, 2])
+        # Values converted by a converter are in a list.
+        self.assertEqual(numbers, [5.0, None])
+        self.assertEqual(type(numbers[0]), float)
+
     def test_number2(self):
         """Checks whether converter names are cut off at '(' characters"""
         self.cur.execute("insert into test(n2) values (5)")
@@ -2,10 +2,15 @@
 import unittest
 import sys
 import io
+import json
+import subprocess
+from unittest import mock
 from textwrap import dedent
 
 from test.support import captured_stdout
 from test.support import captured_stderr
+from test.support import os_helper
+from test.support import requires_subprocess
 
 # timeit's default number of iterations.
 DEFAULT_NUMBER = 1000000
@@ -363,6 +368,145 @@ def test_main_exception_fixed_reps(self):
             s = self.run_main(switches=['-n1', '1/0'])
         self.assert_exc_string(error_stringio.getvalue(), 'ZeroDivisionError')
 
+    def test_main_worker(self):
+        s = self.run_main(seconds_per_increment=0.5,
+                          switches=['--worker', '-n4', '-r3', '--warmups', '2'])
+        self.assertEqual(json.loads(s), {
+            "number": 4,
+            "warmups": [0.5, 0.5],
+            "values": [0.5, 0.5, 0.5],
+        })
+
+    def test_main_worker_calibrate(self):
+        s = self.run_main(seconds_per_increment=1/1024,
+                          switches=['--worker', '-n0'])
+        self.assertEqual(json.loads(s), {"number": 500})
+
+    def test_main_worker_keeps_stdout_clean(self):
+        with captured_stderr() as error_stringio:
+            s = self.run_main(switches=['--worker', '-n1', '-r1',
+                                        '-s', 'print("CustomSetup")'])
+        self.assertEqual(json.loads(s)["values"], [1.0])
+        self.assertEqual(error_stringio.getvalue(), "CustomSetup\n" * 2)
+
+    def test_summarize(self):
+        values = [1.0, 1.1, 0.9, 1.0, 1.05, 0.95, 10.0]
+        stats = timeit._summarize(values)
+        self.assertEqual(stats["n"], 6)
+        self.assertEqual(stats["outliers"], 1)
+        self.assertAlmostEqual(stats["mean"], 1.0)
+        self.assertEqual(stats["median"], 1.0)
+        self.assertEqual(stats["min"], 0.9)
+        self.assertEqual(stats["max"], 1.1)
+        low, high = stats["ci95"]
+        self.assertLess(low, stats["mean"])
+        self.assertGreater(high, stats["mean"])
+        self.assertAlmostEqual(stats["mean"] - low, high - stats["mean"])
+
+    def test_summarize_single_value(self):
+        stats = timeit._summarize([2.0])
+        self.assertEqual(stats["stdev"], 0.0)
+        self.assertEqual(stats["ci95"], [2.0, 2.0])
+
+    def make_result(self, values):
+        return {"values": values, "stats": timeit._summarize(values)}
+
+    def test_compare_significant(self):
+        old = self.make_result([1.0 + i / 100 for i in range(20)])
+        new = self.make_result([1.5 + i / 100 for i in range(20)])
+        outcome = timeit.compare(old, new)
+        self.assertTrue(outcome["significant"])
+        self.assertLess(outcome["p_value"], 0.001)
+        self.assertGreater(outcome["ratio"], 1.3)
+
+    def test_compare_zero_mean(self):
+        zero = self.make_result([0.0] * 5)
+        outcome = timeit.compare(zero, zero)
+        self.assertEqual(outcome["ratio"], 1.0)
+        outcome = timeit.compare(zero, self.make_result([1.0] * 5))
+        self.assertEqual(outcome["ratio"], float("inf"))
+
+    def test_compare_not_significant(self):
+        old = self.make_result([1.0 + i / 100 for i in range(0, 40, 2)])
+        new = self.make_result([1.0 + i / 100 for i in range(1, 40, 2)])
+        outcome = timeit.compare(old, new)
+        self.assertFalse(outcome["significant"])
+        self.assertGreater(outcome["p_value"], 0.5)
+
+    def test_main_compare(self):
+        old = dict(self.make_result([1.0] * 5 + [1.1] * 5), number=10)
+        new = dict(self.make_result([2.0] * 5 + [2.2] * 5), number=10)
+        filenames = []
+        for name, result in (("old", old), ("new", new)):
+            filename = os_helper.TESTFN + name
+            self.addCleanup(os_helper.unlink, filename)
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(result, f)
+            filenames.append(filename)
+        with captured_stdout() as s:
+            timeit.main(args=['--compare', *filenames])
+        lines = s.getvalue().splitlines()
+        self.assertEqual(lines[0], "old: 1.05 sec +- 52.7 msec per loop")
+        self.assertEqual(lines[1], "new: 2.1 sec +- 105 msec per loop")
+        self.assertTrue(lines[2].startswith("2.00x slower (p="), lines[2])
+        self.assertTrue(lines[2].endswith("): significant"), lines[2])
+
+    def test_main_compare_bad_args(self):
+        with captured_stderr() as error_stringio:
+            self.assertEqual(timeit.main(args=['--compare', 'a.json']), 2)
+        self.assertEqual(error_stringio.getvalue(),
+                         "--compare requires two JSON result files\n")
+
+    def test_bench_requires_strings(self):
+        with self.assertRaises(TypeError):
+            timeit.bench(lambda: None)
+
+    @requires_subprocess()
+    def test_bench(self):
+        result = timeit.bench("x + 1", "x = 1", processes=2, repeat=3,
+                              number=10, warmups=1)
+        self.assertEqual(result["number"], 10)
+        self.assertEqual(result["processes"], 2)
+        self.assertEqual(len(result["values"]), 6)
+        self.assertEqual(len(result["warmups"]), 2)
+        self.assertEqual(result["stats"], timeit._summarize(result["values"]))
+        # The result can be stored as JSON.
+        self.assertEqual(json.loads(json.dumps(result)), result)
+
+    @requires_subprocess()
+    def test_main_processes(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        with captured_stdout() as s:
+            timeit.main(args=['-P2', '-r2', '-n5', '--json', os_helper.TESTFN,
+                              'pass'])
+        lines = s.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith("2 processes x 2 values, 5 loops: "
+                                            "mean "), lines[0])
+        self.assertTrue(lines[1].startswith("median "), lines[1])
+        self.assertTrue(lines[2].startswith("95% confidence interval: "),
+                        lines[2])
+        with open(os_helper.TESTFN, encoding="utf-8") as f:
+            result = json.load(f)
+        self.assertEqual(result["stmt"], "pass")
+        self.assertEqual(len(result["values"]), 4)
+
+    @requires_subprocess()
+    def test_main_processes_exception(self):
+        # Capture the traceback written by the worker process.
+        worker_stderr = []
+        run = subprocess.run
+        def run_captured(*args, **kwargs):
+            proc = run(*args, stderr=subprocess.PIPE, **kwargs)
+            worker_stderr.append(proc.stderr)
+            return proc
+        with (captured_stdout() as s, captured_stderr() as error_stringio,
+              mock.patch('subprocess.run', run_captured)):
+            self.assertEqual(timeit.main(args=['-P1', '-n1', '1/0']), 1)
+        self.assertEqual(s.getvalue(), "")
+        self.assertIn("worker process failed", error_stringio.getvalue())
+        self.assertEqual(len(worker_stderr), 1)
+        self.assertIn("ZeroDivisionError", worker_stderr[0])
+
     def autorange(self, seconds_per_increment=1/1024, callback=None):
         timer = FakeTimer(seconds_per_increment=seconds_per_increment)
         t = timeit.Timer(stmt=self.fake_stmt, setup=self.fake_setup, timer=timer)
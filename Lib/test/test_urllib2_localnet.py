@@ -3,10 +3,12 @@
 import email
 import urllib.parse
 import urllib.request
+import http.client
 import http.server
 import threading
 import unittest
 import hashlib
+from unittest import mock
 
 from test import support
 from test.support import hashlib_helper
@@ -567,6 +569,24 @@ def test_https(self):
         data = self.urlopen("https://localhost:%s/bizarre" % handler.port, context=context)
         self.assertEqual(data, b"we care a bit")
 
+    def test_https_session_resumption(self):
+        # The TLS 1.3 session ticket is received after the handshake.  It
+        # must be saved although the connection is not closed by the
+        # response, which is not the last one of a persistent connection.
+        body = b"we care a bit"
+        handler = self.start_https_server(
+            responses=[(200, [("Content-Length", str(len(body)))], body)] * 2)
+        handler.protocol_version = "HTTP/1.1"
+        context = ssl.create_default_context(cafile=CERT_localhost)
+        https_handler = urllib.request.HTTPSHandler(context=context)
+        opener = urllib.request.build_opener(urllib.request.ProxyHandler({}),
+                                             https_handler)
+        for _ in range(2):
+            with opener.open("https://localhost:%s/" % handler.port) as f:
+                self.assertEqual(f.read(), body)
+        cache = https_handler._session_cache
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
     def test_https_sni(self):
         if ssl is None:
             self.skipTest("ssl module required")
@@ -665,6 +685,216 @@ def test_issue16464(self):
         self.assertEqual(b"1234567890", request.data)
         self.assertEqual("10", request.get_header("Content-length"))
 
+class KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        if self.path == '/chunked':
+            self.send_response(200)
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            self.wfile.write(b'4\r\nspam\r\n3\r\nham\r\n0\r\n\r\n')
+            return
+        body = self.path.encode('ascii') * 1000
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        if self.path == '/close':
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+        if self.path == '/drop':
+            # Close the connection without telling the client.
+            self.close_connection = True
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+class ConnectionPoolTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0),
+                                                      KeepAliveHandler)
+        self.server.daemon_threads = False
+        self.server.block_on_close = True
+        self.server.connections = 0
+        thread = threading.Thread(target=self.server.serve_forever,
+                                  kwargs={'poll_interval': 0.01})
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.pool = urllib.request.HTTPConnectionPool()
+        self.addCleanup(self.pool.clear)
+        self.opener = urllib.request.build_opener(
+            urllib.request.ProxyHandler({}),
+            urllib.request.HTTPHandler(pool=self.pool))
+
+    def open(self, path, **kwargs):
+        url = "http://localhost:%d%s" % (self.server.server_port, path)
+        return self.opener.open(url, **kwargs)
+
+    def test_reuse(self):
+        for _ in range(3):
+            with self.open('/a') as f:
+                self.assertEqual(f.read(), b'/a' * 1000)
+                self.assertEqual(f.status, 200)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_reuse_chunked(self):
+        for _ in range(3):
+            with self.open('/chunked') as f:
+                self.assertEqual(f.read(), b'spamham')
+        self.assertEqual(self.server.connections, 1)
+
+    def test_reuse_after_partial_reads(self):
+        for _ in range(2):
+            f = self.open('/a')
+            while f.read(100):
+                pass
+            f.close()
+        self.assertEqual(self.server.connections, 1)
+
+    def test_reuse_head(self):
+        for _ in range(2):
+            request = urllib.request.Request(
+                "http://localhost:%d/a" % self.server.server_port,
+                method='HEAD')
+            self.opener.open(request).close()
+        self.assertEqual(self.server.connections, 1)
+
+    def test_no_reuse_unread_response(self):
+        with self.open('/a') as f:
+            self.assertEqual(f.read(10), b'/a' * 5)
+        with self.open('/b') as f:
+            self.assertEqual(f.read(), b'/b' * 1000)
+        self.assertEqual(self.server.connections, 2)
+
+    def test_no_reuse_connection_close(self):
+        for _ in range(2):
+            with self.open('/close') as f:
+                f.read()
+        self.assertEqual(self.server.connections, 2)
+
+    def test_concurrent_responses(self):
+        f1 = self.open('/a')
+        f2 = self.open('/b')
+        self.assertEqual(f2.read(), b'/b' * 1000)
+        self.assertEqual(f1.read(), b'/a' * 1000)
+        with self.open('/c') as f:
+            f.read()
+        self.assertEqual(self.server.connections, 2)
+
+    def test_maxsize(self):
+        self.pool.maxsize = 1
+        f1 = self.open('/a')
+        f2 = self.open('/b')
+        f1.read()
+        f2.read()
+        for _ in range(2):
+            with self.open('/c') as f:
+                f.read()
+        self.assertEqual(self.server.connections, 2)
+
+    def test_maxconnections(self):
+        self.pool.maxconnections = 1
+        f1 = self.open('/a')
+        results = []
+        def target():
+            with self.open('/b') as f:
+                results.append(f.read())
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join(0.2)
+        # The request waits for the response to /a to be closed.
+        self.assertTrue(thread.is_alive())
+        self.assertEqual(results, [])
+        with f1:
+            self.assertEqual(f1.read(), b'/a' * 1000)
+        thread.join()
+        self.assertEqual(results, [b'/b' * 1000])
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(self.pool._active, {})
+
+    def test_maxconnections_error(self):
+        self.pool.maxconnections = 1
+        with mock.patch.object(http.client.HTTPConnection, 'request',
+                               side_effect=OSError):
+            with self.assertRaises(urllib.error.URLError):
+                self.open('/a')
+        with self.open('/close') as f:
+            f.read()
+        with self.open('/a') as f:
+            f.read(10)
+        self.assertEqual(self.pool._active, {})
+
+    def test_idle_timeout(self):
+        self.pool.idle_timeout = 0
+        for _ in range(2):
+            with self.open('/a') as f:
+                f.read()
+        self.assertEqual(self.server.connections, 2)
+
+    def test_dropped_connection(self):
+        with self.open('/drop') as f:
+            f.read()
+        with self.open('/a') as f:
+            self.assertEqual(f.read(), b'/a' * 1000)
+        self.assertEqual(self.server.connections, 2)
+
+    def test_retry_dropped_connection(self):
+        with self.open('/drop') as f:
+            f.read()
+        # The connection was closed after the pool checked it.
+        with mock.patch('urllib.request._connection_dropped',
+                        return_value=False):
+            with self.open('/a') as f:
+                self.assertEqual(f.read(), b'/a' * 1000)
+        self.assertEqual(self.server.connections, 2)
+
+    def test_no_retry_non_idempotent_request(self):
+        # The response is lost after the request was written on a reused
+        # connection: the server may have processed it, so only idempotent
+        # requests are sent again.
+        for data, calls in [(b'data', 1), (None, 2)]:
+            with self.subTest(data=data):
+                with self.open('/a') as f:
+                    f.read()
+                with mock.patch.object(
+                        http.client.HTTPConnection, 'getresponse',
+                        side_effect=http.client.RemoteDisconnected) as m:
+                    with self.assertRaises(http.client.RemoteDisconnected):
+                        self.open('/a', data=data)
+                self.assertEqual(m.call_count, calls)
+
+    def test_clear(self):
+        with self.open('/a') as f:
+            f.read()
+        self.pool.clear()
+        with self.open('/a') as f:
+            f.read()
+        self.assertEqual(self.server.connections, 2)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            urllib.request.HTTPConnectionPool(maxsize=0)
+        with self.assertRaises(ValueError):
+            urllib.request.HTTPConnectionPool(maxconnections=0)
+
+
 def setUpModule():
     thread_info = threading_helper.threading_setup()
     unittest.addModuleCleanup(threading_helper.threading_cleanup, *thread_info)
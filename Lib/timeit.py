@@ -8,6 +8,8 @@
 
 Command line usage:
     python timeit.py [-n N] [-r N] [-s S] [-p] [-h] [--] [statement]
+    python timeit.py -P N [--warmups N] [--json FILE] [...] [statement]
+    python timeit.py --compare OLD.json NEW.json
 
 Options:
   -n/--number N: how many times to execute 'statement' (default: see below)
@@ -17,6 +19,11 @@
   -p/--process: use time.process_time() (default is time.perf_counter())
   -v/--verbose: print raw timing results; repeat for more digits precision
   -u/--unit: set the output time unit (nsec, usec, msec, or sec)
+  -P/--processes N: rigorous mode: spawn N worker processes (default 5 if
+                    --warmups or --json is given) and report statistics
+  --warmups N: rigorous mode: discard N warmup runs per process (default 1)
+  --json FILE: rigorous mode: write the results to FILE as JSON
+  --compare: compare the two JSON result files given as arguments
   -h/--help: print this usage message and exit
   --: separate options from statement, use when statement starts with -
   statement: statement to be timed (default 'pass')
@@ -30,6 +37,13 @@
 increasing numbers from the sequence 1, 2, 5, 10, 20, 50, ... until the
 total time is at least 0.2 seconds.
 
+In rigorous mode, the number of loops is calibrated once in a separate
+process and then -r timings are taken in each of the -P worker
+processes, after discarding the warmup runs.  The mean, standard
+deviation, median and 95% confidence interval of the mean are reported,
+leaving out outliers.  Two JSON result files can be compared with
+--compare, which also tells whether the difference is significant.
+
 Note: there is a certain baseline overhead associated with executing a
 pass statement.  It differs between versions.  The code here doesn't try
 to hide it, but you should be aware of it.  The baseline overhead can be
@@ -43,6 +57,8 @@
 
     timeit(string, string) -> float
     repeat(string, string) -> list
+    bench(string, string) -> dict
+    compare(dict, dict) -> dict
     default_timer() -> float
 
 """
@@ -52,11 +68,13 @@
 import sys
 import time
 
-__all__ = ["Timer", "timeit", "repeat", "default_timer"]
+__all__ = ["Timer", "timeit", "repeat", "bench", "compare", "default_timer"]
 
 dummy_src_name = "<timeit-src>"
 default_number = 1000000
 default_repeat = 5
+default_processes = 5
+default_warmups = 1
 default_timer = time.perf_counter
 
 _globals = globals
@@ -241,6 +259,148 @@ def repeat(stmt="pass", setup="pass", timer=default_timer,
     return Timer(stmt, setup, timer, globals).repeat(repeat, number)
 
 
+def _remove_outliers(values):
+    """Return *values* without the points outside of Tukey's fences."""
+    import statistics
+    if len(values) < 4:
+        return list(values)
+    q1, _, q3 = statistics.quantiles(values, n=4)
+    low = q1 - 1.5 * (q3 - q1)
+    high = q3 + 1.5 * (q3 - q1)
+    return [value for value in values if low <= value <= high]
+
+
+def _summarize(values):
+    """Compute the statistics reported for a list of timings."""
+    import statistics
+    kept = _remove_outliers(values)
+    mean = statistics.fmean(kept)
+    stdev = statistics.stdev(kept, mean) if len(kept) > 1 else 0.0
+    # Normal approximation of the 95% confidence interval of the mean.
+    margin = 1.96 * stdev / len(kept) ** 0.5
+    return {
+        "n": len(kept),
+        "outliers": len(values) - len(kept),
+        "mean": mean,
+        "stdev": stdev,
+        "median": statistics.median(kept),
+        "min": min(kept),
+        "max": max(kept),
+        "ci95": [mean - margin, mean + margin],
+    }
+
+
+def _run_worker(args):
+    """Run one worker process and return its decoded JSON output."""
+    import json
+    import subprocess
+    # The worker's stderr is inherited, so that tracebacks and any output
+    # of the timed code are shown.
+    proc = subprocess.run([sys.executable, "-m", "timeit", "--worker", *args],
+                          stdout=subprocess.PIPE, text=True)
+    if proc.returncode:
+        raise RuntimeError("timeit worker process failed")
+    return json.loads(proc.stdout)
+
+
+def bench(stmt="pass", setup="pass", *, processes=default_processes,
+          repeat=default_repeat, number=0, warmups=default_warmups,
+          process_time=False):
+    """Benchmark 'stmt' in several fresh worker processes.
+
+    If 'number' is 0, the number of loops is first calibrated with
+    Timer.autorange() in a separate process.  Each of the 'processes'
+    workers then runs 'warmups' timings which are discarded, followed by
+    'repeat' timings which are kept.  Only string statements can be used,
+    since they must be compiled again in every worker.
+
+    Return a dict, suitable for json.dump(), with the per-loop timings in
+    seconds under "values" and their statistics under "stats".
+    """
+    if not isinstance(stmt, str) or not isinstance(setup, str):
+        raise TypeError("bench() requires the statements to be strings")
+    if processes < 1:
+        raise ValueError("processes must be at least 1")
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+    if warmups < 0:
+        raise ValueError("warmups must be non-negative")
+    common = ["-s", setup]
+    if process_time:
+        common.append("-p")
+    if number <= 0:
+        number = _run_worker([*common, "-n", "0", "--", stmt])["number"]
+    values = []
+    warmup_values = []
+    for _ in range(processes):
+        result = _run_worker([*common, "-n", str(number), "-r", str(repeat),
+                              "--warmups", str(warmups), "--", stmt])
+        values.extend(result["values"])
+        warmup_values.extend(result["warmups"])
+    return {
+        "version": 1,
+        "stmt": stmt,
+        "setup": setup,
+        "python": sys.version,
+        "timer": "process_time" if process_time else "perf_counter",
+        "processes": processes,
+        "number": number,
+        "values": values,
+        "warmups": warmup_values,
+        "stats": _summarize(values),
+    }
+
+
+def _mann_whitney_u(a, b):
+    """Two-sided p-value of the Mann-Whitney U test (normal approximation)."""
+    import statistics
+    n1, n2 = len(a), len(b)
+    combined = sorted([(value, 0) for value in a] + [(value, 1) for value in b])
+    # Average the ranks of tied values.
+    rank_sum = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        rank_sum += rank * sum(1 for k in range(i, j + 1)
+                               if combined[k][1] == 0)
+        i = j + 1
+    u = rank_sum - n1 * (n1 + 1) / 2
+    sigma = (n1 * n2 * (n1 + n2 + 1) / 12) ** 0.5
+    if not sigma:
+        return 1.0
+    z = (u - n1 * n2 / 2) / sigma
+    return 2 * (1 - statistics.NormalDist().cdf(abs(z)))
+
+
+def compare(old, new, alpha=0.05):
+    """Compare two results returned by bench() (or loaded from JSON).
+
+    Return a dict with the ratio of the new mean to the old one, the
+    p-value of a Mann-Whitney U test on the timings, and whether the
+    difference is significant at the 'alpha' level.
+    """
+    old_values = _remove_outliers(old["values"])
+    new_values = _remove_outliers(new["values"])
+    old_mean = old["stats"]["mean"]
+    new_mean = new["stats"]["mean"]
+    p_value = _mann_whitney_u(old_values, new_values)
+    if old_mean:
+        ratio = new_mean / old_mean
+    else:
+        # A coarse timer can measure no time at all.
+        ratio = float("inf") if new_mean else 1.0
+    return {
+        "old_mean": old_mean,
+        "new_mean": new_mean,
+        "ratio": ratio,
+        "p_value": p_value,
+        "significant": p_value < alpha,
+    }
+
+
 def main(args=None, *, _wrap_timer=None):
     """Main program, used when run as a script.
 
@@ -262,9 +422,11 @@ def main(args=None, *, _wrap_timer=None):
         args = sys.argv[1:]
     import getopt
     try:
-        opts, args = getopt.getopt(args, "n:u:s:r:pvh",
+        opts, args = getopt.getopt(args, "n:u:s:r:pvhP:",
                                    ["number=", "setup=", "repeat=",
-                                    "process", "verbose", "unit=", "help"])
+                                    "process", "verbose", "unit=", "help",
+                                    "processes=", "warmups=", "json=",
+                                    "compare", "worker"])
     except getopt.error as err:
         print(err)
         print("use -h/--help for command line help")
@@ -279,6 +441,11 @@ def main(args=None, *, _wrap_timer=None):
     time_unit = None
     units = {"nsec": 1e-9, "usec": 1e-6, "msec": 1e-3, "sec": 1.0}
     precision = 3
+    processes = 0  # classic mode
+    warmups = None
+    json_file = None
+    compare_mode = False
+    worker = False
     for o, a in opts:
         if o in ("-n", "--number"):
             number = int(a)
@@ -301,11 +468,49 @@ def main(args=None, *, _wrap_timer=None):
             if verbose:
                 precision += 1
             verbose += 1
+        if o in ("-P", "--processes"):
+            processes = max(int(a), 1)
+        if o == "--warmups":
+            warmups = max(int(a), 0)
+        if o == "--json":
+            json_file = a
+        if o == "--compare":
+            compare_mode = True
+        if o == "--worker":
+            worker = True
         if o in ("-h", "--help"):
             print(__doc__, end=' ')
             return 0
     setup = "\n".join(setup) or "pass"
 
+    def format_time(dt):
+        unit = time_unit
+
+        if unit is not None:
+            scale = units[unit]
+        else:
+            scales = [(scale, unit) for unit, scale in units.items()]
+            scales.sort(reverse=True)
+            for scale, unit in scales:
+                if dt >= scale:
+                    break
+
+        return "%.*g %s" % (precision, dt / scale, unit)
+
+    if compare_mode:
+        return _main_compare(args, format_time)
+    if warmups is None:
+        warmups = default_warmups
+    elif not processes:
+        processes = default_processes
+    if json_file is not None and not processes:
+        processes = default_processes
+    if processes and not worker:
+        # The statements are compiled and timed in the worker processes.
+        return _main_bench(stmt, setup, processes, repeat, number, warmups,
+                           timer is time.process_time, json_file,
+                           format_time)
+
     # Include the current directory, so that local imports work (sys.path
     # contains the directory of this script, rather than the current
     # directory)
@@ -315,6 +520,8 @@ def main(args=None, *, _wrap_timer=None):
         timer = _wrap_timer(timer)
 
     t = Timer(stmt, setup, timer)
+    if worker:
+        return _main_worker(t, repeat, number, warmups)
     if number == 0:
         # determine number so that 0.2 <= total time < 2.0
         callback = None
@@ -339,20 +546,6 @@ def callback(number, time_taken):
         t.print_exc()
         return 1
 
-    def format_time(dt):
-        unit = time_unit
-
-        if unit is not None:
-            scale = units[unit]
-        else:
-            scales = [(scale, unit) for unit, scale in units.items()]
-            scales.sort(reverse=True)
-            for scale, unit in scales:
-                if dt >= scale:
-                    break
-
-        return "%.*g %s" % (precision, dt / scale, unit)
-
     if verbose:
         print("raw times: %s" % ", ".join(map(format_time, raw_timings)))
         print()
@@ -375,5 +568,96 @@ def format_time(dt):
     return None
 
 
+def _main_worker(t, repeat, number, warmups):
+    """Time 't' on behalf of bench() and write the result as JSON."""
+    import json
+    # The timed code may print: keep stdout for the JSON result.
+    stdout = sys.stdout
+    sys.stdout = sys.stderr
+    try:
+        if number == 0:
+            number, _ = t.autorange()
+            result = {"number": number}
+        else:
+            warmup_timings = t.repeat(warmups, number)
+            raw_timings = t.repeat(repeat, number)
+            result = {
+                "number": number,
+                "warmups": [dt / number for dt in warmup_timings],
+                "values": [dt / number for dt in raw_timings],
+            }
+    except:
+        t.print_exc()
+        return 1
+    finally:
+        sys.stdout = stdout
+    json.dump(result, sys.stdout)
+    return None
+
+
+def _main_bench(stmt, setup, processes, repeat, number, warmups,
+                process_time, json_file, format_time):
+    """Run bench() and print a summary of the results."""
+    try:
+        result = bench(stmt, setup, processes=processes, repeat=repeat,
+                       number=number, warmups=warmups,
+                       process_time=process_time)
+    except RuntimeError as err:
+        print(err, file=sys.stderr)
+        return 1
+
+    stats = result["stats"]
+    number = result["number"]
+    print("%d process%s x %d value%s, %d loop%s: mean %s +- %s per loop"
+          % (processes, 'es' if processes != 1 else '',
+             repeat, 's' if repeat != 1 else '',
+             number, 's' if number != 1 else '',
+             format_time(stats["mean"]), format_time(stats["stdev"])))
+    print("median %s, min %s, max %s"
+          % (format_time(stats["median"]), format_time(stats["min"]),
+             format_time(stats["max"])))
+    low, high = stats["ci95"]
+    print("95%% confidence interval: %s .. %s (%d outlier%s removed)"
+          % (format_time(low), format_time(high),
+             stats["outliers"], 's' if stats["outliers"] != 1 else ''))
+
+    if json_file is not None:
+        import json
+        with open(json_file, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+            f.write("\n")
+    return None
+
+
+def _main_compare(filenames, format_time):
+    """Compare two JSON result files and print the outcome."""
+    import json
+    if len(filenames) != 2:
+        print("--compare requires two JSON result files", file=sys.stderr)
+        return 2
+    results = []
+    for filename in filenames:
+        with open(filename, encoding="utf-8") as f:
+            results.append(json.load(f))
+    old, new = results
+    for name, result in zip(("old", "new"), results):
+        stats = result["stats"]
+        print("%s: %s +- %s per loop"
+              % (name, format_time(stats["mean"]),
+                 format_time(stats["stdev"])))
+
+    outcome = compare(old, new)
+    ratio = outcome["ratio"]
+    if ratio > 1:
+        change = "%.2fx slower" % ratio
+    else:
+        change = "%.2fx faster" % (1 / ratio if ratio else float("inf"))
+    print("%s (p=%.3g): %s"
+          % (change, outcome["p_value"],
+             "significant" if outcome["significant"]
+             else "not significant"))
+    return None
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -89,9 +89,11 @@
 import io
 import os
 import re
+import select
 import socket
 import string
 import sys
+import threading
 import time
 import tempfile
 import contextlib
@@ -122,8 +124,8 @@
     'HTTPPasswordMgrWithPriorAuth', 'AbstractBasicAuthHandler',
     'HTTPBasicAuthHandler', 'ProxyBasicAuthHandler', 'AbstractDigestAuthHandler',
     'HTTPDigestAuthHandler', 'ProxyDigestAuthHandler', 'HTTPHandler',
-    'FileHandler', 'FTPHandler', 'CacheFTPHandler', 'DataHandler',
-    'UnknownHandler', 'HTTPErrorProcessor',
+    'HTTPConnectionPool', 'FileHandler', 'FTPHandler', 'CacheFTPHandler',
+    'DataHandler', 'UnknownHandler', 'HTTPErrorProcessor',
     # Functions
     'urlopen', 'install_opener', 'build_opener',
     'pathname2url', 'url2pathname', 'getproxies',
@@ -1224,10 +1226,154 @@ def http_error_407(self, req, fp, code, msg, headers):
         self.reset_retry_count()
         return retry
 
+
+def _connection_dropped(sock):
+    # An idle connection becomes readable when the server closes it or
+    # sends unexpected data: it cannot be reused in both cases.
+    try:
+        if hasattr(select, 'poll'):
+            poller = select.poll()
+            poller.register(sock, select.POLLIN)
+            return bool(poller.poll(0))
+        return bool(select.select([sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+class HTTPConnectionPool:
+    """Pool of persistent HTTP connections shared by HTTP handlers.
+
+    Connections are keyed by connection class, host, port, tunnel host and
+    TLS context.  A connection returns to the pool once its response has
+    been completely read, unless the server asked to close it.  At most
+    maxsize idle connections are kept per key, each for at most
+    idle_timeout seconds.  If maxconnections is not None, at most
+    maxconnections connections per key are in use at the same time: a
+    request waits until a response for the same key is closed.
+    """
+
+    def __init__(self, maxsize=10, idle_timeout=60.0, maxconnections=None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if maxconnections is not None and maxconnections < 1:
+            raise ValueError("maxconnections must be at least 1")
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.maxconnections = maxconnections
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        # Map keys to lists of (connection, release time), the most
+        # recently released connection last.
+        self._idle = {}
+        # Map keys to the number of connections in use.
+        self._active = {}
+
+    def _get(self, key):
+        # Reserve a connection for key, waiting for one to be released if
+        # maxconnections are in use.  Return an idle connection, or None if
+        # a new one must be opened.  _put() or _discard() must be called
+        # once the connection is no longer used.
+        now = time.monotonic()
+        expired = []
+        conn = None
+        with self._lock:
+            if self.maxconnections is not None:
+                while self._active.get(key, 0) >= self.maxconnections:
+                    self._released.wait()
+            self._active[key] = self._active.get(key, 0) + 1
+            conns = self._idle.get(key)
+            while conns:
+                h, released = conns.pop()
+                if now - released >= self.idle_timeout:
+                    # Older connections have expired too.
+                    expired.append(h)
+                    expired.extend(h for h, released in conns)
+                    conns.clear()
+                elif h.sock is None or _connection_dropped(h.sock):
+                    expired.append(h)
+                else:
+                    conn = h
+                    break
+            if not conns:
+                self._idle.pop(key, None)
+        for h in expired:
+            h.close()
+        return conn
+
+    def _put(self, key, conn):
+        with self._lock:
+            self._done(key)
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < self.maxsize:
+                conns.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def _discard(self, key, conn):
+        with self._lock:
+            self._done(key)
+        if conn is not None:
+            conn.close()
+
+    def _done(self, key):
+        # Called with the lock held.
+        active = self._active[key] - 1
+        if active:
+            self._active[key] = active
+        else:
+            del self._active[key]
+        self._released.notify()
+
+    def clear(self):
+        """Close all idle connections."""
+        with self._lock:
+            idle = self._idle
+            self._idle = {}
+        for conns in idle.values():
+            for h, released in conns:
+                h.close()
+
+
+class _PooledHTTPResponse(http.client.HTTPResponse):
+    # Give the connection back to its pool once the response body has been
+    # completely read.  A response closed before that closes its
+    # connection, since the rest of the body is still pending on it.
+
+    _pool = _pool_key = _pool_conn = None
+
+    def close(self):
+        if self.fp is not None:
+            # Nothing is left to read if the response has no body.
+            self._release(not self.will_close and not self.chunked
+                          and self.length == 0)
+        super().close()
+
+    def _close_conn(self):
+        super()._close_conn()
+        self._release(not self.will_close)
+
+    def _release(self, reusable):
+        pool = self._pool
+        if pool is None:
+            return
+        key = self._pool_key
+        conn = self._pool_conn
+        self._pool = self._pool_key = self._pool_conn = None
+        if reusable and conn.sock is not None:
+            pool._put(key, conn)
+        else:
+            pool._discard(key, conn)
+
+
+def _can_resend(data):
+    return data is None or isinstance(data, (bytes, bytearray, memoryview))
+
+
 class AbstractHTTPHandler(BaseHandler):
 
-    def __init__(self, debuglevel=None):
+    def __init__(self, debuglevel=None, *, pool=None):
         self._debuglevel = debuglevel if debuglevel is not None else http.client.HTTPConnection.debuglevel
+        self._pool = pool
 
     def set_http_debuglevel(self, level):
         self._debuglevel = level
@@ -1284,51 +1430,106 @@ def do_open(self, http_class, req, **http_conn_args):
         if not host:
             raise URLError('no host given')
 
-        # will parse host:port
-        h = http_class(host, timeout=req.timeout, **http_conn_args)
-        h.set_debuglevel(self._debuglevel)
+        pool = self._pool
+        key = None
+        h = None
+        if (pool is not None and getattr(http_class, 'response_class', None)
+                is http.client.HTTPResponse):
+            key = (http_class, host, req._tunnel_host,
+                   tuple(sorted(http_conn_args.items())))
 
         headers = dict(req.unredirected_hdrs)
         headers.update({k: v for k, v in req.headers.items()
                         if k not in headers})
 
-        # TODO(jhylton): Should this be redesigned to handle
-        # persistent connections?
-
-        # We want to make an HTTP/1.1 request, but the addinfourl
-        # class isn't prepared to deal with a persistent connection.
-        # It will try to read all remaining data from the socket,
-        # which will block while the server waits for the next request.
-        # So make sure the connection gets closed after the (only)
-        # request.
-        headers["Connection"] = "close"
+        if key is None:
+            # We want to make an HTTP/1.1 request, but the addinfourl
+            # class isn't prepared to deal with a persistent connection.
+            # It will try to read all remaining data from the socket,
+            # which will block while the server waits for the next request.
+            # So make sure the connection gets closed after the (only)
+            # request.
+            headers["Connection"] = "close"
         headers = {name.title(): val for name, val in headers.items()}
 
+        tunnel_headers = {}
         if req._tunnel_host:
-            tunnel_headers = {}
             proxy_auth_hdr = "Proxy-Authorization"
             if proxy_auth_hdr in headers:
                 tunnel_headers[proxy_auth_hdr] = headers[proxy_auth_hdr]
                 # Proxy-Authorization should not be sent to origin
                 # server.
                 del headers[proxy_auth_hdr]
-            h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
 
-        try:
+        def connect():
+            # will parse host:port
+            h = http_class(host, timeout=req.timeout, **http_conn_args)
+            h.set_debuglevel(self._debuglevel)
+            if key is not None:
+                h.response_class = _PooledHTTPResponse
+            if req._tunnel_host:
+                h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
+            return h
+
+        def send(h):
             try:
-                h.request(req.get_method(), req.selector, req.data, headers,
-                          encode_chunked=req.has_header('Transfer-encoding'))
-            except OSError as err: # timeout error
-                raise URLError(err)
-            r = h.getresponse()
+                try:
+                    h.request(req.get_method(), req.selector, req.data,
+                              headers,
+                              encode_chunked=req.has_header('Transfer-encoding'))
+                except OSError as err: # timeout error
+                    raise URLError(err)
+                return h.getresponse()
+            except:
+                h.close()
+                raise
+
+        if key is not None:
+            h = pool._get(key)
+        try:
+            if h is not None:
+                timeout = req.timeout
+                if timeout is socket._GLOBAL_DEFAULT_TIMEOUT:
+                    timeout = socket.getdefaulttimeout()
+                h.timeout = timeout
+                h.sock.settimeout(timeout)
+                h.set_debuglevel(self._debuglevel)
+                try:
+                    r = send(h)
+                except (URLError, ConnectionError) as err:
+                    # The server may have closed the connection while it
+                    # was idle: send the request again on a new connection.
+                    # If the request was written (the error is not a
+                    # URLError from h.request()), the server may have
+                    # processed it, so it is only sent again if it is
+                    # idempotent.
+                    if not (isinstance(getattr(err, 'reason', err),
+                                       ConnectionError)
+                            and _can_resend(req.data)
+                            and (isinstance(err, URLError)
+                                 or req.get_method()
+                                    in http.client._IDEMPOTENT_METHODS)):
+                        raise
+                    h = connect()
+                    r = send(h)
+            else:
+                h = connect()
+                r = send(h)
         except:
-            h.close()
+            # send() has closed the connection, if it was opened.
+            if key is not None:
+                pool._discard(key, None)
             raise
 
-        # If the server does not send us a 'Connection: close' header,
-        # HTTPConnection assumes the socket should be left open. Manually
-        # mark the socket to be closed when this response object goes away.
-        if h.sock:
+        if key is not None:
+            r._pool = pool
+            r._pool_key = key
+            r._pool_conn = h
+        elif h.sock:
+            # If the server does not send us a 'Connection: close' header,
+            # HTTPConnection assumes the socket should be left open.
+            # Manually mark the socket to be closed when this response
+            # object goes away.
             h.sock.close()
             h.sock = None
 
@@ -1353,19 +1554,22 @@ def http_open(self, req):
 
     class HTTPSHandler(AbstractHTTPHandler):
 
-        def __init__(self, debuglevel=None, context=None, check_hostname=None):
+        def __init__(self, debuglevel=None, context=None, check_hostname=None,
+                     *, pool=None):
             debuglevel = debuglevel if debuglevel is not None else http.client.HTTPSConnection.debuglevel
-            AbstractHTTPHandler.__init__(self, debuglevel)
+            AbstractHTTPHandler.__init__(self, debuglevel, pool=pool)
             if context is None:
                 http_version = http.client.HTTPSConnection._http_vsn
                 context = http.client._create_https_context(http_version)
             if check_hostname is not None:
                 context.check_hostname = check_hostname
             self._context = context
+            self._session_cache = http.client.SSLSessionCache()
 
         def https_open(self, req):
             return self.do_open(http.client.HTTPSConnection, req,
-                                context=self._context)
+                                context=self._context,
+                                session_cache=self._session_cache)
 
         https_request = AbstractHTTPHandler.do_request_
 
@@ -809,6 +809,9 @@ typedef struct lru_list_elem {
     struct lru_list_elem *prev, *next;  /* borrowed links */
     Py_hash_t hash;
     PyObject *key, *result;
+    /* only used by evicting_lru_cache_wrapper() */
+    PyTime_t expires;
+    Py_ssize_t weight;
 } lru_list_elem;
 
 static void
@@ -835,11 +838,15 @@ static PyType_Spec lru_list_elem_type_spec = {
 };
 
 
-typedef PyObject *(*lru_cache_ternaryfunc)(struct lru_cache_object *, PyObject *, PyObject *);
+/* The wrappers take the key, which they steal a reference to, and its hash
+   from lru_cache_call().  The key is NULL for uncached_lru_cache_wrapper(). */
+typedef PyObject *(*lru_cache_wrapperfunc)(struct lru_cache_object *,
+                                           PyObject *, PyObject *,
+                                           PyObject *, Py_hash_t);
 
 typedef struct lru_cache_object {
     lru_list_elem root;  /* includes PyObject_HEAD */
-    lru_cache_ternaryfunc wrapper;
+    lru_cache_wrapperfunc wrapper;
     int typed;
     PyObject *cache;
     Py_ssize_t hits;
@@ -852,6 +859,15 @@ typedef struct lru_cache_object {
     PyObject *cache_info_type;
     PyObject *dict;
     PyObject *weakreflist;
+    /* The following are only used by evicting_lru_cache_wrapper() */
+    PyTime_t ttl;               /* 0 if entries never expire */
+    PyObject *weigher;          /* NULL if every entry weighs 1 */
+    Py_ssize_t maxweight;       /* -1 if unbounded */
+    Py_ssize_t currweight;
+    Py_ssize_t evictions;
+    Py_ssize_t expirations;
+    /* Tuple of the caches the calls are spread over, or NULL */
+    PyObject *shards;
 } lru_cache_object;
 
 static PyObject *
@@ -916,10 +932,12 @@ lru_cache_make_key(PyObject *kwd_mark, PyObject *args,
 }
 
 static PyObject *
-uncached_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwds)
+uncached_lru_cache_wrapper(lru_cache_object *self, PyObject *args,
+                           PyObject *kwds, PyObject *key, Py_hash_t hash)
 {
     PyObject *result;
 
+    assert(key == NULL);
     self->misses++;
     result = PyObject_Call(self->func, args, kwds);
     if (!result)
@@ -928,18 +946,11 @@ uncached_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwd
 }
 
 static PyObject *
-infinite_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwds)
+infinite_lru_cache_wrapper(lru_cache_object *self, PyObject *args,
+                           PyObject *kwds, PyObject *key, Py_hash_t hash)
 {
     PyObject *result;
-    Py_hash_t hash;
-    PyObject *key = lru_cache_make_key(self->kwd_mark, args, kwds, self->typed);
-    if (!key)
-        return NULL;
-    hash = PyObject_Hash(key);
-    if (hash == -1) {
-        Py_DECREF(key);
-        return NULL;
-    }
+
     result = _PyDict_GetItem_KnownHash(self->cache, key, hash);
     if (result) {
         Py_INCREF(result);
@@ -1027,20 +1038,12 @@ lru_cache_prepend_link(lru_cache_object *self, lru_list_elem *link)
  */
 
 static PyObject *
-bounded_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwds)
+bounded_lru_cache_wrapper(lru_cache_object *self, PyObject *args,
+                          PyObject *kwds, PyObject *key, Py_hash_t hash)
 {
     lru_list_elem *link;
-    PyObject *key, *result, *testresult;
-    Py_hash_t hash;
+    PyObject *result, *testresult;
 
-    key = lru_cache_make_key(self->kwd_mark, args, kwds, self->typed);
-    if (!key)
-        return NULL;
-    hash = PyObject_Hash(key);
-    if (hash == -1) {
-        Py_DECREF(key);
-        return NULL;
-    }
     link  = (lru_list_elem *)_PyDict_GetItem_KnownHash(self->cache, key, hash);
     if (link != NULL) {
         lru_cache_extract_link(link);
@@ -1192,21 +1195,241 @@ bounded_lru_cache_wrapper(lru_cache_object *self, PyObject *args, PyObject *kwds
     return result;
 }
 
+static PyObject *evicting_lru_cache_wrapper(lru_cache_object *, PyObject *,
+                                            PyObject *, PyObject *, Py_hash_t);
+
+/* Remove a link from both the cache dict and the linked list, and drop
+   the reference held by the list.  The caller must not touch the link
+   afterwards.  Returns -1 (with the link left in place) on error. */
+static int
+lru_cache_remove_link(lru_cache_object *self, lru_list_elem *link)
+{
+    PyObject *popresult;
+    lru_cache_extract_link(link);
+    /* The key is found by identity, so no __eq__ call is made. */
+    int res = _PyDict_Pop_KnownHash((PyDictObject*)self->cache, link->key,
+                                    link->hash, &popresult);
+    if (res < 0) {
+        lru_cache_prepend_link(self, link);
+        return -1;
+    }
+    if (self->wrapper == evicting_lru_cache_wrapper) {
+        self->currweight -= link->weight;
+    }
+    /* If res == 0, the user function or another thread has already
+       removed the key from the dict and the link was an orphan. */
+    Py_XDECREF(popresult);
+    /* The cache is consistent again, so it is safe to let arbitrary
+       clean-up code run. */
+    Py_DECREF(link);
+    return 0;
+}
+
+/* Wrapper used when entries can expire or have a weight.  Entries are
+   kept in a linked list like in bounded_lru_cache_wrapper(), but a new
+   link is always allocated and as many of the oldest entries as needed
+   are evicted after the new one has been added.  Expired entries are
+   removed lazily, when they are looked up or when they are the oldest
+   entry at eviction time. */
+static PyObject *
+evicting_lru_cache_wrapper(lru_cache_object *self, PyObject *args,
+                           PyObject *kwds, PyObject *key, Py_hash_t hash)
+{
+    lru_list_elem *link;
+    PyObject *result, *testresult;
+    Py_ssize_t weight = 1;
+    PyTime_t now = 0;
+
+    link  = (lru_list_elem *)_PyDict_GetItem_KnownHash(self->cache, key, hash);
+    if (link != NULL) {
+        if (self->ttl) {
+            (void)PyTime_Monotonic(&now);
+        }
+        if (!self->ttl || now < link->expires) {
+            lru_cache_extract_link(link);
+            lru_cache_append_link(self, link);
+            result = link->result;
+            self->hits++;
+            Py_INCREF(result);
+            Py_DECREF(key);
+            return result;
+        }
+        /* The entry has expired: drop it and treat the call as a miss. */
+        self->expirations++;
+        if (lru_cache_remove_link(self, link) < 0) {
+            Py_DECREF(key);
+            return NULL;
+        }
+    }
+    else if (PyErr_Occurred()) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    self->misses++;
+    result = PyObject_Call(self->func, args, kwds);
+    if (!result) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    if (self->weigher != NULL) {
+        PyObject *weight_O = PyObject_CallOneArg(self->weigher, result);
+        if (weight_O == NULL) {
+            goto error;
+        }
+        weight = PyNumber_AsSsize_t(weight_O, PyExc_OverflowError);
+        Py_DECREF(weight_O);
+        if (weight == -1 && PyErr_Occurred()) {
+            goto error;
+        }
+        if (weight < 0) {
+            PyErr_SetString(PyExc_ValueError,
+                            "weigher must return a non-negative integer");
+            goto error;
+        }
+        if (self->maxweight >= 0 && weight > self->maxweight) {
+            /* Too heavy to ever fit in the cache. */
+            Py_DECREF(key);
+            return result;
+        }
+    }
+    testresult = _PyDict_GetItem_KnownHash(self->cache, key, hash);
+    if (testresult != NULL) {
+        /* Getting here means that this same key was added to the cache
+           during the PyObject_Call(). */
+        Py_DECREF(key);
+        return result;
+    }
+    if (PyErr_Occurred()) {
+        goto error;
+    }
+
+    link = (lru_list_elem *)PyObject_New(lru_list_elem,
+                                         self->lru_list_elem_type);
+    if (link == NULL) {
+        goto error;
+    }
+    link->hash = hash;
+    link->key = key;
+    link->result = Py_NewRef(result);
+    link->weight = weight;
+    link->expires = 0;
+    if (self->ttl) {
+        (void)PyTime_Monotonic(&now);
+        link->expires = now + self->ttl;
+    }
+    if (_PyDict_SetItem_KnownHash(self->cache, key, (PyObject *)link,
+                                  hash) < 0) {
+        Py_DECREF(link);
+        Py_DECREF(result);
+        return NULL;
+    }
+    lru_cache_append_link(self, link);
+    self->currweight += weight;
+
+    /* Evict the oldest entries until the cache fits its limits again.
+       The new entry is the newest, and is never evicted: it fits on
+       its own. */
+    while ((self->maxsize >= 0 &&
+            PyDict_GET_SIZE(self->cache) > self->maxsize) ||
+           (self->maxweight >= 0 && self->currweight > self->maxweight))
+    {
+        lru_list_elem *oldest = self->root.next;
+        if (oldest == &self->root || oldest == link) {
+            break;
+        }
+        if (self->ttl && now >= oldest->expires) {
+            self->expirations++;
+        }
+        else {
+            self->evictions++;
+        }
+        if (lru_cache_remove_link(self, oldest) < 0) {
+            Py_DECREF(result);
+            return NULL;
+        }
+    }
+    return result;
+
+error:
+    Py_DECREF(key);
+    Py_DECREF(result);
+    return NULL;
+}
+
+static lru_cache_object *
+lru_cache_alloc(PyTypeObject *type, _functools_state *state,
+                lru_cache_wrapperfunc wrapper, PyObject *func, int typed,
+                Py_ssize_t maxsize, PyObject *cache_info_type, PyTime_t ttl,
+                PyObject *weigher, Py_ssize_t maxweight)
+{
+    PyObject *cachedict;
+    lru_cache_object *obj;
+
+    if (!(cachedict = PyDict_New()))
+        return NULL;
+
+    obj = (lru_cache_object *)type->tp_alloc(type, 0);
+    if (obj == NULL) {
+        Py_DECREF(cachedict);
+        return NULL;
+    }
+
+    obj->root.prev = &obj->root;
+    obj->root.next = &obj->root;
+    obj->wrapper = wrapper;
+    obj->typed = typed;
+    obj->cache = cachedict;
+    obj->func = Py_NewRef(func);
+    obj->misses = obj->hits = 0;
+    obj->maxsize = maxsize;
+    obj->kwd_mark = Py_NewRef(state->kwd_mark);
+    obj->lru_list_elem_type = (PyTypeObject*)Py_NewRef(state->lru_list_elem_type);
+    obj->cache_info_type = Py_NewRef(cache_info_type);
+    obj->dict = NULL;
+    obj->weakreflist = NULL;
+    obj->ttl = ttl;
+    obj->weigher = Py_XNewRef(weigher);
+    obj->maxweight = maxweight;
+    obj->currweight = 0;
+    obj->evictions = obj->expirations = 0;
+    obj->shards = NULL;
+    return obj;
+}
+
+/* Spread total over n shards, so that the shard sizes add up to it exactly.
+   A negative total means unbounded. */
+static Py_ssize_t
+lru_cache_shard_size(Py_ssize_t total, Py_ssize_t n, Py_ssize_t i)
+{
+    if (total < 0) {
+        return -1;
+    }
+    return total / n + (i < total % n);
+}
+
 static PyObject *
 lru_cache_new(PyTypeObject *type, PyObject *args, PyObject *kw)
 {
-    PyObject *func, *maxsize_O, *cache_info_type, *cachedict;
+    PyObject *func, *maxsize_O, *cache_info_type;
+    PyObject *ttl_O = Py_None, *weigher = Py_None, *maxweight_O = Py_None;
     int typed;
     lru_cache_object *obj;
-    Py_ssize_t maxsize;
-    PyObject *(*wrapper)(lru_cache_object *, PyObject *, PyObject *);
+    Py_ssize_t maxsize, maxweight = -1, shards = 1;
+    PyTime_t ttl = 0;
+    lru_cache_wrapperfunc wrapper;
     _functools_state *state;
     static char *keywords[] = {"user_function", "maxsize", "typed",
-                               "cache_info_type", NULL};
+                               "cache_info_type", "ttl", "weigher",
+                               "maxweight", "shards", NULL};
 
-    if (!PyArg_ParseTupleAndKeywords(args, kw, "OOpO:lru_cache", keywords,
-                                     &func, &maxsize_O, &typed,
-                                     &cache_info_type)) {
+    if (!PyArg_ParseTupleAndKeywords(args, kw, "OOpO|$OOOn:lru_cache",
+                                     keywords, &func, &maxsize_O, &typed,
+                                     &cache_info_type, &ttl_O, &weigher,
+                                     &maxweight_O, &shards)) {
+        return NULL;
+    }
+    if (shards < 1) {
+        PyErr_SetString(PyExc_ValueError, "shards must be at least 1");
         return NULL;
     }
 
@@ -1242,28 +1465,79 @@ lru_cache_new(PyTypeObject *type, PyObject *args, PyObject *kw)
         return NULL;
     }
 
-    if (!(cachedict = PyDict_New()))
-        return NULL;
+    if (ttl_O != Py_None) {
+        double seconds = PyFloat_AsDouble(ttl_O);
+        if (seconds == -1.0 && PyErr_Occurred())
+            return NULL;
+        if (!(seconds > 0)) {
+            PyErr_SetString(PyExc_ValueError, "ttl must be positive");
+            return NULL;
+        }
+        if (seconds * 1e9 >= (double)PyTime_MAX) {
+            PyErr_SetString(PyExc_OverflowError, "ttl is too large");
+            return NULL;
+        }
+        ttl = (PyTime_t)(seconds * 1e9);
+        if (ttl == 0)
+            ttl = 1;
+    }
+    if (weigher == Py_None) {
+        weigher = NULL;
+        if (maxweight_O != Py_None) {
+            PyErr_SetString(PyExc_TypeError, "maxweight requires a weigher");
+            return NULL;
+        }
+    }
+    else {
+        if (!PyCallable_Check(weigher)) {
+            PyErr_SetString(PyExc_TypeError, "weigher must be callable");
+            return NULL;
+        }
+        if (maxweight_O != Py_None) {
+            maxweight = PyNumber_AsSsize_t(maxweight_O, PyExc_OverflowError);
+            if (maxweight == -1 && PyErr_Occurred())
+                return NULL;
+            if (maxweight < 0) {
+                PyErr_SetString(PyExc_ValueError,
+                                "maxweight must be non-negative");
+                return NULL;
+            }
+        }
+    }
+    if ((ttl || weigher) && wrapper != uncached_lru_cache_wrapper) {
+        wrapper = evicting_lru_cache_wrapper;
+    }
+    if (maxsize >= 0 && shards > maxsize) {
+        /* Every shard holds at least one entry */
+        shards = maxsize ? maxsize : 1;
+    }
 
-    obj = (lru_cache_object *)type->tp_alloc(type, 0);
+    obj = lru_cache_alloc(type, state, wrapper, func, typed, maxsize,
+                          cache_info_type, ttl, weigher, maxweight);
     if (obj == NULL) {
-        Py_DECREF(cachedict);
         return NULL;
     }
-
-    obj->root.prev = &obj->root;
-    obj->root.next = &obj->root;
-    obj->wrapper = wrapper;
-    obj->typed = typed;
-    obj->cache = cachedict;
-    obj->func = Py_NewRef(func);
-    obj->misses = obj->hits = 0;
-    obj->maxsize = maxsize;
-    obj->kwd_mark = Py_NewRef(state->kwd_mark);
-    obj->lru_list_elem_type = (PyTypeObject*)Py_NewRef(state->lru_list_elem_type);
-    obj->cache_info_type = Py_NewRef(cache_info_type);
-    obj->dict = NULL;
-    obj->weakreflist = NULL;
+    if (shards > 1) {
+        /* Each shard is a complete cache, with its own critical section,
+           so that calls landing in different shards do not serialize.
+           The wrapper itself holds no entries. */
+        obj->shards = PyTuple_New(shards);
+        if (obj->shards == NULL) {
+            Py_DECREF(obj);
+            return NULL;
+        }
+        for (Py_ssize_t i = 0; i < shards; i++) {
+            lru_cache_object *shard = lru_cache_alloc(
+                type, state, wrapper, func, typed,
+                lru_cache_shard_size(maxsize, shards, i), cache_info_type,
+                ttl, weigher, lru_cache_shard_size(maxweight, shards, i));
+            if (shard == NULL) {
+                Py_DECREF(obj);
+                return NULL;
+            }
+            PyTuple_SET_ITEM(obj->shards, i, (PyObject *)shard);
+        }
+    }
     return (PyObject *)obj;
 }
 
@@ -1298,6 +1572,8 @@ lru_cache_tp_clear(lru_cache_object *self)
     Py_CLEAR(self->lru_list_elem_type);
     Py_CLEAR(self->cache_info_type);
     Py_CLEAR(self->dict);
+    Py_CLEAR(self->weigher);
+    Py_CLEAR(self->shards);
     lru_cache_clear_list(list);
     return 0;
 }
@@ -1320,9 +1596,29 @@ lru_cache_dealloc(lru_cache_object *obj)
 static PyObject *
 lru_cache_call(lru_cache_object *self, PyObject *args, PyObject *kwds)
 {
-    PyObject *result;
+    PyObject *result, *key = NULL;
+    Py_hash_t hash = -1;
+
+    /* The key only depends on the arguments, so it is built and hashed
+       before entering the critical section. */
+    if (self->wrapper != uncached_lru_cache_wrapper) {
+        key = lru_cache_make_key(self->kwd_mark, args, kwds, self->typed);
+        if (!key)
+            return NULL;
+        hash = PyObject_Hash(key);
+        if (hash == -1) {
+            Py_DECREF(key);
+            return NULL;
+        }
+    }
+    if (self->shards != NULL) {
+        /* Equal keys have equal hashes, so they land in the same shard. */
+        Py_uhash_t n = (Py_uhash_t)PyTuple_GET_SIZE(self->shards);
+        self = (lru_cache_object *)PyTuple_GET_ITEM(self->shards,
+                                                    (Py_uhash_t)hash % n);
+    }
     Py_BEGIN_CRITICAL_SECTION(self);
-    result = self->wrapper(self, args, kwds);
+    result = self->wrapper(self, args, kwds, key, hash);
     Py_END_CRITICAL_SECTION();
     return result;
 }
@@ -1348,14 +1644,59 @@ _functools__lru_cache_wrapper_cache_info_impl(PyObject *self)
 /*[clinic end generated code: output=cc796a0b06dbd717 input=00e1acb31aa21ecc]*/
 {
     lru_cache_object *_self = (lru_cache_object *) self;
+    Py_ssize_t hits = _self->hits, misses = _self->misses;
+    Py_ssize_t currsize = PyDict_GET_SIZE(_self->cache);
+    Py_ssize_t evictions = _self->evictions;
+    Py_ssize_t expirations = _self->expirations;
+    Py_ssize_t currweight = _self->currweight;
+    if (_self->shards != NULL) {
+        /* Add up the statistics of the shards */
+        for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(_self->shards); i++) {
+            lru_cache_object *shard =
+                (lru_cache_object *)PyTuple_GET_ITEM(_self->shards, i);
+            Py_BEGIN_CRITICAL_SECTION(shard);
+            hits += shard->hits;
+            misses += shard->misses;
+            currsize += PyDict_GET_SIZE(shard->cache);
+            evictions += shard->evictions;
+            expirations += shard->expirations;
+            currweight += shard->currweight;
+            Py_END_CRITICAL_SECTION();
+        }
+    }
+    if (_self->wrapper == evicting_lru_cache_wrapper) {
+        PyObject *maxsize = (_self->maxsize == -1 ? Py_NewRef(Py_None)
+                             : PyLong_FromSsize_t(_self->maxsize));
+        if (maxsize == NULL) {
+            return NULL;
+        }
+        PyObject *currweight_O = (_self->weigher == NULL ? Py_NewRef(Py_None)
+                                  : PyLong_FromSsize_t(currweight));
+        if (currweight_O == NULL) {
+            Py_DECREF(maxsize);
+            return NULL;
+        }
+        return PyObject_CallFunction(_self->cache_info_type, "nnNnnnN",
+                                     hits, misses, maxsize, currsize,
+                                     evictions, expirations, currweight_O);
+    }
     if (_self->maxsize == -1) {
         return PyObject_CallFunction(_self->cache_info_type, "nnOn",
-                                     _self->hits, _self->misses, Py_None,
-                                     PyDict_GET_SIZE(_self->cache));
+                                     hits, misses, Py_None, currsize);
     }
     return PyObject_CallFunction(_self->cache_info_type, "nnnn",
-                                 _self->hits, _self->misses, _self->maxsize,
-                                 PyDict_GET_SIZE(_self->cache));
+                                 hits, misses, _self->maxsize, currsize);
+}
+
+static void
+lru_cache_clear(lru_cache_object *self)
+{
+    lru_list_elem *list = lru_cache_unlink_list(self);
+    self->hits = self->misses = 0;
+    self->evictions = self->expirations = 0;
+    self->currweight = 0;
+    PyDict_Clear(self->cache);
+    lru_cache_clear_list(list);
 }
 
 /*[clinic input]
@@ -1370,10 +1711,78 @@ _functools__lru_cache_wrapper_cache_clear_impl(PyObject *self)
 /*[clinic end generated code: output=58423b35efc3e381 input=dfa33acbecf8b4b2]*/
 {
     lru_cache_object *_self = (lru_cache_object *) self;
-    lru_list_elem *list = lru_cache_unlink_list(_self);
-    _self->hits = _self->misses = 0;
-    PyDict_Clear(_self->cache);
-    lru_cache_clear_list(list);
+    lru_cache_clear(_self);
+    if (_self->shards != NULL) {
+        for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(_self->shards); i++) {
+            lru_cache_object *shard =
+                (lru_cache_object *)PyTuple_GET_ITEM(_self->shards, i);
+            Py_BEGIN_CRITICAL_SECTION(shard);
+            lru_cache_clear(shard);
+            Py_END_CRITICAL_SECTION();
+        }
+    }
+    Py_RETURN_NONE;
+}
+
+/* Remove the entry for key if it still holds result. */
+static int
+lru_cache_discard_key(lru_cache_object *self, PyObject *result,
+                      PyObject *key, Py_hash_t hash)
+{
+    PyObject *value = _PyDict_GetItem_KnownHash(self->cache, key, hash);
+    if (value == NULL) {
+        return PyErr_Occurred() ? -1 : 0;
+    }
+    if (self->wrapper == infinite_lru_cache_wrapper) {
+        if (value != result) {
+            return 0;
+        }
+        return _PyDict_DelItem_KnownHash(self->cache, key, hash);
+    }
+    lru_list_elem *link = (lru_list_elem *)value;
+    if (link->result != result) {
+        return 0;
+    }
+    return lru_cache_remove_link(self, link);
+}
+
+/* Private method used by the coroutine wrapper of functools.lru_cache()
+   to drop the calls which failed. */
+static PyObject *
+lru_cache_discard(PyObject *op, PyObject *args)
+{
+    lru_cache_object *self = (lru_cache_object *)op;
+    PyObject *result, *fargs, *fkwds, *key;
+    Py_hash_t hash;
+    int res;
+
+    if (!PyArg_ParseTuple(args, "OO!O!:_cache_discard", &result,
+                          &PyTuple_Type, &fargs, &PyDict_Type, &fkwds)) {
+        return NULL;
+    }
+    if (self->wrapper == uncached_lru_cache_wrapper) {
+        Py_RETURN_NONE;
+    }
+    key = lru_cache_make_key(self->kwd_mark, fargs, fkwds, self->typed);
+    if (!key)
+        return NULL;
+    hash = PyObject_Hash(key);
+    if (hash == -1) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    if (self->shards != NULL) {
+        Py_uhash_t n = (Py_uhash_t)PyTuple_GET_SIZE(self->shards);
+        self = (lru_cache_object *)PyTuple_GET_ITEM(self->shards,
+                                                    (Py_uhash_t)hash % n);
+    }
+    Py_BEGIN_CRITICAL_SECTION(self);
+    res = lru_cache_discard_key(self, result, key, hash);
+    Py_END_CRITICAL_SECTION();
+    Py_DECREF(key);
+    if (res < 0) {
+        return NULL;
+    }
     Py_RETURN_NONE;
 }
 
@@ -1413,6 +1822,8 @@ lru_cache_tp_traverse(lru_cache_object *self, visitproc visit, void *arg)
     Py_VISIT(self->lru_list_elem_type);
     Py_VISIT(self->cache_info_type);
     Py_VISIT(self->dict);
+    Py_VISIT(self->weigher);
+    Py_VISIT(self->shards);
     return 0;
 }
 
@@ -1430,12 +1841,26 @@ typed:    False     cache f(3) and f(3.0) as identical calls\n\
           True      cache f(3) and f(3.0) as distinct calls\n\
 \n\
 cache_info_type:    namedtuple class with the fields:\n\
-                        hits misses currsize maxsize\n"
+                        hits misses currsize maxsize\n\
+                    (followed by evictions expirations currweight\n\
+                    if ttl or weigher is given)\n\
+\n\
+ttl:      None      entries never expire\n\
+          seconds   entries expire that long after being cached\n\
+\n\
+weigher:  None      every entry counts as one\n\
+          callable  weigher(result) returns the weight of an entry\n\
+\n\
+maxweight: None     no limit on the total weight\n\
+          n         evict entries to keep the total weight below n\n\
+\n\
+shards:   n         spread the entries over n independent caches\n"
 );
 
 static PyMethodDef lru_cache_methods[] = {
     _FUNCTOOLS__LRU_CACHE_WRAPPER_CACHE_INFO_METHODDEF
     _FUNCTOOLS__LRU_CACHE_WRAPPER_CACHE_CLEAR_METHODDEF
+    {"_cache_discard", lru_cache_discard, METH_VARARGS},
     {"__reduce__", (PyCFunction)lru_cache_reduce, METH_NOARGS},
     {"__copy__", (PyCFunction)lru_cache_copy, METH_VARARGS},
     {"__deepcopy__", (PyCFunction)lru_cache_deepcopy, METH_VARARGS},
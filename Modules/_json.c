@@ -45,12 +45,25 @@ typedef struct _PyEncoderObject {
     PyObject *indent;
     PyObject *key_separator;
     PyObject *item_separator;
+    PyObject *object_plans;
     char sort_keys;
     char skipkeys;
     int allow_nan;
     PyCFunction fast_encode;
 } PyEncoderObject;
 
+/* The writer used by the encoder.  If write is not NULL, the encoded data is
+   passed to it in blocks of about JSON_WRITE_SIZE characters while encoding,
+   instead of being accumulated into a single string.  The _PyUnicodeWriter
+   must be the first member: the encoder functions only get a pointer to it,
+   and encoder_maybe_flush() casts it back. */
+typedef struct {
+    _PyUnicodeWriter writer;
+    PyObject *write;
+} JSONStreamWriter;
+
+#define JSON_WRITE_SIZE (64 * 1024)
+
 static PyMemberDef encoder_members[] = {
     {"markers", _Py_T_OBJECT, offsetof(PyEncoderObject, markers), Py_READONLY, "markers"},
     {"default", _Py_T_OBJECT, offsetof(PyEncoderObject, defaultfn), Py_READONLY, "default"},
@@ -60,6 +73,7 @@ static PyMemberDef encoder_members[] = {
     {"item_separator", _Py_T_OBJECT, offsetof(PyEncoderObject, item_separator), Py_READONLY, "item_separator"},
     {"sort_keys", Py_T_BOOL, offsetof(PyEncoderObject, sort_keys), Py_READONLY, "sort_keys"},
     {"skipkeys", Py_T_BOOL, offsetof(PyEncoderObject, skipkeys), Py_READONLY, "skipkeys"},
+    {"object_plans", _Py_T_OBJECT, offsetof(PyEncoderObject, object_plans), Py_READONLY, "object_plans"},
     {NULL}
 };
 
@@ -91,6 +105,8 @@ static int
 encoder_listencode_obj(PyEncoderObject *s, _PyUnicodeWriter *writer, PyObject *obj, PyObject *newline_indent);
 static int
 encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer, PyObject *dct, PyObject *newline_indent);
+static int
+encoder_listencode_fields(PyEncoderObject *s, _PyUnicodeWriter *writer, PyObject *obj, PyObject *plan, PyObject *newline_indent);
 static PyObject *
 _encoded_const(PyObject *obj);
 static void
@@ -1206,17 +1222,18 @@ static PyType_Spec PyScannerType_spec = {
 static PyObject *
 encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    static char *kwlist[] = {"markers", "default", "encoder", "indent", "key_separator", "item_separator", "sort_keys", "skipkeys", "allow_nan", NULL};
+    static char *kwlist[] = {"markers", "default", "encoder", "indent", "key_separator", "item_separator", "sort_keys", "skipkeys", "allow_nan", "object_plans", NULL};
 
     PyEncoderObject *s;
     PyObject *markers, *defaultfn, *encoder, *indent, *key_separator;
     PyObject *item_separator;
+    PyObject *object_plans = Py_None;
     int sort_keys, skipkeys, allow_nan;
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OOOOUUppp:make_encoder", kwlist,
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "OOOOUUppp|$O:make_encoder", kwlist,
         &markers, &defaultfn, &encoder, &indent,
         &key_separator, &item_separator,
-        &sort_keys, &skipkeys, &allow_nan))
+        &sort_keys, &skipkeys, &allow_nan, &object_plans))
         return NULL;
 
     if (markers != Py_None && !PyDict_Check(markers)) {
@@ -1236,6 +1253,7 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     s->indent = Py_NewRef(indent);
     s->key_separator = Py_NewRef(key_separator);
     s->item_separator = Py_NewRef(item_separator);
+    s->object_plans = Py_NewRef(object_plans);
     s->sort_keys = sort_keys;
     s->skipkeys = skipkeys;
     s->allow_nan = allow_nan;
@@ -1263,40 +1281,82 @@ _create_newline_indent(PyObject *indent, Py_ssize_t indent_level)
     return newline_indent;
 }
 
+static int
+encoder_flush(JSONStreamWriter *sw)
+{
+    /* Pass the data accumulated so far to sw->write, and start a new
+       block */
+    PyObject *chunk = _PyUnicodeWriter_Finish(&sw->writer);
+    _PyUnicodeWriter_Init(&sw->writer);
+    sw->writer.overallocate = 1;
+    if (chunk == NULL) {
+        return -1;
+    }
+    PyObject *res = PyObject_CallOneArg(sw->write, chunk);
+    Py_DECREF(chunk);
+    if (res == NULL) {
+        return -1;
+    }
+    Py_DECREF(res);
+    return 0;
+}
+
+static inline int
+encoder_maybe_flush(_PyUnicodeWriter *writer)
+{
+    JSONStreamWriter *sw = (JSONStreamWriter *)writer;
+    if (sw->write == NULL || writer->pos < JSON_WRITE_SIZE) {
+        return 0;
+    }
+    return encoder_flush(sw);
+}
+
 static PyObject *
 encoder_call(PyEncoderObject *self, PyObject *args, PyObject *kwds)
 {
     /* Python callable interface to encode_listencode_obj */
-    static char *kwlist[] = {"obj", "_current_indent_level", NULL};
+    static char *kwlist[] = {"obj", "_current_indent_level", "_write", NULL};
     PyObject *obj, *result;
+    PyObject *write = Py_None;
     Py_ssize_t indent_level;
-    _PyUnicodeWriter writer;
+    JSONStreamWriter sw;
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:_iterencode", kwlist,
-        &obj, &indent_level))
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On|$O:_iterencode", kwlist,
+        &obj, &indent_level, &write))
         return NULL;
 
-    _PyUnicodeWriter_Init(&writer);
-    writer.overallocate = 1;
+    _PyUnicodeWriter_Init(&sw.writer);
+    sw.writer.overallocate = 1;
+    sw.write = (write == Py_None) ? NULL : write;
 
     PyObject *newline_indent = NULL;
     if (self->indent != Py_None) {
         newline_indent = _create_newline_indent(self->indent, indent_level);
         if (newline_indent == NULL) {
-            _PyUnicodeWriter_Dealloc(&writer);
+            _PyUnicodeWriter_Dealloc(&sw.writer);
             return NULL;
         }
     }
-    if (encoder_listencode_obj(self, &writer, obj, newline_indent)) {
-        _PyUnicodeWriter_Dealloc(&writer);
+    if (encoder_listencode_obj(self, &sw.writer, obj, newline_indent)) {
+        _PyUnicodeWriter_Dealloc(&sw.writer);
         Py_XDECREF(newline_indent);
         return NULL;
     }
     Py_XDECREF(newline_indent);
 
+    if (sw.write != NULL) {
+        /* Everything has been written: return an empty tuple of chunks */
+        if (sw.writer.pos && encoder_flush(&sw) < 0) {
+            _PyUnicodeWriter_Dealloc(&sw.writer);
+            return NULL;
+        }
+        _PyUnicodeWriter_Dealloc(&sw.writer);
+        return PyTuple_New(0);
+    }
+
     result = PyTuple_New(1);
     if (result == NULL ||
-            PyTuple_SetItem(result, 0, _PyUnicodeWriter_Finish(&writer)) < 0) {
+            PyTuple_SetItem(result, 0, _PyUnicodeWriter_Finish(&sw.writer)) < 0) {
         Py_XDECREF(result);
         return NULL;
     }
@@ -1429,6 +1489,26 @@ encoder_listencode_obj(PyEncoderObject *s, _PyUnicodeWriter *writer,
     }
     else {
         PyObject *ident = NULL;
+        if (s->object_plans != Py_None) {
+            /* The plan of a type is computed by object_plans.__missing__()
+               the first time the type is seen. */
+            PyObject *plan = PyObject_GetItem(s->object_plans,
+                                              (PyObject *)Py_TYPE(obj));
+            if (plan == NULL)
+                return -1;
+            if (plan != Py_None) {
+                if (_Py_EnterRecursiveCall(" while encoding a JSON object")) {
+                    Py_DECREF(plan);
+                    return -1;
+                }
+                rv = encoder_listencode_fields(s, writer, obj, plan,
+                                               newline_indent);
+                _Py_LeaveRecursiveCall();
+                Py_DECREF(plan);
+                return rv;
+            }
+            Py_DECREF(plan);
+        }
         if (s->markers != Py_None) {
             int has_key;
             ident = PyLong_FromVoidPtr(obj);
@@ -1540,7 +1620,7 @@ encoder_encode_key_value(PyEncoderObject *s, _PyUnicodeWriter *writer, bool *fir
         _PyErr_FormatNote("when serializing %T item %R", dct, key);
         return -1;
     }
-    return 0;
+    return encoder_maybe_flush(writer);
 }
 
 static int
@@ -1652,6 +1732,129 @@ encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
     return -1;
 }
 
+static int
+encoder_listencode_fields(PyEncoderObject *s, _PyUnicodeWriter *writer,
+                          PyObject *obj, PyObject *plan,
+                          PyObject *newline_indent)
+{
+    /* Encode the fields of obj listed in plan as a JSON object.  plan is
+       a tuple of (attribute name, encoded key) pairs; the keys are already
+       quoted and escaped.  Missing attributes are skipped. */
+    PyObject *ident = NULL;
+    PyObject *new_newline_indent = NULL;
+    PyObject *separator_indent = NULL;
+    bool first = true;
+
+    if (!PyTuple_Check(plan)) {
+        PyErr_Format(PyExc_TypeError,
+                     "object plan must be a tuple or None, not %.200s",
+                     Py_TYPE(plan)->tp_name);
+        return -1;
+    }
+
+    if (s->markers != Py_None) {
+        int has_key;
+        ident = PyLong_FromVoidPtr(obj);
+        if (ident == NULL)
+            goto bail;
+        has_key = PyDict_Contains(s->markers, ident);
+        if (has_key) {
+            if (has_key != -1)
+                PyErr_SetString(PyExc_ValueError, "Circular reference detected");
+            goto bail;
+        }
+        if (PyDict_SetItem(s->markers, ident, obj)) {
+            goto bail;
+        }
+    }
+
+    if (_PyUnicodeWriter_WriteChar(writer, '{'))
+        goto bail;
+
+    PyObject *current_item_separator = s->item_separator; // borrowed reference
+    if (s->indent != Py_None) {
+        new_newline_indent = PyUnicode_Concat(newline_indent, s->indent);
+        if (new_newline_indent == NULL) {
+            goto bail;
+        }
+        separator_indent = PyUnicode_Concat(current_item_separator, new_newline_indent);
+        if (separator_indent == NULL) {
+            goto bail;
+        }
+        current_item_separator = separator_indent;
+    }
+
+    for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(plan); i++) {
+        PyObject *field = PyTuple_GET_ITEM(plan, i);
+        PyObject *value;
+
+        if (!PyTuple_Check(field) || PyTuple_GET_SIZE(field) != 2 ||
+            !PyUnicode_Check(PyTuple_GET_ITEM(field, 1)))
+        {
+            PyErr_SetString(PyExc_ValueError,
+                            "object plan items must be (name, str) 2-tuples");
+            goto bail;
+        }
+        PyObject *name = PyTuple_GET_ITEM(field, 0);
+        int rc = PyObject_GetOptionalAttr(obj, name, &value);
+        if (rc < 0)
+            goto bail;
+        if (rc == 0)
+            continue;
+
+        if (first) {
+            first = false;
+            if (new_newline_indent != NULL &&
+                _PyUnicodeWriter_WriteStr(writer, new_newline_indent) < 0)
+            {
+                Py_DECREF(value);
+                goto bail;
+            }
+        }
+        else if (_PyUnicodeWriter_WriteStr(writer, current_item_separator) < 0) {
+            Py_DECREF(value);
+            goto bail;
+        }
+        if (_PyUnicodeWriter_WriteStr(writer, PyTuple_GET_ITEM(field, 1)) < 0 ||
+            _PyUnicodeWriter_WriteStr(writer, s->key_separator) < 0)
+        {
+            Py_DECREF(value);
+            goto bail;
+        }
+        rc = encoder_listencode_obj(s, writer, value, new_newline_indent);
+        Py_DECREF(value);
+        if (rc < 0) {
+            _PyErr_FormatNote("when serializing %T field %R", obj, name);
+            goto bail;
+        }
+        if (encoder_maybe_flush(writer) < 0)
+            goto bail;
+    }
+
+    if (ident != NULL) {
+        if (PyDict_DelItem(s->markers, ident))
+            goto bail;
+        Py_CLEAR(ident);
+    }
+    Py_CLEAR(new_newline_indent);
+    Py_CLEAR(separator_indent);
+    if (!first && s->indent != Py_None) {
+        if (_PyUnicodeWriter_WriteStr(writer, newline_indent) < 0) {
+            goto bail;
+        }
+    }
+
+    if (_PyUnicodeWriter_WriteChar(writer, '}'))
+        goto bail;
+    return 0;
+
+bail:
+    Py_XDECREF(ident);
+    Py_XDECREF(separator_indent);
+    Py_XDECREF(new_newline_indent);
+    return -1;
+}
+
 static int
 encoder_listencode_list(PyEncoderObject *s, _PyUnicodeWriter *writer,
                         PyObject *seq, PyObject *newline_indent)
@@ -1717,6 +1920,8 @@ encoder_listencode_list(PyEncoderObject *s, _PyUnicodeWriter *writer,
             _PyErr_FormatNote("when serializing %T item %zd", seq, i);
             goto bail;
         }
+        if (encoder_maybe_flush(writer) < 0)
+            goto bail;
     }
     if (ident != NULL) {
         if (PyDict_DelItem(s->markers, ident))
@@ -1766,6 +1971,7 @@ encoder_traverse(PyEncoderObject *self, visitproc visit, void *arg)
     Py_VISIT(self->indent);
     Py_VISIT(self->key_separator);
     Py_VISIT(self->item_separator);
+    Py_VISIT(self->object_plans);
     return 0;
 }
 
@@ -1779,10 +1985,11 @@ encoder_clear(PyEncoderObject *self)
     Py_CLEAR(self->indent);
     Py_CLEAR(self->key_separator);
     Py_CLEAR(self->item_separator);
+    Py_CLEAR(self->object_plans);
     return 0;
 }
 
-PyDoc_STRVAR(encoder_doc, "Encoder(markers, default, encoder, indent, key_separator, item_separator, sort_keys, skipkeys, allow_nan)");
+PyDoc_STRVAR(encoder_doc, "Encoder(markers, default, encoder, indent, key_separator, item_separator, sort_keys, skipkeys, allow_nan, *, object_plans=None)");
 
 static PyType_Slot PyEncoderType_slots[] = {
     {Py_tp_doc, (void *)encoder_doc},
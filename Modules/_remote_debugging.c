@@ -526,6 +526,266 @@ parse_frame_object(
     return parse_code_object(pid, result, offsets, address_of_code_object, previous_frame);
 }
 
+static int
+parse_code_object_location(
+        int pid,
+        PyObject* result,
+        struct _Py_DebugOffsets* offsets,
+        void* address)
+{
+    void* address_of_function_name;
+    ssize_t bytes_read = read_memory(
+            pid,
+            (void*)(address + offsets->code_object.name),
+            sizeof(void*),
+            &address_of_function_name);
+    if (bytes_read == -1) {
+        return -1;
+    }
+    if (address_of_function_name == NULL) {
+        PyErr_SetString(PyExc_RuntimeError, "No function name found");
+        return -1;
+    }
+
+    void* address_of_filename;
+    bytes_read = read_memory(
+            pid,
+            (void*)(address + offsets->code_object.filename),
+            sizeof(void*),
+            &address_of_filename);
+    if (bytes_read == -1) {
+        return -1;
+    }
+    if (address_of_filename == NULL) {
+        PyErr_SetString(PyExc_RuntimeError, "No file name found");
+        return -1;
+    }
+
+    int firstlineno;
+    bytes_read = read_memory(
+            pid,
+            (void*)(address + offsets->code_object.firstlineno),
+            sizeof(int),
+            &firstlineno);
+    if (bytes_read == -1) {
+        return -1;
+    }
+
+    char function_name[256];
+    if (read_string(pid, offsets, address_of_function_name, function_name, sizeof(function_name)) != 0) {
+        return -1;
+    }
+
+    char filename[MAXPATHLEN + 1];
+    if (read_string(pid, offsets, address_of_filename, filename, sizeof(filename)) != 0) {
+        return -1;
+    }
+
+    PyObject* location = Py_BuildValue("(sis)", filename, firstlineno, function_name);
+    if (location == NULL) {
+        return -1;
+    }
+
+    if (PyList_Append(result, location) == -1) {
+        Py_DECREF(location);
+        return -1;
+    }
+    Py_DECREF(location);
+
+    return 0;
+}
+
+static int
+parse_frame_object_location(
+        int pid,
+        PyObject* result,
+        struct _Py_DebugOffsets* offsets,
+        void* address,
+        void** previous_frame)
+{
+    ssize_t bytes_read = read_memory(
+            pid,
+            (void*)(address + offsets->interpreter_frame.previous),
+            sizeof(void*),
+            previous_frame);
+    if (bytes_read == -1) {
+        return -1;
+    }
+
+    char owner;
+    bytes_read =
+            read_memory(pid, (void*)(address + offsets->interpreter_frame.owner), sizeof(char), &owner);
+    if (bytes_read < 0) {
+        return -1;
+    }
+
+    if (owner == FRAME_OWNED_BY_CSTACK) {
+        return 0;
+    }
+
+    void* address_of_code_object;
+    bytes_read = read_memory(
+            pid,
+            (void*)(address + offsets->interpreter_frame.executable),
+            sizeof(void*),
+            &address_of_code_object);
+    if (bytes_read == -1) {
+        return -1;
+    }
+
+    if (address_of_code_object == NULL) {
+        return 0;
+    }
+    return parse_code_object_location(pid, result, offsets, address_of_code_object);
+}
+
+static PyObject*
+get_thread_stack_trace(
+        int pid,
+        struct _Py_DebugOffsets* offsets,
+        void* address_of_thread)
+{
+    unsigned long thread_id;
+    ssize_t bytes_read = read_memory(
+            pid,
+            (void*)(address_of_thread + offsets->thread_state.thread_id),
+            sizeof(unsigned long),
+            &thread_id);
+    if (bytes_read == -1) {
+        return NULL;
+    }
+
+    void* address_of_current_frame;
+    bytes_read = read_memory(
+            pid,
+            (void*)(address_of_thread + offsets->thread_state.current_frame),
+            sizeof(void*),
+            &address_of_current_frame);
+    if (bytes_read == -1) {
+        return NULL;
+    }
+
+    PyObject* frames = PyList_New(0);
+    if (frames == NULL) {
+        return NULL;
+    }
+
+    while (address_of_current_frame != NULL) {
+        if (parse_frame_object_location(
+                    pid,
+                    frames,
+                    offsets,
+                    address_of_current_frame,
+                    &address_of_current_frame)
+            < 0)
+        {
+            Py_DECREF(frames);
+            return NULL;
+        }
+    }
+
+    return Py_BuildValue("(kN)", thread_id, frames);
+}
+
+static PyObject*
+get_all_stack_traces(PyObject* self, PyObject* args)
+{
+#if (!defined(__linux__) && !defined(__APPLE__)) || (defined(__linux__) && !HAVE_PROCESS_VM_READV)
+    PyErr_SetString(PyExc_RuntimeError, "get_all_stack_traces is not supported on this platform");
+    return NULL;
+#endif
+    int pid;
+
+    if (!PyArg_ParseTuple(args, "i", &pid)) {
+        return NULL;
+    }
+
+    void* runtime_start_address = get_py_runtime(pid);
+    if (runtime_start_address == NULL) {
+        if (!PyErr_Occurred()) {
+            PyErr_SetString(PyExc_RuntimeError, "Failed to get .PyRuntime address");
+        }
+        return NULL;
+    }
+    size_t size = sizeof(struct _Py_DebugOffsets);
+    struct _Py_DebugOffsets local_debug_offsets;
+
+    ssize_t bytes_read = read_memory(pid, runtime_start_address, size, &local_debug_offsets);
+    if (bytes_read == -1) {
+        return NULL;
+    }
+    off_t interpreter_state_list_head = local_debug_offsets.runtime_state.interpreters_head;
+
+    void* address_of_interpreter_state;
+    bytes_read = read_memory(
+            pid,
+            (void*)(runtime_start_address + interpreter_state_list_head),
+            sizeof(void*),
+            &address_of_interpreter_state);
+    if (bytes_read == -1) {
+        return NULL;
+    }
+
+    if (address_of_interpreter_state == NULL) {
+        PyErr_SetString(PyExc_RuntimeError, "No interpreter state found");
+        return NULL;
+    }
+
+    PyObject* result = PyList_New(0);
+    if (result == NULL) {
+        return NULL;
+    }
+
+    while (address_of_interpreter_state != NULL) {
+        void* address_of_thread;
+        bytes_read = read_memory(
+                pid,
+                (void*)(address_of_interpreter_state + local_debug_offsets.interpreter_state.threads_head),
+                sizeof(void*),
+                &address_of_thread);
+        if (bytes_read == -1) {
+            goto error;
+        }
+
+        while (address_of_thread != NULL) {
+            PyObject* thread_trace = get_thread_stack_trace(
+                    pid, &local_debug_offsets, address_of_thread);
+            if (thread_trace == NULL) {
+                goto error;
+            }
+            if (PyList_Append(result, thread_trace) == -1) {
+                Py_DECREF(thread_trace);
+                goto error;
+            }
+            Py_DECREF(thread_trace);
+
+            bytes_read = read_memory(
+                    pid,
+                    (void*)(address_of_thread + local_debug_offsets.thread_state.next),
+                    sizeof(void*),
+                    &address_of_thread);
+            if (bytes_read == -1) {
+                goto error;
+            }
+        }
+
+        bytes_read = read_memory(
+                pid,
+                (void*)(address_of_interpreter_state + local_debug_offsets.interpreter_state.next),
+                sizeof(void*),
+                &address_of_interpreter_state);
+        if (bytes_read == -1) {
+            goto error;
+        }
+    }
+
+    return result;
+
+error:
+    Py_DECREF(result);
+    return NULL;
+}
+
 static PyObject*
 get_stack_trace(PyObject* self, PyObject* args)
 {
@@ -613,18 +873,20 @@ get_stack_trace(PyObject* self, PyObject* args)
 
 static PyMethodDef methods[] = {
         {"get_stack_trace", get_stack_trace, METH_VARARGS, "Get the Python stack from a given PID"},
+        {"get_all_stack_traces", get_all_stack_traces, METH_VARARGS,
+         "Get the Python stacks of all threads from a given PID"},
         {NULL, NULL, 0, NULL},
 };
 
 static struct PyModuleDef module = {
         .m_base = PyModuleDef_HEAD_INIT,
-        .m_name = "_testexternalinspection",
+        .m_name = "_remote_debugging",
         .m_size = -1,
         .m_methods = methods,
 };
 
 PyMODINIT_FUNC
-PyInit__testexternalinspection(void)
+PyInit__remote_debugging(void)
 {
     PyObject* mod = PyModule_Create(&module);
     if (mod == NULL) {
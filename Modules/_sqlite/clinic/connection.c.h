@@ -1102,6 +1102,59 @@ exit:
 
 #endif /* defined(PY_SQLITE_ENABLE_LOAD_EXTENSION) */
 
+PyDoc_STRVAR(pysqlite_connection_prepare__doc__,
+"prepare($self, sql, /)\n"
+"--\n"
+"\n"
+"Creates a prepared statement.\n"
+"\n"
+"The statement can be passed to execute() and executemany() instead of\n"
+"the SQL string, so that it is not looked up in the statement cache.");
+
+#define PYSQLITE_CONNECTION_PREPARE_METHODDEF    \
+    {"prepare", (PyCFunction)pysqlite_connection_prepare, METH_O, pysqlite_connection_prepare__doc__},
+
+static PyObject *
+pysqlite_connection_prepare_impl(pysqlite_Connection *self, PyObject *sql);
+
+static PyObject *
+pysqlite_connection_prepare(pysqlite_Connection *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    PyObject *sql;
+
+    if (!PyUnicode_Check(arg)) {
+        _PyArg_BadArgument("prepare", "argument", "str", arg);
+        goto exit;
+    }
+    sql = arg;
+    return_value = pysqlite_connection_prepare_impl(self, sql);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(pysqlite_connection_statement_cache_info__doc__,
+"statement_cache_info($self, /)\n"
+"--\n"
+"\n"
+"Returns statistics about the statement cache.\n"
+"\n"
+"The result is a named tuple with the fields hits, misses, evictions,\n"
+"maxsize and currsize.");
+
+#define PYSQLITE_CONNECTION_STATEMENT_CACHE_INFO_METHODDEF    \
+    {"statement_cache_info", (PyCFunction)pysqlite_connection_statement_cache_info, METH_NOARGS, pysqlite_connection_statement_cache_info__doc__},
+
+static PyObject *
+pysqlite_connection_statement_cache_info_impl(pysqlite_Connection *self);
+
+static PyObject *
+pysqlite_connection_statement_cache_info(pysqlite_Connection *self, PyObject *Py_UNUSED(ignored))
+{
+    return pysqlite_connection_statement_cache_info_impl(self);
+}
+
 PyDoc_STRVAR(pysqlite_connection_execute__doc__,
 "execute($self, sql, parameters=<unrepresentable>, /)\n"
 "--\n"
@@ -1125,10 +1178,6 @@ pysqlite_connection_execute(pysqlite_Connection *self, PyObject *const *args, Py
     if (!_PyArg_CheckPositional("execute", nargs, 1, 2)) {
         goto exit;
     }
-    if (!PyUnicode_Check(args[0])) {
-        _PyArg_BadArgument("execute", "argument 1", "str", args[0]);
-        goto exit;
-    }
     sql = args[0];
     if (nargs < 2) {
         goto skip_optional;
@@ -1164,10 +1213,6 @@ pysqlite_connection_executemany(pysqlite_Connection *self, PyObject *const *args
     if (!_PyArg_CheckPositional("executemany", nargs, 2, 2)) {
         goto exit;
     }
-    if (!PyUnicode_Check(args[0])) {
-        _PyArg_BadArgument("executemany", "argument 1", "str", args[0]);
-        goto exit;
-    }
     sql = args[0];
     parameters = args[1];
     return_value = pysqlite_connection_executemany_impl(self, sql, parameters);
@@ -1866,4 +1911,4 @@ exit:
 #ifndef DESERIALIZE_METHODDEF
     #define DESERIALIZE_METHODDEF
 #endif /* !defined(DESERIALIZE_METHODDEF) */
-/*[clinic end generated code: output=5d4d7e4abe17b164 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=c19c7e705afa588c input=a9049054013a1b77]*/
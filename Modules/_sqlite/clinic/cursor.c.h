@@ -61,10 +61,6 @@ pysqlite_cursor_execute(pysqlite_Cursor *self, PyObject *const *args, Py_ssize_t
     if (!_PyArg_CheckPositional("execute", nargs, 1, 2)) {
         goto exit;
     }
-    if (!PyUnicode_Check(args[0])) {
-        _PyArg_BadArgument("execute", "argument 1", "str", args[0]);
-        goto exit;
-    }
     sql = args[0];
     if (nargs < 2) {
         goto skip_optional;
@@ -100,10 +96,6 @@ pysqlite_cursor_executemany(pysqlite_Cursor *self, PyObject *const *args, Py_ssi
     if (!_PyArg_CheckPositional("executemany", nargs, 2, 2)) {
         goto exit;
     }
-    if (!PyUnicode_Check(args[0])) {
-        _PyArg_BadArgument("executemany", "argument 1", "str", args[0]);
-        goto exit;
-    }
     sql = args[0];
     seq_of_parameters = args[1];
     return_value = pysqlite_cursor_executemany_impl(self, sql, seq_of_parameters);
@@ -252,6 +244,76 @@ pysqlite_cursor_fetchall(pysqlite_Cursor *self, PyObject *Py_UNUSED(ignored))
     return pysqlite_cursor_fetchall_impl(self);
 }
 
+PyDoc_STRVAR(pysqlite_cursor_fetchcolumns__doc__,
+"fetchcolumns($self, /, size=-1)\n"
+"--\n"
+"\n"
+"Fetches several rows from the resultset, as a list of columns.\n"
+"\n"
+"  size\n"
+"    The maximum number of rows to fetch.  If negative, all the\n"
+"    remaining rows are fetched.\n"
+"\n"
+"Columns holding only integers or only floats are returned as\n"
+"array.array objects of type \'q\' or \'d\', and other columns as lists.");
+
+#define PYSQLITE_CURSOR_FETCHCOLUMNS_METHODDEF    \
+    {"fetchcolumns", _PyCFunction_CAST(pysqlite_cursor_fetchcolumns), METH_FASTCALL|METH_KEYWORDS, pysqlite_cursor_fetchcolumns__doc__},
+
+static PyObject *
+pysqlite_cursor_fetchcolumns_impl(pysqlite_Cursor *self, int maxrows);
+
+static PyObject *
+pysqlite_cursor_fetchcolumns(pysqlite_Cursor *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(size), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"size", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "fetchcolumns",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    int maxrows = -1;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 0, 1, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    maxrows = PyLong_AsInt(args[0]);
+    if (maxrows == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = pysqlite_cursor_fetchcolumns_impl(self, maxrows);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(pysqlite_cursor_setinputsizes__doc__,
 "setinputsizes($self, sizes, /)\n"
 "--\n"
@@ -313,4 +375,4 @@ pysqlite_cursor_close(pysqlite_Cursor *self, PyObject *Py_UNUSED(ignored))
 {
     return pysqlite_cursor_close_impl(self);
 }
-/*[clinic end generated code: output=a8ce095c3c80cf65 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=fa92f3fb0f7a3b19 input=a9049054013a1b77]*/
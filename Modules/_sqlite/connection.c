@@ -149,6 +149,26 @@ static void set_callback_context(callback_context **ctx_pp,
 static int connection_close(pysqlite_Connection *self);
 PyObject *_pysqlite_query_execute(pysqlite_Cursor *, int, PyObject *, PyObject *);
 
+/*
+ * Creates a statement for the statement cache, and counts it, so that the
+ * number of statements evicted from the cache can be computed.
+ */
+static PyObject *
+create_cached_statement(PyObject *self, PyObject *sql)
+{
+    pysqlite_Connection *con = (pysqlite_Connection *)self;
+    pysqlite_Statement *statement = pysqlite_statement_create(con, sql);
+    if (statement == NULL) {
+        return NULL;
+    }
+    con->cached_statements_created++;
+    return (PyObject *)statement;
+}
+
+static PyMethodDef create_cached_statement_def = {
+    "create_cached_statement", create_cached_statement, METH_O,
+};
+
 static PyObject *
 new_statement_cache(pysqlite_Connection *self, pysqlite_state *state,
                     int maxsize)
@@ -165,9 +185,14 @@ new_statement_cache(pysqlite_Connection *self, pysqlite_state *state,
         return NULL;
     }
 
-    args[1] = (PyObject *)self;  // Borrowed ref.
+    args[1] = PyCFunction_New(&create_cached_statement_def, (PyObject *)self);
+    if (args[1] == NULL) {
+        Py_DECREF(inner);
+        return NULL;
+    }
     nargsf = 1 | PY_VECTORCALL_ARGUMENTS_OFFSET;
     PyObject *res = PyObject_Vectorcall(inner, args + 1, nargsf, NULL);
+    Py_DECREF(args[1]);
     Py_DECREF(inner);
     return res;
 }
@@ -306,6 +331,7 @@ pysqlite_connection_init_impl(pysqlite_Connection *self, PyObject *database,
     self->check_same_thread = check_same_thread;
     self->thread_ident = PyThread_get_thread_ident();
     self->statement_cache = statement_cache;
+    self->cached_statements_created = 0;
     self->cursors = cursors;
     self->blobs = blobs;
     self->created_cursors = 0;
@@ -1791,9 +1817,91 @@ pysqlite_connection_call(pysqlite_Connection *self, PyObject *args,
 }
 
 /*[clinic input]
-_sqlite3.Connection.execute as pysqlite_connection_execute
+_sqlite3.Connection.prepare as pysqlite_connection_prepare
 
     sql: unicode
+    /
+
+Creates a prepared statement.
+
+The statement can be passed to execute() and executemany() instead of
+the SQL string, so that it is not looked up in the statement cache.
+[clinic start generated code]*/
+
+static PyObject *
+pysqlite_connection_prepare_impl(pysqlite_Connection *self, PyObject *sql)
+/*[clinic end generated code: output=fb4453c4f82775d2 input=a071635e074aa950]*/
+{
+    if (!pysqlite_check_thread(self) || !pysqlite_check_connection(self)) {
+        return NULL;
+    }
+    return (PyObject *)pysqlite_statement_create(self, sql);
+}
+
+/*[clinic input]
+_sqlite3.Connection.statement_cache_info as pysqlite_connection_statement_cache_info
+
+Returns statistics about the statement cache.
+
+The result is a named tuple with the fields hits, misses, evictions,
+maxsize and currsize.
+[clinic start generated code]*/
+
+static PyObject *
+pysqlite_connection_statement_cache_info_impl(pysqlite_Connection *self)
+/*[clinic end generated code: output=939bca7b08674d09 input=2db06ec43f5484b0]*/
+{
+    if (!pysqlite_check_thread(self) || !pysqlite_check_connection(self)) {
+        return NULL;
+    }
+
+    // The lru_cache info is hits, misses, maxsize and currsize.
+    PyObject *info = PyObject_CallMethod(self->statement_cache,
+                                         "cache_info", NULL);
+    if (info == NULL) {
+        return NULL;
+    }
+    if (!PyTuple_Check(info) || PyTuple_GET_SIZE(info) != 4) {
+        Py_DECREF(info);
+        PyErr_SetString(PyExc_SystemError, "unexpected cache_info() result");
+        return NULL;
+    }
+    Py_ssize_t maxsize = PyLong_AsSsize_t(PyTuple_GET_ITEM(info, 2));
+    Py_ssize_t currsize = PyLong_AsSsize_t(PyTuple_GET_ITEM(info, 3));
+    if ((maxsize == -1 || currsize == -1) && PyErr_Occurred()) {
+        Py_DECREF(info);
+        return NULL;
+    }
+    // Every statement created by a full cache evicts another one.
+    Py_ssize_t evictions = 0;
+    if (maxsize > 0) {
+        evictions = self->cached_statements_created - currsize;
+    }
+    PyObject *evictions_obj = PyLong_FromSsize_t(evictions);
+    if (evictions_obj == NULL) {
+        Py_DECREF(info);
+        return NULL;
+    }
+
+    PyObject *res = PyStructSequence_New(self->state->StatementCacheInfoType);
+    if (res == NULL) {
+        Py_DECREF(evictions_obj);
+        Py_DECREF(info);
+        return NULL;
+    }
+    PyStructSequence_SET_ITEM(res, 0, Py_NewRef(PyTuple_GET_ITEM(info, 0)));
+    PyStructSequence_SET_ITEM(res, 1, Py_NewRef(PyTuple_GET_ITEM(info, 1)));
+    PyStructSequence_SET_ITEM(res, 2, evictions_obj);
+    PyStructSequence_SET_ITEM(res, 3, Py_NewRef(PyTuple_GET_ITEM(info, 2)));
+    PyStructSequence_SET_ITEM(res, 4, Py_NewRef(PyTuple_GET_ITEM(info, 3)));
+    Py_DECREF(info);
+    return res;
+}
+
+/*[clinic input]
+_sqlite3.Connection.execute as pysqlite_connection_execute
+
+    sql: object
     parameters: object = NULL
     /
 
@@ -1803,7 +1911,7 @@ Executes an SQL statement.
 static PyObject *
 pysqlite_connection_execute_impl(pysqlite_Connection *self, PyObject *sql,
                                  PyObject *parameters)
-/*[clinic end generated code: output=5be05ae01ee17ee4 input=27aa7792681ddba2]*/
+/*[clinic end generated code: output=5be05ae01ee17ee4 input=72f0935a8956d244]*/
 {
     PyObject* result = 0;
 
@@ -1826,7 +1934,7 @@ pysqlite_connection_execute_impl(pysqlite_Connection *self, PyObject *sql,
 /*[clinic input]
 _sqlite3.Connection.executemany as pysqlite_connection_executemany
 
-    sql: unicode
+    sql: object
     parameters: object
     /
 
@@ -1836,7 +1944,7 @@ Repeatedly executes an SQL statement.
 static PyObject *
 pysqlite_connection_executemany_impl(pysqlite_Connection *self,
                                      PyObject *sql, PyObject *parameters)
-/*[clinic end generated code: output=776cd2fd20bfe71f input=495be76551d525db]*/
+/*[clinic end generated code: output=776cd2fd20bfe71f input=ba0ca1cdd1731ce8]*/
 {
     PyObject* result = 0;
 
@@ -2609,6 +2717,8 @@ static PyMethodDef connection_methods[] = {
     BLOBOPEN_METHODDEF
     SETCONFIG_METHODDEF
     GETCONFIG_METHODDEF
+    PYSQLITE_CONNECTION_PREPARE_METHODDEF
+    PYSQLITE_CONNECTION_STATEMENT_CACHE_INFO_METHODDEF
     {NULL, NULL}
 };
 
@@ -2651,6 +2761,22 @@ static PyType_Spec connection_spec = {
     .slots = connection_slots,
 };
 
+static PyStructSequence_Field statement_cache_info_fields[] = {
+    {"hits", "number of statements found in the cache"},
+    {"misses", "number of statements not found in the cache"},
+    {"evictions", "number of statements removed from the full cache"},
+    {"maxsize", "maximum number of statements in the cache"},
+    {"currsize", "current number of statements in the cache"},
+    {NULL}
+};
+
+static PyStructSequence_Desc statement_cache_info_desc = {
+    .name = MODULE_NAME ".StatementCacheInfo",
+    .doc = PyDoc_STR("Statistics about the statement cache of a connection."),
+    .fields = statement_cache_info_fields,
+    .n_in_sequence = 5,
+};
+
 int
 pysqlite_connection_setup_types(PyObject *module)
 {
@@ -2660,5 +2786,11 @@ pysqlite_connection_setup_types(PyObject *module)
     }
     pysqlite_state *state = pysqlite_get_state(module);
     state->ConnectionType = (PyTypeObject *)type;
+
+    type = (PyObject *)PyStructSequence_NewType(&statement_cache_info_desc);
+    if (type == NULL) {
+        return -1;
+    }
+    state->StatementCacheInfoType = (PyTypeObject *)type;
     return 0;
 }
@@ -69,6 +69,9 @@ typedef struct
 
     PyObject *statement_cache;
 
+    /* Number of statements created by the statement cache */
+    Py_ssize_t cached_statements_created;
+
     /* Lists of weak references to cursors and blobs used within this connection */
     PyObject *cursors;
     PyObject *blobs;
@@ -30,6 +30,7 @@
 #include "module.h"
 #include "util.h"
 
+#include "pycore_import.h"        // _PyImport_GetModuleAttrString()
 #include "pycore_pyerrors.h"      // _PyErr_FormatFromCause()
 
 typedef enum {
@@ -315,6 +316,125 @@ _pysqlite_build_column_name(pysqlite_Cursor *self, const char *colname)
     return PyUnicode_FromStringAndSize(colname, len);
 }
 
+/*
+ * Returns the column i of the current row of the active SQLite statement,
+ * converted by converter if it is not None.  Otherwise, coltype is the type
+ * of the column, as returned by sqlite3_column_type().
+ *
+ * Precondidition:
+ * - sqlite3_step() has been called before and it returned SQLITE_ROW.
+ */
+static PyObject *
+_pysqlite_fetch_one_value(pysqlite_Cursor *self, int i, PyObject *converter,
+                          int coltype)
+{
+    PyObject* converted;
+    Py_ssize_t nbytes;
+    char buf[200];
+    const char* colname;
+    PyObject* error_msg;
+
+    sqlite3 *db = self->connection->db;
+
+    /*
+     * Note, sqlite3_column_bytes() must come after sqlite3_column_blob()
+     * or sqlite3_column_text().
+     *
+     * See https://sqlite.org/c3ref/column_blob.html for details.
+     */
+    if (converter != Py_None) {
+        const void *blob = sqlite3_column_blob(self->statement->st, i);
+        if (blob == NULL) {
+            if (sqlite3_errcode(db) == SQLITE_NOMEM) {
+                PyErr_NoMemory();
+                return NULL;
+            }
+            converted = Py_NewRef(Py_None);
+        }
+        else {
+            nbytes = sqlite3_column_bytes(self->statement->st, i);
+            PyObject *item = PyBytes_FromStringAndSize(blob, nbytes);
+            if (item == NULL) {
+                return NULL;
+            }
+            converted = PyObject_CallOneArg(converter, item);
+            Py_DECREF(item);
+        }
+    } else {
+        if (coltype == SQLITE_NULL) {
+            converted = Py_NewRef(Py_None);
+        } else if (coltype == SQLITE_INTEGER) {
+            converted = PyLong_FromLongLong(sqlite3_column_int64(self->statement->st, i));
+        } else if (coltype == SQLITE_FLOAT) {
+            converted = PyFloat_FromDouble(sqlite3_column_double(self->statement->st, i));
+        } else if (coltype == SQLITE_TEXT) {
+            const char *text = (const char*)sqlite3_column_text(self->statement->st, i);
+            if (text == NULL && sqlite3_errcode(db) == SQLITE_NOMEM) {
+                PyErr_NoMemory();
+                return NULL;
+            }
+
+            nbytes = sqlite3_column_bytes(self->statement->st, i);
+            if (self->connection->text_factory == (PyObject*)&PyUnicode_Type) {
+                converted = PyUnicode_FromStringAndSize(text, nbytes);
+                if (!converted && PyErr_ExceptionMatches(PyExc_UnicodeDecodeError)) {
+                    PyErr_Clear();
+                    colname = sqlite3_column_name(self->statement->st, i);
+                    if (colname == NULL) {
+                        PyErr_NoMemory();
+                        return NULL;
+                    }
+                    PyOS_snprintf(buf, sizeof(buf) - 1, "Could not decode to UTF-8 column '%s' with text '%s'",
+                                 colname , text);
+                    error_msg = PyUnicode_Decode(buf, strlen(buf), "ascii", "replace");
+
+                    PyObject *exc = self->connection->OperationalError;
+                    if (!error_msg) {
+                        PyErr_SetString(exc, "Could not decode to UTF-8");
+                    } else {
+                        PyErr_SetObject(exc, error_msg);
+                        Py_DECREF(error_msg);
+                    }
+                }
+            } else if (self->connection->text_factory == (PyObject*)&PyBytes_Type) {
+                converted = PyBytes_FromStringAndSize(text, nbytes);
+            } else if (self->connection->text_factory == (PyObject*)&PyByteArray_Type) {
+                converted = PyByteArray_FromStringAndSize(text, nbytes);
+            } else {
+                converted = PyObject_CallFunction(self->connection->text_factory, "y#", text, nbytes);
+            }
+        } else {
+            /* coltype == SQLITE_BLOB */
+            const void *blob = sqlite3_column_blob(self->statement->st, i);
+            if (blob == NULL && sqlite3_errcode(db) == SQLITE_NOMEM) {
+                PyErr_NoMemory();
+                return NULL;
+            }
+
+            nbytes = sqlite3_column_bytes(self->statement->st, i);
+            converted = PyBytes_FromStringAndSize(blob, nbytes);
+        }
+    }
+
+    return converted;
+}
+
+/*
+ * Returns the converter of the column i of the active SQLite statement, or
+ * None.  Returns a borrowed reference.
+ */
+static inline PyObject *
+get_column_converter(pysqlite_Cursor *self, int i)
+{
+    if (self->connection->detect_types
+            && self->row_cast_map != NULL
+            && i < PyList_GET_SIZE(self->row_cast_map))
+    {
+        return PyList_GET_ITEM(self->row_cast_map, i);
+    }
+    return Py_None;
+}
+
 /*
  * Returns a row from the currently active SQLite statement
  *
@@ -329,10 +449,6 @@ _pysqlite_fetch_one_row(pysqlite_Cursor* self)
     int coltype;
     PyObject* converter;
     PyObject* converted;
-    Py_ssize_t nbytes;
-    char buf[200];
-    const char* colname;
-    PyObject* error_msg;
 
     Py_BEGIN_ALLOW_THREADS
     numcols = sqlite3_data_count(self->statement->st);
@@ -342,101 +458,18 @@ _pysqlite_fetch_one_row(pysqlite_Cursor* self)
     if (!row)
         return NULL;
 
-    sqlite3 *db = self->connection->db;
     for (i = 0; i < numcols; i++) {
-        if (self->connection->detect_types
-                && self->row_cast_map != NULL
-                && i < PyList_GET_SIZE(self->row_cast_map))
-        {
-            converter = PyList_GET_ITEM(self->row_cast_map, i);
+        converter = get_column_converter(self, i);
+        if (converter != Py_None) {
+            coltype = SQLITE_NULL;  // Unused
         }
         else {
-            converter = Py_None;
-        }
-
-        /*
-         * Note, sqlite3_column_bytes() must come after sqlite3_column_blob()
-         * or sqlite3_column_text().
-         *
-         * See https://sqlite.org/c3ref/column_blob.html for details.
-         */
-        if (converter != Py_None) {
-            const void *blob = sqlite3_column_blob(self->statement->st, i);
-            if (blob == NULL) {
-                if (sqlite3_errcode(db) == SQLITE_NOMEM) {
-                    PyErr_NoMemory();
-                    goto error;
-                }
-                converted = Py_NewRef(Py_None);
-            }
-            else {
-                nbytes = sqlite3_column_bytes(self->statement->st, i);
-                PyObject *item = PyBytes_FromStringAndSize(blob, nbytes);
-                if (item == NULL) {
-                    goto error;
-                }
-                converted = PyObject_CallOneArg(converter, item);
-                Py_DECREF(item);
-            }
-        } else {
             Py_BEGIN_ALLOW_THREADS
             coltype = sqlite3_column_type(self->statement->st, i);
             Py_END_ALLOW_THREADS
-            if (coltype == SQLITE_NULL) {
-                converted = Py_NewRef(Py_None);
-            } else if (coltype == SQLITE_INTEGER) {
-                converted = PyLong_FromLongLong(sqlite3_column_int64(self->statement->st, i));
-            } else if (coltype == SQLITE_FLOAT) {
-                converted = PyFloat_FromDouble(sqlite3_column_double(self->statement->st, i));
-            } else if (coltype == SQLITE_TEXT) {
-                const char *text = (const char*)sqlite3_column_text(self->statement->st, i);
-                if (text == NULL && sqlite3_errcode(db) == SQLITE_NOMEM) {
-                    PyErr_NoMemory();
-                    goto error;
-                }
-
-                nbytes = sqlite3_column_bytes(self->statement->st, i);
-                if (self->connection->text_factory == (PyObject*)&PyUnicode_Type) {
-                    converted = PyUnicode_FromStringAndSize(text, nbytes);
-                    if (!converted && PyErr_ExceptionMatches(PyExc_UnicodeDecodeError)) {
-                        PyErr_Clear();
-                        colname = sqlite3_column_name(self->statement->st, i);
-                        if (colname == NULL) {
-                            PyErr_NoMemory();
-                            goto error;
-                        }
-                        PyOS_snprintf(buf, sizeof(buf) - 1, "Could not decode to UTF-8 column '%s' with text '%s'",
-                                     colname , text);
-                        error_msg = PyUnicode_Decode(buf, strlen(buf), "ascii", "replace");
-
-                        PyObject *exc = self->connection->OperationalError;
-                        if (!error_msg) {
-                            PyErr_SetString(exc, "Could not decode to UTF-8");
-                        } else {
-                            PyErr_SetObject(exc, error_msg);
-                            Py_DECREF(error_msg);
-                        }
-                    }
-                } else if (self->connection->text_factory == (PyObject*)&PyBytes_Type) {
-                    converted = PyBytes_FromStringAndSize(text, nbytes);
-                } else if (self->connection->text_factory == (PyObject*)&PyByteArray_Type) {
-                    converted = PyByteArray_FromStringAndSize(text, nbytes);
-                } else {
-                    converted = PyObject_CallFunction(self->connection->text_factory, "y#", text, nbytes);
-                }
-            } else {
-                /* coltype == SQLITE_BLOB */
-                const void *blob = sqlite3_column_blob(self->statement->st, i);
-                if (blob == NULL && sqlite3_errcode(db) == SQLITE_NOMEM) {
-                    PyErr_NoMemory();
-                    goto error;
-                }
-
-                nbytes = sqlite3_column_bytes(self->statement->st, i);
-                converted = PyBytes_FromStringAndSize(blob, nbytes);
-            }
         }
 
+        converted = _pysqlite_fetch_one_value(self, i, converter, coltype);
         if (!converted) {
             goto error;
         }
@@ -785,6 +818,16 @@ _pysqlite_query_execute(pysqlite_Cursor* self, int multiple, PyObject* operation
         goto error;
     }
 
+    pysqlite_state *state = self->connection->state;
+    if (!PyUnicode_Check(operation)
+        && !Py_IS_TYPE(operation, state->StatementType))
+    {
+        PyErr_Format(PyExc_TypeError,
+                     "%s() argument 1 must be str or Statement, not %T",
+                     multiple ? "executemany" : "execute", operation);
+        goto error;
+    }
+
     self->locked = 1;
 
     if (multiple) {
@@ -833,13 +876,27 @@ _pysqlite_query_execute(pysqlite_Cursor* self, int multiple, PyObject* operation
         (void)stmt_reset(self->statement);
     }
 
-    PyObject *stmt = get_statement_from_cache(self, operation);
+    PyObject *stmt;
+    if (PyUnicode_Check(operation)) {
+        stmt = get_statement_from_cache(self, operation);
+    }
+    else {
+        // A statement prepared by Connection.prepare().
+        if (sqlite3_db_handle(((pysqlite_Statement *)operation)->st)
+            != self->connection->db)
+        {
+            PyErr_SetString(state->ProgrammingError,
+                            "The statement was prepared by another "
+                            "connection.");
+            goto error;
+        }
+        stmt = Py_NewRef(operation);
+    }
     Py_XSETREF(self->statement, (pysqlite_Statement *)stmt);
     if (!self->statement) {
         goto error;
     }
 
-    pysqlite_state *state = self->connection->state;
     if (multiple && sqlite3_stmt_readonly(self->statement->st)) {
         PyErr_SetString(state->ProgrammingError,
                         "executemany() can only execute DML statements.");
@@ -847,8 +904,11 @@ _pysqlite_query_execute(pysqlite_Cursor* self, int multiple, PyObject* operation
     }
 
     if (sqlite3_stmt_busy(self->statement->st)) {
+        // The statement is used by another cursor: create a new one.
+        PyObject *sql = Py_NewRef(self->statement->sql);
         Py_SETREF(self->statement,
-                  pysqlite_statement_create(self->connection, operation));
+                  pysqlite_statement_create(self->connection, sql));
+        Py_DECREF(sql);
         if (self->statement == NULL) {
             goto error;
         }
@@ -976,7 +1036,7 @@ _pysqlite_query_execute(pysqlite_Cursor* self, int multiple, PyObject* operation
 /*[clinic input]
 _sqlite3.Cursor.execute as pysqlite_cursor_execute
 
-    sql: unicode
+    sql: object
     parameters: object(c_default = 'NULL') = ()
     /
 
@@ -986,7 +1046,7 @@ Executes an SQL statement.
 static PyObject *
 pysqlite_cursor_execute_impl(pysqlite_Cursor *self, PyObject *sql,
                              PyObject *parameters)
-/*[clinic end generated code: output=d81b4655c7c0bbad input=a8e0200a11627f94]*/
+/*[clinic end generated code: output=d81b4655c7c0bbad input=6fff66c67707ca22]*/
 {
     return _pysqlite_query_execute(self, 0, sql, parameters);
 }
@@ -994,7 +1054,7 @@ pysqlite_cursor_execute_impl(pysqlite_Cursor *self, PyObject *sql,
 /*[clinic input]
 _sqlite3.Cursor.executemany as pysqlite_cursor_executemany
 
-    sql: unicode
+    sql: object
     seq_of_parameters: object
     /
 
@@ -1004,7 +1064,7 @@ Repeatedly executes an SQL statement.
 static PyObject *
 pysqlite_cursor_executemany_impl(pysqlite_Cursor *self, PyObject *sql,
                                  PyObject *seq_of_parameters)
-/*[clinic end generated code: output=2c65a3c4733fb5d8 input=0d0a52e5eb7ccd35]*/
+/*[clinic end generated code: output=2c65a3c4733fb5d8 input=da1226106a2bb7b1]*/
 {
     return _pysqlite_query_execute(self, 1, sql, seq_of_parameters);
 }
@@ -1086,6 +1146,33 @@ pysqlite_cursor_executescript_impl(pysqlite_Cursor *self,
     return NULL;
 }
 
+/*
+ * Steps to the next row of the active SQLite statement, once the current row
+ * has been fetched.  The statement is released if there are no more rows.
+ *
+ * 0 => ok; -1 => error
+ */
+static int
+cursor_step(pysqlite_Cursor *self)
+{
+    int rc = stmt_step(self->statement->st);
+    if (rc == SQLITE_DONE) {
+        if (self->statement->is_dml) {
+            self->rowcount = (long)sqlite3_changes(self->connection->db);
+        }
+        (void)stmt_reset(self->statement);
+        Py_CLEAR(self->statement);
+    }
+    else if (rc != SQLITE_ROW) {
+        (void)_pysqlite_seterror(self->connection->state,
+                                 self->connection->db);
+        (void)stmt_reset(self->statement);
+        Py_CLEAR(self->statement);
+        return -1;
+    }
+    return 0;
+}
+
 static PyObject *
 pysqlite_cursor_iternext(pysqlite_Cursor *self)
 {
@@ -1097,9 +1184,8 @@ pysqlite_cursor_iternext(pysqlite_Cursor *self)
         return NULL;
     }
 
-    sqlite3_stmt *stmt = self->statement->st;
-    assert(stmt != NULL);
-    assert(sqlite3_data_count(stmt) != 0);
+    assert(self->statement->st != NULL);
+    assert(sqlite3_data_count(self->statement->st) != 0);
 
     self->locked = 1;  // GH-80254: Prevent recursive use of cursors.
     PyObject *row = _pysqlite_fetch_one_row(self);
@@ -1107,19 +1193,7 @@ pysqlite_cursor_iternext(pysqlite_Cursor *self)
     if (row == NULL) {
         return NULL;
     }
-    int rc = stmt_step(stmt);
-    if (rc == SQLITE_DONE) {
-        if (self->statement->is_dml) {
-            self->rowcount = (long)sqlite3_changes(self->connection->db);
-        }
-        (void)stmt_reset(self->statement);
-        Py_CLEAR(self->statement);
-    }
-    else if (rc != SQLITE_ROW) {
-        (void)_pysqlite_seterror(self->connection->state,
-                                 self->connection->db);
-        (void)stmt_reset(self->statement);
-        Py_CLEAR(self->statement);
+    if (cursor_step(self) < 0) {
         Py_DECREF(row);
         return NULL;
     }
@@ -1228,6 +1302,271 @@ pysqlite_cursor_fetchall_impl(pysqlite_Cursor *self)
     }
 }
 
+/* The values of a column fetched by fetchcolumns(). */
+typedef enum {
+    COLUMN_EMPTY,       // Only NULL values so far
+    COLUMN_INTEGER,
+    COLUMN_FLOAT,
+    COLUMN_LIST,
+} column_kind;
+
+typedef struct {
+    column_kind kind;
+    Py_ssize_t size;        // Number of values
+    Py_ssize_t allocated;   // Number of values allocated in data
+    union {
+        sqlite3_int64 *ints;
+        double *floats;
+    } data;                 // Values of an integer or float column
+    PyObject *list;         // Values of a list column
+} column_buffer;
+
+static int
+column_append_number(column_buffer *col, column_kind kind)
+{
+    if (col->size == col->allocated) {
+        Py_ssize_t allocated = col->allocated ? col->allocated * 2 : 64;
+        void *data = PyMem_Realloc(col->data.ints,
+                                   allocated * sizeof(sqlite3_int64));
+        if (data == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        col->data.ints = data;
+        col->allocated = allocated;
+    }
+    col->kind = kind;
+    col->size++;
+    return 0;
+}
+
+/*
+ * Converts the column to a list of Python objects.
+ *
+ * 0 => ok; -1 => error
+ */
+static int
+column_to_list(column_buffer *col)
+{
+    PyObject *list = PyList_New(col->size);
+    if (list == NULL) {
+        return -1;
+    }
+    for (Py_ssize_t i = 0; i < col->size; i++) {
+        PyObject *value;
+        if (col->kind == COLUMN_INTEGER) {
+            value = PyLong_FromLongLong(col->data.ints[i]);
+            if (value == NULL) {
+                Py_DECREF(list);
+                return -1;
+            }
+        }
+        else if (col->kind == COLUMN_FLOAT) {
+            value = PyFloat_FromDouble(col->data.floats[i]);
+            if (value == NULL) {
+                Py_DECREF(list);
+                return -1;
+            }
+        }
+        else {
+            assert(col->kind == COLUMN_EMPTY);
+            value = Py_NewRef(Py_None);
+        }
+        PyList_SET_ITEM(list, i, value);
+    }
+    PyMem_Free(col->data.ints);
+    col->data.ints = NULL;
+    col->allocated = 0;
+    col->list = list;
+    col->kind = COLUMN_LIST;
+    return 0;
+}
+
+/*
+ * Returns the values of the column as an array.array or a list.
+ */
+static PyObject *
+column_to_object(pysqlite_state *state, column_buffer *col)
+{
+    const char *typecode;
+    if (col->kind == COLUMN_INTEGER) {
+        typecode = "q";
+    }
+    else if (col->kind == COLUMN_FLOAT) {
+        typecode = "d";
+    }
+    else {
+        if (col->kind == COLUMN_EMPTY && column_to_list(col) < 0) {
+            return NULL;
+        }
+        return Py_NewRef(col->list);
+    }
+
+    if (state->array_type == NULL) {
+        state->array_type = _PyImport_GetModuleAttrString("array", "array");
+        if (state->array_type == NULL) {
+            return NULL;
+        }
+    }
+    PyObject *array = PyObject_CallFunction(state->array_type, "s", typecode);
+    if (array == NULL) {
+        return NULL;
+    }
+    PyObject *data = PyMemoryView_FromMemory(
+        (char *)col->data.ints, col->size * sizeof(sqlite3_int64), PyBUF_READ);
+    if (data == NULL) {
+        Py_DECREF(array);
+        return NULL;
+    }
+    PyObject *res = PyObject_CallMethod(array, "frombytes", "O", data);
+    Py_DECREF(data);
+    if (res == NULL) {
+        Py_DECREF(array);
+        return NULL;
+    }
+    Py_DECREF(res);
+    return array;
+}
+
+/*
+ * Appends the column i of the current row of the active SQLite statement to
+ * col.
+ *
+ * 0 => ok; -1 => error
+ */
+static int
+fetch_column_value(pysqlite_Cursor *self, int i, column_buffer *col)
+{
+    sqlite3_stmt *stmt = self->statement->st;
+    PyObject *converter = get_column_converter(self, i);
+    int coltype = SQLITE_NULL;
+
+    if (converter == Py_None) {
+        coltype = sqlite3_column_type(stmt, i);
+        switch (coltype) {
+        case SQLITE_INTEGER:
+            if (col->kind == COLUMN_INTEGER
+                || (col->kind == COLUMN_EMPTY && col->size == 0))
+            {
+                if (column_append_number(col, COLUMN_INTEGER) < 0) {
+                    return -1;
+                }
+                col->data.ints[col->size - 1] = sqlite3_column_int64(stmt, i);
+                return 0;
+            }
+            break;
+        case SQLITE_FLOAT:
+            if (col->kind == COLUMN_FLOAT
+                || (col->kind == COLUMN_EMPTY && col->size == 0))
+            {
+                if (column_append_number(col, COLUMN_FLOAT) < 0) {
+                    return -1;
+                }
+                col->data.floats[col->size - 1] = sqlite3_column_double(stmt, i);
+                return 0;
+            }
+            break;
+        case SQLITE_NULL:
+            if (col->kind == COLUMN_EMPTY) {
+                col->size++;
+                return 0;
+            }
+            break;
+        }
+    }
+
+    /* A list is needed for other values, or if the column holds values of
+     * several types. */
+    if (col->kind != COLUMN_LIST && column_to_list(col) < 0) {
+        return -1;
+    }
+    PyObject *value = _pysqlite_fetch_one_value(self, i, converter, coltype);
+    if (value == NULL) {
+        return -1;
+    }
+    int rc = PyList_Append(col->list, value);
+    Py_DECREF(value);
+    if (rc < 0) {
+        return -1;
+    }
+    col->size++;
+    return 0;
+}
+
+/*[clinic input]
+_sqlite3.Cursor.fetchcolumns as pysqlite_cursor_fetchcolumns
+
+    size as maxrows: int = -1
+        The maximum number of rows to fetch.  If negative, all the
+        remaining rows are fetched.
+
+Fetches several rows from the resultset, as a list of columns.
+
+Columns holding only integers or only floats are returned as
+array.array objects of type 'q' or 'd', and other columns as lists.
+[clinic start generated code]*/
+
+static PyObject *
+pysqlite_cursor_fetchcolumns_impl(pysqlite_Cursor *self, int maxrows)
+/*[clinic end generated code: output=781d71c1122c0ace input=1473aa47464b5991]*/
+{
+    if (!check_cursor(self)) {
+        return NULL;
+    }
+
+    Py_ssize_t numcols = 0;
+    if (self->statement != NULL) {
+        numcols = sqlite3_column_count(self->statement->st);
+    }
+    else if (!Py_IsNone(self->description)) {
+        numcols = PyTuple_GET_SIZE(self->description);
+    }
+    column_buffer *cols = PyMem_Calloc(numcols ? numcols : 1,
+                                       sizeof(column_buffer));
+    if (cols == NULL) {
+        return PyErr_NoMemory();
+    }
+
+    PyObject *result = NULL;
+    self->locked = 1;  // GH-80254: Prevent recursive use of cursors.
+    for (int nrows = 0;
+         self->statement != NULL && (maxrows < 0 || nrows < maxrows);
+         nrows++)
+    {
+        assert(sqlite3_data_count(self->statement->st) == numcols);
+        for (int i = 0; i < numcols; i++) {
+            if (fetch_column_value(self, i, &cols[i]) < 0) {
+                goto finally;
+            }
+        }
+        if (cursor_step(self) < 0) {
+            goto finally;
+        }
+    }
+
+    result = PyList_New(numcols);
+    if (result == NULL) {
+        goto finally;
+    }
+    for (Py_ssize_t i = 0; i < numcols; i++) {
+        PyObject *column = column_to_object(self->connection->state, &cols[i]);
+        if (column == NULL) {
+            Py_CLEAR(result);
+            goto finally;
+        }
+        PyList_SET_ITEM(result, i, column);
+    }
+
+finally:
+    self->locked = 0;
+    for (Py_ssize_t i = 0; i < numcols; i++) {
+        PyMem_Free(cols[i].data.ints);
+        Py_XDECREF(cols[i].list);
+    }
+    PyMem_Free(cols);
+    return result;
+}
+
 /*[clinic input]
 _sqlite3.Cursor.setinputsizes as pysqlite_cursor_setinputsizes
 
@@ -1303,6 +1642,7 @@ static PyMethodDef cursor_methods[] = {
     PYSQLITE_CURSOR_EXECUTESCRIPT_METHODDEF
     PYSQLITE_CURSOR_EXECUTE_METHODDEF
     PYSQLITE_CURSOR_FETCHALL_METHODDEF
+    PYSQLITE_CURSOR_FETCHCOLUMNS_METHODDEF
     PYSQLITE_CURSOR_FETCHMANY_METHODDEF
     PYSQLITE_CURSOR_FETCHONE_METHODDEF
     PYSQLITE_CURSOR_SETINPUTSIZES_METHODDEF
@@ -564,10 +564,12 @@ module_traverse(PyObject *module, visitproc visit, void *arg)
     Py_VISIT(state->PrepareProtocolType);
     Py_VISIT(state->RowType);
     Py_VISIT(state->StatementType);
+    Py_VISIT(state->StatementCacheInfoType);
 
     // Misc
     Py_VISIT(state->converters);
     Py_VISIT(state->lru_cache);
+    Py_VISIT(state->array_type);
     Py_VISIT(state->psyco_adapters);
 
     return 0;
@@ -597,10 +599,12 @@ module_clear(PyObject *module)
     Py_CLEAR(state->PrepareProtocolType);
     Py_CLEAR(state->RowType);
     Py_CLEAR(state->StatementType);
+    Py_CLEAR(state->StatementCacheInfoType);
 
     // Misc
     Py_CLEAR(state->converters);
     Py_CLEAR(state->lru_cache);
+    Py_CLEAR(state->array_type);
     Py_CLEAR(state->psyco_adapters);
 
     // Interned strings
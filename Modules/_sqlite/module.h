@@ -50,6 +50,7 @@ typedef struct {
     PyObject *converters;
 
     PyObject *lru_cache;
+    PyObject *array_type;  // array.array, imported on first use
     PyObject *psyco_adapters;  // The adapters registry
     int BaseTypeAdapted;
     int enable_callback_tracebacks;
@@ -60,6 +61,7 @@ typedef struct {
     PyTypeObject *PrepareProtocolType;
     PyTypeObject *RowType;
     PyTypeObject *StatementType;
+    PyTypeObject *StatementCacheInfoType;
 
     /* Pointers to interned strings */
     PyObject *str___adapt__;
@@ -88,6 +88,7 @@ pysqlite_statement_create(pysqlite_Connection *connection, PyObject *sql)
     }
 
     self->st = stmt;
+    self->sql = Py_NewRef(sql);
     self->is_dml = is_dml;
 
     PyObject_GC_Track(self);
@@ -109,6 +110,7 @@ stmt_dealloc(pysqlite_Statement *self)
         Py_END_ALLOW_THREADS
         self->st = 0;
     }
+    Py_XDECREF(self->sql);
     tp->tp_free(self);
     Py_DECREF(tp);
 }
@@ -178,8 +180,18 @@ lstrip_sql(const char *sql)
     return NULL;
 }
 
+static struct PyMemberDef stmt_members[] = {
+    {"sql", _Py_T_OBJECT, offsetof(pysqlite_Statement, sql), Py_READONLY},
+    {NULL}
+};
+
+static const char stmt_doc[] =
+PyDoc_STR("SQLite prepared statement.");
+
 static PyType_Slot stmt_slots[] = {
     {Py_tp_dealloc, stmt_dealloc},
+    {Py_tp_doc, (void *)stmt_doc},
+    {Py_tp_members, stmt_members},
     {Py_tp_traverse, stmt_traverse},
     {0, NULL},
 };
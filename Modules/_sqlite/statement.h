@@ -32,6 +32,7 @@ typedef struct
 {
     PyObject_HEAD
     sqlite3_stmt* st;
+    PyObject *sql;
     int is_dml;
 } pysqlite_Statement;
 
@@ -1079,6 +1079,694 @@ exit:
 
 #endif /* defined(HAVE_EPOLL) */
 
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring__doc__,
+"io_uring(entries=256)\n"
+"--\n"
+"\n"
+"Returns an io_uring object.\n"
+"\n"
+"  entries\n"
+"    the size of the submission ring; larger values are clamped to the\n"
+"    maximum supported by the kernel");
+
+static PyObject *
+select_io_uring_impl(PyTypeObject *type, int entries);
+
+static PyObject *
+select_io_uring(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(entries), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"entries", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "io_uring",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject * const *fastargs;
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+    Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 0;
+    int entries = 256;
+
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser, 0, 1, 0, argsbuf);
+    if (!fastargs) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    entries = PyLong_AsInt(fastargs[0]);
+    if (entries == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = select_io_uring_impl(type, entries);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_close__doc__,
+"close($self, /)\n"
+"--\n"
+"\n"
+"Close the io_uring file descriptor.\n"
+"\n"
+"Operations still in flight are cancelled first.  Further operations on\n"
+"the io_uring object will raise an exception.");
+
+#define SELECT_IO_URING_CLOSE_METHODDEF    \
+    {"close", (PyCFunction)select_io_uring_close, METH_NOARGS, select_io_uring_close__doc__},
+
+static PyObject *
+select_io_uring_close_impl(pyIoUring_Object *self);
+
+static PyObject *
+select_io_uring_close(pyIoUring_Object *self, PyObject *Py_UNUSED(ignored))
+{
+    return select_io_uring_close_impl(self);
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_fileno__doc__,
+"fileno($self, /)\n"
+"--\n"
+"\n"
+"Return the io_uring file descriptor.");
+
+#define SELECT_IO_URING_FILENO_METHODDEF    \
+    {"fileno", (PyCFunction)select_io_uring_fileno, METH_NOARGS, select_io_uring_fileno__doc__},
+
+static PyObject *
+select_io_uring_fileno_impl(pyIoUring_Object *self);
+
+static PyObject *
+select_io_uring_fileno(pyIoUring_Object *self, PyObject *Py_UNUSED(ignored))
+{
+    return select_io_uring_fileno_impl(self);
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_read__doc__,
+"read($self, user_data, fd, buffer, offset=-1, /)\n"
+"--\n"
+"\n"
+"Queue a read from fd into the writable buffer.\n"
+"\n"
+"  offset\n"
+"    the file offset to read from; -1 reads from the current position\n"
+"\n"
+"The result of the operation is the number of bytes read.");
+
+#define SELECT_IO_URING_READ_METHODDEF    \
+    {"read", _PyCFunction_CAST(select_io_uring_read), METH_FASTCALL, select_io_uring_read__doc__},
+
+static PyObject *
+select_io_uring_read_impl(pyIoUring_Object *self,
+                          unsigned long long user_data, int fd,
+                          PyObject *buffer, long long offset);
+
+static PyObject *
+select_io_uring_read(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    unsigned long long user_data;
+    int fd;
+    PyObject *buffer;
+    long long offset = -1;
+
+    if (!_PyArg_CheckPositional("read", nargs, 3, 4)) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    buffer = args[2];
+    if (nargs < 4) {
+        goto skip_optional;
+    }
+    offset = PyLong_AsLongLong(args[3]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    return_value = select_io_uring_read_impl(self, user_data, fd, buffer, offset);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_write__doc__,
+"write($self, user_data, fd, buffer, offset=-1, /)\n"
+"--\n"
+"\n"
+"Queue a write of the bytes-like object to fd.\n"
+"\n"
+"  offset\n"
+"    the file offset to write at; -1 writes at the current position\n"
+"\n"
+"The result of the operation is the number of bytes written.");
+
+#define SELECT_IO_URING_WRITE_METHODDEF    \
+    {"write", _PyCFunction_CAST(select_io_uring_write), METH_FASTCALL, select_io_uring_write__doc__},
+
+static PyObject *
+select_io_uring_write_impl(pyIoUring_Object *self,
+                           unsigned long long user_data, int fd,
+                           PyObject *buffer, long long offset);
+
+static PyObject *
+select_io_uring_write(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    unsigned long long user_data;
+    int fd;
+    PyObject *buffer;
+    long long offset = -1;
+
+    if (!_PyArg_CheckPositional("write", nargs, 3, 4)) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    buffer = args[2];
+    if (nargs < 4) {
+        goto skip_optional;
+    }
+    offset = PyLong_AsLongLong(args[3]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    return_value = select_io_uring_write_impl(self, user_data, fd, buffer, offset);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_recv__doc__,
+"recv($self, user_data, fd, buffer, flags=0, /)\n"
+"--\n"
+"\n"
+"Queue a receive from the socket fd into the writable buffer.\n"
+"\n"
+"The result of the operation is the number of bytes received.");
+
+#define SELECT_IO_URING_RECV_METHODDEF    \
+    {"recv", _PyCFunction_CAST(select_io_uring_recv), METH_FASTCALL, select_io_uring_recv__doc__},
+
+static PyObject *
+select_io_uring_recv_impl(pyIoUring_Object *self,
+                          unsigned long long user_data, int fd,
+                          PyObject *buffer, int flags);
+
+static PyObject *
+select_io_uring_recv(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    unsigned long long user_data;
+    int fd;
+    PyObject *buffer;
+    int flags = 0;
+
+    if (!_PyArg_CheckPositional("recv", nargs, 3, 4)) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    buffer = args[2];
+    if (nargs < 4) {
+        goto skip_optional;
+    }
+    flags = PyLong_AsInt(args[3]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    return_value = select_io_uring_recv_impl(self, user_data, fd, buffer, flags);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_send__doc__,
+"send($self, user_data, fd, buffer, flags=0, /)\n"
+"--\n"
+"\n"
+"Queue a send of the bytes-like object to the socket fd.\n"
+"\n"
+"The result of the operation is the number of bytes sent.");
+
+#define SELECT_IO_URING_SEND_METHODDEF    \
+    {"send", _PyCFunction_CAST(select_io_uring_send), METH_FASTCALL, select_io_uring_send__doc__},
+
+static PyObject *
+select_io_uring_send_impl(pyIoUring_Object *self,
+                          unsigned long long user_data, int fd,
+                          PyObject *buffer, int flags);
+
+static PyObject *
+select_io_uring_send(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    unsigned long long user_data;
+    int fd;
+    PyObject *buffer;
+    int flags = 0;
+
+    if (!_PyArg_CheckPositional("send", nargs, 3, 4)) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    buffer = args[2];
+    if (nargs < 4) {
+        goto skip_optional;
+    }
+    flags = PyLong_AsInt(args[3]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    return_value = select_io_uring_send_impl(self, user_data, fd, buffer, flags);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_accept__doc__,
+"accept($self, user_data, fd, flags=0, /)\n"
+"--\n"
+"\n"
+"Queue the acceptance of a connection on the listening socket fd.\n"
+"\n"
+"  flags\n"
+"    flags for accept4(), such as socket.SOCK_NONBLOCK\n"
+"\n"
+"The result of the operation is the file descriptor of the new connection.");
+
+#define SELECT_IO_URING_ACCEPT_METHODDEF    \
+    {"accept", _PyCFunction_CAST(select_io_uring_accept), METH_FASTCALL, select_io_uring_accept__doc__},
+
+static PyObject *
+select_io_uring_accept_impl(pyIoUring_Object *self,
+                            unsigned long long user_data, int fd, int flags);
+
+static PyObject *
+select_io_uring_accept(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    unsigned long long user_data;
+    int fd;
+    int flags = 0;
+
+    if (!_PyArg_CheckPositional("accept", nargs, 2, 3)) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    flags = PyLong_AsInt(args[2]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional:
+    return_value = select_io_uring_accept_impl(self, user_data, fd, flags);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_poll_add__doc__,
+"poll_add($self, user_data, fd, eventmask, /)\n"
+"--\n"
+"\n"
+"Queue a one-shot wait for events on fd.\n"
+"\n"
+"  eventmask\n"
+"    a bit set composed of the POLL constants\n"
+"\n"
+"The result of the operation is the mask of the events which occurred.");
+
+#define SELECT_IO_URING_POLL_ADD_METHODDEF    \
+    {"poll_add", _PyCFunction_CAST(select_io_uring_poll_add), METH_FASTCALL, select_io_uring_poll_add__doc__},
+
+static PyObject *
+select_io_uring_poll_add_impl(pyIoUring_Object *self,
+                              unsigned long long user_data, int fd,
+                              unsigned int eventmask);
+
+static PyObject *
+select_io_uring_poll_add(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    unsigned long long user_data;
+    int fd;
+    unsigned int eventmask;
+
+    if (!_PyArg_CheckPositional("poll_add", nargs, 3, 3)) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    fd = PyObject_AsFileDescriptor(args[1]);
+    if (fd < 0) {
+        goto exit;
+    }
+    eventmask = (unsigned int)PyLong_AsUnsignedLongMask(args[2]);
+    if (eventmask == (unsigned int)-1 && PyErr_Occurred()) {
+        goto exit;
+    }
+    return_value = select_io_uring_poll_add_impl(self, user_data, fd, eventmask);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_cancel__doc__,
+"cancel($self, user_data, target, /)\n"
+"--\n"
+"\n"
+"Queue the cancellation of an operation.\n"
+"\n"
+"  target\n"
+"    the user_data of the operation to cancel\n"
+"\n"
+"The cancelled operation completes with the result -errno.ECANCELED,\n"
+"unless it completed before the cancellation took effect.  The result of\n"
+"the cancellation itself is 0 or -errno.ENOENT if target was not found.");
+
+#define SELECT_IO_URING_CANCEL_METHODDEF    \
+    {"cancel", _PyCFunction_CAST(select_io_uring_cancel), METH_FASTCALL, select_io_uring_cancel__doc__},
+
+static PyObject *
+select_io_uring_cancel_impl(pyIoUring_Object *self,
+                            unsigned long long user_data,
+                            unsigned long long target);
+
+static PyObject *
+select_io_uring_cancel(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    unsigned long long user_data;
+    unsigned long long target;
+
+    if (!_PyArg_CheckPositional("cancel", nargs, 2, 2)) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[1], &target)) {
+        goto exit;
+    }
+    return_value = select_io_uring_cancel_impl(self, user_data, target);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_nop__doc__,
+"nop($self, user_data, /)\n"
+"--\n"
+"\n"
+"Queue an operation which does nothing and completes with result 0.");
+
+#define SELECT_IO_URING_NOP_METHODDEF    \
+    {"nop", (PyCFunction)select_io_uring_nop, METH_O, select_io_uring_nop__doc__},
+
+static PyObject *
+select_io_uring_nop_impl(pyIoUring_Object *self,
+                         unsigned long long user_data);
+
+static PyObject *
+select_io_uring_nop(pyIoUring_Object *self, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    unsigned long long user_data;
+
+    if (!_PyLong_UnsignedLongLong_Converter(arg, &user_data)) {
+        goto exit;
+    }
+    return_value = select_io_uring_nop_impl(self, user_data);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_submit__doc__,
+"submit($self, /)\n"
+"--\n"
+"\n"
+"Hand the queued operations to the kernel.\n"
+"\n"
+"Returns the number of operations submitted.  wait() submits the queued\n"
+"operations as well, so calling this method is seldom necessary.");
+
+#define SELECT_IO_URING_SUBMIT_METHODDEF    \
+    {"submit", (PyCFunction)select_io_uring_submit, METH_NOARGS, select_io_uring_submit__doc__},
+
+static PyObject *
+select_io_uring_submit_impl(pyIoUring_Object *self);
+
+static PyObject *
+select_io_uring_submit(pyIoUring_Object *self, PyObject *Py_UNUSED(ignored))
+{
+    return select_io_uring_submit_impl(self);
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_wait__doc__,
+"wait($self, /, timeout=None)\n"
+"--\n"
+"\n"
+"Submit the queued operations and wait for completions.\n"
+"\n"
+"  timeout\n"
+"    the maximum time to wait in seconds (as float);\n"
+"    a timeout of None or a negative value makes wait block indefinitely\n"
+"\n"
+"All the queued operations are submitted with a single system call.\n"
+"Returns a list of (user_data, result, flags) 3-tuples for the completed\n"
+"operations.  A negative result is an error number with the opposite\n"
+"sign.  An empty list is returned if the timeout expires first.");
+
+#define SELECT_IO_URING_WAIT_METHODDEF    \
+    {"wait", _PyCFunction_CAST(select_io_uring_wait), METH_FASTCALL|METH_KEYWORDS, select_io_uring_wait__doc__},
+
+static PyObject *
+select_io_uring_wait_impl(pyIoUring_Object *self, PyObject *timeout_obj);
+
+static PyObject *
+select_io_uring_wait(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(timeout), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"timeout", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "wait",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    PyObject *timeout_obj = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 0, 1, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    timeout_obj = args[0];
+skip_optional_pos:
+    return_value = select_io_uring_wait_impl(self, timeout_obj);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring___enter____doc__,
+"__enter__($self, /)\n"
+"--\n"
+"\n");
+
+#define SELECT_IO_URING___ENTER___METHODDEF    \
+    {"__enter__", (PyCFunction)select_io_uring___enter__, METH_NOARGS, select_io_uring___enter____doc__},
+
+static PyObject *
+select_io_uring___enter___impl(pyIoUring_Object *self);
+
+static PyObject *
+select_io_uring___enter__(pyIoUring_Object *self, PyObject *Py_UNUSED(ignored))
+{
+    return select_io_uring___enter___impl(self);
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring___exit____doc__,
+"__exit__($self, exc_type=None, exc_value=None, exc_tb=None, /)\n"
+"--\n"
+"\n");
+
+#define SELECT_IO_URING___EXIT___METHODDEF    \
+    {"__exit__", _PyCFunction_CAST(select_io_uring___exit__), METH_FASTCALL, select_io_uring___exit____doc__},
+
+static PyObject *
+select_io_uring___exit___impl(pyIoUring_Object *self, PyObject *exc_type,
+                              PyObject *exc_value, PyObject *exc_tb);
+
+static PyObject *
+select_io_uring___exit__(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *exc_type = Py_None;
+    PyObject *exc_value = Py_None;
+    PyObject *exc_tb = Py_None;
+
+    if (!_PyArg_CheckPositional("__exit__", nargs, 0, 3)) {
+        goto exit;
+    }
+    if (nargs < 1) {
+        goto skip_optional;
+    }
+    exc_type = args[0];
+    if (nargs < 2) {
+        goto skip_optional;
+    }
+    exc_value = args[1];
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    exc_tb = args[2];
+skip_optional:
+    return_value = select_io_uring___exit___impl(self, exc_type, exc_value, exc_tb);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
 #if defined(HAVE_KQUEUE)
 
 PyDoc_STRVAR(select_kqueue__doc__,
@@ -1345,6 +2033,62 @@ exit:
     #define SELECT_EPOLL___EXIT___METHODDEF
 #endif /* !defined(SELECT_EPOLL___EXIT___METHODDEF) */
 
+#ifndef SELECT_IO_URING_CLOSE_METHODDEF
+    #define SELECT_IO_URING_CLOSE_METHODDEF
+#endif /* !defined(SELECT_IO_URING_CLOSE_METHODDEF) */
+
+#ifndef SELECT_IO_URING_FILENO_METHODDEF
+    #define SELECT_IO_URING_FILENO_METHODDEF
+#endif /* !defined(SELECT_IO_URING_FILENO_METHODDEF) */
+
+#ifndef SELECT_IO_URING_READ_METHODDEF
+    #define SELECT_IO_URING_READ_METHODDEF
+#endif /* !defined(SELECT_IO_URING_READ_METHODDEF) */
+
+#ifndef SELECT_IO_URING_WRITE_METHODDEF
+    #define SELECT_IO_URING_WRITE_METHODDEF
+#endif /* !defined(SELECT_IO_URING_WRITE_METHODDEF) */
+
+#ifndef SELECT_IO_URING_RECV_METHODDEF
+    #define SELECT_IO_URING_RECV_METHODDEF
+#endif /* !defined(SELECT_IO_URING_RECV_METHODDEF) */
+
+#ifndef SELECT_IO_URING_SEND_METHODDEF
+    #define SELECT_IO_URING_SEND_METHODDEF
+#endif /* !defined(SELECT_IO_URING_SEND_METHODDEF) */
+
+#ifndef SELECT_IO_URING_ACCEPT_METHODDEF
+    #define SELECT_IO_URING_ACCEPT_METHODDEF
+#endif /* !defined(SELECT_IO_URING_ACCEPT_METHODDEF) */
+
+#ifndef SELECT_IO_URING_POLL_ADD_METHODDEF
+    #define SELECT_IO_URING_POLL_ADD_METHODDEF
+#endif /* !defined(SELECT_IO_URING_POLL_ADD_METHODDEF) */
+
+#ifndef SELECT_IO_URING_CANCEL_METHODDEF
+    #define SELECT_IO_URING_CANCEL_METHODDEF
+#endif /* !defined(SELECT_IO_URING_CANCEL_METHODDEF) */
+
+#ifndef SELECT_IO_URING_NOP_METHODDEF
+    #define SELECT_IO_URING_NOP_METHODDEF
+#endif /* !defined(SELECT_IO_URING_NOP_METHODDEF) */
+
+#ifndef SELECT_IO_URING_SUBMIT_METHODDEF
+    #define SELECT_IO_URING_SUBMIT_METHODDEF
+#endif /* !defined(SELECT_IO_URING_SUBMIT_METHODDEF) */
+
+#ifndef SELECT_IO_URING_WAIT_METHODDEF
+    #define SELECT_IO_URING_WAIT_METHODDEF
+#endif /* !defined(SELECT_IO_URING_WAIT_METHODDEF) */
+
+#ifndef SELECT_IO_URING___ENTER___METHODDEF
+    #define SELECT_IO_URING___ENTER___METHODDEF
+#endif /* !defined(SELECT_IO_URING___ENTER___METHODDEF) */
+
+#ifndef SELECT_IO_URING___EXIT___METHODDEF
+    #define SELECT_IO_URING___EXIT___METHODDEF
+#endif /* !defined(SELECT_IO_URING___EXIT___METHODDEF) */
+
 #ifndef SELECT_KQUEUE_CLOSE_METHODDEF
     #define SELECT_KQUEUE_CLOSE_METHODDEF
 #endif /* !defined(SELECT_KQUEUE_CLOSE_METHODDEF) */
@@ -1360,4 +2104,4 @@ exit:
 #ifndef SELECT_KQUEUE_CONTROL_METHODDEF
     #define SELECT_KQUEUE_CONTROL_METHODDEF
 #endif /* !defined(SELECT_KQUEUE_CONTROL_METHODDEF) */
-/*[clinic end generated code: output=f99427b75cbe6d44 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=d4a6cd9ca3803ca6 input=a9049054013a1b77]*/
@@ -31,6 +31,17 @@
 #include <fcntl.h>
 #endif
 
+#ifdef HAVE_LINUX_IO_URING_H
+#  include <linux/io_uring.h>
+#  include <signal.h>             // _NSIG
+#  include <sys/mman.h>           // mmap()
+#  include <sys/syscall.h>        // __NR_io_uring_setup
+#  if defined(__NR_io_uring_setup) && defined(__NR_io_uring_enter) \
+      && defined(IORING_FEAT_EXT_ARG)
+#    define HAVE_IO_URING 1
+#  endif
+#endif
+
 #ifdef __APPLE__
     /* Perform runtime testing for a broken poll on OSX to make it easier
      * to use the same binary on multiple releases of the OS.
@@ -91,6 +102,7 @@ typedef struct {
     PyTypeObject *poll_Type;
     PyTypeObject *devpoll_Type;
     PyTypeObject *pyEpoll_Type;
+    PyTypeObject *pyIoUring_Type;
 #ifdef HAVE_KQUEUE
     PyTypeObject *kqueue_event_Type;
     PyTypeObject *kqueue_queue_Type;
@@ -116,9 +128,10 @@ module select
 class select.poll "pollObject *" "_selectstate_by_type(type)->poll_Type"
 class select.devpoll "devpollObject *" "_selectstate_by_type(type)->devpoll_Type"
 class select.epoll "pyEpoll_Object *" "_selectstate_by_type(type)->pyEpoll_Type"
+class select.io_uring "pyIoUring_Object *" "_selectstate_by_type(type)->pyIoUring_Type"
 class select.kqueue "kqueue_queue_Object *" "_selectstate_by_type(type)->kqueue_queue_Type"
 [clinic start generated code]*/
-/*[clinic end generated code: output=da39a3ee5e6b4b0d input=8072de35824aa327]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=daa749b086445bd7]*/
 
 /* list of Python objects and their file descriptor */
 typedef struct {
@@ -1724,6 +1737,894 @@ the maximum number of monitored events.");
 
 #endif /* HAVE_EPOLL */
 
+#ifdef HAVE_IO_URING
+/* **************************************************************************
+ *                      io_uring interface for Linux 5.11+
+ *
+ * Operations are queued in the submission ring by the methods named after
+ * them and handed to the kernel in batches by submit() or wait().  Buffers
+ * passed to an operation are kept alive until its completion is reaped.
+ */
+
+/* user_data reserved for the cancellations issued by close() */
+#define IORING_INTERNAL_USER_DATA UINT64_MAX
+
+typedef struct {
+    PyObject_HEAD
+    int ring_fd;                        /* io_uring file descriptor */
+    unsigned int sq_entries;
+    unsigned int sq_tail;               /* next free submission slot */
+    unsigned int *ksq_head;
+    unsigned int *ksq_tail;
+    unsigned int *ksq_mask;
+    unsigned int *ksq_array;
+    unsigned int *kcq_head;
+    unsigned int *kcq_tail;
+    unsigned int *kcq_mask;
+    struct io_uring_sqe *sqes;
+    struct io_uring_cqe *cqes;
+    void *sq_ring;
+    size_t sq_ring_size;
+    void *cq_ring;
+    size_t cq_ring_size;
+    size_t sqes_size;
+    PyObject *buffers;                  /* {user_data: memoryview} */
+} pyIoUring_Object;
+
+static PyObject *
+pyiouring_err_closed(void)
+{
+    PyErr_SetString(PyExc_ValueError,
+                    "I/O operation on closed io_uring object");
+    return NULL;
+}
+
+static int
+pyiouring_enter(pyIoUring_Object *self, unsigned int to_submit,
+                unsigned int min_complete, unsigned int flags,
+                void *arg, size_t argsz)
+{
+    int ret;
+    Py_BEGIN_ALLOW_THREADS
+    ret = (int)syscall(__NR_io_uring_enter, self->ring_fd, to_submit,
+                       min_complete, flags, arg, argsz);
+    Py_END_ALLOW_THREADS
+    return ret;
+}
+
+static inline unsigned int
+pyiouring_sq_pending(pyIoUring_Object *self)
+{
+    return self->sq_tail - __atomic_load_n(self->ksq_head, __ATOMIC_ACQUIRE);
+}
+
+static inline int
+pyiouring_cq_ready(pyIoUring_Object *self)
+{
+    return __atomic_load_n(self->kcq_tail, __ATOMIC_ACQUIRE) != *self->kcq_head;
+}
+
+/* Hand all queued operations to the kernel.  Return the number of
+   submitted operations, or -1 with an exception set. */
+static int
+pyiouring_submit(pyIoUring_Object *self)
+{
+    unsigned int to_submit;
+    int ret;
+
+    while ((to_submit = pyiouring_sq_pending(self)) != 0) {
+        ret = pyiouring_enter(self, to_submit, 0, 0, NULL, 0);
+        if (ret >= 0) {
+            return ret;
+        }
+        if (errno != EINTR) {
+            PyErr_SetFromErrno(PyExc_OSError);
+            return -1;
+        }
+        if (PyErr_CheckSignals()) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+/* Return a cleared submission queue entry, submitting the queued
+   operations first if the submission ring is full.  The entry is only
+   handed to the kernel once pyiouring_queue() has been called. */
+static struct io_uring_sqe *
+pyiouring_get_sqe(pyIoUring_Object *self, unsigned long long user_data)
+{
+    struct io_uring_sqe *sqe;
+
+    if (self->ring_fd < 0) {
+        pyiouring_err_closed();
+        return NULL;
+    }
+    if (user_data == IORING_INTERNAL_USER_DATA) {
+        PyErr_SetString(PyExc_ValueError, "user_data is out of range");
+        return NULL;
+    }
+    if (pyiouring_sq_pending(self) >= self->sq_entries) {
+        if (pyiouring_submit(self) < 0) {
+            return NULL;
+        }
+        if (pyiouring_sq_pending(self) >= self->sq_entries) {
+            errno = EBUSY;
+            PyErr_SetFromErrno(PyExc_OSError);
+            return NULL;
+        }
+    }
+    sqe = &self->sqes[self->sq_tail & *self->ksq_mask];
+    memset(sqe, 0, sizeof(*sqe));
+    sqe->user_data = user_data;
+    return sqe;
+}
+
+static void
+pyiouring_queue(pyIoUring_Object *self)
+{
+    unsigned int index = self->sq_tail & *self->ksq_mask;
+    self->ksq_array[index] = index;
+    self->sq_tail++;
+    __atomic_store_n(self->ksq_tail, self->sq_tail, __ATOMIC_RELEASE);
+}
+
+/* Keep *obj* alive and its memory pinned until the completion of the
+   operation identified by *user_data* is reaped. */
+static Py_buffer *
+pyiouring_hold_buffer(pyIoUring_Object *self, unsigned long long user_data,
+                      PyObject *obj, int writable)
+{
+    PyObject *view, *key;
+    Py_buffer *buf;
+    int rc;
+
+    view = PyMemoryView_FromObject(obj);
+    if (view == NULL) {
+        return NULL;
+    }
+    buf = PyMemoryView_GET_BUFFER(view);
+    if (writable && buf->readonly) {
+        PyErr_SetString(PyExc_TypeError, "buffer must be writable");
+        goto error;
+    }
+    if (!PyBuffer_IsContiguous(buf, 'C')) {
+        PyErr_SetString(PyExc_BufferError, "buffer must be contiguous");
+        goto error;
+    }
+    key = PyLong_FromUnsignedLongLong(user_data);
+    if (key == NULL) {
+        goto error;
+    }
+    rc = PyDict_Contains(self->buffers, key);
+    if (rc == 0) {
+        rc = PyDict_SetItem(self->buffers, key, view);
+    }
+    else if (rc > 0) {
+        PyErr_Format(PyExc_ValueError,
+                     "user_data %llu is already in use", user_data);
+        rc = -1;
+    }
+    Py_DECREF(key);
+    if (rc < 0) {
+        goto error;
+    }
+    /* The dictionary now owns the memoryview. */
+    Py_DECREF(view);
+    return buf;
+
+error:
+    Py_DECREF(view);
+    return NULL;
+}
+
+static int
+pyiouring_release_buffer(pyIoUring_Object *self, unsigned long long user_data)
+{
+    PyObject *key;
+    int rc;
+
+    if (PyDict_GET_SIZE(self->buffers) == 0) {
+        return 0;
+    }
+    key = PyLong_FromUnsignedLongLong(user_data);
+    if (key == NULL) {
+        return -1;
+    }
+    rc = PyDict_Pop(self->buffers, key, NULL);
+    Py_DECREF(key);
+    return rc < 0 ? -1 : 0;
+}
+
+/* Cancel the operations which hold a buffer and wait for their completion,
+   so that the kernel does not write into memory which is about to be
+   released. */
+static void
+pyiouring_drain(pyIoUring_Object *self)
+{
+    PyObject *key, *value;
+    Py_ssize_t pos = 0;
+    unsigned int head, tail;
+    struct io_uring_sqe *sqe;
+    int ret;
+
+    while (PyDict_Next(self->buffers, &pos, &key, &value)) {
+        unsigned long long user_data = PyLong_AsUnsignedLongLong(key);
+        if (pyiouring_sq_pending(self) >= self->sq_entries) {
+            if (pyiouring_submit(self) < 0) {
+                PyErr_Clear();
+                break;
+            }
+        }
+        sqe = &self->sqes[self->sq_tail & *self->ksq_mask];
+        memset(sqe, 0, sizeof(*sqe));
+        sqe->opcode = IORING_OP_ASYNC_CANCEL;
+        sqe->fd = -1;
+        sqe->addr = user_data;
+        sqe->user_data = IORING_INTERNAL_USER_DATA;
+        pyiouring_queue(self);
+    }
+
+    while (PyDict_GET_SIZE(self->buffers)) {
+        if (!pyiouring_cq_ready(self)) {
+            ret = pyiouring_enter(self, pyiouring_sq_pending(self), 1,
+                                  IORING_ENTER_GETEVENTS, NULL, 0);
+            if (ret < 0 && errno != EINTR) {
+                /* Leak the buffers rather than risk a use after free. */
+                self->buffers = NULL;
+                return;
+            }
+        }
+        head = *self->kcq_head;
+        tail = __atomic_load_n(self->kcq_tail, __ATOMIC_ACQUIRE);
+        for (; head != tail; head++) {
+            struct io_uring_cqe *cqe = &self->cqes[head & *self->kcq_mask];
+            if (cqe->user_data != IORING_INTERNAL_USER_DATA &&
+                pyiouring_release_buffer(self, cqe->user_data) < 0)
+            {
+                PyErr_Clear();
+            }
+        }
+        __atomic_store_n(self->kcq_head, head, __ATOMIC_RELEASE);
+    }
+}
+
+static int
+pyiouring_internal_close(pyIoUring_Object *self)
+{
+    int save_errno = 0;
+    if (self->ring_fd >= 0) {
+        if (self->buffers != NULL && PyDict_GET_SIZE(self->buffers)) {
+            PyObject *exc = PyErr_GetRaisedException();
+            pyiouring_drain(self);
+            PyErr_SetRaisedException(exc);
+        }
+        if (self->sqes != NULL) {
+            munmap(self->sqes, self->sqes_size);
+        }
+        if (self->cq_ring != NULL && self->cq_ring != self->sq_ring) {
+            munmap(self->cq_ring, self->cq_ring_size);
+        }
+        if (self->sq_ring != NULL) {
+            munmap(self->sq_ring, self->sq_ring_size);
+        }
+        self->sqes = NULL;
+        self->sq_ring = self->cq_ring = NULL;
+        int ring_fd = self->ring_fd;
+        self->ring_fd = -1;
+        Py_BEGIN_ALLOW_THREADS
+        if (close(ring_fd) < 0)
+            save_errno = errno;
+        Py_END_ALLOW_THREADS
+    }
+    return save_errno;
+}
+
+static int
+pyiouring_setup(pyIoUring_Object *self, unsigned int entries)
+{
+    struct io_uring_params p;
+    char *sq_ring, *cq_ring;
+
+    memset(&p, 0, sizeof(p));
+    p.flags = IORING_SETUP_CLAMP;
+    Py_BEGIN_ALLOW_THREADS
+    self->ring_fd = (int)syscall(__NR_io_uring_setup, entries, &p);
+    Py_END_ALLOW_THREADS
+    if (self->ring_fd < 0) {
+        return -1;
+    }
+    /* wait() relies on IORING_ENTER_EXT_ARG for its timeout. */
+    if (!(p.features & IORING_FEAT_EXT_ARG)) {
+        errno = ENOSYS;
+        return -1;
+    }
+
+    self->sq_entries = p.sq_entries;
+    self->sq_ring_size = p.sq_off.array + p.sq_entries * sizeof(unsigned int);
+    self->cq_ring_size = (p.cq_off.cqes +
+                          p.cq_entries * sizeof(struct io_uring_cqe));
+    if (p.features & IORING_FEAT_SINGLE_MMAP) {
+        self->sq_ring_size = Py_MAX(self->sq_ring_size, self->cq_ring_size);
+        self->cq_ring_size = self->sq_ring_size;
+    }
+    sq_ring = mmap(NULL, self->sq_ring_size, PROT_READ | PROT_WRITE,
+                   MAP_SHARED | MAP_POPULATE, self->ring_fd, IORING_OFF_SQ_RING);
+    if (sq_ring == MAP_FAILED) {
+        return -1;
+    }
+    self->sq_ring = sq_ring;
+    if (p.features & IORING_FEAT_SINGLE_MMAP) {
+        cq_ring = sq_ring;
+    }
+    else {
+        cq_ring = mmap(NULL, self->cq_ring_size, PROT_READ | PROT_WRITE,
+                       MAP_SHARED | MAP_POPULATE, self->ring_fd,
+                       IORING_OFF_CQ_RING);
+        if (cq_ring == MAP_FAILED) {
+            return -1;
+        }
+    }
+    self->cq_ring = cq_ring;
+    self->sqes_size = p.sq_entries * sizeof(struct io_uring_sqe);
+    self->sqes = mmap(NULL, self->sqes_size, PROT_READ | PROT_WRITE,
+                      MAP_SHARED | MAP_POPULATE, self->ring_fd,
+                      IORING_OFF_SQES);
+    if (self->sqes == MAP_FAILED) {
+        self->sqes = NULL;
+        return -1;
+    }
+
+    self->ksq_head = (unsigned int *)(sq_ring + p.sq_off.head);
+    self->ksq_tail = (unsigned int *)(sq_ring + p.sq_off.tail);
+    self->ksq_mask = (unsigned int *)(sq_ring + p.sq_off.ring_mask);
+    self->ksq_array = (unsigned int *)(sq_ring + p.sq_off.array);
+    self->kcq_head = (unsigned int *)(cq_ring + p.cq_off.head);
+    self->kcq_tail = (unsigned int *)(cq_ring + p.cq_off.tail);
+    self->kcq_mask = (unsigned int *)(cq_ring + p.cq_off.ring_mask);
+    self->cqes = (struct io_uring_cqe *)(cq_ring + p.cq_off.cqes);
+    self->sq_tail = *self->ksq_tail;
+    return 0;
+}
+
+/*[clinic input]
+@classmethod
+select.io_uring.__new__
+
+    entries: int = 256
+      the size of the submission ring; larger values are clamped to the
+      maximum supported by the kernel
+
+Returns an io_uring object.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_impl(PyTypeObject *type, int entries)
+/*[clinic end generated code: output=3e176ae7f5b0bc8b input=2c1961c1c76c70d1]*/
+{
+    pyIoUring_Object *self;
+
+    if (entries < 1) {
+        PyErr_SetString(PyExc_ValueError, "entries must be positive");
+        return NULL;
+    }
+    allocfunc iouring_alloc = PyType_GetSlot(type, Py_tp_alloc);
+    assert(iouring_alloc != NULL);
+    self = (pyIoUring_Object *) iouring_alloc(type, 0);
+    if (self == NULL)
+        return NULL;
+    self->ring_fd = -1;
+    self->buffers = PyDict_New();
+    if (self->buffers == NULL) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    if (pyiouring_setup(self, (unsigned int)entries) < 0) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        Py_DECREF(self);
+        return NULL;
+    }
+    return (PyObject *)self;
+}
+
+static void
+pyiouring_dealloc(pyIoUring_Object *self)
+{
+    PyTypeObject* type = Py_TYPE(self);
+    (void)pyiouring_internal_close(self);
+    Py_XDECREF(self->buffers);
+    freefunc iouring_free = PyType_GetSlot(type, Py_tp_free);
+    iouring_free((PyObject *)self);
+    Py_DECREF((PyObject *)type);
+}
+
+/*[clinic input]
+select.io_uring.close
+
+Close the io_uring file descriptor.
+
+Operations still in flight are cancelled first.  Further operations on
+the io_uring object will raise an exception.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_close_impl(pyIoUring_Object *self)
+/*[clinic end generated code: output=ab34c3876bdadb71 input=8e498f60c99e6f23]*/
+{
+    errno = pyiouring_internal_close(self);
+    if (errno != 0) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+
+static PyObject*
+pyiouring_get_closed(pyIoUring_Object *self, void *Py_UNUSED(ignored))
+{
+    if (self->ring_fd < 0)
+        Py_RETURN_TRUE;
+    else
+        Py_RETURN_FALSE;
+}
+
+/*[clinic input]
+select.io_uring.fileno
+
+Return the io_uring file descriptor.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_fileno_impl(pyIoUring_Object *self)
+/*[clinic end generated code: output=7915f2f83c9cd9ae input=387b7ad3eb89de90]*/
+{
+    if (self->ring_fd < 0)
+        return pyiouring_err_closed();
+    return PyLong_FromLong(self->ring_fd);
+}
+
+static PyObject *
+pyiouring_prep_buffer(pyIoUring_Object *self, int opcode,
+                      unsigned long long user_data, int fd, PyObject *buffer,
+                      long long offset, int flags, int writable)
+{
+    struct io_uring_sqe *sqe;
+    Py_buffer *buf;
+
+    sqe = pyiouring_get_sqe(self, user_data);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    buf = pyiouring_hold_buffer(self, user_data, buffer, writable);
+    if (buf == NULL) {
+        return NULL;
+    }
+    sqe->opcode = opcode;
+    sqe->fd = fd;
+    sqe->off = (unsigned long long)offset;
+    sqe->addr = (uintptr_t)buf->buf;
+    /* The result of an operation is a 32-bit integer. */
+    sqe->len = (unsigned int)Py_MIN(buf->len, INT_MAX);
+    sqe->msg_flags = (unsigned int)flags;
+    pyiouring_queue(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+select.io_uring.read
+
+    user_data: unsigned_long_long
+    fd: fildes
+    buffer: object
+    offset: long_long = -1
+      the file offset to read from; -1 reads from the current position
+    /
+
+Queue a read from fd into the writable buffer.
+
+The result of the operation is the number of bytes read.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_read_impl(pyIoUring_Object *self,
+                          unsigned long long user_data, int fd,
+                          PyObject *buffer, long long offset)
+/*[clinic end generated code: output=4216c1f31b7b06b6 input=25693c2acc7647df]*/
+{
+    return pyiouring_prep_buffer(self, IORING_OP_READ, user_data, fd,
+                                 buffer, offset, 0, 1);
+}
+
+/*[clinic input]
+select.io_uring.write
+
+    user_data: unsigned_long_long
+    fd: fildes
+    buffer: object
+    offset: long_long = -1
+      the file offset to write at; -1 writes at the current position
+    /
+
+Queue a write of the bytes-like object to fd.
+
+The result of the operation is the number of bytes written.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_write_impl(pyIoUring_Object *self,
+                           unsigned long long user_data, int fd,
+                           PyObject *buffer, long long offset)
+/*[clinic end generated code: output=3af9f3379d3802d9 input=2c81fd7c5cbe243a]*/
+{
+    return pyiouring_prep_buffer(self, IORING_OP_WRITE, user_data, fd,
+                                 buffer, offset, 0, 0);
+}
+
+/*[clinic input]
+select.io_uring.recv
+
+    user_data: unsigned_long_long
+    fd: fildes
+    buffer: object
+    flags: int = 0
+    /
+
+Queue a receive from the socket fd into the writable buffer.
+
+The result of the operation is the number of bytes received.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_recv_impl(pyIoUring_Object *self,
+                          unsigned long long user_data, int fd,
+                          PyObject *buffer, int flags)
+/*[clinic end generated code: output=7d54e7a6a6418417 input=d86c8be69535a198]*/
+{
+    return pyiouring_prep_buffer(self, IORING_OP_RECV, user_data, fd,
+                                 buffer, 0, flags, 1);
+}
+
+/*[clinic input]
+select.io_uring.send
+
+    user_data: unsigned_long_long
+    fd: fildes
+    buffer: object
+    flags: int = 0
+    /
+
+Queue a send of the bytes-like object to the socket fd.
+
+The result of the operation is the number of bytes sent.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_send_impl(pyIoUring_Object *self,
+                          unsigned long long user_data, int fd,
+                          PyObject *buffer, int flags)
+/*[clinic end generated code: output=2c625e8037b6fd15 input=095bf629602b5cc1]*/
+{
+    return pyiouring_prep_buffer(self, IORING_OP_SEND, user_data, fd,
+                                 buffer, 0, flags, 0);
+}
+
+/*[clinic input]
+select.io_uring.accept
+
+    user_data: unsigned_long_long
+    fd: fildes
+    flags: int = 0
+      flags for accept4(), such as socket.SOCK_NONBLOCK
+    /
+
+Queue the acceptance of a connection on the listening socket fd.
+
+The result of the operation is the file descriptor of the new connection.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_accept_impl(pyIoUring_Object *self,
+                            unsigned long long user_data, int fd, int flags)
+/*[clinic end generated code: output=17972c6d85c8adb9 input=7620e28c00e98a03]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_get_sqe(self, user_data);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_ACCEPT;
+    sqe->fd = fd;
+    sqe->accept_flags = (unsigned int)flags;
+    pyiouring_queue(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+select.io_uring.poll_add
+
+    user_data: unsigned_long_long
+    fd: fildes
+    eventmask: unsigned_int(bitwise=True)
+      a bit set composed of the POLL constants
+    /
+
+Queue a one-shot wait for events on fd.
+
+The result of the operation is the mask of the events which occurred.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_poll_add_impl(pyIoUring_Object *self,
+                              unsigned long long user_data, int fd,
+                              unsigned int eventmask)
+/*[clinic end generated code: output=46ca4aa754146304 input=bc9b76f03f19a9a6]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_get_sqe(self, user_data);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_POLL_ADD;
+    sqe->fd = fd;
+#if PY_BIG_ENDIAN
+    eventmask = (eventmask << 16) | (eventmask >> 16);
+#endif
+    sqe->poll32_events = eventmask;
+    pyiouring_queue(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+select.io_uring.cancel
+
+    user_data: unsigned_long_long
+    target: unsigned_long_long
+      the user_data of the operation to cancel
+    /
+
+Queue the cancellation of an operation.
+
+The cancelled operation completes with the result -errno.ECANCELED,
+unless it completed before the cancellation took effect.  The result of
+the cancellation itself is 0 or -errno.ENOENT if target was not found.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_cancel_impl(pyIoUring_Object *self,
+                            unsigned long long user_data,
+                            unsigned long long target)
+/*[clinic end generated code: output=633ed566715b7dac input=b9cd79353333ea8d]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_get_sqe(self, user_data);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_ASYNC_CANCEL;
+    sqe->fd = -1;
+    sqe->addr = target;
+    pyiouring_queue(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+select.io_uring.nop
+
+    user_data: unsigned_long_long
+    /
+
+Queue an operation which does nothing and completes with result 0.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_nop_impl(pyIoUring_Object *self,
+                         unsigned long long user_data)
+/*[clinic end generated code: output=7f18acd6a0f5c1df input=a60a3ee596b5f40e]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_get_sqe(self, user_data);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_NOP;
+    pyiouring_queue(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+select.io_uring.submit
+
+Hand the queued operations to the kernel.
+
+Returns the number of operations submitted.  wait() submits the queued
+operations as well, so calling this method is seldom necessary.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_submit_impl(pyIoUring_Object *self)
+/*[clinic end generated code: output=07eb59929b462eb5 input=9d4d0b1723f86463]*/
+{
+    int n;
+
+    if (self->ring_fd < 0)
+        return pyiouring_err_closed();
+    n = pyiouring_submit(self);
+    if (n < 0) {
+        return NULL;
+    }
+    return PyLong_FromLong(n);
+}
+
+/*[clinic input]
+select.io_uring.wait
+
+    timeout as timeout_obj: object = None
+      the maximum time to wait in seconds (as float);
+      a timeout of None or a negative value makes wait block indefinitely
+
+Submit the queued operations and wait for completions.
+
+All the queued operations are submitted with a single system call.
+Returns a list of (user_data, result, flags) 3-tuples for the completed
+operations.  A negative result is an error number with the opposite
+sign.  An empty list is returned if the timeout expires first.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_wait_impl(pyIoUring_Object *self, PyObject *timeout_obj)
+/*[clinic end generated code: output=6f1bd28cfe8c9979 input=6c3693f1f39c2238]*/
+{
+    PyTime_t timeout = -1, deadline = 0;
+    struct io_uring_getevents_arg arg;
+    struct __kernel_timespec kts;
+    struct timespec ts;
+    unsigned int to_submit, min_complete, head, tail;
+    PyObject *elist, *etuple;
+    int ret;
+
+    if (self->ring_fd < 0)
+        return pyiouring_err_closed();
+
+    if (timeout_obj != Py_None) {
+        if (_PyTime_FromSecondsObject(&timeout, timeout_obj,
+                                      _PyTime_ROUND_TIMEOUT) < 0) {
+            if (PyErr_ExceptionMatches(PyExc_TypeError)) {
+                PyErr_SetString(PyExc_TypeError,
+                                "timeout must be an integer or None");
+            }
+            return NULL;
+        }
+        if (timeout > 0) {
+            deadline = _PyDeadline_Init(timeout);
+        }
+    }
+
+    do {
+        to_submit = pyiouring_sq_pending(self);
+        min_complete = (timeout != 0 && !pyiouring_cq_ready(self));
+        if (to_submit == 0 && min_complete == 0 && pyiouring_cq_ready(self)) {
+            break;
+        }
+
+        memset(&arg, 0, sizeof(arg));
+        arg.sigmask_sz = _NSIG / 8;
+        if (timeout > 0 && min_complete) {
+            if (_PyTime_AsTimespec(timeout, &ts) < 0) {
+                return NULL;
+            }
+            kts.tv_sec = ts.tv_sec;
+            kts.tv_nsec = ts.tv_nsec;
+            arg.ts = (uintptr_t)&kts;
+        }
+        errno = 0;
+        ret = pyiouring_enter(self, to_submit, min_complete,
+                              IORING_ENTER_GETEVENTS | IORING_ENTER_EXT_ARG,
+                              &arg, sizeof(arg));
+        if (ret < 0) {
+            if (errno == ETIME) {
+                break;
+            }
+            /* The completion ring is full: reap it, the remaining
+               operations are submitted by the next call. */
+            if (errno == EBUSY || errno == EAGAIN) {
+                break;
+            }
+            if (errno != EINTR) {
+                PyErr_SetFromErrno(PyExc_OSError);
+                return NULL;
+            }
+        }
+        else if (!min_complete || pyiouring_cq_ready(self)) {
+            break;
+        }
+
+        /* io_uring_enter() was interrupted by a signal */
+        if (PyErr_CheckSignals())
+            return NULL;
+
+        if (timeout > 0) {
+            timeout = _PyDeadline_Get(deadline);
+            if (timeout <= 0) {
+                break;
+            }
+            /* retry io_uring_enter() with the recomputed timeout */
+        }
+    } while (1);
+
+    elist = PyList_New(0);
+    if (elist == NULL) {
+        return NULL;
+    }
+    head = *self->kcq_head;
+    tail = __atomic_load_n(self->kcq_tail, __ATOMIC_ACQUIRE);
+    for (; head != tail; head++) {
+        struct io_uring_cqe *cqe = &self->cqes[head & *self->kcq_mask];
+        etuple = Py_BuildValue("KiI", (unsigned long long)cqe->user_data,
+                               cqe->res, cqe->flags);
+        if (etuple == NULL || PyList_Append(elist, etuple) < 0) {
+            Py_XDECREF(etuple);
+            Py_CLEAR(elist);
+            break;
+        }
+        Py_DECREF(etuple);
+        if (pyiouring_release_buffer(self, cqe->user_data) < 0) {
+            Py_CLEAR(elist);
+            head++;
+            break;
+        }
+    }
+    __atomic_store_n(self->kcq_head, head, __ATOMIC_RELEASE);
+    return elist;
+}
+
+/*[clinic input]
+select.io_uring.__enter__
+
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring___enter___impl(pyIoUring_Object *self)
+/*[clinic end generated code: output=6453f8b2562a22d4 input=8edfa5fe3684ef9a]*/
+{
+    if (self->ring_fd < 0)
+        return pyiouring_err_closed();
+
+    return Py_NewRef(self);
+}
+
+/*[clinic input]
+select.io_uring.__exit__
+
+    exc_type:  object = None
+    exc_value: object = None
+    exc_tb:    object = None
+    /
+
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring___exit___impl(pyIoUring_Object *self, PyObject *exc_type,
+                              PyObject *exc_value, PyObject *exc_tb)
+/*[clinic end generated code: output=313376fb85210e74 input=1e269333b0d5d167]*/
+{
+    _selectstate *state = _selectstate_by_type(Py_TYPE(self));
+    return PyObject_CallMethodObjArgs((PyObject *)self, state->close, NULL);
+}
+
+static PyGetSetDef pyiouring_getsetlist[] = {
+    {"closed", (getter)pyiouring_get_closed, NULL,
+     "True if the io_uring object is closed"},
+    {0},
+};
+
+PyDoc_STRVAR(pyiouring_doc,
+"select.io_uring(entries=256)\n\
+\n\
+Returns an io_uring object\n\
+\n\
+Operations are queued with the methods named after them, each tagged\n\
+with an integer user_data which identifies its completion, and are\n\
+submitted to the kernel in a single system call by wait().");
+
+#endif /* HAVE_IO_URING */
+
 #ifdef HAVE_KQUEUE
 /* **************************************************************************
  *                      kqueue interface for BSD
@@ -2502,6 +3403,46 @@ static PyType_Spec pyEpoll_Type_spec = {
 
 #endif /* HAVE_EPOLL */
 
+#ifdef HAVE_IO_URING
+
+static PyMethodDef pyiouring_methods[] = {
+    SELECT_IO_URING_CLOSE_METHODDEF
+    SELECT_IO_URING_FILENO_METHODDEF
+    SELECT_IO_URING_READ_METHODDEF
+    SELECT_IO_URING_WRITE_METHODDEF
+    SELECT_IO_URING_RECV_METHODDEF
+    SELECT_IO_URING_SEND_METHODDEF
+    SELECT_IO_URING_ACCEPT_METHODDEF
+    SELECT_IO_URING_POLL_ADD_METHODDEF
+    SELECT_IO_URING_CANCEL_METHODDEF
+    SELECT_IO_URING_NOP_METHODDEF
+    SELECT_IO_URING_SUBMIT_METHODDEF
+    SELECT_IO_URING_WAIT_METHODDEF
+    SELECT_IO_URING___ENTER___METHODDEF
+    SELECT_IO_URING___EXIT___METHODDEF
+    {NULL,      NULL},
+};
+
+static PyType_Slot pyIoUring_Type_slots[] = {
+    {Py_tp_dealloc, pyiouring_dealloc},
+    {Py_tp_doc, (void*)pyiouring_doc},
+    {Py_tp_getattro, PyObject_GenericGetAttr},
+    {Py_tp_getset, pyiouring_getsetlist},
+    {Py_tp_methods, pyiouring_methods},
+    {Py_tp_new, select_io_uring},
+    {0, 0},
+};
+
+static PyType_Spec pyIoUring_Type_spec = {
+    "select.io_uring",
+    sizeof(pyIoUring_Object),
+    0,
+    Py_TPFLAGS_DEFAULT,
+    pyIoUring_Type_slots
+};
+
+#endif /* HAVE_IO_URING */
+
 #ifdef HAVE_KQUEUE
 
 static PyMethodDef kqueue_queue_methods[] = {
@@ -2562,6 +3503,7 @@ _select_traverse(PyObject *module, visitproc visit, void *arg)
     Py_VISIT(state->poll_Type);
     Py_VISIT(state->devpoll_Type);
     Py_VISIT(state->pyEpoll_Type);
+    Py_VISIT(state->pyIoUring_Type);
 #ifdef HAVE_KQUEUE
     Py_VISIT(state->kqueue_event_Type);
     Py_VISIT(state->kqueue_queue_Type);
@@ -2579,6 +3521,7 @@ _select_clear(PyObject *module)
     Py_CLEAR(state->poll_Type);
     Py_CLEAR(state->devpoll_Type);
     Py_CLEAR(state->pyEpoll_Type);
+    Py_CLEAR(state->pyIoUring_Type);
 #ifdef HAVE_KQUEUE
     Py_CLEAR(state->kqueue_event_Type);
     Py_CLEAR(state->kqueue_queue_Type);
@@ -2721,6 +3664,17 @@ _select_exec(PyObject *m)
 #endif
 #endif /* HAVE_EPOLL */
 
+#ifdef HAVE_IO_URING
+    state->pyIoUring_Type = (PyTypeObject *)PyType_FromModuleAndSpec(
+        m, &pyIoUring_Type_spec, NULL);
+    if (state->pyIoUring_Type == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(m, state->pyIoUring_Type) < 0) {
+        return -1;
+    }
+#endif /* HAVE_IO_URING */
+
 #undef ADD_INT
 
 #define ADD_INT_CONST(NAME, VAL) \
@@ -35,7 +35,6 @@
     '_testlimitedcapi',
     '_testmultiphase',
     '_testsinglephase',
-    '_testexternalinspection',
     '_xxtestfuzz',
     'idlelib.idle_test',
     'test',
@@ -0,0 +1,94 @@
+"""Measure the throughput of asyncio TLS streams over loopback.
+
+A client writes many messages of a given size to a start_server() reader,
+draining the writer every few messages, like a server sending a stream of
+small responses.  The time until the reader has received everything is
+reported for each message size, with and without TLS.
+
+To run:
+
+    python3 Tools/scripts/asyncio_ssl_benchmark.py
+    python3 Tools/scripts/asyncio_ssl_benchmark.py --sizes 100 --messages 10000
+
+Options:
+
+    * `--sizes` message sizes in bytes to measure
+    * `--messages` number of messages written for each size
+    * `--drain-every` number of messages written between two drain() calls
+    * `--certfile` PEM file holding the certificate and private key of the
+      server
+"""
+
+import argparse
+import asyncio
+import os
+import ssl
+import time
+
+
+CERTFILE = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir,
+                        'Lib', 'test', 'certdata', 'keycert.pem')
+
+
+async def bench(size, messages, drain_every, server_ctx, client_ctx):
+    total = size * messages
+    done = asyncio.get_running_loop().create_future()
+
+    async def handle(reader, writer):
+        received = 0
+        while data := await reader.read(256 * 1024):
+            received += len(data)
+        done.set_result(received)
+        writer.close()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0,
+                                        ssl=server_ctx)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection('127.0.0.1', port,
+                                                   ssl=client_ctx)
+    message = b'x' * size
+
+    t0 = time.perf_counter()
+    for i in range(1, messages + 1):
+        writer.write(message)
+        if i % drain_every == 0:
+            await writer.drain()
+    writer.close()
+    await writer.wait_closed()
+    received = await done
+    elapsed = time.perf_counter() - t0
+
+    server.close()
+    await server.wait_closed()
+    assert received == total, (received, total)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[100, 1_000, 4_000, 64_000])
+    parser.add_argument('--messages', type=int, default=100_000)
+    parser.add_argument('--drain-every', type=int, default=50)
+    parser.add_argument('--certfile', default=CERTFILE)
+    args = parser.parse_args()
+
+    server_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_ctx.load_cert_chain(args.certfile)
+    client_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    client_ctx.check_hostname = False
+    client_ctx.verify_mode = ssl.CERT_NONE
+
+    print(f"{'size':>8}  {'plain':>19}  {'TLS':>19}")
+    for size in args.sizes:
+        results = []
+        for ctxs in [(None, None), (server_ctx, client_ctx)]:
+            elapsed = asyncio.run(
+                bench(size, args.messages, args.drain_every, *ctxs))
+            rate = size * args.messages / elapsed / 1e6
+            results.append(f"{elapsed:6.2f} s {rate:6.0f} MB/s")
+        print(f"{size:8d}  {results[0]:>19}  {results[1]:>19}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Measure the cost of event loop iterations as the number of timeouts grows.
+
+Every task runs inside an asyncio.timeout() and postpones it each time it
+is woken up, like a connection resetting its idle timeout on every packet.
+The loop-wide cost of an iteration is reported for increasing numbers of
+tasks.
+
+To run:
+
+    python3 Tools/scripts/asyncio_timeout_benchmark.py
+    python3 Tools/scripts/asyncio_timeout_benchmark.py --tasks 1000 100000
+
+Options:
+
+    * `--tasks` numbers of concurrent tasks to measure
+    * `--iterations` number of loop iterations to time for each count
+    * `--idle-timeout` idle timeout of each task in seconds
+"""
+
+import argparse
+import asyncio
+import time
+
+
+async def connection(idle_timeout, ready):
+    loop = asyncio.get_running_loop()
+    async with asyncio.timeout(idle_timeout) as cm:
+        ready.release()
+        while True:
+            await asyncio.sleep(0)
+            # A packet was received: reset the idle timeout.
+            cm.reschedule(loop.time() + idle_timeout)
+
+
+async def bench(ntasks, iterations, idle_timeout):
+    ready = asyncio.Semaphore(0)
+    tasks = [asyncio.create_task(connection(idle_timeout, ready))
+             for _ in range(ntasks)]
+    for _ in range(ntasks):
+        await ready.acquire()
+
+    # Every task is woken up once per iteration of the event loop.
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - t0
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return elapsed / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tasks', type=int, nargs='+',
+                        default=[100, 1_000, 10_000, 100_000])
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--idle-timeout', type=float, default=60.0)
+    args = parser.parse_args()
+
+    print(f"{'tasks':>8}  {'per iteration':>14}  {'per timeout':>12}")
+    for ntasks in args.tasks:
+        per_iteration = asyncio.run(
+            bench(ntasks, args.iterations, args.idle_timeout))
+        print(f"{ntasks:8d}  {per_iteration * 1e3:11.2f} ms  "
+              f"{per_iteration / ntasks * 1e9:9.0f} ns")
+
+
+if __name__ == '__main__':
+    main()